@@ -54,6 +54,8 @@ def OWM(API_key=constants.DEFAULT_API_KEY, version=constants.LATEST_OWM_API_VERS
             config_module = "pyowm.weatherapi25.configuration25"
         cfg_module = __import__(config_module,  fromlist=[''])
         from pyowm.weatherapi25.owm25 import OWM25
+        from pyowm.commons import jsoncodec
+        jsoncodec.use_default(getattr(cfg_module, 'JSON_CODEC', 'auto'))
         if language is None:
             language = cfg_module.language
         if subscription_type is None:
@@ -63,5 +65,7 @@ def OWM(API_key=constants.DEFAULT_API_KEY, version=constants.LATEST_OWM_API_VERS
         if use_ssl is None:
             use_ssl = cfg_module.USE_SSL
         return OWM25(cfg_module.parsers, API_key, cfg_module.cache,
-                     language, subscription_type, use_ssl)
+                     language, subscription_type, use_ssl,
+                     negative_cache=getattr(cfg_module, 'negative_cache', None),
+                     object_cache=getattr(cfg_module, 'object_cache', None))
     raise ValueError("Unsupported OWM Weather API version")
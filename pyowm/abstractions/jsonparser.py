@@ -3,6 +3,8 @@ Module containing an abstract base class for JSON OWM Weather API responses pars
 """
 
 from abc import ABCMeta, abstractmethod
+from pyowm.commons import jsoncodec
+from pyowm.exceptions import parse_response_error
 
 
 class JSONParser(object):
@@ -13,7 +15,6 @@ class JSONParser(object):
 
     __metaclass__ = ABCMeta
 
-    @abstractmethod
     def parse_JSON(self, JSON_string):
         """
         Returns a proper object parsed from the input JSON_string. Subclasses
@@ -25,5 +26,23 @@ class JSONParser(object):
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the resulting object
 
+        """
+        if JSON_string is None:
+            raise parse_response_error.ParseResponseError('JSON data is None')
+        return self.parse_dict(jsoncodec.loads(JSON_string))
+
+    @abstractmethod
+    def parse_dict(self, data_dict):
+        """
+        Returns a proper object parsed from the input data, which is the
+        outcome of decoding a JSON text string. Subclasses know from their
+        specific type which object is to be parsed and returned
+
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
+        :returns: an object
+        :raises: *ParseResponseError* if it is impossible to find or parse the
+            data needed to build the resulting object
+
         """
         raise NotImplementedError
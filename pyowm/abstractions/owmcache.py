@@ -3,6 +3,7 @@ Module containing the abstract PyOWM cache provider
 """
 
 from abc import ABCMeta, abstractmethod
+from pyowm.caches.cachestats import CacheStats
 
 
 class OWMCache(object):
@@ -22,6 +23,11 @@ class OWMCache(object):
     External caching mechanisms (eg: memcached, redis, etc..) can be used by
     extending this class into a proper decorator for the correspondent Python
     bindings.
+    Cached values are the JSON responses either as already decoded data (as
+    returned by ``json.loads``) or as raw JSON text (str or bytes): in-memory
+    implementations should store and return decoded data as is, so that
+    neither cache hits nor misses pay for JSON encoding/decoding, while
+    implementations backed by external storage can return raw JSON text.
     """
 
     __metaclass__ = ABCMeta
@@ -29,13 +35,14 @@ class OWMCache(object):
     @abstractmethod
     def get(self, request_url):
         """
-        In case of a hit, returns the JSON string which represents the OWM web
+        In case of a hit, returns the JSON data which represents the OWM web
         API response to the request being identified by a specific string URL.
 
         :param request_url: an URL that uniquely identifies the request whose
             response is to be looked up
         :type request_url: str
-        :returns: a JSON str in case of cache hit or ``None`` otherwise
+        :returns: the decoded JSON data or a JSON str/bytes in case of cache
+            hit or ``None`` otherwise
 
         """
         raise NotImplementedError
@@ -49,7 +56,87 @@ class OWMCache(object):
         :param request_url: the request URL
         :type request_url: str
         :param response_json: the response JSON
-        :type response_json: str
+        :type response_json: decoded JSON data (eg: dict or list)
 
         """
         raise NotImplementedError
+
+    def get_many(self, request_urls):
+        """
+        Looks up the JSON data of the responses to many requests at once.
+        Caches backed by remote stores should override this default
+        implementation, which looks up each request URL in turn, so that all
+        of the lookups take a single round trip.
+
+        :param request_urls: the URLs that uniquely identify the requests
+            whose responses are to be looked up
+        :type request_urls: list of str
+        :returns: a list holding - for each request URL, in the same order -
+            the JSON data as returned by ``get`` in case of cache hit or
+            ``None`` otherwise
+
+        """
+        return [self.get(request_url) for request_url in request_urls]
+
+    def set_many(self, responses):
+        """
+        Adds many responses to the cache at once. Caches backed by remote
+        stores should override this default implementation, which adds each
+        response in turn, so that all of them are stored in a single round
+        trip.
+
+        :param responses: the response JSONs by request URL
+        :type responses: dict
+
+        """
+        for request_url, response_json in responses.items():
+            self.set(request_url, response_json)
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Looks up the JSON data which represents the OWM web API response to
+        the request being identified by a specific string URL, even though it
+        has expired, as long as it is within a grace period after its
+        expiration: either the stale-while-revalidate one - during which the
+        response is served while it is being refreshed in background - or, in
+        case the OWM web API failed to provide a fresh response, the
+        stale-if-error one. Caches that do not keep expired responses, as this
+        default implementation, always return ``None``.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the decoded JSON data or a JSON str/bytes in case of hit
+            or ``None`` otherwise
+
+        """
+        return None
+
+    def is_thread_safe(self):
+        """
+        Tells whether the cache can be used by many threads at the same time.
+        Bulk queries only issue concurrent API calls to caches which can, as
+        their responses are stored by the calling threads. This default
+        implementation conservatively returns ``False``.
+
+        :returns: a bool
+
+        """
+        return False
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache, broken down by OWM
+        API endpoint (see ``CacheStats.snapshot``). Caches not recording
+        statistics, as this default implementation, return empty ones.
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return CacheStats().snapshot()
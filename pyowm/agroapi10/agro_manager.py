@@ -23,15 +23,18 @@ class AgroManager(object):
 
     :param API_key: the OWM Weather API key
     :type API_key: str
+    :param session: the `requests.Session` to be used for API calls (defaults
+        to `None`, which means a new connection is opened for each call)
+    :type session: `requests.Session`
     :returns: an `AgroManager` instance
     :raises: `AssertionError` when no API Key is provided
 
     """
 
-    def __init__(self, API_key):
+    def __init__(self, API_key, session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
-        self.http_client = HttpClient()
+        self.http_client = HttpClient(session=session)
 
     def agro_api_version(self):
         return AGRO_API_VERSION
@@ -2,9 +2,10 @@ from pyowm.utils import timeformatutils
 from pyowm.commons.enums import ImageTypeEnum
 from pyowm.commons.image import Image
 from pyowm.commons.tile import Tile
+from pyowm.commons.slotted import Slotted
 
 
-class MetaImage:
+class MetaImage(Slotted):
     """
     A class representing metadata for a satellite-acquired image
 
@@ -32,6 +33,10 @@ class MetaImage:
     :returns: an `MetaImage` object
     """
 
+    __slots__ = ('url', 'preset', 'satellite_name', '_acquisition_time',
+                 'valid_data_percentage', 'cloud_coverage_percentage',
+                 'sun_azimuth', 'sun_elevation', 'polygon_id', 'stats_url')
+
     image_type = None
 
     def __init__(self, url, preset, satellite_name, acquisition_time,
@@ -84,6 +89,9 @@ class MetaPNGImage(MetaImage):
     """
     Class representing metadata for a satellite image of a polygon in PNG format
     """
+
+    __slots__ = ()
+
     image_type = ImageTypeEnum.PNG
 
 
@@ -91,6 +99,9 @@ class MetaTile(MetaImage):
     """
     Class representing metadata for a tile in PNG format
     """
+
+    __slots__ = ()
+
     image_type = ImageTypeEnum.PNG
 
 
@@ -98,6 +109,9 @@ class MetaGeoTiffImage(MetaImage):
     """
     Class representing metadata for a satellite image of a polygon in GeoTiff format
     """
+
+    __slots__ = ()
+
     image_type = ImageTypeEnum.GEOTIFF
 
 
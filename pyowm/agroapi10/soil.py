@@ -1,7 +1,8 @@
+from pyowm.commons.slotted import Slotted
 from pyowm.utils import timeformatutils, temputils
 
 
-class Soil:
+class Soil(Slotted):
 
     """
     Soil data over a specific Polygon
@@ -20,6 +21,9 @@ class Soil:
     :raises: `AssertionError` when any of the mandatory fields is `None` or has wrong type
     """
 
+    __slots__ = ('_reference_time', '_surface_temp', '_ten_cm_temp',
+                 'moisture', 'polygon_id')
+
     def __init__(self, reference_time, surface_temp, ten_cm_temp, moisture, polygon_id=None):
         assert reference_time is not None
         assert isinstance(reference_time, int), 'reference time must be a UNIX int timestamp'
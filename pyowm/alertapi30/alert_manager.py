@@ -13,17 +13,20 @@ class AlertManager:
 
     :param API_key: the OWM Weather API key
     :type API_key: str
+    :param session: the ``requests.Session`` to be used for API calls (defaults
+        to ``None``, which means a new connection is opened for each call)
+    :type session: ``requests.Session``
     :returns: an *AlertManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key):
+    def __init__(self, API_key, session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         self.trigger_parser = TriggerParser()
         self.alert_parser = AlertParser()
-        self.http_client = HttpClient()
+        self.http_client = HttpClient(session=session)
 
     def alert_api_version(self):
         return ALERT_API_VERSION
@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a Station instance
 """
 
-import json
 from pyowm.abstractions import jsonparser
 from pyowm.exceptions import parse_response_error
 from pyowm.alertapi30.trigger import Trigger
@@ -25,16 +24,6 @@ class TriggerParser(jsonparser.JSONParser):
         pass
 
     def parse_dict(self, data_dict):
-        """
-        Parses a dictionary representing the attributes of a `pyowm.alertapi30.trigger.Trigger` entity
-        :param data_dict: dict
-        :return: `pyowm.alertapi30.trigger.Trigger`
-        """
-        assert isinstance(data_dict, dict)
-        string_repr = json.dumps(data_dict)
-        return self.parse_JSON(string_repr)
-
-    def parse_JSON(self, JSON_string):
         """
         Parses a `pyowm.alertapi30.trigger.Trigger` instance out of raw JSON
         data. As per OWM documentation, start and end times are expressed with
@@ -42,17 +31,18 @@ class TriggerParser(jsonparser.JSONParser):
         PyOWM will only allow users to specify *absolute* datetimes - which is, with the `exact` expression -
         for start/end timestamps (will otherwise result in a `ParseResponseError` be raised)
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :return: a `pyowm.alertapi30.trigger.Trigger` instance or ``None``
             if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        assert isinstance(data_dict, dict)
+        d = data_dict
         try:
             # trigger id
             trigger_id = d.get('_id', None)
@@ -115,30 +105,21 @@ class AlertParser(jsonparser.JSONParser):
         pass
 
     def parse_dict(self, data_dict):
-        """
-        Parses a dictionary representing the attributes of a `pyowm.alertapi30.alert.Alert entity
-        :param data_dict: dict
-        :return: `pyowm.alertapi30.alert.Alert`
-        """
-        assert isinstance(data_dict, dict)
-        string_repr = json.dumps(data_dict)
-        return self.parse_JSON(string_repr)
-
-    def parse_JSON(self, JSON_string):
         """
         Parses a `pyowm.alertapi30.alert.Alert` instance out of raw JSON data.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :return: a `pyowm.alertapi30.alert.Alert` instance or ``None``
             if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        assert isinstance(data_dict, dict)
+        d = data_dict
         try:
             alert_id = d['_id']
             t = d['last_update'].split('.')[0].replace('T', ' ') + '+00'
@@ -0,0 +1,346 @@
+"""
+Module containing the statistics recorder for cache providers
+"""
+
+import re
+import threading
+from time import perf_counter
+
+# Path segments embedding coordinates or UTC datetimes (eg: the Air Pollution
+# API ones, like '/co/45.0,9.0/2016-01-02Z.json') are collapsed, so that they
+# do not make up different endpoints
+_COORDS_SEGMENT = re.compile(r'/[^/]*,[^/]*')
+_DATETIME_SEGMENT = re.compile(r'/\d{4}(-\d{2}(-\d{2}(T\d{2}(:\d{2})?)?)?)?Z')
+
+# Latency histograms buckets: bucket i counts latencies shorter than 2^i
+# microseconds, the last one counts all of the longer latencies as well
+_LATENCY_BUCKETS = 24
+
+_COUNTERS = ('hits', 'misses', 'expirations', 'evictions', 'sets', 'errors')
+
+# Maximum number of memoized URL bases (URLs without query)
+_MAX_BASES = 1024
+
+
+def clock_ns():
+    """
+    Returns the value in nanoseconds of a performance counter, to be used for
+    measuring the latencies to be recorded (``time.perf_counter_ns`` is not
+    available before Python 3.7)
+
+    :returns: an int
+
+    """
+    return int(perf_counter() * 1000000000)
+
+
+def endpoint_of(request_url):
+    """
+    Returns the endpoint a request URL belongs to, that is the path of the
+    URL with the coordinates and the datetimes embedded into it collapsed
+
+    :param request_url: the request URL
+    :type request_url: str
+    :returns: a str
+
+    """
+    path = request_url.split('?', 1)[0]
+    scheme_end = path.find('://')
+    if scheme_end >= 0:
+        path_start = path.find('/', scheme_end + 3)
+        path = path[path_start:] if path_start >= 0 else '/'
+    if ',' in path:
+        path = _COORDS_SEGMENT.sub('/{}', path)
+    if 'Z' in path:
+        path = _DATETIME_SEGMENT.sub('/{}', path)
+    return path
+
+
+class _EndpointStats(object):
+
+    __slots__ = ('hits', 'misses', 'expirations', 'evictions', 'sets',
+                 'errors', 'bytes', 'get_latency', 'set_latency')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.sets = 0
+        self.errors = 0
+        self.bytes = 0
+        self.get_latency = [0] * _LATENCY_BUCKETS
+        self.set_latency = [0] * _LATENCY_BUCKETS
+
+
+class NoLock(object):
+    """
+    A no-op stand-in for a lock, for objects which are synchronized only
+    when configured to be
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+def _histogram(buckets):
+    return {2 ** i: count for i, count in enumerate(buckets) if count}
+
+
+class CacheStats(object):
+    """
+    Records the statistics of a cache provider, broken down by the OWM API
+    endpoints the cached responses come from: hits, misses, expirations
+    (items discarded because expired), evictions (items discarded to make
+    room for new ones), sets, errors (lookups and insertions which failed
+    because the cache could not be used), bytes currently stored and the
+    latency histograms of lookups and insertions.
+    Recording an event takes a small constant time, so that statistics can
+    be left on in production; snapshots of them can be periodically taken
+    and exported.
+
+    :param track_bytes: whether the bytes stored are tracked, which is only
+        possible for caches knowing the size of their items (eg: having a
+        byte budget). Defaults to ``False``, meaning that the bytes stored
+        are reported as ``None``
+    :type track_bytes: bool
+    :param synchronized: whether events are recorded under a lock. Caches
+        which are not thread-safe or serialize their operations on their own
+        (eg: *LRUCache*) can do without it. Defaults to ``True``
+    :type synchronized: bool
+    :returns: a new *CacheStats* instance
+
+    """
+
+    def __init__(self, track_bytes=False, synchronized=True):
+        self._track_bytes = track_bytes
+        self._lock = threading.Lock() if synchronized else NoLock()
+        self._endpoints = dict()  # endpoint -> stats
+        self._bases = dict()  # URL base -> endpoint stats
+        if not synchronized:
+            # events are recorded on the hot path of the cache operations,
+            # where even entering a no-op context manager is worth skipping
+            self.record_get = self._record_get
+            self.record_set = self._record_set
+            self.record_removal = self._record_removal
+
+    def _endpoint(self, base):
+        endpoint = endpoint_of(base)
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        if len(self._bases) >= _MAX_BASES:
+            self._bases.clear()
+        self._bases[base] = stats
+        return stats
+
+    def record_get(self, request_url, hit, elapsed_ns):
+        """
+        Records a lookup
+
+        :param request_url: the looked up request URL
+        :type request_url: str
+        :param hit: whether the lookup was a hit
+        :type hit: bool
+        :param elapsed_ns: the lookup latency in nanoseconds
+        :type elapsed_ns: int
+
+        """
+        with self._lock:
+            self._record_get(request_url, hit, elapsed_ns)
+
+    def _record_get(self, request_url, hit, elapsed_ns):
+        base = request_url.partition('?')[0]
+        stats = self._bases.get(base) or self._endpoint(base)
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        bucket = (elapsed_ns // 1000).bit_length()
+        if bucket >= _LATENCY_BUCKETS:
+            bucket = _LATENCY_BUCKETS - 1
+        stats.get_latency[bucket] += 1
+
+    def record_set(self, request_url, elapsed_ns, nbytes=None):
+        """
+        Records an insertion
+
+        :param request_url: the request URL
+        :type request_url: str
+        :param elapsed_ns: the insertion latency in nanoseconds
+        :type elapsed_ns: int
+        :param nbytes: the size in bytes of the stored item, if it has been
+            stored and bytes are tracked
+        :type nbytes: int
+
+        """
+        with self._lock:
+            self._record_set(request_url, elapsed_ns, nbytes)
+
+    def _record_set(self, request_url, elapsed_ns, nbytes=None):
+        base = request_url.partition('?')[0]
+        stats = self._bases.get(base) or self._endpoint(base)
+        stats.sets += 1
+        bucket = (elapsed_ns // 1000).bit_length()
+        if bucket >= _LATENCY_BUCKETS:
+            bucket = _LATENCY_BUCKETS - 1
+        stats.set_latency[bucket] += 1
+        if nbytes is not None:
+            stats.bytes += nbytes
+
+    def record_removal(self, request_url, nbytes=None, expired=False,
+                       evicted=False):
+        """
+        Records the removal of an item from the cache
+
+        :param request_url: the request URL of the removed item
+        :type request_url: str
+        :param nbytes: the size in bytes of the removed item, if bytes are
+            tracked
+        :type nbytes: int
+        :param expired: whether the item was removed because expired
+        :type expired: bool
+        :param evicted: whether the item was evicted to make room for others
+        :type evicted: bool
+
+        """
+        with self._lock:
+            self._record_removal(request_url, nbytes, expired, evicted)
+
+    def _record_removal(self, request_url, nbytes=None, expired=False,
+                        evicted=False):
+        base = request_url.partition('?')[0]
+        stats = self._bases.get(base) or self._endpoint(base)
+        if expired:
+            stats.expirations += 1
+        if evicted:
+            stats.evictions += 1
+        if nbytes is not None:
+            stats.bytes -= nbytes
+
+    def record_error(self, request_url):
+        """
+        Records a lookup or an insertion that failed, eg: because the remote
+        store backing the cache could not be reached. Failed lookups are to be
+        recorded as misses as well
+
+        :param request_url: the request URL
+        :type request_url: str
+
+        """
+        with self._lock:
+            base = request_url.partition('?')[0]
+            stats = self._bases.get(base) or self._endpoint(base)
+            stats.errors += 1
+
+    def clear_bytes(self):
+        """
+        Records that the cache has been emptied
+
+        """
+        with self._lock:
+            for stats in self._endpoints.values():
+                stats.bytes = 0
+
+    def snapshot(self, reset=False, bytes_by_endpoint=None):
+        """
+        Returns a snapshot of the statistics, as a dict with the following
+        keys:
+
+        - 'endpoints': a dict mapping each endpoint to its statistics
+        - 'total': the statistics of all of the endpoints together
+
+        Statistics are dicts having keys 'hits', 'misses', 'expirations',
+        'evictions', 'sets', 'errors', 'bytes' and - for the latency histograms -
+        'get_latency_us' and 'set_latency_us', which map the upper bounds of
+        the histogram buckets in microseconds to the count of latencies
+        falling into each bucket.
+
+        :param reset: whether all of the counters but the bytes stored are
+            to be reset after taking the snapshot
+        :type reset: bool
+        :param bytes_by_endpoint: the bytes stored by endpoint, for caches
+            which compute them upon request rather than tracking them
+        :type bytes_by_endpoint: dict
+        :returns: a dict
+
+        """
+        with self._lock:
+            endpoints = dict()
+            for endpoint, stats in self._endpoints.items():
+                snapshot = {name: getattr(stats, name) for name in _COUNTERS}
+                snapshot['bytes'] = stats.bytes if self._track_bytes else None
+                snapshot['get_latency_us'] = _histogram(stats.get_latency)
+                snapshot['set_latency_us'] = _histogram(stats.set_latency)
+                endpoints[endpoint] = snapshot
+            if reset:
+                self._reset()
+        if bytes_by_endpoint is not None:
+            for endpoint in bytes_by_endpoint:
+                if endpoint not in endpoints:
+                    endpoints[endpoint] = CacheStats._total([])
+            for endpoint, snapshot in endpoints.items():
+                snapshot['bytes'] = bytes_by_endpoint.get(endpoint, 0)
+        return dict(endpoints=endpoints, total=self._total(endpoints.values()))
+
+    def reset(self):
+        """
+        Resets all of the counters but the bytes stored
+
+        """
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self._bases.clear()
+        for endpoint, stats in list(self._endpoints.items()):
+            if stats.bytes:
+                fresh = self._endpoints[endpoint] = _EndpointStats()
+                fresh.bytes = stats.bytes
+            else:
+                del self._endpoints[endpoint]
+
+    @staticmethod
+    def _total(snapshots):
+        total = {name: 0 for name in _COUNTERS}
+        total['bytes'] = None
+        total['get_latency_us'] = dict()
+        total['set_latency_us'] = dict()
+        for snapshot in snapshots:
+            for name in _COUNTERS:
+                total[name] += snapshot[name]
+            if snapshot['bytes'] is not None:
+                total['bytes'] = (total['bytes'] or 0) + snapshot['bytes']
+            for name in ('get_latency_us', 'set_latency_us'):
+                for bound, count in snapshot[name].items():
+                    total[name][bound] = total[name].get(bound, 0) + count
+        return total
+
+    @staticmethod
+    def merge(snapshots):
+        """
+        Merges snapshots of statistics taken from different caches (eg: the
+        stripes of a *StripedLRUCache*) into one
+
+        :param snapshots: the snapshots
+        :type snapshots: iterable of dict
+        :returns: a dict
+
+        """
+        by_endpoint = dict()
+        for snapshot in snapshots:
+            for endpoint, stats in snapshot['endpoints'].items():
+                by_endpoint.setdefault(endpoint, []).append(stats)
+        endpoints = {endpoint: CacheStats._total(stats)
+                     for endpoint, stats in by_endpoint.items()}
+        return dict(endpoints=endpoints,
+                    total=CacheStats._total(endpoints.values()))
+
+    def __repr__(self):
+        return "<%s.%s - endpoints=%s>" % (__name__, self.__class__.__name__,
+                                           len(self._endpoints))
@@ -0,0 +1,211 @@
+"""
+Module containing a cache decorator compressing the cached responses
+"""
+
+import lzma
+import zlib
+from pyowm.commons import jsoncodec
+from pyowm.abstractions import owmcache
+
+# Compressed values are tagged with a header made out of this marker - which
+# JSON text can never start with - followed by the codec identifier
+_MARKER = b'\x00'
+
+_CODECS = {
+    'zlib': (b'z', lambda data, level: zlib.compress(data, level)),
+    'lzma': (b'x', lambda data, level: lzma.compress(data, preset=level))
+}
+
+_DECOMPRESSORS = {
+    b'z': zlib.decompress,
+    b'x': lzma.decompress
+}
+
+
+class CompressedCache(owmcache.OWMCache):
+    """
+    A decorator for any *OWMCache* implementation, compressing the JSON text
+    of the responses before storing them into the decorated cache and
+    decompressing them upon lookup. OWM API responses (especially forecasts
+    and weather history) are highly repetitive, so that many more of them fit
+    the same memory. Compression trades CPU time for memory: responses
+    smaller than the size threshold are stored as they are, as compressing
+    them would not be worth it.
+    Compressed responses are tagged with the codec they were compressed with,
+    so that they can be looked up even after the codec is changed.
+
+    :param cache: the decorated cache
+    :type cache: an *OWMCache* concrete instance
+    :param codec: the compression codec, either 'zlib' or 'lzma'
+    :type codec: str
+    :param level: the compression level: from 0 (fastest) to 9 (smallest
+        output) for both codecs
+    :type level: int
+    :param threshold_bytes: the minimum size in bytes of the JSON text of the
+        responses to be compressed. A reasonable default value is provided.
+    :type threshold_bytes: int
+    :returns: a new *CompressedCache* instance
+
+    """
+
+    _CODEC = 'zlib'
+    _LEVEL = 6
+    _THRESHOLD_BYTES = 512
+
+    def __init__(self, cache, codec=_CODEC, level=_LEVEL,
+                 threshold_bytes=_THRESHOLD_BYTES):
+        assert codec in _CODECS, "codec must be one of: %s" % ', '.join(sorted(_CODECS))
+        assert 0 <= level <= 9, "level must be between 0 and 9"
+        assert threshold_bytes >= 0, "threshold_bytes must not be negative"
+        self._cache = cache
+        self._codec = codec
+        self._codec_id, self._compress = _CODECS[codec]
+        self._level = level
+        self._threshold_bytes = threshold_bytes
+
+    def get(self, request_url):
+        """
+        Looks up the request URL into the decorated cache, decompressing the
+        response in case it was compressed.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: the JSON text as bytes in case of hit on a compressed
+            response, the response as stored otherwise or ``None`` in case
+            of cache miss
+
+        """
+        return self._decompressed(self._cache.get(request_url))
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Looks up the request URL into the decorated cache even though its
+        response has expired, as long as the decorated cache keeps it for the
+        applicable grace period, decompressing the response in case it was
+        compressed.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the response as in ``get`` in case of hit or ``None``
+            otherwise
+
+        """
+        return self._decompressed(self._cache.get_stale(request_url,
+                                                        upstream_failed))
+
+    def get_many(self, request_urls):
+        """
+        Looks up the request URLs into the decorated cache at once,
+        decompressing the responses which were compressed.
+
+        :param request_urls: the URLs that uniquely identify the requests
+            whose responses are to be looked up
+        :type request_urls: list of str
+        :returns: a list holding - for each request URL, in the same order -
+            the response as in ``get`` in case of hit or ``None`` otherwise
+
+        """
+        return [self._decompressed(value)
+                for value in self._cache.get_many(request_urls)]
+
+    @staticmethod
+    def _decompressed(value):
+        if isinstance(value, bytes) and value[:1] == _MARKER:
+            return _DECOMPRESSORS[value[1:2]](value[2:])
+        return value
+
+    def set(self, request_url, response_json):
+        """
+        Stores the response_json into the decorated cache, compressed in case
+        its JSON text is not smaller than the size threshold.
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str/bytes
+
+        """
+        self._cache.set(request_url, self._compressed(response_json))
+
+    def set_many(self, responses):
+        """
+        Stores the responses into the decorated cache at once, compressed in
+        case their JSON text is not smaller than the size threshold.
+
+        :param responses: the response JSONs by request URL
+        :type responses: dict
+
+        """
+        self._cache.set_many({request_url: self._compressed(response_json)
+                              for request_url, response_json in responses.items()})
+
+    def _compressed(self, response_json):
+        if isinstance(response_json, bytes):
+            data = response_json
+        elif isinstance(response_json, str):
+            data = response_json.encode('utf-8')
+        else:
+            data = jsoncodec.dumpb(response_json)
+        if len(data) < self._threshold_bytes:
+            return response_json
+        return _MARKER + self._codec_id + self._compress(data, self._level)
+
+    def clean(self):
+        """
+        Empties the decorated cache
+
+        """
+        self._cache.clean()
+
+    def size(self):
+        """
+        Returns the number of elements that are currently stored into the
+        decorated cache
+
+        :returns: an int
+
+        """
+        return self._cache.size()
+
+    def size_bytes(self):
+        """
+        Returns the size in bytes of the elements that are currently stored
+        into the decorated cache, as they are stored (ie: compressed)
+
+        :returns: an int
+
+        """
+        return self._cache.size_bytes()
+
+    def is_thread_safe(self):
+        """
+        Tells whether the decorated cache can be used by many threads at the
+        same time
+
+        :returns: a bool
+
+        """
+        return self._cache.is_thread_safe()
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the decorated cache
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return self._cache.stats(reset)
+
+    def __repr__(self):
+        return "<%s.%s - cache=%s, codec=%s, level=%s, threshold bytes=%s>" % \
+            (__name__, self.__class__.__name__, repr(self._cache), self._codec,
+             self._level, self._threshold_bytes)
@@ -2,43 +2,105 @@
 Module containing LRU cache related class
 """
 
+import threading
+from collections import OrderedDict
+from time import monotonic
+from pyowm.commons import jsoncodec
 from pyowm.abstractions import owmcache
-from pyowm.commons import frontlinkedlist
-from pyowm.utils import timeutils
+from pyowm.caches.cachestats import CacheStats, clock_ns, NoLock
+
+
+def encoded_size(response_json):
+    """
+    Returns the size in bytes of the encoded JSON response
+
+    :param response_json: the JSON response
+    :type response_json: decoded JSON data or str/bytes
+    :returns: an int
+
+    """
+    if isinstance(response_json, bytes):
+        return len(response_json)
+    if isinstance(response_json, str):
+        return len(response_json.encode('utf-8'))
+    return len(jsoncodec.dumpb(response_json))
 
 
 class LRUCache(owmcache.OWMCache):
     """
-    This cache is made out of a 'table' dict and the 'usage_recency' linked
-    list.'table' maps uses requests' URLs as keys and stores JSON raw responses
-    as values. 'usage_recency' tracks down the "recency" of the OWM Weather API
-    requests: the more recent a request, the more the element will be far from
-    the "death" point of the recency list. Items in 'usage_recency' are the
-    requests' URLs themselves.
+    This cache is made out of a 'table' ordered dict, which maps requests' URLs
+    to JSON responses and their insertion times and also tracks down the
+    "recency" of the OWM Weather API requests: the more recent a request, the
+    closer its item is to the end of 'table', while the least recently used
+    item is always the first one.
     The implemented LRU caching mechanism is the following:
 
-    - cached elements must expire after a certain time passed into the cache.
-      So when an element is looked up and found in the cache, its insertion
-      timestamp is compared to the current one: if the difference is higher
-      than a prefixed value, then the lookup is considered a MISS: the
-      element is removed either from 'table' and from 'usage_recency' and must
-      be requested again to the OWM Weather API. If the time difference is ok,
-      then the lookup is considered a HIT.
-    - when a GET results in a HIT, promote the element to the front of the
-      recency list updating its cache insertion timestamp and return the
-      data to the cache clients
+    - cached elements must expire after a certain time passed into the cache,
+      which is either the same for all elements or assigned to each element
+      by a *TTLPolicy* according to the OWM API endpoint it comes from. So
+      when an element is looked up and found in the cache, its expiration
+      timestamp is compared to the current one: if it has been reached, then
+      the lookup is considered a MISS: the element is removed from 'table'
+      and must be requested again to the OWM Weather API. Otherwise, the
+      lookup is considered a HIT.
+    - when a GET results in a HIT, move the element to the end of 'table' and
+      return the data to the cache clients: hits do not postpone expiration,
+      so frequently looked up elements are not served stale
     - when a GET results in a MISS, return ``None``
-    - when a SET is issued, check if the maximum size of the cache has
-      been reached: if so, discard the least recently used item from the
-      recency list and the dict; then add the element to 'table' recording its
-      timestamp and finally add it at the front of the recency list.
+    - when a SET is issued for a new element, check if the maximum size of the
+      cache has been reached: if so, discard the least recently used item;
+      then add the element to the end of 'table' recording its expiration
+      timestamp.
+    - when the cache is given a byte budget, the encoded size of each element
+      is recorded as well and least recently used items are discarded until
+      the new element fits the budget. Elements larger than the whole budget
+      are not cached at all.
+    - when the cache is given stale-while-revalidate or stale-if-error grace
+      periods, expired elements are kept in 'table' until the longest grace
+      period is over, so that they can still be looked up with
+      ``get_stale``: GETs still consider them a MISS.
+    - statistics about hits, misses, expirations, evictions and latencies are
+      recorded by endpoint, as well as the bytes stored when the cache has a
+      byte budget (see ``stats``).
+
+    All of the operations take constant time, regardless of the cache size.
+    The cache is not thread-safe unless it is synchronized, which it is by
+    default when grace periods are given: expired items are then refreshed
+    in background threads (see *HttpClient*) while being looked up.
+    Timestamps are taken from a monotonic clock, so that items expiration is
+    not affected by system clock adjustments.
 
     :param cache_max_size: the maximum size of the cache in terms of cached
         OWM Weather API responses. A reasonable default value is provided.
+        It can be ``None`` only when a byte budget is provided, meaning that
+        the number of cached responses is not limited
     :type cache_max_size: int
     :param item_lifetime_millis: the maximum lifetime allowed for a cache item
         in milliseconds. A reasonable default value is provided.
     :type item_lifetime_millis: int
+    :param ttl_policy: the policy assigning lifetimes to cache items according
+        to their request URLs (eg: ``configuration25.cache_ttl_policy``): items
+        whose URL is not matched by the policy last ``item_lifetime_millis``.
+        Defaults to ``None``, meaning that all items last
+        ``item_lifetime_millis``
+    :type ttl_policy: *TTLPolicy*
+    :param max_bytes: the byte budget of the cache, in terms of encoded size
+        of the cached OWM Weather API responses. Defaults to ``None``, meaning
+        that the cache is only bounded by the number of cached responses
+    :type max_bytes: int
+    :param stale_while_revalidate_millis: how long in milliseconds expired
+        items can be served while they are refreshed in background. Defaults
+        to 0, meaning that expired items are never served
+    :type stale_while_revalidate_millis: int
+    :param stale_if_error_millis: how long in milliseconds expired items can
+        be served when the OWM Weather API fails to provide fresh ones.
+        Defaults to 0, meaning that expired items are never served
+    :type stale_if_error_millis: int
+    :param synchronized: whether the operations are serialized under a lock.
+        Defaults to ``None``, meaning only when a grace period is given:
+        caches which serialize their operations on their own (eg:
+        *StripedLRUCache*) can do without it
+    :type synchronized: bool
     :returns: a new *LRUCache* instance
 
     """
@@ -47,93 +109,182 @@ class LRUCache(owmcache.OWMCache):
     _ITEM_LIFETIME_MILLISECONDS = 1000 * 60 * 10  # Ten minutes
 
     def __init__(self, cache_max_size=_CACHE_MAX_SIZE,
-                 item_lifetime_millis=_ITEM_LIFETIME_MILLISECONDS):
-        assert cache_max_size > 0 and item_lifetime_millis > 0, \
+                 item_lifetime_millis=_ITEM_LIFETIME_MILLISECONDS,
+                 ttl_policy=None, max_bytes=None,
+                 stale_while_revalidate_millis=0, stale_if_error_millis=0,
+                 synchronized=None):
+        assert item_lifetime_millis > 0, "wrong cache init parameters"
+        assert stale_while_revalidate_millis >= 0 and stale_if_error_millis >= 0, \
+            "wrong cache init parameters"
+        assert cache_max_size is None or cache_max_size > 0, \
             "wrong cache init parameters"
-        self._table = {}
-        self._usage_recency = frontlinkedlist.FrontLinkedList()
+        assert max_bytes is None or max_bytes > 0, "wrong cache init parameters"
+        assert cache_max_size is not None or max_bytes is not None, \
+            "the cache must be bounded either in size or in bytes"
+        self._table = OrderedDict()
         self._max_size = cache_max_size
         self._item_lifetime = item_lifetime_millis
+        self._ttl_policy = ttl_policy
+        self._max_bytes = max_bytes
+        self._bytes = 0  # only tracked when a byte budget is given
+        self._stale_while_revalidate = stale_while_revalidate_millis / 1000.
+        self._stale_if_error = stale_if_error_millis / 1000.
+        # expired items are kept as long as any grace period applies
+        self._retention = max(self._stale_while_revalidate,
+                              self._stale_if_error)
+        if synchronized is None:
+            synchronized = self._retention > 0
+        self._lock = threading.Lock() if synchronized else NoLock()
+        self._stats = CacheStats(track_bytes=max_bytes is not None,
+                                 synchronized=False)
+
+    def _lifetime_secs(self, request_url):
+        lifetime = None
+        if self._ttl_policy is not None:
+            lifetime = self._ttl_policy.lifetime_for(request_url)
+        if lifetime is None:
+            lifetime = self._item_lifetime
+        return lifetime / 1000.
 
     def get(self, request_url):
         """
-        In case of a hit, returns the JSON string which represents the OWM web
+        In case of a hit, returns the JSON data which represents the OWM web
         API response to the request being identified by a specific string URL
         and updates the recency of this request.
 
         :param request_url: an URL that uniquely identifies the request whose
             response is to be looked up
         :type request_url: str
-        :returns: a JSON str in case of cache hit or ``None`` otherwise
+        :returns: the cached JSON data in case of cache hit or ``None``
+            otherwise
 
         """
-        try:
-            cached_item = self._table[request_url]
-            cur_time = timeutils.now('unix')
-            if cur_time - cached_item['insertion_time'] > self._item_lifetime:
-                # Cache item has expired
-                self._clean_item(request_url)
-                return None
-            cached_item['insertion_time'] = cur_time  # Update insertion time
-            self._promote(request_url)
-            return cached_item['data']
-        except:
+        with self._lock:
+            start = clock_ns()
+            data = self._lookup(request_url)
+            self._stats.record_get(request_url, data is not None,
+                                   clock_ns() - start)
+            return data
+
+    def _lookup(self, request_url):
+        cached_item = self._table.get(request_url)
+        if cached_item is None:
             return None
+        now = monotonic()
+        if now >= cached_item[1]:
+            # Cache item has expired
+            if now >= cached_item[1] + self._retention:
+                self._clean_item(request_url, expired=True)
+            return None
+        self._table.move_to_end(request_url)
+        return cached_item[0]
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Returns the JSON data which represents the OWM web API response to the
+        request being identified by a specific string URL if it has not
+        expired yet or if it is within the stale-while-revalidate grace period
+        (the stale-if-error one when ``upstream_failed`` is ``True``) after its
+        expiration, and updates the recency of this request.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the cached JSON data in case of hit or ``None`` otherwise
+
+        """
+        with self._lock:
+            return self._lookup_stale(request_url, upstream_failed)
+
+    def _lookup_stale(self, request_url, upstream_failed):
+        cached_item = self._table.get(request_url)
+        if cached_item is None:
+            return None
+        grace = self._stale_if_error if upstream_failed \
+            else self._stale_while_revalidate
+        now = monotonic()
+        if now >= cached_item[1] + grace:
+            if now >= cached_item[1] + self._retention:
+                self._clean_item(request_url, expired=True)
+            return None
+        self._table.move_to_end(request_url)
+        return cached_item[0]
 
     def set(self, request_url, response_json):
         """
-        Checks if the maximum size of the cache has been reached and in case
-        discards the least recently used item from 'usage_recency' and 'table';
-        then adds the response_json to be cached to the 'table' dict using as
-        a lookup key the request_url of the request that generated the value;
-        finally adds it at the front of 'usage_recency'
+        Adds the response_json to be cached to the end of the 'table' dict
+        using as a lookup key the request_url of the request that generated
+        the value; if the maximum size or the byte budget of the cache would
+        be exceeded, the least recently used items are discarded first.
 
         :param request_url: the request URL that uniquely identifies the
             request whose response is to be cached
         :type request_url: str
         :param response_json: the response JSON to be cached
-        :type response_json: str
+        :type response_json: decoded JSON data or str
 
         """
-        if self.size() == self._max_size:
-            popped = self._usage_recency.pop()
-            del self._table[popped]
-        current_time = timeutils.now('unix')
-        if request_url not in self._table:
-            self._table[request_url] = {'data': response_json,
-                                        'insertion_time': current_time}
-            self._usage_recency.add(request_url)
-        else:
-            self._table[request_url]['insertion_time'] = current_time
-            self._promote(request_url)
+        with self._lock:
+            self._store(request_url, response_json)
 
-    def _promote(self, request_url):
-        """
-        Moves the cache item specified by request_url to the front of the
-        'usage_recency' list
-        """
-        self._usage_recency.remove(request_url)
-        self._usage_recency.add(request_url)
+    def _store(self, request_url, response_json):
+        start = clock_ns()
+        nbytes = None
+        if self._max_bytes is not None:
+            nbytes = encoded_size(response_json)
+            if nbytes > self._max_bytes:
+                # would not fit even into an empty cache: also drop the
+                # previously cached response, which is older
+                self._clean_item(request_url)
+                self._stats.record_set(request_url, clock_ns() - start)
+                return
+        self._clean_item(request_url)
+        while self._table and self._is_full(nbytes):
+            self._clean_item(next(iter(self._table)), evicted=True)
+        self._table[request_url] = \
+            (response_json, monotonic() + self._lifetime_secs(request_url), nbytes)
+        if nbytes is not None:
+            self._bytes += nbytes
+        self._stats.record_set(request_url, clock_ns() - start, nbytes)
+
+    def _is_full(self, nbytes):
+        if self._max_size is not None and len(self._table) >= self._max_size:
+            return True
+        return nbytes is not None and self._bytes + nbytes > self._max_bytes
 
-    def _clean_item(self, request_url):
+    def _clean_item(self, request_url, expired=False, evicted=False):
         """
-        Removes the specified item from the cache's datastructures
+        Removes the specified item from the cache, if present
 
         :param request_url: the request URL
         :type request_url: str
+        :param expired: whether the item is removed because expired
+        :type expired: bool
+        :param evicted: whether the item is evicted to make room for others
+        :type evicted: bool
 
         """
-        del self._table[request_url]
-        self._usage_recency.remove(request_url)
+        cached_item = self._table.pop(request_url, None)
+        if cached_item is None:
+            return
+        if cached_item[2] is not None:
+            self._bytes -= cached_item[2]
+        if cached_item[2] is not None or expired or evicted:
+            self._stats.record_removal(request_url, cached_item[2], expired,
+                                       evicted)
 
     def clean(self):
         """
         Empties the cache
 
         """
-        self._table.clear()
-        for item in self._usage_recency:
-            self._usage_recency.remove(item)
+        with self._lock:
+            self._table.clear()
+            self._bytes = 0
+            self._stats.clear_bytes()
 
     def size(self):
         """
@@ -144,7 +295,48 @@ class LRUCache(owmcache.OWMCache):
         """
         return len(self._table)
 
+    def size_bytes(self):
+        """
+        Returns the overall encoded size in bytes of the elements that are
+        currently stored into the cache. It takes constant time when the cache
+        has a byte budget, while it requires encoding all of the elements
+        otherwise.
+
+        :returns: an int
+
+        """
+        with self._lock:
+            if self._max_bytes is not None:
+                return self._bytes
+            items = list(self._table.values())
+        return sum(encoded_size(item[0]) for item in items)
+
+    def is_thread_safe(self):
+        """
+        Tells whether the cache can be used by many threads at the same time,
+        which is the case only when it is synchronized
+
+        :returns: a bool
+
+        """
+        return not isinstance(self._lock, NoLock)
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache, broken down by OWM
+        API endpoint (see ``CacheStats.snapshot``). Bytes stored are only
+        tracked when the cache has a byte budget.
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        with self._lock:
+            return self._stats.snapshot(reset)
+
     def __repr__(self):
-        return "<%s.%s - size=%s, max size=%s, item lifetime=%s>" % \
+        return "<%s.%s - size=%s, max size=%s, max bytes=%s, item lifetime=%s>" % \
             (__name__, self.__class__.__name__, str(self.size()),
-             self._max_size, self._item_lifetime)
+             self._max_size, self._max_bytes, self._item_lifetime)
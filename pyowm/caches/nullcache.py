@@ -3,12 +3,15 @@ Module containing a null-object cache for OWM Weather API responses
 """
 
 from pyowm.abstractions import owmcache
+from pyowm.caches.cachestats import CacheStats
 
 
 class NullCache(owmcache.OWMCache):
 
     """
-    A null-object implementation of the *OWMCache* abstract class
+    A null-object implementation of the *OWMCache* abstract class. It keeps
+    no state, so that a single instance can be shared by any number of
+    clients, and records no statistics.
 
     """
 
@@ -38,5 +41,26 @@ class NullCache(owmcache.OWMCache):
         """
         pass
 
+    def is_thread_safe(self):
+        """
+        Returns ``True``, as the cache keeps no state
+
+        :returns: a bool
+
+        """
+        return True
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache (see
+        ``CacheStats.snapshot``), which are always empty
+
+        :param reset: ignored
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return CacheStats().snapshot()
+
     def __repr__(self):
         return "<%s.%s>" % (__name__, self.__class__.__name__)
@@ -0,0 +1,150 @@
+"""
+Module containing a cache of the domain objects parsed out of OWM API responses
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+
+
+def _copy(obj):
+    """
+    Returns a shallow copy of the object: the ``__copy__`` hook is used when
+    the class defines one, while the instance dict is copied straight away
+    otherwise, which is several times faster than ``copy.copy``
+
+    """
+    cls = type(obj)
+    if hasattr(cls, '__copy__'):
+        return obj.__copy__()
+    state = getattr(obj, '__dict__', None)
+    if state is None:
+        return copy.copy(obj)
+    clone = object.__new__(cls)
+    clone.__dict__.update(state)
+    return clone
+
+
+def _copied(result):
+    """
+    Returns a shallow copy of a parsed result, which is either an object, a
+    list of objects or ``None``
+
+    """
+    if result is None:
+        return None
+    if isinstance(result, list):
+        return [_copy(item) for item in result]
+    return _copy(result)
+
+
+class ObjectCache(object):
+    """
+    A cache of the domain objects (eg: *Observation*, *Forecast*, *UVIndex*,
+    *COIndex*) parsed out of OWM API responses, so that responses served by
+    the responses cache are not parsed again and again: a hit costs a dict
+    lookup and a shallow copy instead of a parse.
+    Parsed objects are keyed by the identity of the parser and of the decoded
+    JSON data they were parsed from, which is the very object returned by
+    in-process responses caches (eg: *LRUCache*, *StripedLRUCache* or a
+    *TieredCache* with such an L1) as long as they keep the response:
+    entries are therefore never stale. Caches returning JSON text (eg:
+    *SQLiteCache*, *RedisCache*) decode a new object on every lookup, so
+    their responses are never hit.
+    Entries hold references to the JSON data, so that their identities
+    cannot be reused while they are in the cache, and are discarded in
+    least recently used order once ``max_size`` is reached.
+    Cached objects are never handed out: each hit returns a shallow copy
+    of them - or a list of shallow copies - so that mutating calls (eg:
+    ``Forecast.actualize``, ``Forecast.set_interval``) only affect the copy.
+    Copies share the nested objects, whose getters return copies of their
+    mutable containers.
+
+    :param max_size: the maximum number of parsed results to be kept. A
+        reasonable default value is provided.
+    :type max_size: int
+    :returns: a new *ObjectCache* instance
+
+    """
+
+    _MAX_SIZE = 1000
+
+    def __init__(self, max_size=_MAX_SIZE):
+        assert max_size > 0, "wrong cache init parameters"
+        self._max_size = max_size
+        self._table = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def parse(self, parser, json_data):
+        """
+        Returns a copy of the object parsed by the parser out of the JSON
+        data, parsing it only if it is not cached yet.
+
+        :param parser: the parser of the JSON data
+        :type parser: a *jsonparser* concrete instance
+        :param json_data: the decoded JSON data
+        :type json_data: dict
+        :returns: a copy of the parsed object, a list of copies of the parsed
+            objects or ``None``
+        :raises: the same exceptions as ``parser.parse_dict``
+
+        """
+        key = (id(parser), id(json_data))
+        with self._lock:
+            entry = self._table.get(key)
+            hit = entry is not None and entry[1] is json_data
+            if hit:
+                self._table.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if hit:
+            return _copied(entry[2])
+        result = parser.parse_dict(json_data)
+        with self._lock:
+            self._table[key] = (parser, json_data, result)
+            self._table.move_to_end(key)
+            while len(self._table) > self._max_size:
+                self._table.popitem(last=False)
+        return _copied(result)
+
+    def clean(self):
+        """
+        Empties the cache
+
+        """
+        with self._lock:
+            self._table.clear()
+
+    def size(self):
+        """
+        Returns the number of parsed results that are currently cached
+
+        :returns: an int
+
+        """
+        return len(self._table)
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict with keys 'hits', 'misses' and 'size'
+
+        """
+        with self._lock:
+            snapshot = dict(hits=self._hits, misses=self._misses,
+                            size=len(self._table))
+            if reset:
+                self._hits = self._misses = 0
+        return snapshot
+
+    def __repr__(self):
+        return "<%s.%s - size=%s, max size=%s>" % \
+            (__name__, self.__class__.__name__, len(self._table),
+             self._max_size)
@@ -0,0 +1,396 @@
+"""
+Module containing a cache backed by a remote key-value store speaking the
+Redis protocol (RESP)
+"""
+
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from pyowm.commons import jsoncodec
+from pyowm.abstractions import owmcache
+from pyowm.caches.cachestats import CacheStats, clock_ns
+from pyowm.exceptions.cache_error import CacheError
+
+_CRLF = b'\r\n'
+
+# Number of keys fetched by each SCAN iteration
+_SCAN_COUNT = 1000
+
+
+def _encode_command(*args):
+    """
+    Encodes a command as a RESP array of bulk strings
+
+    """
+    # headers are formatted as str, as bytes formatting requires Python 3.5
+    chunks = [('*%d\r\n' % len(args)).encode('ascii')]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode('utf-8')
+        elif isinstance(arg, int):
+            arg = str(arg).encode('ascii')
+        chunks.append(('$%d\r\n' % len(arg)).encode('ascii'))
+        chunks.append(arg)
+        chunks.append(_CRLF)
+    return b''.join(chunks)
+
+
+def _read_reply(stream):
+    """
+    Reads a RESP reply from a binary stream: errors replied by the server are
+    returned as *CacheError* instances, so that the remaining replies of a
+    pipeline can be read anyway
+
+    """
+    line = stream.readline()
+    if not line.endswith(_CRLF):
+        raise CacheError('Connection closed by the server')
+    kind, payload = line[:1], line[1:-2]
+    if kind == b'+':
+        return payload.decode('utf-8')
+    if kind == b'-':
+        return CacheError(payload.decode('utf-8', 'replace'))
+    if kind == b':':
+        return int(payload)
+    if kind == b'$':
+        length = int(payload)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise CacheError('Connection closed by the server')
+        return data[:-2]
+    if kind == b'*':
+        length = int(payload)
+        if length < 0:
+            return None
+        return [_read_reply(stream) for _ in range(length)]
+    raise CacheError('Unexpected reply from the server: %r' % line)
+
+
+class _Connection(object):
+
+    def __init__(self, host, port, timeout):
+        self._socket = socket.create_connection((host, port), timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._stream = self._socket.makefile('rb')
+
+    def execute(self, commands):
+        """
+        Sends the commands in a single write and reads their replies
+
+        """
+        self._socket.sendall(b''.join(_encode_command(*command)
+                                      for command in commands))
+        return [_read_reply(self._stream) for _ in commands]
+
+    def close(self):
+        self._stream.close()
+        self._socket.close()
+
+
+class RedisCache(owmcache.OWMCache):
+    """
+    A cache storing OWM API responses into a remote key-value store speaking
+    the Redis protocol (eg: Redis, KeyDB, Valkey), so that cached responses
+    are shared by all of the processes and hosts pointing to the same store.
+    No client library is needed: commands are issued over plain sockets.
+    Responses are stored as raw JSON text - or as the bytes that were given
+    (eg: compressed by a *CompressedCache*) - under keys made out of a prefix
+    and the request URL, and looked up as bytes. They expire after a certain
+    time passed into the cache, which is either the same for all of them or
+    assigned to each one by a *TTLPolicy*: expiration and eviction are left
+    to the store, which should be configured with a memory budget and an LRU
+    eviction policy.
+    Multi-key lookups (``get_many``) take a single round trip, as well as
+    multi-key insertions (``set_many``), which are pipelined: bulk queries
+    (eg: ``OWM25.weather_at_ids``) look up all of their responses at once.
+    Connections are pooled and can be used by many threads. Lookups and
+    insertions are not meant to fail because of the store: when it cannot be
+    used (network failures or errors replied by it), lookups miss and
+    insertions are skipped, and both are counted as errors into the
+    statistics; the other operations raise *CacheError* instead.
+    Statistics are collected by each process and do not include expirations
+    and evictions, which happen into the store.
+
+    :param host: the store hostname. Defaults to 'localhost'
+    :type host: str
+    :param port: the store port. Defaults to 6379
+    :type port: int
+    :param db: the store database number. Defaults to 0
+    :type db: int
+    :param password: the store password. Defaults to ``None``, meaning that
+        no authentication is performed
+    :type password: str
+    :param key_prefix: the prefix of the keys of the cached responses, which
+        keeps them apart from other data into the same database
+    :type key_prefix: str
+    :param item_lifetime_millis: the maximum lifetime allowed for a cache item
+        in milliseconds. A reasonable default value is provided.
+    :type item_lifetime_millis: int
+    :param ttl_policy: the policy assigning lifetimes to cache items according
+        to their request URLs, as in *LRUCache*
+    :type ttl_policy: *TTLPolicy*
+    :param timeout: the timeout in seconds for connecting to the store and for
+        its replies. A reasonable default value is provided.
+    :type timeout: float
+    :param max_idle_connections: the maximum number of idle connections kept
+        open for later use. A reasonable default value is provided.
+    :type max_idle_connections: int
+    :returns: a new *RedisCache* instance
+
+    """
+
+    _KEY_PREFIX = 'pyowm:'
+    _ITEM_LIFETIME_MILLISECONDS = 1000 * 60 * 10  # Ten minutes
+    _TIMEOUT_SECONDS = 5.
+    _MAX_IDLE_CONNECTIONS = 8
+
+    def __init__(self, host='localhost', port=6379, db=0, password=None,
+                 key_prefix=_KEY_PREFIX,
+                 item_lifetime_millis=_ITEM_LIFETIME_MILLISECONDS,
+                 ttl_policy=None, timeout=_TIMEOUT_SECONDS,
+                 max_idle_connections=_MAX_IDLE_CONNECTIONS):
+        assert item_lifetime_millis > 0 and timeout > 0, \
+            "wrong cache init parameters"
+        assert max_idle_connections >= 0, "wrong cache init parameters"
+        self._host = host
+        self._port = port
+        self._db = db
+        self._password = password
+        self._key_prefix = key_prefix
+        self._item_lifetime = item_lifetime_millis
+        self._ttl_policy = ttl_policy
+        self._timeout = timeout
+        self._max_idle_connections = max_idle_connections
+        self._lock = threading.Lock()
+        self._idle = []
+        self._pid = os.getpid()
+        self._stats = CacheStats()
+
+    def _connect(self):
+        connection = _Connection(self._host, self._port, self._timeout)
+        commands = []
+        if self._password is not None:
+            commands.append(('AUTH', self._password))
+        if self._db:
+            commands.append(('SELECT', self._db))
+        try:
+            for reply in connection.execute(commands):
+                if isinstance(reply, CacheError):
+                    raise reply
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    @contextmanager
+    def _connection(self):
+        with self._lock:
+            # connections cannot be inherited by forked processes
+            if self._pid != os.getpid():
+                self._idle = []
+                self._pid = os.getpid()
+            connection = self._idle.pop() if self._idle else None
+        try:
+            if connection is None:
+                connection = self._connect()
+            yield connection
+        except Exception as e:
+            # the connection is in an unknown state
+            if connection is not None:
+                connection.close()
+            if isinstance(e, (OSError, ValueError)):
+                raise CacheError('Unable to talk to the store', e)
+            raise
+        with self._lock:
+            if len(self._idle) < self._max_idle_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def _execute(self, commands):
+        with self._connection() as connection:
+            replies = connection.execute(commands)
+        for reply in replies:
+            if isinstance(reply, CacheError):
+                raise reply
+        return replies
+
+    def _key(self, request_url):
+        return self._key_prefix + request_url
+
+    def _lifetime_millis(self, request_url):
+        lifetime = None
+        if self._ttl_policy is not None:
+            lifetime = self._ttl_policy.lifetime_for(request_url)
+        if lifetime is None:
+            lifetime = self._item_lifetime
+        return int(lifetime)
+
+    @staticmethod
+    def _encoded(response_json):
+        if isinstance(response_json, bytes):
+            return response_json
+        if isinstance(response_json, str):
+            return response_json.encode('utf-8')
+        return jsoncodec.dumpb(response_json)
+
+    def get(self, request_url):
+        """
+        In case of a hit, returns the JSON text which represents the OWM web
+        API response to the request being identified by a specific string URL.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: the JSON text as bytes in case of cache hit or ``None``
+            otherwise, or when the store cannot be used
+
+        """
+        return self.get_many([request_url])[0]
+
+    def get_many(self, request_urls):
+        """
+        Looks up the responses to many requests in a single round trip.
+
+        :param request_urls: the URLs that uniquely identify the requests
+            whose responses are to be looked up
+        :type request_urls: list of str
+        :returns: a list holding - for each request URL, in the same order -
+            the JSON text as bytes in case of cache hit or ``None`` otherwise,
+            or when the store cannot be used
+
+        """
+        if not request_urls:
+            return []
+        start = clock_ns()
+        command = ['MGET'] + [self._key(request_url) for request_url in request_urls]
+        try:
+            values = self._execute([command])[0]
+        except CacheError:
+            values = [None] * len(request_urls)
+            for request_url in request_urls:
+                self._stats.record_error(request_url)
+        elapsed = clock_ns() - start
+        for request_url, value in zip(request_urls, values):
+            self._stats.record_get(request_url, value is not None, elapsed)
+        return values
+
+    def set(self, request_url, response_json):
+        """
+        Stores the JSON text of the response_json, which expires after its
+        lifetime.
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str/bytes
+
+        """
+        self.set_many({request_url: response_json})
+
+    def set_many(self, responses):
+        """
+        Stores many responses in a single round trip, pipelining their
+        insertions. When the store cannot be used, the insertions are skipped.
+
+        :param responses: the response JSONs by request URL
+        :type responses: dict
+
+        """
+        if not responses:
+            return
+        start = clock_ns()
+        try:
+            self._execute([('SET', self._key(request_url),
+                            self._encoded(response_json),
+                            'PX', self._lifetime_millis(request_url))
+                           for request_url, response_json in responses.items()])
+        except CacheError:
+            for request_url in responses:
+                self._stats.record_error(request_url)
+            return
+        elapsed = clock_ns() - start
+        for request_url in responses:
+            self._stats.record_set(request_url, elapsed)
+
+    def _keys(self):
+        """
+        Yields the batches of the keys of the cached responses
+
+        """
+        cursor = b'0'
+        while True:
+            cursor, keys = self._execute([('SCAN', cursor,
+                                           'MATCH', self._key_prefix + '*',
+                                           'COUNT', _SCAN_COUNT)])[0]
+            if keys:
+                yield keys
+            if cursor == b'0':
+                return
+
+    def clean(self):
+        """
+        Removes all of the cached responses from the store, leaving any other
+        key untouched
+
+        :raises: *CacheError* when the store cannot be used
+
+        """
+        for keys in self._keys():
+            self._execute([['DEL'] + keys])
+
+    def size(self):
+        """
+        Returns the number of responses that are currently stored. The keys of
+        the store are scanned, so this takes time proportional to their
+        number.
+
+        :returns: an int
+        :raises: *CacheError* when the store cannot be used
+
+        """
+        return sum(len(keys) for keys in self._keys())
+
+    def size_bytes(self):
+        """
+        Returns the size in bytes of the JSON text of the responses that are
+        currently stored. The keys of the store are scanned, so this takes
+        time proportional to their number.
+
+        :returns: an int
+        :raises: *CacheError* when the store cannot be used
+
+        """
+        return sum(sum(self._execute([('STRLEN', key) for key in keys]))
+                   for keys in self._keys())
+
+    def is_thread_safe(self):
+        """
+        Returns ``True``, as connections are pooled
+
+        :returns: a bool
+
+        """
+        return True
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache, as collected by
+        this process (see ``CacheStats.snapshot``)
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return self._stats.snapshot(reset)
+
+    def __repr__(self):
+        return "<%s.%s - host=%s, port=%s, db=%s, key prefix=%s>" % \
+            (__name__, self.__class__.__name__, self._host, self._port,
+             self._db, self._key_prefix)
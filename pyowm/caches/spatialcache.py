@@ -0,0 +1,280 @@
+"""
+Module containing a cache decorator serving responses to coordinates queries
+from nearby cached locations
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from pyowm.abstractions import owmcache
+from pyowm.utils import geo
+
+# Coordinates embedded into URL paths (eg: the Air Pollution API ones)
+_PATH_COORDS = re.compile(r'/(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)(?=/|$)')
+
+_KM_PER_DEGREE = math.pi * geo.EARTH_RADIUS_KM / 180.
+
+
+def _distance_km(lat1, lon1, lat2, lon2):
+    # haversine formula
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2.) ** 2 + \
+        math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2.) ** 2
+    return 2. * geo.EARTH_RADIUS_KM * math.asin(min(1., math.sqrt(a)))
+
+
+class SpatialCache(owmcache.OWMCache):
+    """
+    A decorator for any *OWMCache* implementation, serving the responses to
+    queries about geographic coordinates (eg: ``weather_at_coords``,
+    ``three_hours_forecast_at_coords``, ``uvindex_around_coords`` and the air
+    pollution queries) from the cached responses about the nearest location
+    within a configurable radius, when the exact coordinates are not cached.
+    This raises the hit rate of queries about positions differing only
+    slightly (eg: the GPS positions of mobile devices), at the price of
+    returning responses about locations which are up to the radius away:
+    such responses report the coordinates of the location they are about.
+    Queries only match cached responses to the same endpoint with the same
+    query params - coordinates apart (eg: a different language or results
+    count makes no match).
+    Cached coordinates are indexed on a grid, whose cells are as wide as the
+    radius: lookups take constant time, regardless of the number of indexed
+    locations. The index is bounded and forgets the least recently indexed
+    locations first; it also forgets the locations whose responses are not
+    found into the decorated cache anymore.
+
+    :param cache: the decorated cache
+    :type cache: an *OWMCache* concrete instance
+    :param radius_km: the maximum distance in kilometers of the location
+        whose cached response is returned from the queried coordinates. A
+        reasonable default value is provided.
+    :type radius_km: int or float
+    :param max_locations: the maximum number of locations to be indexed. A
+        reasonable default value is provided.
+    :type max_locations: int
+    :returns: a new *SpatialCache* instance
+
+    """
+
+    _RADIUS_KM = 2.
+    _MAX_LOCATIONS = 100000
+
+    def __init__(self, cache, radius_km=_RADIUS_KM, max_locations=_MAX_LOCATIONS):
+        assert radius_km > 0 and max_locations > 0, "wrong cache init parameters"
+        self._cache = cache
+        self._radius_km = radius_km
+        self._max_locations = max_locations
+        self._cell_degrees = float(radius_km) / _KM_PER_DEGREE
+        self._locations = OrderedDict()  # request URL -> (cell, lat, lon)
+        self._cells = dict()  # cell -> set of request URLs
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def locate(request_url):
+        """
+        Splits the request URL of a query about geographic coordinates into
+        the coordinates and the rest of the URL, which identifies the endpoint
+        and the other query params
+
+        :param request_url: the request URL
+        :type request_url: str
+        :returns: a (URL without coordinates, lat, lon) tuple or ``None`` in
+            case the request URL is not about geographic coordinates
+
+        """
+        parts = urlsplit(request_url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        coords = dict(param for param in query if param[0] in ('lat', 'lon'))
+        if 'lat' in coords and 'lon' in coords:
+            try:
+                lat, lon = float(coords['lat']), float(coords['lon'])
+            except ValueError:
+                return None
+            query = urlencode([param for param in query
+                               if param[0] not in ('lat', 'lon')])
+            path = parts.path
+        else:
+            match = _PATH_COORDS.search(parts.path)
+            if match is None:
+                return None
+            lat, lon = float(match.group(1)), float(match.group(2))
+            query = parts.query
+            path = parts.path[:match.start()] + '/{}' + parts.path[match.end():]
+        return urlunsplit((parts.scheme, parts.netloc, path, query, '')), lat, lon
+
+    def _row(self, lat):
+        return int(math.floor(lat / self._cell_degrees))
+
+    def _column(self, row, lon):
+        # cells are as wide as the radius at the most poleward latitude that
+        # points within the radius of the row may have, so that only the
+        # neighbouring cells are to be looked up
+        edge = (max(abs(row), abs(row + 1)) + 1) * self._cell_degrees
+        cos_edge = math.cos(math.radians(min(90., edge)))
+        if cos_edge * 360. <= self._cell_degrees:
+            return 0
+        return int(math.floor(lon * cos_edge / self._cell_degrees))
+
+    def _cell(self, base, lat, lon):
+        row = self._row(lat)
+        return base, row, self._column(row, lon)
+
+    def _nearest(self, base, lat, lon):
+        """
+        Returns the request URLs of the indexed locations within the radius
+        from the specified coordinates, nearest first
+
+        """
+        row = self._row(lat)
+        candidates = []
+        with self._lock:
+            for r in (row - 1, row, row + 1):
+                column = self._column(r, lon)
+                for c in (column - 1, column, column + 1):
+                    for url in self._cells.get((base, r, c), ()):
+                        _, other_lat, other_lon = self._locations[url]
+                        distance = _distance_km(lat, lon, other_lat, other_lon)
+                        if distance <= self._radius_km:
+                            candidates.append((distance, url))
+        candidates.sort()
+        return [url for _, url in candidates]
+
+    def _index(self, request_url, base, lat, lon):
+        with self._lock:
+            self._forget(request_url)
+            cell = self._cell(base, lat, lon)
+            self._locations[request_url] = (cell, lat, lon)
+            self._cells.setdefault(cell, set()).add(request_url)
+            while len(self._locations) > self._max_locations:
+                self._forget(next(iter(self._locations)))
+
+    def _forget(self, request_url):
+        location = self._locations.pop(request_url, None)
+        if location is None:
+            return
+        urls = self._cells[location[0]]
+        urls.discard(request_url)
+        if not urls:
+            del self._cells[location[0]]
+
+    def get(self, request_url):
+        """
+        Looks up the request URL into the decorated cache; in case of miss on
+        a query about geographic coordinates, looks up the responses about
+        the indexed locations within the radius, nearest first.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: the cached JSON data in case of cache hit or ``None``
+            otherwise
+
+        """
+        data = self._cache.get(request_url)
+        if data is not None:
+            return data
+        located = self.locate(request_url)
+        if located is None:
+            return None
+        for url in self._nearest(*located):
+            data = self._cache.get(url)
+            if data is not None:
+                return data
+            with self._lock:
+                self._forget(url)
+        return None
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Looks up the request URL into the decorated cache even though its
+        response has expired, as long as the decorated cache keeps it for the
+        applicable grace period. Only exact coordinates are matched.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the cached JSON data in case of hit or ``None`` otherwise
+
+        """
+        return self._cache.get_stale(request_url, upstream_failed)
+
+    def set(self, request_url, response_json):
+        """
+        Stores the response_json into the decorated cache and, in case it
+        answers a query about geographic coordinates, indexes its location.
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str/bytes
+
+        """
+        self._cache.set(request_url, response_json)
+        located = self.locate(request_url)
+        if located is not None:
+            self._index(request_url, *located)
+
+    def clean(self):
+        """
+        Empties the decorated cache and the index of locations
+
+        """
+        self._cache.clean()
+        with self._lock:
+            self._locations.clear()
+            self._cells.clear()
+
+    def size(self):
+        """
+        Returns the number of elements that are currently stored into the
+        decorated cache
+
+        :returns: an int
+
+        """
+        return self._cache.size()
+
+    def size_bytes(self):
+        """
+        Returns the size in bytes of the elements that are currently stored
+        into the decorated cache
+
+        :returns: an int
+
+        """
+        return self._cache.size_bytes()
+
+    def is_thread_safe(self):
+        """
+        Tells whether the decorated cache can be used by many threads at the
+        same time
+
+        :returns: a bool
+
+        """
+        return self._cache.is_thread_safe()
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the decorated cache, where
+        lookups of responses about nearby locations are recorded as lookups
+        of their own request URLs
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return self._cache.stats(reset)
+
+    def __repr__(self):
+        return "<%s.%s - cache=%s, radius km=%s, locations=%s>" % \
+            (__name__, self.__class__.__name__, repr(self._cache),
+             self._radius_km, len(self._locations))
@@ -0,0 +1,311 @@
+"""
+Module containing a persistent cache backed by a SQLite database file
+"""
+
+import os
+import sqlite3
+import threading
+from time import time
+from pyowm.commons import jsoncodec
+from pyowm.abstractions import owmcache
+from pyowm.caches.cachestats import CacheStats, clock_ns, endpoint_of
+
+
+class SQLiteCache(owmcache.OWMCache):
+    """
+    A persistent cache storing OWM API responses into a local SQLite database
+    file, so that cached responses survive application restarts and can be
+    shared by multiple processes (eg: the workers of a pre-forking web server)
+    pointing to the same file.
+    The database is used in WAL mode, so that readers do not block the writer
+    and vice versa; writers belonging to different processes wait for each
+    other up to the specified timeout. Each thread of each process uses its
+    own connection to the database.
+    Cached elements expire after a certain time passed into the cache, which is
+    either the same for all elements or assigned to each element by a
+    *TTLPolicy*; timestamps are taken from the system clock, as they are shared
+    by different processes. When the maximum size or the byte budget of the
+    cache is exceeded, expired elements are discarded first and then the least
+    recently inserted ones: eviction is first-in first-out rather than least
+    recently used, as cache hits do not write to the database, so that
+    lookups never wait for the writers. The number of elements and their
+    overall size are kept up to date in the database, so that telling whether
+    the cache is exceeded takes constant time. Responses are stored as raw
+    JSON text and looked up as such; responses given as bytes (eg: compressed
+    by a *CompressedCache*) are stored and looked up as bytes.
+
+    :param db_path: the path to the SQLite database file, which is created if
+        it does not exist
+    :type db_path: str
+    :param cache_max_size: the maximum size of the cache in terms of cached
+        OWM Weather API responses. A reasonable default value is provided.
+        It can be ``None`` only when a byte budget is provided, meaning that
+        the number of cached responses is not limited
+    :type cache_max_size: int
+    :param item_lifetime_millis: the maximum lifetime allowed for a cache item
+        in milliseconds. A reasonable default value is provided.
+    :type item_lifetime_millis: int
+    :param ttl_policy: the policy assigning lifetimes to cache items according
+        to their request URLs, as in *LRUCache*
+    :type ttl_policy: *TTLPolicy*
+    :param timeout: how long in seconds to wait for the database to be
+        unlocked by other writers. A reasonable default value is provided.
+    :type timeout: float
+    :param max_bytes: the byte budget of the cache, in terms of size of the
+        cached JSON text. Defaults to ``None``, meaning that the cache is only
+        bounded by the number of cached responses
+    :type max_bytes: int
+    :returns: a new *SQLiteCache* instance
+
+    """
+
+    _CACHE_MAX_SIZE = 10000  # Maximum number of elements that fit the cache
+    _ITEM_LIFETIME_MILLISECONDS = 1000 * 60 * 10  # Ten minutes
+    _TIMEOUT_SECONDS = 5.
+
+    def __init__(self, db_path, cache_max_size=_CACHE_MAX_SIZE,
+                 item_lifetime_millis=_ITEM_LIFETIME_MILLISECONDS,
+                 ttl_policy=None, timeout=_TIMEOUT_SECONDS, max_bytes=None):
+        assert item_lifetime_millis > 0 and timeout >= 0, \
+            "wrong cache init parameters"
+        assert cache_max_size is None or cache_max_size > 0, \
+            "wrong cache init parameters"
+        assert max_bytes is None or max_bytes > 0, "wrong cache init parameters"
+        assert cache_max_size is not None or max_bytes is not None, \
+            "the cache must be bounded either in size or in bytes"
+        self._db_path = db_path
+        self._max_size = cache_max_size
+        self._max_bytes = max_bytes
+        self._item_lifetime = item_lifetime_millis
+        self._ttl_policy = ttl_policy
+        self._timeout = timeout
+        self._local = threading.local()
+        self._stats = CacheStats()
+        self._connection()  # fail fast on unusable database files
+
+    def _connection(self):
+        # connections can be neither shared by threads nor inherited by
+        # forked processes
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self._db_path, timeout=self._timeout,
+                               isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('CREATE TABLE IF NOT EXISTS owm_cache ('
+                         'url TEXT PRIMARY KEY, '
+                         'data TEXT NOT NULL, '
+                         'size INTEGER NOT NULL, '
+                         'expires_at REAL NOT NULL, '
+                         'stored_at REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS owm_cache_stored_at '
+                         'ON owm_cache (stored_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS owm_cache_expires_at '
+                         'ON owm_cache (expires_at)')
+            # the number of rows and their overall size are kept up to date
+            # by triggers, within the transaction changing the rows, so that
+            # they need not be computed upon the whole table on each insertion
+            conn.execute('CREATE TABLE IF NOT EXISTS owm_cache_totals ('
+                         'id INTEGER PRIMARY KEY CHECK (id = 0), '
+                         'count INTEGER NOT NULL, '
+                         'bytes INTEGER NOT NULL)')
+            conn.execute('INSERT OR IGNORE INTO owm_cache_totals '
+                         'SELECT 0, COUNT(*), COALESCE(SUM(size), 0) '
+                         'FROM owm_cache')
+            conn.execute('CREATE TRIGGER IF NOT EXISTS owm_cache_inserted '
+                         'AFTER INSERT ON owm_cache BEGIN '
+                         'UPDATE owm_cache_totals SET count = count + 1, '
+                         'bytes = bytes + NEW.size; END')
+            conn.execute('CREATE TRIGGER IF NOT EXISTS owm_cache_deleted '
+                         'AFTER DELETE ON owm_cache BEGIN '
+                         'UPDATE owm_cache_totals SET count = count - 1, '
+                         'bytes = bytes - OLD.size; END')
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _lifetime_secs(self, request_url):
+        lifetime = None
+        if self._ttl_policy is not None:
+            lifetime = self._ttl_policy.lifetime_for(request_url)
+        if lifetime is None:
+            lifetime = self._item_lifetime
+        return lifetime / 1000.
+
+    def get(self, request_url):
+        """
+        In case of a hit, returns the JSON text which represents the OWM web
+        API response to the request being identified by a specific string URL.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: a JSON str (or the bytes that were stored) in case of cache
+            hit or ``None`` otherwise
+
+        """
+        start = clock_ns()
+        data = self._lookup(request_url)
+        self._stats.record_get(request_url, data is not None,
+                               clock_ns() - start)
+        return data
+
+    def _lookup(self, request_url):
+        conn = self._connection()
+        row = conn.execute('SELECT data, expires_at FROM owm_cache WHERE url = ?',
+                           (request_url,)).fetchone()
+        if row is None:
+            return None
+        data, expires_at = row
+        if time() >= expires_at:
+            # Cache item has expired
+            if conn.execute('DELETE FROM owm_cache WHERE url = ? AND expires_at = ?',
+                            (request_url, expires_at)).rowcount:
+                self._stats.record_removal(request_url, expired=True)
+            return None
+        return data
+
+    def set(self, request_url, response_json):
+        """
+        Stores the response_json into the database using as a lookup key the
+        request_url of the request that generated the value; then, if the
+        maximum size or the byte budget of the cache has been exceeded,
+        discards the expired items and the least recently inserted ones.
+        Responses larger than the whole byte budget are not cached at all.
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str/bytes
+
+        """
+        start = clock_ns()
+        self._store(request_url, response_json)
+        self._stats.record_set(request_url, clock_ns() - start)
+
+    def _store(self, request_url, response_json):
+        if isinstance(response_json, bytes):
+            data = response_json
+        elif isinstance(response_json, str):
+            data = response_json
+        else:
+            data = jsoncodec.dumps(response_json)
+        size = len(data) if isinstance(data, bytes) else len(data.encode('utf-8'))
+        now = time()
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if self._max_bytes is not None and size > self._max_bytes:
+                conn.execute('DELETE FROM owm_cache WHERE url = ?', (request_url,))
+                return
+            # no INSERT OR REPLACE, whose deletions do not fire triggers
+            conn.execute('DELETE FROM owm_cache WHERE url = ?', (request_url,))
+            conn.execute('INSERT INTO owm_cache '
+                         '(url, data, size, expires_at, stored_at) '
+                         'VALUES (?, ?, ?, ?, ?)',
+                         (request_url, data, size,
+                          now + self._lifetime_secs(request_url), now))
+            if not self._is_exceeded(conn):
+                return
+            expired = conn.execute('SELECT url FROM owm_cache WHERE expires_at <= ?',
+                                   (now,)).fetchall()
+            conn.execute('DELETE FROM owm_cache WHERE expires_at <= ?', (now,))
+            for url, in expired:
+                self._stats.record_removal(url, expired=True)
+            count, total = self._totals(conn)
+            evicted = []
+            for url, item_size in conn.execute(
+                    'SELECT url, size FROM owm_cache ORDER BY stored_at'):
+                if not self._is_exceeded(conn, count, total):
+                    break
+                evicted.append((url,))
+                count -= 1
+                total -= item_size
+            conn.executemany('DELETE FROM owm_cache WHERE url = ?', evicted)
+            for url, in evicted:
+                self._stats.record_removal(url, evicted=True)
+
+    def _totals(self, conn):
+        return conn.execute(
+            'SELECT count, bytes FROM owm_cache_totals').fetchone()
+
+    def _is_exceeded(self, conn, count=None, total=None):
+        if count is None:
+            count, total = self._totals(conn)
+        if self._max_size is not None and count > self._max_size:
+            return True
+        return self._max_bytes is not None and total > self._max_bytes
+
+    def clean(self):
+        """
+        Empties the cache
+
+        """
+        self._connection().execute('DELETE FROM owm_cache')
+
+    def size(self):
+        """
+        Returns the number of elements that are currently stored into the cache
+
+        :returns: an int
+
+        """
+        return self._totals(self._connection())[0]
+
+    def size_bytes(self):
+        """
+        Returns the overall size in bytes of the JSON text of the elements
+        that are currently stored into the cache
+
+        :returns: an int
+
+        """
+        return self._totals(self._connection())[1]
+
+    def is_thread_safe(self):
+        """
+        Returns ``True``, as each thread uses its own database connection
+
+        :returns: a bool
+
+        """
+        return True
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache, broken down by OWM
+        API endpoint (see ``CacheStats.snapshot``). Counters only cover the
+        operations of the calling process, while the bytes stored are
+        computed upon the whole database, which takes linear time.
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        bytes_by_endpoint = dict()
+        for url, size in self._connection().execute(
+                'SELECT url, size FROM owm_cache'):
+            endpoint = endpoint_of(url)
+            bytes_by_endpoint[endpoint] = bytes_by_endpoint.get(endpoint, 0) + size
+        return self._stats.snapshot(reset, bytes_by_endpoint=bytes_by_endpoint)
+
+    def close(self):
+        """
+        Closes the database connection used by the calling thread
+
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __repr__(self):
+        return "<%s.%s - db path=%s, max size=%s, max bytes=%s, item lifetime=%s>" % \
+            (__name__, self.__class__.__name__, self._db_path,
+             self._max_size, self._max_bytes, self._item_lifetime)
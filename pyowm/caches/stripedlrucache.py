@@ -0,0 +1,221 @@
+"""
+Module containing a thread-safe LRU cache, meant to be shared by the threads
+of multi-threaded applications
+"""
+
+import threading
+from pyowm.abstractions import owmcache
+from pyowm.caches import lrucache
+from pyowm.caches.cachestats import CacheStats
+
+
+class StripedLRUCache(owmcache.OWMCache):
+    """
+    A thread-safe LRU cache made out of a fixed number of stripes: each stripe
+    is an independent *LRUCache* guarded by its own lock and request URLs are
+    spread over the stripes according to their hash. Threads looking up or
+    storing different URLs are therefore unlikely to contend for the same
+    lock, while operations on the same URL are serialized.
+    Expiration of cached elements and LRU eviction work just as in
+    *LRUCache*, except that the least recently used element is discarded
+    from the stripe that is full, so that the overall cache size and byte
+    budget are never exceeded.
+    The byte budget is split over the stripes as well, so that each response
+    must fit the budget of its own stripe: responses larger than
+    ``max_bytes / stripes`` are not cached at all. When larger responses are
+    to be cached, ``max_item_bytes`` makes the stripes fewer, so that each
+    one of them can hold at least a response of that size.
+
+    :param cache_max_size: the maximum size of the cache in terms of cached
+        OWM Weather API responses. A reasonable default value is provided.
+    :type cache_max_size: int
+    :param item_lifetime_millis: the maximum lifetime allowed for a cache item
+        in milliseconds. A reasonable default value is provided.
+    :type item_lifetime_millis: int
+    :param stripes: the number of stripes, which is capped to the maximum
+        size of the cache. A reasonable default value is provided.
+    :type stripes: int
+    :param ttl_policy: the policy assigning lifetimes to cache items according
+        to their request URLs, as in *LRUCache*
+    :type ttl_policy: *TTLPolicy*
+    :param max_bytes: the byte budget of the cache, as in *LRUCache*
+    :type max_bytes: int
+    :param stale_while_revalidate_millis: how long in milliseconds expired
+        items can be served while they are refreshed, as in *LRUCache*
+    :type stale_while_revalidate_millis: int
+    :param stale_if_error_millis: how long in milliseconds expired items can
+        be served when the OWM Weather API fails, as in *LRUCache*
+    :type stale_if_error_millis: int
+    :param max_item_bytes: the size in bytes of the largest response that
+        must fit the cache, which cannot exceed ``max_bytes``. Defaults to
+        ``None``, meaning that the number of stripes is not limited by the
+        size of the responses
+    :type max_item_bytes: int
+    :returns: a new *StripedLRUCache* instance
+
+    """
+
+    _CACHE_MAX_SIZE = 1000  # Maximum number of elements that fit the cache
+    _ITEM_LIFETIME_MILLISECONDS = 1000 * 60 * 10  # Ten minutes
+    _STRIPES = 16  # Number of independently locked stripes
+
+    def __init__(self, cache_max_size=_CACHE_MAX_SIZE,
+                 item_lifetime_millis=_ITEM_LIFETIME_MILLISECONDS,
+                 stripes=_STRIPES, ttl_policy=None, max_bytes=None,
+                 stale_while_revalidate_millis=0, stale_if_error_millis=0,
+                 max_item_bytes=None):
+        assert cache_max_size is None or cache_max_size > 0, \
+            "wrong cache init parameters"
+        assert item_lifetime_millis > 0 and stripes > 0, \
+            "wrong cache init parameters"
+        assert max_item_bytes is None or \
+            (max_bytes is not None and 0 < max_item_bytes <= max_bytes), \
+            "'max_item_bytes' must be positive and must not exceed 'max_bytes'"
+        if cache_max_size is not None:
+            stripes = min(stripes, cache_max_size)
+        if max_bytes is not None:
+            stripes = min(stripes, max_bytes // (max_item_bytes or 1))
+        # spread the maximum size and the byte budget over the stripes, so
+        # that they are never exceeded
+        sizes = self._split(cache_max_size, stripes)
+        budgets = self._split(max_bytes, stripes)
+        self._stripes = [(threading.Lock(),
+                          lrucache.LRUCache(
+                              size, item_lifetime_millis, ttl_policy=ttl_policy,
+                              max_bytes=budget,
+                              stale_while_revalidate_millis=stale_while_revalidate_millis,
+                              stale_if_error_millis=stale_if_error_millis,
+                              synchronized=False))
+                         for size, budget in zip(sizes, budgets)]
+        self._max_size = cache_max_size
+        self._max_bytes = max_bytes
+        self._item_lifetime = item_lifetime_millis
+
+    @staticmethod
+    def _split(total, parts):
+        if total is None:
+            return [None] * parts
+        return [total // parts + (1 if i < total % parts else 0)
+                for i in range(parts)]
+
+    def _stripe_for(self, request_url):
+        return self._stripes[hash(request_url) % len(self._stripes)]
+
+    def get(self, request_url):
+        """
+        In case of a hit, returns the JSON data which represents the OWM web
+        API response to the request being identified by a specific string URL
+        and updates the recency of this request.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: the cached JSON data in case of cache hit or ``None``
+            otherwise
+
+        """
+        lock, stripe = self._stripe_for(request_url)
+        with lock:
+            return stripe.get(request_url)
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Returns the JSON data which represents the OWM web API response to the
+        request being identified by a specific string URL if it has not
+        expired yet or if it is within the applicable grace period after its
+        expiration, as in *LRUCache*
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the cached JSON data in case of hit or ``None`` otherwise
+
+        """
+        lock, stripe = self._stripe_for(request_url)
+        with lock:
+            return stripe.get_stale(request_url, upstream_failed)
+
+    def set(self, request_url, response_json):
+        """
+        Adds the response_json to be cached to the stripe the request_url
+        belongs to, possibly discarding the least recently used item of that
+        stripe
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str
+
+        """
+        lock, stripe = self._stripe_for(request_url)
+        with lock:
+            stripe.set(request_url, response_json)
+
+    def clean(self):
+        """
+        Empties the cache
+
+        """
+        for lock, stripe in self._stripes:
+            with lock:
+                stripe.clean()
+
+    def size(self):
+        """
+        Returns the number of elements that are currently stored into the cache
+
+        :returns: an int
+
+        """
+        return sum(stripe.size() for _, stripe in self._stripes)
+
+    def size_bytes(self):
+        """
+        Returns the overall encoded size in bytes of the elements that are
+        currently stored into the cache, as in *LRUCache*
+
+        :returns: an int
+
+        """
+        total = 0
+        for lock, stripe in self._stripes:
+            with lock:
+                total += stripe.size_bytes()
+        return total
+
+    def is_thread_safe(self):
+        """
+        Returns ``True``, as the stripes are locked
+
+        :returns: a bool
+
+        """
+        return True
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache, broken down by OWM
+        API endpoint, as in *LRUCache*: the statistics of all of the stripes
+        are merged
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        snapshots = []
+        for lock, stripe in self._stripes:
+            with lock:
+                snapshots.append(stripe.stats(reset))
+        return CacheStats.merge(snapshots)
+
+    def __repr__(self):
+        return "<%s.%s - size=%s, max size=%s, max bytes=%s, item lifetime=%s, " \
+            "stripes=%s>" % (__name__, self.__class__.__name__, str(self.size()),
+                             self._max_size, self._max_bytes, self._item_lifetime,
+                             len(self._stripes))
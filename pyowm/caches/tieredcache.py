@@ -0,0 +1,217 @@
+"""
+Module containing a cache made out of a fast in-process tier in front of a
+larger, shared one
+"""
+
+from pyowm.commons import jsoncodec
+from pyowm.abstractions import owmcache
+from pyowm.caches.cachestats import CacheStats, clock_ns
+
+# Counters which are recorded by the tiers only, as items are discarded by them
+# and their failures are dealt with by them
+_TIER_COUNTERS = ('expirations', 'evictions', 'errors')
+
+
+class TieredCache(owmcache.OWMCache):
+    """
+    A cache made out of two tiers, each one being any *OWMCache*
+    implementation: a small and fast in-process L1 (eg: *LRUCache*) in front of
+    a larger L2 which is possibly shared by many processes (eg: *SQLiteCache*
+    or a cache backed by a network store). Lookups are served by L1 whenever
+    possible, without any I/O, while every process sharing L2 benefits from
+    the responses fetched by all of the others.
+    Lookups missing L1 are looked up into L2 and the L2 hits are promoted into
+    L1, decoded in case L2 returns JSON text; responses are written through to
+    both tiers. Promoted responses are given a whole L1 lifetime, regardless
+    of how long they have been in L2: L1 should be given lifetimes which are
+    much shorter than the L2 ones.
+
+    :param l1: the first tier, which is looked up first
+    :type l1: an *OWMCache* concrete instance
+    :param l2: the second tier
+    :type l2: an *OWMCache* concrete instance
+    :returns: a new *TieredCache* instance
+
+    """
+
+    def __init__(self, l1, l2):
+        assert l1 is not None and l2 is not None and l1 is not l2, \
+            "tiers must be two different caches"
+        self._l1 = l1
+        self._l2 = l2
+        self._stats = CacheStats()
+
+    def get(self, request_url):
+        """
+        Looks up the request URL into L1 and - in case of miss - into L2,
+        promoting the L2 hit into L1.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :returns: the JSON data in case of hit - decoded, when it comes from
+            L2 - or ``None`` otherwise
+
+        """
+        start = clock_ns()
+        data = self._l1.get(request_url)
+        if data is None:
+            data = self._l2.get(request_url)
+            if data is not None:
+                if isinstance(data, (str, bytes)):
+                    data = jsoncodec.loads(data)
+                self._l1.set(request_url, data)
+        self._stats.record_get(request_url, data is not None,
+                               clock_ns() - start)
+        return data
+
+    def get_many(self, request_urls):
+        """
+        Looks up the request URLs into L1 at once and then the missing ones
+        into L2 at once, promoting the L2 hits into L1.
+
+        :param request_urls: the URLs that uniquely identify the requests
+            whose responses are to be looked up
+        :type request_urls: list of str
+        :returns: a list holding - for each request URL, in the same order -
+            the JSON data as in ``get`` in case of hit or ``None`` otherwise
+
+        """
+        start = clock_ns()
+        values = self._l1.get_many(request_urls)
+        missing = [i for i, data in enumerate(values) if data is None]
+        if missing:
+            promoted = dict()
+            l2_values = self._l2.get_many([request_urls[i] for i in missing])
+            for i, data in zip(missing, l2_values):
+                if data is not None:
+                    if isinstance(data, (str, bytes)):
+                        data = jsoncodec.loads(data)
+                    values[i] = promoted[request_urls[i]] = data
+            if promoted:
+                self._l1.set_many(promoted)
+        elapsed = clock_ns() - start
+        for request_url, data in zip(request_urls, values):
+            self._stats.record_get(request_url, data is not None, elapsed)
+        return values
+
+    def get_stale(self, request_url, upstream_failed=False):
+        """
+        Looks up the request URL into L1 and - in case of miss - into L2 even
+        though its response has expired, as long as the tier keeps it for the
+        applicable grace period. Stale responses are not promoted.
+
+        :param request_url: an URL that uniquely identifies the request whose
+            response is to be looked up
+        :type request_url: str
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one
+        :type upstream_failed: bool
+        :returns: the JSON data in case of hit or ``None`` otherwise
+
+        """
+        data = self._l1.get_stale(request_url, upstream_failed)
+        if data is None:
+            data = self._l2.get_stale(request_url, upstream_failed)
+        return data
+
+    def set(self, request_url, response_json):
+        """
+        Stores the response_json into L2 and then into L1.
+
+        :param request_url: the request URL that uniquely identifies the
+            request whose response is to be cached
+        :type request_url: str
+        :param response_json: the response JSON to be cached
+        :type response_json: decoded JSON data or str/bytes
+
+        """
+        start = clock_ns()
+        self._l2.set(request_url, response_json)
+        self._l1.set(request_url, response_json)
+        self._stats.record_set(request_url, clock_ns() - start)
+
+    def set_many(self, responses):
+        """
+        Stores the responses into L2 at once and then into L1 at once.
+
+        :param responses: the response JSONs by request URL
+        :type responses: dict
+
+        """
+        start = clock_ns()
+        self._l2.set_many(responses)
+        self._l1.set_many(responses)
+        elapsed = clock_ns() - start
+        for request_url in responses:
+            self._stats.record_set(request_url, elapsed)
+
+    def clean(self):
+        """
+        Empties both of the tiers
+
+        """
+        self._l1.clean()
+        self._l2.clean()
+
+    def size(self):
+        """
+        Returns the number of elements that are currently stored into L2,
+        which holds all of the elements written through, while L1 only holds
+        the most recently used ones
+
+        :returns: an int
+
+        """
+        return self._l2.size()
+
+    def size_bytes(self):
+        """
+        Returns the size in bytes of the elements that are currently stored
+        into L2
+
+        :returns: an int
+
+        """
+        return self._l2.size_bytes()
+
+    def is_thread_safe(self):
+        """
+        Tells whether both of the tiers can be used by many threads at the
+        same time
+
+        :returns: a bool
+
+        """
+        return self._l1.is_thread_safe() and self._l2.is_thread_safe()
+
+    def stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache as a whole (see
+        ``CacheStats.snapshot``), with the snapshots of the statistics of the
+        tiers under keys 'l1' and 'l2'. As a whole, lookups hit when any of
+        the tiers does; expirations, evictions, errors and bytes stored are the
+        sums of the ones of the tiers.
+
+        :param reset: whether the statistics - the tiers ones included - are
+            to be reset after taking the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        own = self._stats.snapshot(reset)
+        tiers = [self._l1.stats(reset), self._l2.stats(reset)]
+        empty = CacheStats().snapshot()['total']
+        endpoints = own['endpoints']
+        for endpoint, tiers_stats in CacheStats.merge(tiers)['endpoints'].items():
+            stats = endpoints.setdefault(endpoint, dict(empty))
+            for name in _TIER_COUNTERS:
+                stats[name] = tiers_stats[name]
+            stats['bytes'] = tiers_stats['bytes']
+        snapshot = CacheStats.merge([own])
+        snapshot['l1'], snapshot['l2'] = tiers
+        return snapshot
+
+    def __repr__(self):
+        return "<%s.%s - l1=%s, l2=%s>" % (__name__, self.__class__.__name__,
+                                          repr(self._l1), repr(self._l2))
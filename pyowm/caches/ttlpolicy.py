@@ -0,0 +1,84 @@
+"""
+Module containing the policy that assigns cache items lifetimes according to
+the OWM API endpoints that responses come from
+"""
+
+import time
+from urllib.parse import urlparse, parse_qs
+
+
+class TTLPolicy(object):
+    """
+    Assigns lifetimes to cached OWM API responses, according to the endpoint
+    of the requests they answer: responses change at different rates (eg:
+    current weather observations change much more frequently than daily
+    forecasts), so they should not expire all at once.
+    Endpoints are matched by the path of their URLs, so that all subscription
+    subdomains and schemes share the same lifetimes; when more endpoints
+    match a request URL, the most specific one wins (eg: a daily forecast
+    request matches both '/data/2.5/forecast' and '/data/2.5/forecast/daily').
+    Requests whose ``end`` query param lies in the past refer to closed time
+    windows, whose data is not going to change anymore: their responses can be
+    assigned a specific (much longer) lifetime.
+
+    :param lifetimes: a dict mapping endpoint URLs to the lifetimes in
+        milliseconds of their responses
+    :type lifetimes: dict
+    :param closed_window_lifetime: the lifetime in milliseconds of responses to
+        requests about closed past time windows. Defaults to ``None``, meaning
+        that the lifetime of their endpoint is used
+    :type closed_window_lifetime: int
+    :returns: a new *TTLPolicy* instance
+
+    """
+
+    # "end" timestamps must be at least this old for time windows to be closed,
+    # allowing for late measurements to be collected by the API
+    _CLOSED_WINDOW_GRACE_SECONDS = 60 * 60
+
+    def __init__(self, lifetimes, closed_window_lifetime=None):
+        assert all(lifetime > 0 for lifetime in lifetimes.values()), \
+            "lifetimes must be greater than zero"
+        assert closed_window_lifetime is None or closed_window_lifetime > 0, \
+            "'closed_window_lifetime' must be greater than zero"
+        # most specific paths first
+        self._lifetimes = sorted(
+            [(urlparse(url).path.rstrip('/'), lifetime)
+             for url, lifetime in lifetimes.items()],
+            key=lambda item: len(item[0]), reverse=True)
+        self._closed_window_lifetime = closed_window_lifetime
+
+    def lifetime_for(self, request_url):
+        """
+        Returns the lifetime of the response to the request identified by the
+        specified URL
+
+        :param request_url: the request URL
+        :type request_url: str
+        :returns: the lifetime in milliseconds or ``None`` if the request URL
+            does not match any of the endpoints of this policy
+
+        """
+        parsed = urlparse(request_url)
+        if self._closed_window_lifetime is not None and \
+                self._is_closed_window(parsed.query):
+            return self._closed_window_lifetime
+        path = parsed.path.rstrip('/')
+        for endpoint_path, lifetime in self._lifetimes:
+            if path == endpoint_path or path.startswith(endpoint_path + '/'):
+                return lifetime
+        return None
+
+    def _is_closed_window(self, query):
+        end = parse_qs(query).get('end')
+        if not end:
+            return False
+        try:
+            end = int(end[0])
+        except ValueError:
+            return False
+        return end < time.time() - self._CLOSED_WINDOW_GRACE_SECONDS
+
+    def __repr__(self):
+        return "<%s.%s - endpoints=%s>" % (__name__, self.__class__.__name__,
+                                           len(self._lifetimes))
@@ -0,0 +1,161 @@
+"""
+Module containing an asyncio HTTP client for the OWM web APIs. It requires the
+optional ``aiohttp`` dependency
+"""
+
+import asyncio
+from functools import partial
+from pyowm.commons import jsoncodec
+from pyowm.commons.http_client import HttpClient
+from pyowm.exceptions import api_call_error, api_response_error, \
+    parse_response_error
+from pyowm.weatherapi25.configuration25 import API_AVAILABILITY_TIMEOUT, \
+    VERIFY_SSL_CERTS, ASYNC_CONNECTION_LIMIT
+
+try:
+    import aiohttp
+    _CONNECTION_ERRORS = (aiohttp.ClientConnectionError,)
+except ImportError:  # optional dependency
+    aiohttp = None
+    _CONNECTION_ERRORS = ()
+
+
+class AsyncHttpClient(HttpClient):
+
+    """
+    The asyncio counterpart of *HttpClient*: API calls are coroutines, so that
+    many of them can be in flight at the same time on a single event loop.
+    Only the transport differs: responses are looked up into and stored in
+    the provided caches - negative responses, stale responses and concurrent
+    misses on the same cache key included - exactly as *HttpClient* does.
+
+    :param timeout: the timeout in seconds for the API calls
+    :type timeout: int
+    :param cache: a concrete implementation of class *OWMCache* serving as the
+        cache provider (defaults to a *NullCache* instance)
+    :type cache: an *OWMCache* concrete instance
+    :param verify_ssl_certs: whether SSL certificates must be verified
+    :type verify_ssl_certs: bool
+    :param session: the ``aiohttp.ClientSession`` to issue API calls with.
+        Defaults to ``None``, which means that a session is lazily created on
+        the first call and closed by ``close()``
+    :type session: ``aiohttp.ClientSession``
+    :param negative_cache: a concrete implementation of class *OWMCache*
+        serving as the cache provider for negative responses (see
+        *HttpClient*). Defaults to ``None``, meaning that not found errors are
+        not cached, while empty results are cached by the cache provider
+    :type negative_cache: an *OWMCache* concrete instance
+    :raises: *ImportError* when no session is provided and ``aiohttp`` is not
+        installed
+
+    """
+
+    def __init__(self, timeout=API_AVAILABILITY_TIMEOUT, cache=None,
+                 verify_ssl_certs=VERIFY_SSL_CERTS, session=None,
+                 negative_cache=None):
+        if session is None and aiohttp is None:
+            raise ImportError('The asyncio client requires the "aiohttp" '
+                              'package: install it with "pip install aiohttp"')
+        HttpClient.__init__(self, timeout=timeout, cache=cache,
+                            verify_ssl_certs=verify_ssl_certs, session=session,
+                            negative_cache=negative_cache)
+        self._owns_session = session is None
+        # tasks fetching and caching responses, by cache key
+        self._tasks = dict()
+
+    def _get_session(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    def _request_options(self):
+        if aiohttp is None:
+            return dict(timeout=self.timeout)
+        return dict(timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    ssl=None if self.verify_ssl_certs else False)
+
+    async def get_json(self, uri, params=None, headers=None):
+        # query params are encoded the same way as by the synchronous client
+        url = HttpClient.prepared_url(uri, params=params)
+        session = self._get_session()
+        try:
+            async with session.get(url, headers=headers,
+                                   **self._request_options()) as resp:
+                status_code = resp.status
+                text = await resp.text()
+        except asyncio.TimeoutError:
+            raise api_call_error.APICallTimeoutError('API call timeouted')
+        except _CONNECTION_ERRORS as e:
+            raise api_call_error.APIInvalidSSLCertificateError(str(e))
+        HttpClient.check_status_code(status_code, text)
+        try:
+            return status_code, jsoncodec.loads(text)
+        except:
+            raise parse_response_error.ParseResponseError('Impossible to parse'
+                                                          'API response data')
+
+    async def cacheable_get_json(self, uri, params=None, headers=None):
+        # check if already cached
+        cached_url_key = HttpClient.cache_key(uri, params=params)
+        cached = self._get_cached_response(cached_url_key)
+        if cached is not None:
+            return cached
+        stale = self.get_cached_json(cached_url_key, stale=True)
+        if stale is not None:
+            # serve the expired response while refreshing it
+            self._fetching_task(cached_url_key, uri, params, headers)
+            return 200, stale
+        # concurrent misses on the same key share a single upstream call,
+        # which goes on even if one of the callers is cancelled
+        try:
+            return await asyncio.shield(
+                self._fetching_task(cached_url_key, uri, params, headers))
+        except api_call_error.APICallError:
+            stale = self.get_cached_json(cached_url_key, stale=True,
+                                         upstream_failed=True)
+            if stale is None:
+                raise
+            return 200, stale
+
+    def _fetching_task(self, cached_url_key, uri, params, headers):
+        # the task fetching and caching the response for the key, which is
+        # started unless one is already in flight
+        task = self._tasks.get(cached_url_key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_and_cache_json(
+                cached_url_key, uri, params, headers))
+            self._tasks[cached_url_key] = task
+            task.add_done_callback(partial(self._forget_task, cached_url_key))
+        return task
+
+    def _forget_task(self, cached_url_key, task):
+        if self._tasks.get(cached_url_key) is task:
+            del self._tasks[cached_url_key]
+        if not task.cancelled():
+            # retrieved, so that failed background refreshes are not logged
+            task.exception()
+
+    async def _get_and_cache_json(self, cached_url_key, uri, params, headers):
+        try:
+            status_code, data = await self.get_json(uri, params=params,
+                                                    headers=headers)
+        except api_response_error.NotFoundError:
+            self._cache_not_found(cached_url_key)
+            raise
+        self._cache_response(cached_url_key, status_code, data)
+        return status_code, data
+
+    async def close(self):
+        """
+        Closes the underlying session, if it was created by this object
+
+        """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def __repr__(self):
+        return "<%s.%s - timeout=%s - cache=%s>" % \
+               (__name__, self.__class__.__name__, repr(self.timeout),
+                str(self.cache) if self.cache is not None else 'None')
@@ -35,3 +35,29 @@ class Satellite:
         return "<%s.%s - name=%s symbol=%s>" % (
             __name__, self.__class__.__name__, self.name, self.symbol)
 
+
+class BulkResult:
+    """
+    Databox class representing the outcome of one of the queries issued by a
+    bulk API call
+
+    :param query: the query, as it was provided to the bulk call
+    :type query: object
+    :param result: the query result, ``None`` if the query failed
+    :type result: object
+    :param error: the exception raised by the query, ``None`` if it succeeded
+    :type error: Exception
+    """
+    def __init__(self, query, result, error=None):
+
+        self.query = query
+        self.result = result
+        self.error = error
+
+    def is_success(self):
+        return self.error is None
+
+    def __repr__(self):
+        return "<%s.%s - query=%s success=%s>" % (
+            __name__, self.__class__.__name__, repr(self.query),
+            self.is_success())
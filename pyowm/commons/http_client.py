@@ -1,16 +1,66 @@
 import requests
-import json
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from pyowm.commons import jsoncodec
 from pyowm.caches import nullcache
 from pyowm.commons.enums import ImageTypeEnum
 from pyowm.exceptions import api_call_error, api_response_error, parse_response_error
+from pyowm.utils.concurrency import SingleFlight
 from pyowm.weatherapi25.configuration25 import API_AVAILABILITY_TIMEOUT, \
-    API_SUBSCRIPTION_SUBDOMAINS, VERIFY_SSL_CERTS
+    API_SUBSCRIPTION_SUBDOMAINS, VERIFY_SSL_CERTS, CONNECTION_POOL_SIZE, \
+    CONNECTION_MAX_RETRIES, CONNECTION_KEEP_ALIVE
+
+# Query params carrying credentials, which are left out of cache keys
+_CREDENTIAL_PARAMS = frozenset(['appid'])
 
 
 class HttpClient(object):
 
+    """
+    An HTTP client for the OWM web APIs.
+
+    :param timeout: the timeout in seconds for the API calls
+    :type timeout: int
+    :param cache: a concrete implementation of class *OWMCache* serving as the
+        cache provider (defaults to a *NullCache* instance)
+    :type cache: an *OWMCache* concrete instance
+    :param use_ssl: whether API calls should be made via SSL or not
+    :type use_ssl: bool
+    :param verify_ssl_certs: whether SSL certificates must be verified
+    :type verify_ssl_certs: bool
+    :param session: a ``requests.Session`` to issue API calls with (eg: the
+        one returned by ``HttpClient.pooled_session()``), so that TCP/TLS
+        connections are kept alive and reused across calls. Defaults to
+        ``None``, which means that each call opens a new connection
+    :type session: ``requests.Session``
+    :param negative_cache: a concrete implementation of class *OWMCache*
+        serving as the cache provider for negative responses, that is not
+        found errors and empty results (see ``is_empty_response``), which
+        are kept apart from the other cached responses so that they can be
+        given shorter lifetimes. Defaults to ``None``, meaning that not found
+        errors are not cached, while empty results are cached by the cache
+        provider as any other response (as well as with a *NullCache*)
+    :type negative_cache: an *OWMCache* concrete instance
+
+    Concurrent ``cacheable_get_json`` calls for the same cache key that miss
+    the cache are coalesced into a single upstream request, whose outcome is
+    shared by all of them.
+    When the cache keeps expired responses for a grace period (see
+    ``OWMCache.get_stale``), ``cacheable_get_json`` serves them in place of
+    fresh ones: within the stale-while-revalidate period an expired response
+    is returned at once while it is refreshed in background, and within the
+    stale-if-error period it is returned when the API call fails because of
+    network or infrastructural issues (*APICallError*).
+    Within a ``refreshing`` block, cache lookups miss, so that responses are
+    fetched anew and cached in place of the previous ones.
+
+    """
+
     def __init__(self, timeout=API_AVAILABILITY_TIMEOUT, cache=None,
-                 use_ssl=False, verify_ssl_certs=VERIFY_SSL_CERTS):
+                 use_ssl=False, verify_ssl_certs=VERIFY_SSL_CERTS,
+                 session=None, negative_cache=None):
         self.timeout = timeout
         if cache is None:
             self.cache = nullcache.NullCache()
@@ -18,11 +68,60 @@ class HttpClient(object):
             self.cache = cache
         self.use_ssl = use_ssl
         self.verify_ssl_certs = verify_ssl_certs
+        self.session = session
+        if negative_cache is None:
+            self.negative_cache = nullcache.NullCache()
+        else:
+            self.negative_cache = negative_cache
+        # without a negative cache, empty results are cached as any other
+        # response
+        self._has_negative_cache = \
+            not isinstance(self.negative_cache, nullcache.NullCache)
+        self._in_flight = SingleFlight()
+        self._local = threading.local()
+
+    @classmethod
+    def pooled_session(cls, pool_size=CONNECTION_POOL_SIZE,
+                       max_retries=CONNECTION_MAX_RETRIES,
+                       keep_alive=CONNECTION_KEEP_ALIVE):
+        """
+        Creates a ``requests.Session`` holding a pool of keep-alive
+        connections, meant to be shared by all the *HttpClient* instances
+        issuing calls to the OWM web APIs
+
+        :param pool_size: the maximum number of connections kept open for
+            each host
+        :type pool_size: int
+        :param max_retries: the maximum number of retries for each connection
+            attempt
+        :type max_retries: int
+        :param keep_alive: whether connections are to be kept open and reused
+            after each call
+        :type keep_alive: bool
+        :returns: a ``requests.Session`` instance
+
+        """
+        assert pool_size > 0, "'pool_size' must be greater than zero"
+        assert max_retries >= 0, "'max_retries' must not be negative"
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size,
+                              max_retries=max_retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _requester(self):
+        if self.session is None:
+            return requests
+        return self.session
 
     def get_json(self, uri, params=None, headers=None):
         try:
-            resp = requests.get(uri, params=params, headers=headers,
-                                timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().get(uri, params=params, headers=headers,
+                                         timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -31,7 +130,7 @@ class HttpClient(object):
             raise api_call_error.APICallTimeoutError('API call timeouted')
         HttpClient.check_status_code(resp.status_code, resp.text)
         try:
-            return resp.status_code, resp.json()
+            return resp.status_code, jsoncodec.loads(resp.content)
         except:
             raise parse_response_error.ParseResponseError('Impossible to parse'
                                                           'API response data')
@@ -42,8 +141,8 @@ class HttpClient(object):
         else:
             headers.update({'Accept': ImageTypeEnum.PNG.mime_type})
         try:
-            resp = requests.get(uri, stream=True, params=params, headers=headers,
-                                timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().get(uri, stream=True, params=params, headers=headers,
+                                         timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -63,8 +162,8 @@ class HttpClient(object):
         else:
             headers.update({'Accept': ImageTypeEnum.GEOTIFF.mime_type})
         try:
-            resp = requests.get(uri, stream=True, params=params, headers=headers,
-                                timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().get(uri, stream=True, params=params, headers=headers,
+                                         timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -78,21 +177,253 @@ class HttpClient(object):
             raise parse_response_error.ParseResponseError('Impossible to parse'
                                                           'API response data')
 
+    @classmethod
+    def prepared_url(cls, uri, params=None):
+        """
+        Returns the URL of a GET request on the specified URI and query params
+
+        :param uri: the request URI
+        :type uri: str
+        :param params: the request query params
+        :type params: dict
+        :returns: a str
+
+        """
+        return requests.Request('GET', uri, params=params).prepare().url
+
+    @classmethod
+    def cache_key(cls, uri, params=None):
+        """
+        Returns the key under which the response to a GET request on the
+        specified URI and query params is cached. The key is the canonical
+        form of the request URL: credentials (the API key) are stripped, query
+        params are sorted by name and the subscription subdomain and the
+        scheme are normalised, so that clients using different API keys,
+        subscription types or schemes share cached responses.
+
+        :param uri: the request URI
+        :type uri: str
+        :param params: the request query params
+        :type params: dict
+        :returns: a str
+
+        """
+        parts = urlsplit(cls.prepared_url(uri, params=params))
+        # the sort is stable: values of repeated params keep their order
+        query = sorted([(name, value) for name, value
+                        in parse_qsl(parts.query, keep_blank_values=True)
+                        if name.lower() not in _CREDENTIAL_PARAMS],
+                       key=lambda param: param[0])
+        host = parts.netloc
+        free_subdomain = API_SUBSCRIPTION_SUBDOMAINS['free']
+        for subdomain in API_SUBSCRIPTION_SUBDOMAINS.values():
+            if host.startswith(subdomain + '.'):
+                host = free_subdomain + host[len(subdomain):]
+                break
+        return urlunsplit(('http', host, parts.path, urlencode(query), ''))
+
+    @contextmanager
+    def refreshing(self):
+        """
+        Returns a context manager within which - for the current thread only -
+        cache lookups (negative and stale ones included) miss, so that
+        ``cacheable_get_json`` calls fetch the responses from the API and
+        cache them in place of the previous ones, whether these have expired
+        or not. API call failures are raised rather than served with stale
+        responses.
+
+        :returns: a context manager
+
+        """
+        previous = getattr(self._local, 'refreshing', False)
+        self._local.refreshing = True
+        try:
+            yield
+        finally:
+            self._local.refreshing = previous
+
+    def is_refreshing(self):
+        """
+        Tells whether the current thread is within a ``refreshing`` block
+
+        :returns: bool
+
+        """
+        return getattr(self._local, 'refreshing', False)
+
+    def has_thread_safe_caches(self):
+        """
+        Tells whether both the cache and the negative cache can be used by
+        many threads at the same time (see *OWMCache.is_thread_safe*)
+
+        :returns: bool
+
+        """
+        for cache in (self.cache, self.negative_cache):
+            is_thread_safe = getattr(cache, 'is_thread_safe', None)
+            if is_thread_safe is None or not is_thread_safe():
+                return False
+        return True
+
+    def get_cached_json(self, cache_key, stale=False, upstream_failed=False):
+        """
+        Looks up into the cache the JSON data stored under the specified key.
+        Cache providers may store either already decoded JSON data, which is
+        returned as is, or raw JSON text (as str or bytes), which is decoded
+
+        :param cache_key: the cache key
+        :type cache_key: str
+        :param stale: whether expired JSON data is to be looked up as well,
+            as long as it is within a grace period (see
+            ``OWMCache.get_stale``)
+        :type stale: bool
+        :param upstream_failed: whether the stale-if-error grace period
+            applies instead of the stale-while-revalidate one, when looking
+            up expired JSON data
+        :type upstream_failed: bool
+        :returns: the decoded JSON data in case of cache hit or ``None``
+            otherwise
+
+        """
+        if getattr(self._local, 'refreshing', False):
+            return None
+        if stale:
+            # duck-typed cache providers may not support stale lookups
+            get_stale = getattr(self.cache, 'get_stale', None)
+            if get_stale is None:
+                return None
+            cached = get_stale(cache_key, upstream_failed)
+        else:
+            cached = self.cache.get(cache_key)
+        if isinstance(cached, (str, bytes)):
+            return jsoncodec.loads(cached)
+        return cached
+
+    def get_cached_json_many(self, cache_keys):
+        """
+        Looks up into the cache the JSON data stored under each one of the
+        specified keys - in a single round trip, for cache providers backed by
+        remote stores - decoding it as ``get_cached_json`` does
+
+        :param cache_keys: the cache keys
+        :type cache_keys: list of str
+        :returns: a list holding - for each key, in the same order - the
+            decoded JSON data in case of cache hit or ``None`` otherwise
+
+        """
+        if getattr(self._local, 'refreshing', False):
+            return [None] * len(cache_keys)
+        # duck-typed cache providers may not support multi-key lookups
+        get_many = getattr(self.cache, 'get_many', None)
+        if get_many is None:
+            cached = [self.cache.get(cache_key) for cache_key in cache_keys]
+        else:
+            cached = get_many(cache_keys)
+        return [jsoncodec.loads(data) if isinstance(data, (str, bytes)) else data
+                for data in cached]
+
+    def set_cached_json_many(self, responses):
+        """
+        Stores into the cache many decoded JSON data at once - in a single
+        round trip, for cache providers backed by remote stores
+
+        :param responses: the decoded JSON data by cache key
+        :type responses: dict
+
+        """
+        set_many = getattr(self.cache, 'set_many', None)
+        if set_many is None:
+            for cache_key, data in responses.items():
+                self.cache.set(cache_key, data)
+        else:
+            set_many(responses)
+
     def cacheable_get_json(self, uri, params=None, headers=None):
         # check if already cached
-        cached_url_key = requests.Request('GET', uri, params=params).prepare().url
-        cached = self.cache.get(cached_url_key)
-        if cached:
+        cached_url_key = HttpClient.cache_key(uri, params=params)
+        cached = self._get_cached_response(cached_url_key)
+        if cached is not None:
+            return cached
+        stale = self.get_cached_json(cached_url_key, stale=True)
+        if stale is not None:
+            # serve the expired response while refreshing it
+            self._in_flight.do_in_background(
+                cached_url_key, self._get_and_cache_json, cached_url_key, uri,
+                params, headers)
+            return 200, stale
+        # concurrent misses on the same key share a single upstream call
+        try:
+            return self._in_flight.do(cached_url_key, self._get_and_cache_json,
+                                      cached_url_key, uri, params, headers)
+        except api_call_error.APICallError:
+            stale = self.get_cached_json(cached_url_key, stale=True,
+                                         upstream_failed=True)
+            if stale is None:
+                raise
+            return 200, stale
+
+    def _get_and_cache_json(self, cached_url_key, uri, params, headers):
+        try:
+            status_code, data = self.get_json(uri, params=params, headers=headers)
+        except api_response_error.NotFoundError:
+            self._cache_not_found(cached_url_key)
+            raise
+        self._cache_response(cached_url_key, status_code, data)
+        return status_code, data
+
+    def _get_cached_response(self, cache_key):
+        # the status code and the data of the cached response, negative
+        # responses included
+        cached = self.get_cached_json(cache_key)
+        if cached is not None:
             return 200, cached
-        status_code, data = self.get_json(uri, params=params, headers=headers)
-        json_string = json.dumps(data)
-        self.cache.set(cached_url_key, json_string)
-        return status_code, json_string
+        return self._get_negative_json(cache_key)
+
+    def _cache_response(self, cache_key, status_code, data):
+        if self._has_negative_cache and self.is_empty_response(data):
+            self.negative_cache.set(cache_key,
+                                    dict(status=status_code, data=data))
+        else:
+            self.cache.set(cache_key, data)
+
+    def _cache_not_found(self, cache_key):
+        self.negative_cache.set(cache_key, dict(status=404, data=None))
+
+    def _get_negative_json(self, cache_key):
+        # negative entries wrap the response status code and data
+        if getattr(self._local, 'refreshing', False):
+            return None
+        cached = self.negative_cache.get(cache_key)
+        if cached is None:
+            return None
+        if isinstance(cached, (str, bytes)):
+            cached = jsoncodec.loads(cached)
+        if cached['status'] == 404:
+            raise api_response_error.NotFoundError('Unable to find the resource')
+        return cached['status'], cached['data']
+
+    @classmethod
+    def is_empty_response(cls, data):
+        """
+        Tells whether the decoded JSON data of a successful response carries
+        no results, that is whether it is a not found payload (eg: weather
+        history for unknown cities) or a result set with zero items
+
+        :param data: the decoded JSON data
+        :type data: dict or list
+        :returns: a bool
+
+        """
+        if not isinstance(data, dict):
+            return False
+        if str(data.get('cod')) == '404':
+            return True
+        return data.get('cnt') == 0 or data.get('count') == 0
 
     def post(self, uri, params=None, data=None, headers=None):
         try:
-            resp = requests.post(uri, params=params, json=data, headers=headers,
-                                 timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().post(uri, params=params, json=data, headers=headers,
+                                          timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -102,15 +433,15 @@ class HttpClient(object):
         HttpClient.check_status_code(resp.status_code, resp.text)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = jsoncodec.loads(resp.content)
         except:
             json_data = {}
         return resp.status_code, json_data
 
     def put(self, uri, params=None, data=None, headers=None):
         try:
-            resp = requests.put(uri, params=params, json=data, headers=headers,
-                                timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().put(uri, params=params, json=data, headers=headers,
+                                         timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -120,15 +451,15 @@ class HttpClient(object):
         HttpClient.check_status_code(resp.status_code, resp.text)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = jsoncodec.loads(resp.content)
         except:
             json_data = {}
         return resp.status_code, json_data
 
     def delete(self, uri, params=None, data=None, headers=None):
         try:
-            resp = requests.delete(uri, params=params, json=data, headers=headers,
-                                   timeout=self.timeout, verify=self.verify_ssl_certs)
+            resp = self._requester().delete(uri, params=params, json=data, headers=headers,
+                                            timeout=self.timeout, verify=self.verify_ssl_certs)
         except requests.exceptions.SSLError as e:
             raise api_call_error.APIInvalidSSLCertificateError(str(e))
         except requests.exceptions.ConnectionError as e:
@@ -138,7 +469,7 @@ class HttpClient(object):
         HttpClient.check_status_code(resp.status_code, resp.text)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = jsoncodec.loads(resp.content)
         except:
             json_data = None
         return resp.status_code, json_data
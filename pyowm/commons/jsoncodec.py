@@ -0,0 +1,213 @@
+"""
+Module containing the JSON codec used throughout the library to decode OWM API
+responses and to encode JSON text, backed by the fastest JSON library which is
+installed among the supported ones
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional dependency
+    ujson = None
+
+try:
+    import rapidjson
+except ImportError:  # optional dependency
+    rapidjson = None
+
+# Names of the supported JSON libraries, in order of preference
+BACKENDS = ('orjson', 'ujson', 'rapidjson', 'json')
+
+_AUTO = 'auto'
+
+
+def _stdlib_loads(data):
+    # the json module decodes bytes only since Python 3.6
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _stdlib_dumpb(obj):
+    return _stdlib_dumps(obj).encode('utf-8')
+
+
+def _functions(name):
+    """
+    Returns the loads, dumps and dumpb functions of the named JSON library,
+    or ``None`` if it is not installed
+
+    """
+    if name == 'json':
+        return _stdlib_loads, _stdlib_dumps, _stdlib_dumpb
+    if name == 'orjson' and orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        return (orjson.loads,
+                lambda obj: orjson.dumps(obj, option=option).decode('utf-8'),
+                lambda obj: orjson.dumps(obj, option=option))
+    if name == 'ujson' and ujson is not None:
+        def ujson_dumps(obj):
+            return ujson.dumps(obj, escape_forward_slashes=False)
+        return (ujson.loads, ujson_dumps,
+                lambda obj: ujson_dumps(obj).encode('utf-8'))
+    if name == 'rapidjson' and rapidjson is not None:
+        mode = rapidjson.MM_COERCE_KEYS_TO_STRINGS
+        def rapidjson_dumps(obj):
+            return rapidjson.dumps(obj, mapping_mode=mode)
+        return (rapidjson.loads, rapidjson_dumps,
+                lambda obj: rapidjson_dumps(obj).encode('utf-8'))
+    return None
+
+
+def available():
+    """
+    Returns the names of the JSON libraries which can be used, in order of
+    preference: the standard library ``json`` module is always among them
+
+    :returns: a list of str
+
+    """
+    return [name for name in BACKENDS if _functions(name) is not None]
+
+
+class _Codec(object):
+
+    def __init__(self):
+        self.name = None
+        # whether the library has been selected, rather than picked on import
+        self.selected = False
+        self._loads = self._dumps = self._dumpb = None
+
+    def use(self, name):
+        if name is None or name == _AUTO:
+            name = available()[0]
+        assert name in BACKENDS, \
+            "JSON codec must be one of: %s" % ', '.join((_AUTO,) + BACKENDS)
+        functions = _functions(name)
+        if functions is None:
+            raise ImportError("JSON library '%s' is not installed" % name)
+        self._loads, self._dumps, self._dumpb = functions
+        self.name = name
+
+    def loads(self, data):
+        try:
+            return self._loads(data)
+        except (ValueError, TypeError, OverflowError):
+            # eg: integers too large for the library: errors are raised by
+            # the json module, so that they do not depend on the library
+            return _stdlib_loads(data)
+
+    def dumps(self, obj):
+        try:
+            return self._dumps(obj)
+        except (ValueError, TypeError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    def dumpb(self, obj):
+        try:
+            return self._dumpb(obj)
+        except (ValueError, TypeError, OverflowError):
+            return _stdlib_dumpb(obj)
+
+
+_codec = _Codec()
+_codec.use(_AUTO)
+
+
+def use(name=_AUTO):
+    """
+    Selects the JSON library backing the codec of the whole library. It is a
+    process-wide setting, which overrides the ``JSON_CODEC`` setting of the
+    configuration modules.
+
+    :param name: the name of the JSON library - one of 'orjson', 'ujson',
+        'rapidjson' and 'json' (the standard library module) - or 'auto',
+        meaning the first one which is installed in that order
+    :type name: str
+    :raises: *AssertionError* when the name is unknown, *ImportError* when
+        the JSON library is not installed
+
+    """
+    _codec.use(name)
+    _codec.selected = True
+
+
+def use_default(name=_AUTO):
+    """
+    Selects the JSON library as *use* does, unless a library has already been
+    selected: this is how the first ``OWM()`` call applies the ``JSON_CODEC``
+    setting of its configuration module, which is read only once.
+
+    :param name: the name of the JSON library (see *use*)
+    :type name: str
+    :raises: *AssertionError* when the name is unknown, *ImportError* when
+        the JSON library is not installed
+
+    """
+    if not _codec.selected:
+        use(name)
+
+
+def backend():
+    """
+    Returns the name of the JSON library which is currently backing the codec
+
+    :returns: a str
+
+    """
+    return _codec.name
+
+
+def loads(data):
+    """
+    Decodes JSON text. Text which cannot be decoded by the selected library
+    is handed to the ``json`` module, so that the same errors are raised
+    whichever the library.
+
+    :param data: the JSON text
+    :type data: str or bytes
+    :returns: the decoded data
+    :raises: *ValueError* (``json.JSONDecodeError``) when the text is not
+        valid JSON, *TypeError* when it is not a str or bytes
+
+    """
+    return _codec.loads(data)
+
+
+def dumps(obj):
+    """
+    Encodes data as compact JSON text, whichever the selected library. Data
+    which cannot be encoded by the selected library is handed to the ``json``
+    module.
+
+    :param obj: the data to be encoded
+    :type obj: dict, list, str, int, float, bool or ``None``
+    :returns: a str
+    :raises: *TypeError* when the data cannot be encoded
+
+    """
+    return _codec.dumps(obj)
+
+
+def dumpb(obj):
+    """
+    Encodes data as compact JSON text, as UTF-8 bytes. Data which cannot be
+    encoded by the selected library is handed to the ``json`` module.
+
+    :param obj: the data to be encoded
+    :type obj: dict, list, str, int, float, bool or ``None``
+    :returns: bytes
+    :raises: *TypeError* when the data cannot be encoded
+
+    """
+    return _codec.dumpb(obj)
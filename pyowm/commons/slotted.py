@@ -0,0 +1,67 @@
+"""
+Module containing the base class of the domain objects keeping their fields
+into ``__slots__``
+"""
+
+# Slot descriptors of the Slotted subclasses, by class
+_SLOTS = dict()
+
+
+def _slots_of(cls):
+    """
+    Returns the names and the descriptors of the slots of a class, including
+    the ones of its base classes
+
+    """
+    slots = _SLOTS.get(cls)
+    if slots is None:
+        slots = []
+        for klass in reversed(cls.__mro__):
+            names = klass.__dict__.get('__slots__', ())
+            if isinstance(names, str):
+                names = (names,)
+            slots.extend((name, klass.__dict__[name]) for name in names
+                         if name not in ('__dict__', '__weakref__'))
+        slots = _SLOTS[cls] = tuple(slots)
+    return slots
+
+
+class Slotted(object):
+    """
+    Base class of the domain objects keeping their fields into ``__slots__``
+    instead of a per-instance dict, which makes them several times smaller.
+    Subclasses list their fields into ``__slots__``, and so do their own
+    subclasses (even if empty), or else their instances get a dict again.
+    The state of pickled objects is a dict of their fields, as it used to be
+    when they had a per-instance dict: objects pickled before can therefore be
+    unpickled, and any pickle protocol can be used.
+
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', ()))
+        cls = type(self)
+        for name, slot in _slots_of(cls):
+            try:
+                state[name] = slot.__get__(self, cls)
+            except AttributeError:  # unset slot
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __copy__(self):
+        cls = type(self)
+        clone = cls.__new__(cls)
+        for _, slot in _slots_of(cls):
+            try:
+                slot.__set__(clone, slot.__get__(self))
+            except AttributeError:  # unset slot
+                pass
+        if cls.__dictoffset__:  # eg: subclasses not defining __slots__
+            clone.__dict__.update(self.__dict__)
+        return clone
@@ -0,0 +1,29 @@
+"""
+Module containing CacheError class
+"""
+
+import os
+from pyowm.exceptions import OWMError
+
+
+class CacheError(OWMError):
+    """
+    Error class that represents failures of cache providers backed by remote
+    stores, in example due to network errors or to errors replied by the
+    stores.
+
+    :param message: the message of the error
+    :type message: str
+    :param triggering_error: optional *Exception* object that triggered this
+        error (defaults to ``None``)
+    :type triggering_error: an *Exception* subtype
+    """
+    def __init__(self, message, triggering_error=None):
+        self._message = message
+        self._triggering_error = triggering_error
+
+    def __str__(self):
+        """Redefine __str__ hook for pretty-printing"""
+        return ''.join(['Exception in using the cache.', os.linesep,
+                       'Reason: ', self._message, os.linesep,
+                       'Caused by: ', str(self._triggering_error)])
@@ -36,13 +36,16 @@ class AirPollutionHttpClient(object):
             raise ValueError("The interval provided for the search "
                              "window is invalid")
 
-    def get_coi(self, params_dict):
+    def _build_url(self, base_url, params_dict):
         """
-        Invokes the CO Index endpoint
+        Builds the URL of a call to a pollution endpoint, encoding the
+        geocoordinates and the search time window found in the params dict
 
+        :param base_url: the URL of the pollution endpoint
+        :type base_url: str
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
-        :raises: *ValueError*, *APICallError*
+        :returns: a str URL
+        :raises: *ValueError*
 
         """
         lat = str(params_dict['lat'])
@@ -50,7 +53,6 @@ class AirPollutionHttpClient(object):
         start = params_dict['start']
         interval = params_dict['interval']
 
-        # build request URL
         if start is None:
             timeref = 'current'
         else:
@@ -59,8 +61,19 @@ class AirPollutionHttpClient(object):
             else:
                 timeref = self._trim_to(timeformatutils.to_date(start), interval)
 
-        fixed_url = '%s/%s,%s/%s.json' % (CO_INDEX_URL, lat, lon, timeref)
-        uri = http_client.HttpClient.to_url(fixed_url, self._API_key, None)
+        fixed_url = '%s/%s,%s/%s.json' % (base_url, lat, lon, timeref)
+        return http_client.HttpClient.to_url(fixed_url, self._API_key, None)
+
+    def get_coi(self, params_dict):
+        """
+        Invokes the CO Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        uri = self._build_url(CO_INDEX_URL, params_dict)
         _, json_data = self._client.cacheable_get_json(uri)
         return json_data
 
@@ -69,90 +82,37 @@ class AirPollutionHttpClient(object):
         Invokes the O3 Index endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), interval)
-
-        fixed_url = '%s/%s,%s/%s.json' % (OZONE_URL, lat, lon, timeref)
-        uri = http_client.HttpClient.to_url(fixed_url, self._API_key, None)
+        uri = self._build_url(OZONE_URL, params_dict)
         _, json_data = self._client.cacheable_get_json(uri)
         return json_data
 
-
     def get_no2(self, params_dict):
         """
         Invokes the NO2 Index endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), interval)
-
-        fixed_url = '%s/%s,%s/%s.json' % (NO2_INDEX_URL, lat, lon, timeref)
-        uri = http_client.HttpClient.to_url(fixed_url, self._API_key, None)
+        uri = self._build_url(NO2_INDEX_URL, params_dict)
         _, json_data = self._client.cacheable_get_json(uri)
         return json_data
 
-
     def get_so2(self, params_dict):
         """
         Invokes the SO2 Index endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    timeformatutils.to_date(start), interval)
-
-        fixed_url = '%s/%s,%s/%s.json' % (SO2_INDEX_URL, lat, lon, timeref)
-        uri = http_client.HttpClient.to_url(fixed_url, self._API_key, None)
+        uri = self._build_url(SO2_INDEX_URL, params_dict)
         _, json_data = self._client.cacheable_get_json(uri)
         return json_data
 
@@ -0,0 +1,73 @@
+"""
+Module containing the asyncio HTTP client for the OWM Air Pollution web API
+"""
+
+from pyowm.pollutionapi30.uris import CO_INDEX_URL, OZONE_URL, NO2_INDEX_URL, SO2_INDEX_URL
+from pyowm.pollutionapi30.airpollution_client import AirPollutionHttpClient
+
+
+class AsyncAirPollutionHttpClient(AirPollutionHttpClient):
+
+    """
+    The asyncio counterpart of *AirPollutionHttpClient*: endpoints are invoked
+    via coroutines.
+
+    :param API_key: a Unicode object representing the OWM Air Pollution web API key
+    :type API_key: Unicode
+    :param httpclient: an *async_http_client.AsyncHttpClient* instance that
+        will be used to send requests to the OWM Air Pollution web API.
+    :type httpclient: an *async_http_client.AsyncHttpClient* instance
+
+    """
+
+    async def get_coi(self, params_dict):
+        """
+        Invokes the CO Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        uri = self._build_url(CO_INDEX_URL, params_dict)
+        _, json_data = await self._client.cacheable_get_json(uri)
+        return json_data
+
+    async def get_o3(self, params_dict):
+        """
+        Invokes the O3 Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        uri = self._build_url(OZONE_URL, params_dict)
+        _, json_data = await self._client.cacheable_get_json(uri)
+        return json_data
+
+    async def get_no2(self, params_dict):
+        """
+        Invokes the NO2 Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        uri = self._build_url(NO2_INDEX_URL, params_dict)
+        _, json_data = await self._client.cacheable_get_json(uri)
+        return json_data
+
+    async def get_so2(self, params_dict):
+        """
+        Invokes the SO2 Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        uri = self._build_url(SO2_INDEX_URL, params_dict)
+        _, json_data = await self._client.cacheable_get_json(uri)
+        return json_data
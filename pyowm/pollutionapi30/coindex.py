@@ -2,13 +2,14 @@
 Carbon Monoxide classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.pollutionapi30.xsd.xmlnsconfig import COINDEX_XMLNS_URL, COINDEX_XMLNS_PREFIX
 from pyowm.utils import timeformatutils, timeutils, xmlutils
 
 
-class COIndex(object):
+class COIndex(Slotted):
     """
     A class representing the Carbon monOxide Index observed in a certain location
     in the world. The index is made up of several measurements, each one at a
@@ -32,6 +33,9 @@ class COIndex(object):
 
     """
 
+    __slots__ = ('_reference_time', '_location', '_interval', '_co_samples',
+                 '_reception_time')
+
     def __init__(self, reference_time, location, interval, co_samples,
                  reception_time):
         if reference_time < 0:
@@ -101,7 +105,7 @@ class COIndex(object):
         :returns: list of dicts
 
         """
-        return self._co_samples
+        return list(self._co_samples)
 
     def get_co_sample_with_highest_vmr(self):
         """
@@ -132,8 +136,8 @@ class COIndex(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reference_time": self._reference_time,
-                           "location": json.loads(self._location.to_JSON()),
+        return jsoncodec.dumps({"reference_time": self._reference_time,
+                           "location": jsoncodec.loads(self._location.to_JSON()),
                            "interval": self._interval,
                            "co_samples": self._co_samples,
                            "reception_time": self._reception_time,
@@ -2,13 +2,14 @@
 Nitrogen Dioxide classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.pollutionapi30.xsd.xmlnsconfig import NO2INDEX_XMLNS_URL, NO2INDEX_XMLNS_PREFIX
 from pyowm.utils import timeformatutils, timeutils, xmlutils
 
 
-class NO2Index(object):
+class NO2Index(Slotted):
     """
     A class representing the Nitrogen DiOxide Index observed in a certain location
     in the world. The index is made up of several measurements, each one at a
@@ -32,6 +33,9 @@ class NO2Index(object):
 
     """
 
+    __slots__ = ('_reference_time', '_location', '_interval', '_no2_samples',
+                 '_reception_time')
+
     def __init__(self, reference_time, location, interval, no2_samples,
                  reception_time):
         if reference_time < 0:
@@ -101,7 +105,7 @@ class NO2Index(object):
         :returns: list of dicts
 
         """
-        return self._no2_samples
+        return list(self._no2_samples)
 
     def get_sample_by_label(self, label):
         """
@@ -132,8 +136,8 @@ class NO2Index(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reference_time": self._reference_time,
-                           "location": json.loads(self._location.to_JSON()),
+        return jsoncodec.dumps({"reference_time": self._reference_time,
+                           "location": jsoncodec.loads(self._location.to_JSON()),
                            "interval": self._interval,
                            "no2_samples": self._no2_samples,
                            "reception_time": self._reception_time,
@@ -1,10 +1,11 @@
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.pollutionapi30.xsd.xmlnsconfig import OZONE_XMLNS_URL, OZONE_XMLNS_PREFIX
 from pyowm.utils import timeformatutils, timeutils, xmlutils
 
 
-class Ozone(object):
+class Ozone(Slotted):
     """
     A class representing the Ozone (O3) data observed in a certain location
     in the world. The location is represented by the encapsulated *Location* object.
@@ -27,6 +28,9 @@ class Ozone(object):
 
     """
 
+    __slots__ = ('_reference_time', '_location', '_interval', 'du_value',
+                 '_reception_time')
+
     def __init__(self, reference_time, location, interval, du_value, reception_time):
         if reference_time < 0:
             raise ValueError("'referencetime' must be greater than 0")
@@ -112,8 +116,8 @@ class Ozone(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reference_time": self._reference_time,
-                           "location": json.loads(self._location.to_JSON()),
+        return jsoncodec.dumps({"reference_time": self._reference_time,
+                           "location": jsoncodec.loads(self._location.to_JSON()),
                            "interval": self._interval,
                            "value": self.du_value,
                            "reception_time": self._reception_time,
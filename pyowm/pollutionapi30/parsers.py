@@ -1,4 +1,3 @@
-import json
 from pyowm.pollutionapi30 import coindex, no2index, ozone, so2index
 from pyowm.weatherapi25 import location
 from pyowm.abstractions import jsonparser
@@ -16,23 +15,23 @@ class COIndexParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *COIndex* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: an *COIndex* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             # -- reference time (strip away Z and T on ISO8601 format)
             t = d['time'].replace('Z', '+00').replace('T', ' ')
@@ -70,23 +69,23 @@ class NO2IndexParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *NO2Index* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: an *NO2Index* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             # -- reference time (strip away Z and T on ISO8601 format)
             t = d['time'].replace('Z', '+00').replace('T', ' ')
@@ -126,23 +125,23 @@ class OzoneParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *Ozone* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: an *Ozone* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             # -- reference time (strip away Z and T on ISO8601 format)
             ref_t = d['time'].replace('Z', '+00').replace('T', ' ')
@@ -183,23 +182,23 @@ class SO2IndexParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *SO2Index* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a *SO2Index* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             # -- reference time (strip away Z and T on ISO8601 format)
             t = d['time'].replace('Z', '+00').replace('T', ' ')
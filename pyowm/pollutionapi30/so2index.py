@@ -2,13 +2,14 @@
 Sulphur Dioxide classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.pollutionapi30.xsd.xmlnsconfig import SO2INDEX_XMLNS_URL, SO2INDEX_XMLNS_PREFIX
 from pyowm.utils import timeformatutils, timeutils, xmlutils
 
 
-class SO2Index(object):
+class SO2Index(Slotted):
     """
     A class representing the Sulphur Dioxide Index observed in a certain location
     in the world. The index is made up of several measurements, each one at a
@@ -32,6 +33,9 @@ class SO2Index(object):
 
     """
 
+    __slots__ = ('_reference_time', '_location', '_interval', '_so2_samples',
+                 '_reception_time')
+
     def __init__(self, reference_time, location, interval, so2_samples, reception_time):
         if reference_time < 0:
             raise ValueError("'reference_time' must be greater than 0")
@@ -100,7 +104,7 @@ class SO2Index(object):
         :returns: list of dicts
 
         """
-        return self._so2_samples
+        return list(self._so2_samples)
 
     def is_forecast(self):
         """
@@ -117,8 +121,8 @@ class SO2Index(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reference_time": self._reference_time,
-                           "location": json.loads(self._location.to_JSON()),
+        return jsoncodec.dumps({"reference_time": self._reference_time,
+                           "location": jsoncodec.loads(self._location.to_JSON()),
                            "interval": self._interval,
                            "so2_samples": self._so2_samples,
                            "reception_time": self._reception_time,
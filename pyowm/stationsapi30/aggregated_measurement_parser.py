@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning an AggregatedMeasurement instance
 """
 
-import json
 from pyowm.abstractions import jsonparser
 from pyowm.exceptions import parse_response_error
 from pyowm.stationsapi30.measurement import AggregatedMeasurement
@@ -22,32 +21,22 @@ class AggregatedMeasurementParser(jsonparser.JSONParser):
         pass
 
     def parse_dict(self, data_dict):
-        """
-        Parses a dictionary representing the attributes of a
-        *pyowm.stationsapi30.smeasurement.AggregatedMeasurement* entity
-        :param data_dict: dict
-        :return: *pyowm.stationsapi30.measurement.AggregatedMeasurement*
-        """
-        assert isinstance(data_dict, dict)
-        string_repr = json.dumps(data_dict)
-        return self.parse_JSON(string_repr)
-
-    def parse_JSON(self, JSON_string):
         """
         Parses a *pyowm.stationsapi30.measurement.AggregatedMeasurement*
         instance out of raw JSON data.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :return: a *pyowm.stationsapi30.measurement.AggregatedMeasurement*
           instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        assert isinstance(data_dict, dict)
+        d = data_dict
         station_id = d.get('station_id', None)
         ts = d.get('date', None)
         if ts is not None:
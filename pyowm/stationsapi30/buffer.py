@@ -1,5 +1,5 @@
-import json
 import copy
+from pyowm.commons import jsoncodec
 from pyowm.stationsapi30.measurement import Measurement
 from pyowm.utils import timeutils, timeformatutils
 
@@ -59,7 +59,7 @@ class Buffer:
         :param json_string: the JSON formatted string
 
         """
-        a_dict = json.loads(json_string)
+        a_dict = jsoncodec.loads(json_string)
         self.append_from_dict(a_dict)
 
     def empty(self):
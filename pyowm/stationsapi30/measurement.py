@@ -1,8 +1,9 @@
-import json
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.utils import timeformatutils
 
 
-class AggregatedMeasurement:
+class AggregatedMeasurement(Slotted):
     """
     A class representing an aggregation of measurements done by the Stations API
     on a specific time-frame. Values for the aggregation time-frame can be: 'm'
@@ -26,6 +27,9 @@ class AggregatedMeasurement:
     :type precipitation: dict or `None`
     """
 
+    __slots__ = ('station_id', 'timestamp', 'aggregated_on', 'temp',
+                 'humidity', 'wind', 'pressure', 'precipitation')
+
     ALLOWED_AGGREGATION_TIME_FRAMES = ['m', 'h', 'd']
 
     def __init__(self, station_id, timestamp, aggregated_on, temp=None,
@@ -82,7 +86,7 @@ class AggregatedMeasurement:
         :returns: the JSON string
 
         """
-        return json.dumps(self.to_dict())
+        return jsoncodec.dumps(self.to_dict())
 
     def __repr__(self):
         return '<%s.%s - station_id=%s, created_at=%s>' \
@@ -90,7 +94,16 @@ class AggregatedMeasurement:
                   self.station_id, self.creation_time())
 
 
-class Measurement:
+class Measurement(Slotted):
+
+    __slots__ = ('station_id', 'timestamp', 'temperature', 'wind_speed',
+                 'wind_gust', 'wind_deg', 'pressure', 'humidity', 'rain_1h',
+                 'rain_6h', 'rain_24h', 'snow_1h', 'snow_6h', 'snow_24h',
+                 'dew_point', 'humidex', 'heat_index', 'visibility_distance',
+                 'visibility_prefix', 'clouds_distance', 'clouds_condition',
+                 'clouds_cumulus', 'weather_precipitation',
+                 'weather_descriptor', 'weather_intensity',
+                 'weather_proximity', 'weather_obscuration', 'weather_other')
 
     def __init__(self, station_id, timestamp, temperature=None, wind_speed=None,
                  wind_gust=None, wind_deg=None, pressure=None, humidity=None,
@@ -238,7 +251,7 @@ class Measurement:
         :returns: the JSON string
 
         """
-        return json.dumps(self.to_dict())
+        return jsoncodec.dumps(self.to_dict())
 
     def __repr__(self):
         return '<%s.%s - station_id=%s, created_at=%s>' \
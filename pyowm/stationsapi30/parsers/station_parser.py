@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a Station instance
 """
 
-import json
 from pyowm.abstractions import jsonparser
 from pyowm.exceptions import parse_response_error
 from pyowm.stationsapi30.station import Station
@@ -21,32 +20,22 @@ class StationParser(jsonparser.JSONParser):
         pass
 
     def parse_dict(self, data_dict):
-        """
-        Parses a dictionary representing the attributes of a
-        *pyowm.stationsapi30.station.Station* entity
-        :param data_dict: dict
-        :return: *pyowm.stationsapi30.station.Station*
-        """
-        assert isinstance(data_dict, dict)
-        string_repr = json.dumps(data_dict)
-        return self.parse_JSON(string_repr)
-
-    def parse_JSON(self, JSON_string):
         """
         Parses a *pyowm.stationsapi30.station.Station* instance out of raw JSON
         data.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :return: a *pyowm.stationsapi30.station.Station* instance or ``None``
             if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        assert isinstance(data_dict, dict)
+        d = data_dict
         try:
             id = d.get('ID', None) or d.get('id', None)
             external_id = d.get('external_id', None)
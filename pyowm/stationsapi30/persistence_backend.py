@@ -5,8 +5,8 @@ of raw measurements I/O
 
 
 import os
-import json
 from abc import ABCMeta, abstractmethod
+from pyowm.commons import jsoncodec
 from pyowm.stationsapi30.buffer import Buffer
 
 
@@ -73,7 +73,7 @@ class JSONPersistenceBackend(PersistenceBackend):
             raise ValueError('No station ID specified')
         result = Buffer(self._station_id)
         with open(self._file_path, 'r') as f:
-            list_of_dicts = json.load(f)
+            list_of_dicts = jsoncodec.loads(f.read())
             for _dict in list_of_dicts:
                 result.append_from_dict(_dict)
             return result
@@ -1,12 +1,13 @@
-import json
 from datetime import datetime as dt
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.stationsapi30.xsd.xmlnsconfig import (
     STATION_XMLNS_PREFIX, STATION_XMLNS_URL)
 from pyowm.utils import xmlutils, timeformatutils
 
 
-class Station:
+class Station(Slotted):
     """
     A class representing a meteostation in Stations API.
     A reference about OWM stations can be found at:
@@ -32,6 +33,9 @@ class Station:
     :type rank: int
     """
 
+    __slots__ = ('id', 'created_at', 'updated_at', 'external_id', 'name',
+                 '_lon', 'lon', 'lat', 'alt', 'rank')
+
     def __init__(self, id, created_at, updated_at, external_id, name,
                  lon, lat, alt, rank):
         assert id is not None
@@ -122,7 +126,7 @@ class Station:
         :returns: the JSON string
 
         """
-        return json.dumps({'id': self.id,
+        return jsoncodec.dumps({'id': self.id,
                            'external_id': self.external_id,
                            'name': self.name,
                            'created_at': timeformatutils.to_ISO8601(self.created_at),
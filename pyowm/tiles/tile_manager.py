@@ -18,18 +18,21 @@ class TileManager(object):
     :type API_key: str
     :param map_layer: the layer for which you want tiles fetched. Allowed map layers are specified by the `pyowm.tiles.enum.MapLayerEnum` enumerator class.
     :type map_layer: str
+    :param session: the ``requests.Session`` to be used for API calls (defaults
+        to ``None``, which means a new connection is opened for each call)
+    :type session: ``requests.Session``
     :returns: a *TileManager* instance
     :raises: *AssertionError* when no API Key or no map layer is provided, or map layer name is not a string
 
     """
 
-    def __init__(self, API_key, map_layer):
+    def __init__(self, API_key, map_layer, session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert map_layer is not None, 'You must provide a valid map layer name'
         assert isinstance(map_layer, str), 'Map layer name must be a string'
         self.map_layer = map_layer
-        self.http_client = HttpClient()
+        self.http_client = HttpClient(session=session)
 
     def get_tile(self, x, y, zoom):
         """
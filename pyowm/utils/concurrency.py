@@ -0,0 +1,205 @@
+"""
+Module containing utilities for issuing many API calls concurrently
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pyowm.commons.databoxes import BulkResult
+
+
+def _to_bulk_result(query, future):
+    try:
+        return BulkResult(query, future.result())
+    except Exception as e:
+        return BulkResult(query, None, error=e)
+
+
+def bulk_map(function, queries, max_workers):
+    """
+    Applies the function to each one of the queries using a pool of worker
+    threads, yielding a *BulkResult* per query in the same order as the
+    queries. A query failure does not stop the others: the raised exception is
+    reported in the corresponding *BulkResult*.
+    Queries are consumed lazily and at most twice as many queries as workers
+    are in flight at any time, so that results can be consumed while the
+    remaining queries are still being processed. Queries not yet started are
+    cancelled if the generator is closed before being exhausted.
+
+    :param function: the one-argument callable to be applied to each query
+    :type function: callable
+    :param queries: the queries
+    :type queries: iterable
+    :param max_workers: the maximum number of worker threads
+    :type max_workers: int
+    :returns: a generator of *BulkResult* instances
+    :raises: *AssertionError* if the maximum number of workers is not a
+        positive int
+
+    """
+    assert isinstance(max_workers, int) and max_workers > 0, \
+        "'max_workers' must be an int greater than zero"
+    return _bulk_map(function, queries, max_workers)
+
+
+def _bulk_map(function, queries, max_workers):
+    # a generator, apart from bulk_map so that arguments are checked upon
+    # invocation rather than upon the first iteration
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        for query in queries:
+            pending.append((query, executor.submit(function, query)))
+            if len(pending) >= 2 * max_workers:
+                yield _to_bulk_result(*pending.popleft())
+        while pending:
+            yield _to_bulk_result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+# The pool of worker threads running the background calls of all the
+# SingleFlight instances, which is created on first use
+_BACKGROUND_MAX_WORKERS = 4
+# The maximum number of background calls either running or waiting for a
+# worker thread: further ones are not started
+_BACKGROUND_MAX_PENDING = 256
+
+_background_executor = None
+_background_lock = threading.Lock()
+_background_slots = threading.BoundedSemaphore(_BACKGROUND_MAX_PENDING)
+
+
+def _submit_in_background(function, *args):
+    global _background_executor
+    with _background_lock:
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                max_workers=_BACKGROUND_MAX_WORKERS)
+        _background_executor.submit(function, *args)
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+
+    """
+    Deduplicates concurrent invocations of a function: while a call for a
+    given key is in flight, further calls for the same key issued by other
+    threads wait for it to complete and share its result - or its raised
+    exception - instead of invoking the function again. Keys are forgotten as
+    soon as their call completes, so results are not memoized.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = dict()
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Invokes the function with the provided arguments, unless a call for
+        the same key is already in flight: in that case, waits for that call
+        and returns its result (or raises its exception)
+
+        :param key: the key identifying the call
+        :type key: any hashable object
+        :param function: the callable to be invoked
+        :type function: callable
+        :returns: the return value of the function
+        :raises: any exception raised by the function; *RuntimeError* when
+            waiting for a call which has been interrupted by an exception not
+            deriving from *Exception* (eg: *KeyboardInterrupt*), which is only
+            raised by the interrupted caller
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        if not leader:
+            call.done.wait()
+        else:
+            self._run(key, call, function, args, kwargs)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do_in_background(self, key, function, *args, **kwargs):
+        """
+        Invokes the function with the provided arguments on the bounded pool
+        of worker threads shared by all the *SingleFlight* instances, unless a
+        call for the same key is already in flight: calls for the same key
+        issued with ``do`` meanwhile wait for the background call and share
+        its outcome. Exceptions raised by the function are not propagated to
+        the caller. No call is started either when too many background calls
+        are already waiting for a worker thread.
+
+        :param key: the key identifying the call
+        :type key: any hashable object
+        :param function: the callable to be invoked
+        :type function: callable
+        :returns: ``True`` if a background call was started, ``False`` if a
+            call for the same key was already in flight or if too many
+            background calls are pending
+
+        """
+        with self._lock:
+            if key in self._calls:
+                return False
+            if not _background_slots.acquire(False):
+                return False
+            call = _Call()
+            self._calls[key] = call
+        try:
+            _submit_in_background(self._run_in_background, key, call, function,
+                                  args, kwargs)
+        except RuntimeError:  # the interpreter is shutting down
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            _background_slots.release()
+            return False
+        return True
+
+    def _run_in_background(self, key, call, function, args, kwargs):
+        try:
+            self._run(key, call, function, args, kwargs)
+        finally:
+            _background_slots.release()
+
+    def _run(self, key, call, function, args, kwargs):
+        try:
+            call.result = function(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+        except BaseException as e:
+            # eg: KeyboardInterrupt: only propagated to the thread running
+            # the call, while the waiting callers fail instead of returning
+            # a result which has never been set
+            call.error = RuntimeError('The call was interrupted: %r' % e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """
+        Returns the number of calls currently in flight
+
+        :returns: an int
+
+        """
+        with self._lock:
+            return len(self._calls)
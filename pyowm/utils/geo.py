@@ -1,7 +1,7 @@
 
-import json
 import math
 import geojson
+from pyowm.commons import jsoncodec
 
 
 EARTH_RADIUS_KM = 6378.1
@@ -146,7 +146,7 @@ class Point(Geometry):
         return geojson.dumps(self._geom)
 
     def as_dict(self):
-        return json.loads(self.geojson())
+        return jsoncodec.loads(self.geojson())
 
     @classmethod
     def from_dict(self, the_dict):
@@ -155,7 +155,7 @@ class Point(Geometry):
         :param the_dict: the geoJSON dict
         :return: `pyowm.utils.geo.Point` instance
         """
-        geom = geojson.loads(json.dumps(the_dict))
+        geom = geojson.loads(jsoncodec.dumps(the_dict))
         result = Point(0, 0)
         result._geom = geom
         return result
@@ -211,7 +211,7 @@ class MultiPoint(Geometry):
         return geojson.dumps(self._geom)
 
     def as_dict(self):
-        return json.loads(self.geojson())
+        return jsoncodec.loads(self.geojson())
 
     @classmethod
     def from_dict(self, the_dict):
@@ -220,7 +220,7 @@ class MultiPoint(Geometry):
         :param the_dict: the geoJSON dict
         :return: `pyowm.utils.geo.MultiPoint` instance
         """
-        geom = geojson.loads(json.dumps(the_dict))
+        geom = geojson.loads(jsoncodec.dumps(the_dict))
         result = MultiPoint([(0, 0), (0, 0)])
         result._geom = geom
         return result
@@ -254,7 +254,7 @@ class Polygon(Geometry):
         return geojson.dumps(self._geom)
 
     def as_dict(self):
-        return json.loads(self.geojson())
+        return jsoncodec.loads(self.geojson())
 
     @property
     def points(self):
@@ -273,7 +273,7 @@ class Polygon(Geometry):
         :param the_dict: the geoJSON dict
         :return: `pyowm.utils.geo.Polygon` instance
         """
-        geom = geojson.loads(json.dumps(the_dict))
+        geom = geojson.loads(jsoncodec.dumps(the_dict))
         result = Polygon([[[0, 0], [0, 0]]])
         result._geom = geom
         return result
@@ -320,7 +320,7 @@ class MultiPolygon(Geometry):
         return geojson.dumps(self._geom)
 
     def as_dict(self):
-        return json.loads(self.geojson())
+        return jsoncodec.loads(self.geojson())
 
     @classmethod
     def from_dict(self, the_dict):
@@ -329,7 +329,7 @@ class MultiPolygon(Geometry):
         :param the_dict: the geoJSON dict
         :return: `pyowm.utils.geo.MultiPolygon` instance
         """
-        geom = geojson.loads(json.dumps(the_dict))
+        geom = geojson.loads(jsoncodec.dumps(the_dict))
         result = MultiPolygon([
             [[[0, 0], [0, 0]]],
             [[[1, 1], [1, 1]]]
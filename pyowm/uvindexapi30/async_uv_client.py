@@ -0,0 +1,71 @@
+"""
+Module containing the asyncio HTTP client for the OWM UV web API
+"""
+
+from pyowm.uvindexapi30.uris import UV_INDEX_URL, UV_INDEX_FORECAST_URL, \
+    UV_INDEX_HISTORY_URL
+from pyowm.uvindexapi30.uv_client import UltraVioletHttpClient
+from pyowm.commons import http_client
+
+
+class AsyncUltraVioletHttpClient(UltraVioletHttpClient):
+
+    """
+    The asyncio counterpart of *UltraVioletHttpClient*: endpoints are invoked
+    via coroutines.
+
+    :param API_key: a Unicode object representing the OWM UV web API key
+    :type API_key: Unicode
+    :param httpclient: an *async_http_client.AsyncHttpClient* instance that
+        will be used to send requests to the OWM UV web API.
+    :type httpclient: an *async_http_client.AsyncHttpClient* instance
+
+    """
+
+    async def get_uvi(self, params_dict):
+        """
+        Invokes the UV Index endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        params = dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']))
+        uri = http_client.HttpClient.to_url(UV_INDEX_URL, self._API_key, None)
+        _, json_data = await self._client.cacheable_get_json(uri, params=params)
+        return json_data
+
+    async def get_uvi_forecast(self, params_dict):
+        """
+        Invokes the UV Index Forecast endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        params = dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']))
+        uri = http_client.HttpClient.to_url(UV_INDEX_FORECAST_URL,
+                                            self._API_key,
+                                            None)
+        _, json_data = await self._client.cacheable_get_json(uri, params=params)
+        return json_data
+
+    async def get_uvi_history(self, params_dict):
+        """
+        Invokes the UV Index History endpoint
+
+        :param params_dict: dict of parameters
+        :returns: the decoded JSON data
+        :raises: *ValueError*, *APICallError*
+
+        """
+        params = dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']),
+                      start=str(params_dict['start']),
+                      end=str(params_dict['end']))
+        uri = http_client.HttpClient.to_url(UV_INDEX_HISTORY_URL,
+                                            self._API_key,
+                                            None)
+        _, json_data = await self._client.cacheable_get_json(uri, params=params)
+        return json_data
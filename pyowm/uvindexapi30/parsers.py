@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning UVIndex objects
 """
 
-import json
 from pyowm.uvindexapi30 import uvindex
 from pyowm.weatherapi25 import location
 from pyowm.abstractions import jsonparser
@@ -21,23 +20,23 @@ class UVIndexParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *UVIndex* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: an *UVIndex* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             # -- reference time
             reference_time = d['date']
@@ -74,14 +73,14 @@ class UVIndexListParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses a list of *UVIndex* instances out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: list
         :returns: a list of *UVIndex* instances or an empty list if no data is
             available
         :raises: *ParseResponseError* if it is impossible to find or parse the
@@ -89,11 +88,11 @@ class UVIndexListParser(jsonparser.JSONParser):
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         uvindex_parser = UVIndexParser()
-        return [uvindex_parser.parse_JSON(json.dumps(item)) for item in d]
+        return [uvindex_parser.parse_dict(item) for item in d]
 
     def __repr__(self):
         return "<%s.%s>" % (__name__, self.__class__.__name__)
@@ -41,7 +41,7 @@ class UltraVioletHttpClient(object):
         Invokes the UV Index endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
@@ -59,7 +59,7 @@ class UltraVioletHttpClient(object):
         Invokes the UV Index Forecast endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
@@ -79,7 +79,7 @@ class UltraVioletHttpClient(object):
         Invokes the UV Index History endpoint
 
         :param params_dict: dict of parameters
-        :returns: a string containing raw JSON data
+        :returns: the decoded JSON data
         :raises: *ValueError*, *APICallError*
 
         """
@@ -1,5 +1,6 @@
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.uvindexapi30.xsd.xmlnsconfig import (
     UVINDEX_XMLNS_URL, UVINDEX_XMLNS_PREFIX)
 from pyowm.utils import timeformatutils, xmlutils
@@ -19,7 +20,7 @@ def uv_intensity_to_exposure_risk(uv_intensity):
         return 'extreme'
 
 
-class UVIndex(object):
+class UVIndex(Slotted):
     """
     A class representing the UltraViolet Index observed in a certain location
     in the world. The location is represented by the encapsulated *Location* object.
@@ -39,6 +40,8 @@ class UVIndex(object):
 
     """
 
+    __slots__ = ('_reference_time', '_location', '_value', '_reception_time')
+
     def __init__(self, reference_time, location, value, reception_time):
         if reference_time < 0:
             raise ValueError("'referencetime' must be greater than 0")
@@ -114,8 +117,8 @@ class UVIndex(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reference_time": self._reference_time,
-                           "location": json.loads(self._location.to_JSON()),
+        return jsoncodec.dumps({"reference_time": self._reference_time,
+                           "location": jsoncodec.loads(self._location.to_JSON()),
                            "value": self._value,
                            "reception_time": self._reception_time,
                            })
@@ -0,0 +1,287 @@
+"""
+Module containing the asyncio entry point to the OWM Weather API 2.5 and to
+the UV and Air Pollution APIs. It requires the optional ``aiohttp`` dependency
+"""
+
+import asyncio
+from functools import wraps
+from pyowm.weatherapi25.configuration25 import OBSERVATION_URL, \
+    GROUP_OBSERVATIONS_URL, ASYNC_CONNECTION_LIMIT
+from pyowm.caches import nullcache
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.commons.databoxes import BulkResult
+from pyowm.pollutionapi30.async_airpollution_client import AsyncAirPollutionHttpClient
+from pyowm.uvindexapi30.async_uv_client import AsyncUltraVioletHttpClient
+from pyowm.exceptions import api_call_error
+from pyowm.weatherapi25.owm25 import OWM25
+
+
+def _coroutine_of(method):
+    """
+    Turns a query method of *OWM25* into a coroutine function, so that the
+    validation of its arguments takes place when the coroutine is awaited
+    along with the API call it issues
+
+    """
+    @wraps(method)
+    async def coroutine(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+    coroutine.__doc__ = 'Coroutine version of *OWM25.%s*' % method.__name__
+    return coroutine
+
+
+async def _bulk_map(function, items, max_workers):
+    """
+    The asyncio counterpart of ``concurrency.bulk_map``: awaits the coroutine
+    function on each one of the items, at most max_workers at a time
+
+    :returns: a list of *BulkResult* instances, in the same order as the items
+    """
+    assert isinstance(max_workers, int) and max_workers > 0, \
+        "'max_workers' must be a positive int"
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def apply(item):
+        async with semaphore:
+            try:
+                return BulkResult(item, await function(item))
+            except Exception as e:
+                return BulkResult(item, None, error=e)
+
+    return await asyncio.gather(*[apply(item) for item in items])
+
+
+class AsyncOWM25(OWM25):
+
+    """
+    The asyncio counterpart of *OWM25*: each OWM Weather API 2.5, UV API and
+    Air Pollution API endpoint is exposed as a coroutine having the same
+    name, parameters, validation rules and results of the corresponding
+    *OWM25* method, eg::
+
+        async with AsyncOWM25(parsers, API_key) as owm:
+            obs = await owm.weather_at_id(2643743)
+
+    The query methods are the ones of *OWM25*, whose API calls are issued by
+    an *AsyncHttpClient*: responses are therefore cached - negative and stale
+    responses included - and parsed exactly as *OWM25* does.
+
+    :param parsers: the dictionary containing *jsonparser* concrete instances
+        to be used as parsers for OWM Weather API 2.5 responses
+    :type parsers: dict
+    :param API_key: the OWM Weather API key (defaults to ``None``)
+    :type API_key: str
+    :param cache: a concrete implementation of class *OWMCache* serving as the
+        cache provider (defaults to a *NullCache* instance)
+    :type cache: an *OWMCache* concrete instance
+    :param language: the language in which you want text results to be returned.
+          It's a two-characters string, eg: "en", "ru", "it". Defaults to: "en"
+    :type language: str
+    :param subscription_type: the type of OWM Weather API subscription to be wrapped.
+           Can be 'free' (free subscription) or 'pro' (paid subscription),
+           Defaults to: 'free'
+    :type subscription_type: str
+    :param use_ssl: whether API calls should be made via SSL or not.
+           Defaults to: False
+    :type use_ssl: bool
+    :param session: the ``aiohttp.ClientSession`` used for all the API calls.
+        Defaults to ``None``, which means that a session is created on the
+        first call and closed by ``close()``
+    :type session: ``aiohttp.ClientSession``
+    :param negative_cache: a concrete implementation of class *OWMCache*
+        serving as the cache provider for not found errors and empty results
+        (defaults to ``None``, meaning that they are not cached)
+    :type negative_cache: an *OWMCache* concrete instance
+    :param object_cache: the cache of the domain objects parsed out of cached
+        responses, so that they are not parsed again on cache hits (defaults
+        to ``None``, meaning that responses are parsed on every query)
+    :type object_cache: *ObjectCache*
+    :returns: an *AsyncOWM25* instance
+
+    """
+
+    def __init__(self, parsers, API_key=None, cache=nullcache.NullCache(),
+                 language="en", subscription_type='free', use_ssl=False,
+                 session=None, negative_cache=None, object_cache=None):
+        self._parsers = parsers
+        if API_key is not None:
+            assert isinstance(API_key, str), "Value must be a string"
+        self._API_key = API_key
+        # the API clients/managers not covered by this class are synchronous
+        # and open their own sessions
+        self._session = None
+        self._wapi = AsyncHttpClient(cache=cache, session=session,
+                                     negative_cache=negative_cache)
+        self._uvapi = AsyncUltraVioletHttpClient(API_key, self._wapi)
+        self._pollapi = AsyncAirPollutionHttpClient(API_key, self._wapi)
+        self._language = language
+        if API_key is None and subscription_type == 'pro':
+            raise AssertionError('You must provide an API Key for paid subscriptions')
+        self._subscription_type = subscription_type
+        self._use_ssl = use_ssl
+        self._object_cache = object_cache
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session, if it was created by this object
+
+        """
+        await self._wapi.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _query(self, parser_name, fetch, *args, finish=None):
+        result = self._parse(parser_name, await fetch(*args))
+        return result if finish is None else finish(result)
+
+    async def _get_json(self, API_endpoint_URL, params):
+        uri = self._wapi.to_url(API_endpoint_URL, self._API_key,
+                                self._subscription_type, self._use_ssl)
+        _, json_data = await self._wapi.cacheable_get_json(uri, params=params)
+        return json_data
+
+    async def is_API_online(self):
+        """
+        Coroutine version of *OWM25.is_API_online*
+
+        :returns: bool
+        """
+        try:
+            await self._get_json(OBSERVATION_URL, {'q': 'London,GB'})
+            return True
+        except api_call_error.APICallTimeoutError:
+            return False
+
+    #  --- WEATHER API ENDPOINTS ---
+
+    weather_at_place = _coroutine_of(OWM25.weather_at_place)
+    weather_at_coords = _coroutine_of(OWM25.weather_at_coords)
+    weather_at_zip_code = _coroutine_of(OWM25.weather_at_zip_code)
+    weather_at_id = _coroutine_of(OWM25.weather_at_id)
+    weather_at_places = _coroutine_of(OWM25.weather_at_places)
+    weather_at_station = _coroutine_of(OWM25.weather_at_station)
+    weather_at_stations_in_bbox = _coroutine_of(OWM25.weather_at_stations_in_bbox)
+    weather_at_places_in_bbox = _coroutine_of(OWM25.weather_at_places_in_bbox)
+    weather_around_coords = _coroutine_of(OWM25.weather_around_coords)
+    three_hours_forecast = _coroutine_of(OWM25.three_hours_forecast)
+    three_hours_forecast_at_coords = _coroutine_of(OWM25.three_hours_forecast_at_coords)
+    three_hours_forecast_at_id = _coroutine_of(OWM25.three_hours_forecast_at_id)
+    daily_forecast = _coroutine_of(OWM25.daily_forecast)
+    daily_forecast_at_coords = _coroutine_of(OWM25.daily_forecast_at_coords)
+    daily_forecast_at_id = _coroutine_of(OWM25.daily_forecast_at_id)
+    weather_history_at_place = _coroutine_of(OWM25.weather_history_at_place)
+    weather_history_at_coords = _coroutine_of(OWM25.weather_history_at_coords)
+    weather_history_at_id = _coroutine_of(OWM25.weather_history_at_id)
+    station_at_coords = _coroutine_of(OWM25.station_at_coords)
+    station_tick_history = _coroutine_of(OWM25.station_tick_history)
+    station_hour_history = _coroutine_of(OWM25.station_hour_history)
+    station_day_history = _coroutine_of(OWM25.station_day_history)
+
+    async def weather_at_ids(self, ids_list, max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.weather_at_ids*: the chunks of city IDs
+        missing from the cache are queried at most max_workers at a time
+
+        :returns: a list of *Observation* instances
+        """
+        observations, chunks = self._weather_at_ids_lookup(ids_list)
+        for outcome in await _bulk_map(self._weather_at_ids_chunk, chunks,
+                                       max_workers):
+            if not outcome.is_success():
+                raise outcome.error
+            observations.update(outcome.result)
+        return [observations[id] for id in ids_list
+                if observations.get(id) is not None]
+
+    async def _weather_at_ids_chunk(self, ids_chunk):
+        data = await self._get_json(GROUP_OBSERVATIONS_URL,
+                                    self._group_params(ids_chunk))
+        return self._cache_group_observations(data)
+
+    #  --- UV API ENDPOINTS ---
+
+    uvindex_around_coords = _coroutine_of(OWM25.uvindex_around_coords)
+    uvindex_forecast_around_coords = _coroutine_of(OWM25.uvindex_forecast_around_coords)
+    uvindex_history_around_coords = _coroutine_of(OWM25.uvindex_history_around_coords)
+
+    #  --- POLLUTION API ENDPOINTS ---
+
+    coindex_around_coords = _coroutine_of(OWM25.coindex_around_coords)
+    ozone_around_coords = _coroutine_of(OWM25.ozone_around_coords)
+    no2index_around_coords = _coroutine_of(OWM25.no2index_around_coords)
+    so2index_around_coords = _coroutine_of(OWM25.so2index_around_coords)
+
+    #  --- BULK API CALLS ---
+
+    async def weather_at_coords_many(self, coords_list,
+                                     max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.weather_at_coords_many*: at most
+        max_workers API calls are in flight at a time
+
+        :returns: a list of *BulkResult* instances, in the same order as the
+            input coordinates
+        """
+        return await _bulk_map(lambda coords: self.weather_at_coords(*coords),
+                               coords_list, max_workers)
+
+    async def weather_at_ids_many(self, ids_list,
+                                  max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.weather_at_ids_many* (see
+        *weather_at_coords_many*)
+
+        :returns: a list of *BulkResult* instances
+        """
+        return await _bulk_map(self.weather_at_id, ids_list, max_workers)
+
+    async def three_hours_forecast_at_coords_many(self, coords_list,
+                                                  max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.three_hours_forecast_at_coords_many* (see
+        *weather_at_coords_many*)
+
+        :returns: a list of *BulkResult* instances
+        """
+        return await _bulk_map(
+            lambda coords: self.three_hours_forecast_at_coords(*coords),
+            coords_list, max_workers)
+
+    async def three_hours_forecast_at_ids_many(self, ids_list,
+                                               max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.three_hours_forecast_at_ids_many* (see
+        *weather_at_coords_many*)
+
+        :returns: a list of *BulkResult* instances
+        """
+        return await _bulk_map(self.three_hours_forecast_at_id, ids_list,
+                               max_workers)
+
+    async def daily_forecast_at_coords_many(self, coords_list, limit=None,
+                                            max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.daily_forecast_at_coords_many* (see
+        *weather_at_coords_many*)
+
+        :returns: a list of *BulkResult* instances
+        """
+        return await _bulk_map(
+            lambda coords: self.daily_forecast_at_coords(*coords, limit=limit),
+            coords_list, max_workers)
+
+    async def daily_forecast_at_ids_many(self, ids_list, limit=None,
+                                         max_workers=ASYNC_CONNECTION_LIMIT):
+        """
+        Coroutine version of *OWM25.daily_forecast_at_ids_many* (see
+        *weather_at_coords_many*)
+
+        :returns: a list of *BulkResult* instances
+        """
+        return await _bulk_map(
+            lambda id: self.daily_forecast_at_id(id, limit=limit),
+            ids_list, max_workers)
@@ -0,0 +1,240 @@
+"""
+Module containing a scheduler keeping the cached responses about a known set
+of locations fresh
+"""
+
+import heapq
+import threading
+from itertools import count
+from time import monotonic
+from pyowm.uvindexapi30.uris import UV_INDEX_URL
+from pyowm.weatherapi25.configuration25 import OBSERVATION_URL, \
+    THREE_HOURS_FORECAST_URL, GROUP_OBSERVATIONS_MAX_IDS, cache_ttl_policy
+
+# Endpoints which can be warmed: each one maps to the URL its lifetime is
+# looked up with and to the OWM25 query for each kind of location. Weather
+# at city IDs is queried in groups; UV index is only available by coordinates
+_ENDPOINTS = {
+    'weather': (OBSERVATION_URL, {
+        'ids': lambda owm, ids: owm.weather_at_ids(ids),
+        'coords': lambda owm, coords: owm.weather_at_coords(*coords),
+        'places': lambda owm, name: owm.weather_at_place(name)}),
+    'forecast': (THREE_HOURS_FORECAST_URL, {
+        'ids': lambda owm, id: owm.three_hours_forecast_at_id(id),
+        'coords': lambda owm, coords: owm.three_hours_forecast_at_coords(*coords),
+        'places': lambda owm, name: owm.three_hours_forecast(name)}),
+    'uvindex': (UV_INDEX_URL, {
+        'coords': lambda owm, coords: owm.uvindex_around_coords(*coords)})
+}
+
+
+class _Task(object):
+
+    __slots__ = ('query', 'argument', 'interval')
+
+    def __init__(self, query, argument, interval):
+        self.query = query
+        self.argument = argument
+        self.interval = interval  # seconds between refreshes
+
+
+class CacheWarmer(object):
+    """
+    Keeps the cached responses about a known set of locations (city IDs,
+    geographic coordinates or place names) fresh, by querying them again
+    through an *OWM25* object shortly before their lifetime expires: user
+    queries about these locations are then served by the cache, without
+    waiting for the OWM web APIs.
+    Queries are issued one at a time and spaced out so that they do not
+    exceed the allowed calls per minute (eg: the ones of the API key
+    subscription), which spreads the refreshes of the locations over time;
+    weather at city IDs is queried with group calls, each one refreshing up
+    to 20 city IDs. Failed queries are retried after a delay.
+    The warmer must be given the same lifetimes as the cache provider (see
+    ``configuration25.cache_ttl_policy``). It can either run in a background
+    thread (``start``/``stop``) or be driven by the caller (``run_pending``).
+
+    :param owm: the *OWM25* object whose cache is to be kept fresh
+    :type owm: *OWM25*
+    :param ids: the city IDs
+    :type ids: list of int
+    :param coords: the geographic coordinates
+    :type coords: list of (lat, lon) tuples
+    :param places: the place names (eg: 'London,GB')
+    :type places: list of str
+    :param endpoints: the endpoints to be kept fresh, among 'weather'
+        (currently observed weather), 'forecast' (3 hours forecast) and
+        'uvindex' (UV index, only for geographic coordinates)
+    :type endpoints: list of str
+    :param ttl_policy: the policy assigning lifetimes to the cached responses
+        (defaults to ``configuration25.cache_ttl_policy``)
+    :type ttl_policy: *TTLPolicy*
+    :param default_lifetime_millis: the lifetime of the responses to the
+        endpoints which are not matched by the TTL policy. A reasonable
+        default value is provided.
+    :type default_lifetime_millis: int
+    :param lead_millis: how long before their expiry responses are refreshed.
+        It is shortened to a half of their lifetime, for shorter lifetimes.
+        A reasonable default value is provided.
+    :type lead_millis: int
+    :param calls_per_minute: the maximum number of queries per minute. A
+        reasonable default value is provided (the free subscription limit)
+    :type calls_per_minute: int or float
+    :param retry_millis: how long after a failure a query is retried. A
+        reasonable default value is provided.
+    :type retry_millis: int
+    :returns: a new *CacheWarmer* instance
+    :raises: *AssertionError* on wrong parameters
+
+    """
+
+    _DEFAULT_LIFETIME_MILLISECONDS = 1000 * 60 * 10
+    _LEAD_MILLISECONDS = 1000 * 60
+    _CALLS_PER_MINUTE = 60
+    _RETRY_MILLISECONDS = 1000 * 60
+
+    def __init__(self, owm, ids=None, coords=None, places=None,
+                 endpoints=('weather', 'forecast'), ttl_policy=cache_ttl_policy,
+                 default_lifetime_millis=_DEFAULT_LIFETIME_MILLISECONDS,
+                 lead_millis=_LEAD_MILLISECONDS,
+                 calls_per_minute=_CALLS_PER_MINUTE,
+                 retry_millis=_RETRY_MILLISECONDS):
+        for endpoint in endpoints:
+            assert endpoint in _ENDPOINTS, \
+                "endpoints must be among: %s" % ', '.join(sorted(_ENDPOINTS))
+        assert default_lifetime_millis > 0 and lead_millis >= 0 and \
+            calls_per_minute > 0 and retry_millis > 0, \
+            "wrong cache warmer init parameters"
+        self._owm = owm
+        self._call_interval = 60. / calls_per_minute
+        self._retry_interval = retry_millis / 1000.
+        locations = dict(ids=list(ids or []), coords=list(coords or []),
+                         places=list(places or []))
+        self._tasks = []
+        for endpoint in endpoints:
+            url, queries = _ENDPOINTS[endpoint]
+            lifetime = ttl_policy.lifetime_for(url) if ttl_policy else None
+            if lifetime is None:
+                lifetime = default_lifetime_millis
+            interval = (lifetime - min(lead_millis, lifetime / 2.)) / 1000.
+            for kind, query in queries.items():
+                arguments = locations[kind]
+                if kind == 'ids' and endpoint == 'weather':
+                    arguments = [arguments[i:i + GROUP_OBSERVATIONS_MAX_IDS]
+                                 for i in range(0, len(arguments),
+                                                GROUP_OBSERVATIONS_MAX_IDS)]
+                self._tasks.extend(_Task(query, argument, interval)
+                                   for argument in arguments)
+        # all of the queries are due at once, the rate limit spreads them out
+        self._sequence = count()
+        self._schedule = [(0., next(self._sequence), task) for task in self._tasks]
+        self._next_call = 0.
+        self._failures = 0
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def run_pending(self):
+        """
+        Issues the queries which are due, as long as the calls per minute
+        allow for them
+
+        :returns: the number of queries issued
+
+        """
+        issued = 0
+        while self._schedule:
+            now = monotonic()
+            due, _, task = self._schedule[0]
+            if due > now or self._next_call > now:
+                break
+            heapq.heappop(self._schedule)
+            self._next_call = now + self._call_interval
+            issued += 1
+            try:
+                with self._owm.refreshing_cache():
+                    task.query(self._owm, task.argument)
+                interval = task.interval
+            except Exception:
+                self._failures += 1
+                interval = self._retry_interval
+            heapq.heappush(self._schedule,
+                           (now + interval, next(self._sequence), task))
+        return issued
+
+    def _seconds_to_next_call(self):
+        if not self._schedule:
+            return None
+        return max(self._schedule[0][0], self._next_call) - monotonic()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.run_pending()
+            self._stopped.wait(self._seconds_to_next_call())
+
+    def start(self):
+        """
+        Starts issuing the queries in a background daemon thread. Does
+        nothing if the warmer is already running.
+
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread, waiting for the query being issued - if
+        any - to complete. Does nothing if the warmer is not running.
+
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def is_running(self):
+        """
+        Tells whether the background thread is running
+
+        :returns: a bool
+
+        """
+        return self._thread is not None
+
+    def queries(self):
+        """
+        Returns the number of queries the warmer issues in each refresh round
+
+        :returns: an int
+
+        """
+        return len(self._tasks)
+
+    def required_calls_per_minute(self):
+        """
+        Returns the calls per minute needed to refresh all of the responses
+        before they expire: if it exceeds the allowed calls per minute, the
+        refreshes fall behind and some responses expire anyway
+
+        :returns: a float
+
+        """
+        return sum(60. / task.interval for task in self._tasks)
+
+    def failures(self):
+        """
+        Returns the number of failed queries since the warmer was created
+
+        :returns: an int
+
+        """
+        return self._failures
+
+    def __repr__(self):
+        return "<%s.%s - queries=%s, failures=%s, running=%s>" % \
+            (__name__, self.__class__.__name__, len(self._tasks),
+             self._failures, self.is_running())
@@ -1,9 +1,12 @@
 from pyowm.caches import nullcache
+from pyowm.caches.ttlpolicy import TTLPolicy
 from pyowm.weatherapi25 import weathercoderegistry, cityidregistry
 from pyowm.weatherapi25.parsers import  forecastparser, observationlistparser, observationparser,  stationhistoryparser, \
     stationlistparser, stationparser, weatherhistoryparser
 from pyowm.uvindexapi30.parsers import UVIndexParser, UVIndexListParser
 from pyowm.pollutionapi30.parsers import COIndexParser, NO2IndexParser, SO2IndexParser, OzoneParser
+from pyowm.uvindexapi30.uris import UV_INDEX_URL, UV_INDEX_FORECAST_URL, UV_INDEX_HISTORY_URL
+from pyowm.pollutionapi30.uris import CO_INDEX_URL, OZONE_URL, NO2_INDEX_URL, SO2_INDEX_URL
 
 
 """
@@ -35,6 +38,10 @@ DAILY_FORECAST_URL = ROOT_API_URL + '/forecast/daily'
 CITY_WEATHER_HISTORY_URL = ROOT_HISTORY_URL + '/history/city'
 STATION_WEATHER_HISTORY_URL = ROOT_API_URL + '/history/station'
 
+# Maximum number of city IDs that can be queried with a single call to the
+# group observations endpoint
+GROUP_OBSERVATIONS_MAX_IDS = 20
+
 
 # Parser objects injection for OWM Weather API responses parsing
 parsers = {
@@ -59,6 +66,64 @@ city_id_registry = cityidregistry.CityIDRegistry('cityids/%03d-%03d.txt.gz')
 # Cache provider to be used
 cache = nullcache.NullCache()
 
+# Lifetimes in milliseconds of cached responses, by OWM API endpoint, to be
+# used by cache providers supporting TTL policies (eg: LRUCache)
+_MINUTE = 1000 * 60
+_HOUR = 60 * _MINUTE
+CACHE_ITEM_LIFETIMES = {
+    OBSERVATION_URL: 10 * _MINUTE,
+    GROUP_OBSERVATIONS_URL: 10 * _MINUTE,
+    FIND_OBSERVATIONS_URL: 10 * _MINUTE,
+    BBOX_CITY_URL: 10 * _MINUTE,
+    STATION_URL: 10 * _MINUTE,
+    FIND_STATION_URL: 10 * _MINUTE,
+    BBOX_STATION_URL: 10 * _MINUTE,
+    THREE_HOURS_FORECAST_URL: 1 * _HOUR,
+    DAILY_FORECAST_URL: 3 * _HOUR,
+    CITY_WEATHER_HISTORY_URL: 1 * _HOUR,
+    STATION_WEATHER_HISTORY_URL: 1 * _HOUR,
+    UV_INDEX_URL: 1 * _HOUR,
+    UV_INDEX_FORECAST_URL: 3 * _HOUR,
+    UV_INDEX_HISTORY_URL: 1 * _HOUR,
+    CO_INDEX_URL: 1 * _HOUR,
+    OZONE_URL: 1 * _HOUR,
+    NO2_INDEX_URL: 1 * _HOUR,
+    SO2_INDEX_URL: 1 * _HOUR
+}
+
+# Lifetime in milliseconds of cached responses about closed past time windows
+# (eg: weather history up to yesterday), which are not going to change
+CACHE_CLOSED_WINDOW_ITEM_LIFETIME = 365 * 24 * _HOUR
+
+# TTL policy for cache providers
+cache_ttl_policy = TTLPolicy(CACHE_ITEM_LIFETIMES,
+                             closed_window_lifetime=CACHE_CLOSED_WINDOW_ITEM_LIFETIME)
+
+# Cache provider to be used for negative responses (not found errors and
+# empty results), which are kept apart from the other cached responses: it
+# should be given a TTL policy with short lifetimes (eg:
+# LRUCache(ttl_policy=negative_cache_ttl_policy)). With a NullCache, empty
+# results are cached by the cache provider along with the other responses
+negative_cache = nullcache.NullCache()
+
+# Lifetimes in milliseconds of cached negative responses, by OWM API endpoint
+NEGATIVE_CACHE_ITEM_LIFETIMES = {
+    OBSERVATION_URL: 5 * _MINUTE,
+    GROUP_OBSERVATIONS_URL: 5 * _MINUTE,
+    FIND_OBSERVATIONS_URL: 5 * _MINUTE,
+    BBOX_CITY_URL: 1 * _MINUTE,
+    STATION_URL: 5 * _MINUTE,
+    FIND_STATION_URL: 5 * _MINUTE,
+    BBOX_STATION_URL: 1 * _MINUTE,
+    THREE_HOURS_FORECAST_URL: 5 * _MINUTE,
+    DAILY_FORECAST_URL: 5 * _MINUTE,
+    CITY_WEATHER_HISTORY_URL: 10 * _MINUTE,
+    STATION_WEATHER_HISTORY_URL: 10 * _MINUTE
+}
+
+# TTL policy for negative cache providers
+negative_cache_ttl_policy = TTLPolicy(NEGATIVE_CACHE_ITEM_LIFETIMES)
+
 # Default language for OWM Weather API queries text results
 language = 'en'
 
@@ -68,6 +133,15 @@ API_SUBSCRIPTION_TYPE = 'free'
 # OWM Weather API availability timeout in seconds
 API_AVAILABILITY_TIMEOUT = 2
 
+# HTTP connection pooling: max open connections per host, max retries per
+# connection attempt and whether connections are reused across API calls
+CONNECTION_POOL_SIZE = 10
+CONNECTION_MAX_RETRIES = 0
+CONNECTION_KEEP_ALIVE = True
+
+# Max number of simultaneous connections opened by the asyncio HTTP client
+ASYNC_CONNECTION_LIMIT = 100
+
 # Weather status code registry
 weather_code_registry = weathercoderegistry.WeatherCodeRegistry({
     "rain": [{
@@ -127,3 +201,14 @@ weather_code_registry = weathercoderegistry.WeatherCodeRegistry({
         "end": 962
     }]
 })
+
+# Cache of the domain objects parsed out of cached responses (eg:
+# ObjectCache()), sparing their parsing on cache hits: ``None`` means that
+# responses are parsed on every query
+object_cache = None
+
+# JSON library decoding the API responses and encoding JSON text: one of
+# 'orjson', 'ujson', 'rapidjson', 'json' or 'auto', meaning the first one of
+# them which is installed. It is applied by the first OWM() call, unless a
+# library has been selected with pyowm.commons.jsoncodec.use()
+JSON_CODEC = 'auto'
@@ -2,8 +2,9 @@
 Module containing weather forecast classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     FORECAST_XMLNS_PREFIX, FORECAST_XMLNS_URL)
 from pyowm.utils import timeutils, timeformatutils, xmlutils
@@ -48,7 +49,7 @@ class ForecastIterator(object):
             raise StopIteration
 
 
-class Forecast(object):
+class Forecast(Slotted):
     """
     A class encapsulating weather forecast data for a certain location and
     relative to a specific time interval (forecast for every three hours or
@@ -69,6 +70,8 @@ class Forecast(object):
 
     """
 
+    __slots__ = ('_interval', '_reception_time', '_location', '_weathers')
+
     def __init__(self, interval, reception_time, location, weathers):
         self._interval = interval
         if reception_time < 0:
@@ -77,6 +80,12 @@ class Forecast(object):
         self._location = location
         self._weathers = weathers
 
+    def __copy__(self):
+        # copies share the Weather objects but not their list, so that
+        # actualizing a copy leaves the original untouched
+        return Forecast(self._interval, self._reception_time, self._location,
+                        list(self._weathers))
+
     def __iter__(self):
         """
         Creates a *ForecastIterator* instance
@@ -174,10 +183,10 @@ class Forecast(object):
         :returns: the JSON string
 
         """
-        return json.dumps({"interval": self._interval,
+        return jsoncodec.dumps({"interval": self._interval,
                            "reception_time": self._reception_time,
-                           "Location": json.loads(self._location.to_JSON()),
-                           "weathers": json.loads("[" + \
+                           "Location": jsoncodec.loads(self._location.to_JSON()),
+                           "weathers": jsoncodec.loads("[" + \
                                 ",".join([w.to_JSON() for w in self]) + "]")
                            })
 
@@ -2,14 +2,15 @@
 Module containing location-related classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     LOCATION_XMLNS_URL, LOCATION_XMLNS_PREFIX)
 from pyowm.utils import xmlutils, geo
 
 
-class Location(object):
+class Location(Slotted):
     """
     A class representing a location in the world. A location is defined through
     a toponym, a couple of geographic coordinates such as longitude and
@@ -34,6 +35,8 @@ class Location(object):
     :raises: *ValueError* if lon or lat values are provided out of bounds
     """
 
+    __slots__ = ('_name', '_lon', '_lat', '_ID', '_country')
+
     def __init__(self, name, lon, lat, ID, country=None):
         self._name = name
         if lon is None or lat is None:
@@ -108,7 +111,7 @@ class Location(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({'name': self._name,
+        return jsoncodec.dumps({'name': self._name,
                          'coordinates': {'lon': self._lon,
                                          'lat': self._lat
                                         },
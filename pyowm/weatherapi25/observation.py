@@ -2,14 +2,15 @@
 Weather observation classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     OBSERVATION_XMLNS_URL, OBSERVATION_XMLNS_PREFIX)
 from pyowm.utils import timeformatutils, xmlutils
 
 
-class Observation(object):
+class Observation(Slotted):
     """
     A class representing the weather which is currently being observed in a
     certain location in the world. The location is represented by the
@@ -28,6 +29,8 @@ class Observation(object):
 
     """
 
+    __slots__ = ('_reception_time', '_location', '_weather')
+
     def __init__(self, reception_time, location, weather):
         if reception_time < 0:
             raise ValueError("'reception_time' must be greater than 0")
@@ -75,9 +78,9 @@ class Observation(object):
         :returns:  the JSON string
 
         """
-        return json.dumps({"reception_time": self._reception_time,
-                           "Location": json.loads(self._location.to_JSON()),
-                           "Weather": json.loads(self._weather.to_JSON())
+        return jsoncodec.dumps({"reception_time": self._reception_time,
+                           "Location": jsoncodec.loads(self._location.to_JSON()),
+                           "Weather": jsoncodec.loads(self._weather.to_JSON())
                            })
 
     def to_XML(self, xml_declaration=True, xmlns=True):
@@ -8,7 +8,8 @@ from pyowm.weatherapi25.configuration25 import (
     OBSERVATION_URL, GROUP_OBSERVATIONS_URL,
     FIND_OBSERVATIONS_URL, THREE_HOURS_FORECAST_URL,
     DAILY_FORECAST_URL, CITY_WEATHER_HISTORY_URL, STATION_WEATHER_HISTORY_URL,
-    FIND_STATION_URL, STATION_URL, BBOX_STATION_URL, BBOX_CITY_URL)
+    FIND_STATION_URL, STATION_URL, BBOX_STATION_URL, BBOX_CITY_URL,
+    GROUP_OBSERVATIONS_MAX_IDS, CONNECTION_POOL_SIZE)
 from pyowm.weatherapi25.configuration25 import city_id_registry as reg
 from pyowm.abstractions import owm
 from pyowm.abstractions.decorators import deprecated
@@ -17,7 +18,7 @@ from pyowm.commons import http_client
 from pyowm.pollutionapi30 import airpollution_client
 from pyowm.uvindexapi30 import uv_client
 from pyowm.exceptions import api_call_error
-from pyowm.utils import timeformatutils, stringutils, timeutils, geo
+from pyowm.utils import timeformatutils, stringutils, timeutils, geo, concurrency
 from pyowm.weatherapi25 import forecaster
 from pyowm.weatherapi25 import historian
 from pyowm.stationsapi30 import stations_manager
@@ -26,6 +27,36 @@ from pyowm.tiles import tile_manager
 from pyowm.agroapi10 import agro_manager
 
 
+# -- the steps finishing the results of the query methods of OWM25 (see
+# OWM25._query)
+
+def _forecaster(interval):
+    def finish(forecast):
+        if forecast is None:
+            return None
+        forecast.set_interval(interval)
+        return forecaster.Forecaster(forecast)
+    return finish
+
+
+def _historian(station_ID, interval):
+    def finish(station_history):
+        if station_history is None:
+            return None
+        station_history.set_station_ID(station_ID)
+        station_history.set_interval(interval)
+        return historian.Historian(station_history)
+    return finish
+
+
+def _interval_setter(interval):
+    def finish(pollution_index):
+        if pollution_index is not None:
+            pollution_index._interval = interval
+        return pollution_index
+    return finish
+
+
 class OWM25(owm.OWM):
 
     OWM_API_VERSION = '2.5'
@@ -53,11 +84,26 @@ class OWM25(owm.OWM):
     :param use_ssl: whether API calls should be made via SSL or not.
            Defaults to: False
     :type use_ssl: bool
+    :param session: the ``requests.Session`` used for all the API calls issued
+        by this object and by the API clients/managers it creates. Defaults to
+        ``None``, which means that a new session pooling keep-alive connections
+        is created (see ``HttpClient.pooled_session``)
+    :type session: ``requests.Session``
+    :param negative_cache: a concrete implementation of class *OWMCache*
+        serving as the cache provider for not found errors and empty results
+        (defaults to ``None``, meaning that not found errors are not cached,
+        while empty results are cached by the cache provider)
+    :type negative_cache: an *OWMCache* concrete instance
+    :param object_cache: the cache of the domain objects parsed out of cached
+        responses, so that they are not parsed again on cache hits (defaults
+        to ``None``, meaning that responses are parsed on every query)
+    :type object_cache: *ObjectCache*
     :returns: an *OWM25* instance
 
     """
     def __init__(self, parsers, API_key=None, cache=nullcache.NullCache(),
-                 language="en", subscription_type='free', use_ssl=False):
+                 language="en", subscription_type='free', use_ssl=False,
+                 session=None, negative_cache=None, object_cache=None):
 
         stringutils.check_if_running_with_python_2()  # Python 3 only
 
@@ -65,7 +111,11 @@ class OWM25(owm.OWM):
         if API_key is not None:
             assert isinstance(API_key, str), "Value must be a string"
         self._API_key = API_key
-        self._wapi = http_client.HttpClient(cache=cache)
+        if session is None:
+            session = http_client.HttpClient.pooled_session()
+        self._session = session
+        self._wapi = http_client.HttpClient(cache=cache, session=session,
+                                            negative_cache=negative_cache)
         self._uvapi = uv_client.UltraVioletHttpClient(API_key, self._wapi)
         self._pollapi = airpollution_client.AirPollutionHttpClient(API_key, self._wapi)
         self._language = language
@@ -73,6 +123,7 @@ class OWM25(owm.OWM):
             raise AssertionError('You must provide an API Key for paid subscriptions')
         self._subscription_type = subscription_type
         self._use_ssl = use_ssl
+        self._object_cache = object_cache
 
     def get_API_key(self):
         """
@@ -147,6 +198,46 @@ class OWM25(owm.OWM):
         """
         return self._subscription_type
 
+    def cache_stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache provider, broken
+        down by OWM API endpoint (see ``CacheStats.snapshot``)
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return self._wapi.cache.stats(reset)
+
+    def negative_cache_stats(self, reset=False):
+        """
+        Returns a snapshot of the statistics of the cache provider for
+        negative responses, broken down by OWM API endpoint (see
+        ``CacheStats.snapshot``)
+
+        :param reset: whether the statistics are to be reset after taking
+            the snapshot
+        :type reset: bool
+        :returns: a dict
+
+        """
+        return self._wapi.negative_cache.stats(reset)
+
+    def refreshing_cache(self):
+        """
+        Returns a context manager within which - for the current thread only -
+        the queries issued by this object skip the cache lookups, so that
+        their responses are fetched from the OWM web APIs and cached in place
+        of the previous ones (see ``HttpClient.refreshing``). Useful to keep
+        cached responses fresh ahead of their expiry (eg: *CacheWarmer*).
+
+        :returns: a context manager
+
+        """
+        return self._wapi.refreshing()
+
     def city_id_registry(self):
         """
         Gives the *CityIDRegistry* singleton instance that can be used to lookup
@@ -162,14 +253,15 @@ class OWM25(owm.OWM):
         meteostations data.
         :returns: a *StationsManager* instance
         """
-        return stations_manager.StationsManager(self._API_key)
+        return stations_manager.StationsManager(self._API_key,
+                                               session=self._session)
 
     def alert_manager(self):
         """
         Gives an *AlertManager* instance that can be used to read/write weather triggers and alerts data.
         :return: an *AlertManager* instance
         """
-        return alert_manager.AlertManager(self._API_key)
+        return alert_manager.AlertManager(self._API_key, session=self._session)
 
     def tile_manager(self, layer_name):
         """
@@ -177,7 +269,8 @@ class OWM25(owm.OWM):
         :param layer_name: the layer name for the tiles (values can be looked up on `pyowm.tiles.enums.MapLayerEnum`)
         :return: a `pyowm.tiles.tile_manager.TileManager` instance
         """
-        return tile_manager.TileManager(self._API_key, map_layer=layer_name)
+        return tile_manager.TileManager(self._API_key, map_layer=layer_name,
+                                        session=self._session)
 
     def agro_manager(self):
         """
@@ -185,7 +278,7 @@ class OWM25(owm.OWM):
         Agricultural API.
         :return: a `pyowm.agro10.agro_manager.AgroManager` instance
         """
-        return agro_manager.AgroManager(self._API_key)
+        return agro_manager.AgroManager(self._API_key, session=self._session)
 
     def is_API_online(self):
         """
@@ -195,12 +288,8 @@ class OWM25(owm.OWM):
         :returns: bool
 
         """
-        params = {'q': 'London,GB'}
-        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
-                                            self._API_key,
-                                            self._subscription_type)
         try:
-            _1, _2 = self._wapi.cacheable_get_json(uri, params=params)
+            self._get_json(OBSERVATION_URL, {'q': 'London,GB'})
             return True
         except api_call_error.APICallTimeoutError:
             return False
@@ -224,12 +313,7 @@ class OWM25(owm.OWM):
         assert isinstance(name, str), "Value must be a string"
         encoded_name = name
         params = {'q': encoded_name, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation'].parse_JSON(json_data)
+        return self._query('observation', self._get_json, OBSERVATION_URL, params)
 
     def weather_at_coords(self, lat, lon):
         """
@@ -249,12 +333,7 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation'].parse_JSON(json_data)
+        return self._query('observation', self._get_json, OBSERVATION_URL, params)
 
     def weather_at_zip_code(self, zipcode, country):
         """
@@ -277,12 +356,7 @@ class OWM25(owm.OWM):
         encoded_country = country
         zip_param = encoded_zip + ',' + encoded_country
         params = {'zip': zip_param, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation'].parse_JSON(json_data)
+        return self._query('observation', self._get_json, OBSERVATION_URL, params)
 
     def weather_at_id(self, id):
         """
@@ -301,39 +375,161 @@ class OWM25(owm.OWM):
         if id < 0:
             raise ValueError("'id' value must be greater than 0")
         params = {'id': id, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation'].parse_JSON(json_data)
+        return self._query('observation', self._get_json, OBSERVATION_URL, params)
 
-    def weather_at_ids(self, ids_list):
+    def weather_at_ids(self, ids_list, max_workers=None):
         """
         Queries the OWM Weather API for the currently observed weathers at the
         specified city IDs (eg: [5128581,87182])
 
+        All of the city IDs are first looked up in the cache at once, where
+        observations are shared with *weather_at_id*; the missing ones are then
+        split into chunks that fit a single OWM Weather API group call and the
+        chunks are queried one after the other, by means of the cache as any
+        other query. Observations are returned in the same
+        order as the city IDs they refer to, while IDs for which the OWM
+        Weather API returns no data are left out.
+        Chunks are queried concurrently over a bounded pool of worker threads
+        only when ``max_workers`` is provided: please mind that the configured
+        cache must then be thread-safe, otherwise chunks are still queried
+        one after the other.
+
         :param ids_list: the list of city IDs
         :type ids_list: list of int
+        :param max_workers: the maximum number of concurrent API calls.
+            Defaults to ``None``, meaning that chunks are queried one after
+            the other
+        :type max_workers: int
         :returns: a list of *Observation* instances or an empty list if no
             weather data is available
         :raises: *ParseResponseException* when OWM Weather API responses' data
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
+        observations, chunks = self._weather_at_ids_lookup(ids_list)
+        if max_workers is None or len(chunks) < 2 or \
+                not self._wapi.has_thread_safe_caches():
+            for ids_chunk in chunks:
+                observations.update(self._weather_at_ids_chunk(ids_chunk))
+        else:
+            fetch = self._weather_at_ids_chunk
+            if self._wapi.is_refreshing():
+                # the worker threads do not inherit the refreshing block
+                def fetch(ids_chunk):
+                    with self._wapi.refreshing():
+                        return self._weather_at_ids_chunk(ids_chunk)
+            for outcome in concurrency.bulk_map(fetch, chunks,
+                                                min(max_workers, len(chunks))):
+                if not outcome.is_success():
+                    raise outcome.error
+                observations.update(outcome.result)
+        return [observations[id] for id in ids_list
+                if observations.get(id) is not None]
+
+    def _weather_at_ids_lookup(self, ids_list):
+        """
+        Helper method for weather_at_ids: looks up all of the city IDs in the
+        cache at once
+
+        :returns: a dict mapping city IDs to the cached *Observation*
+            instances (or ``None``) and the list of the chunks of the city IDs
+            missing from the cache
+        """
         assert type(ids_list) is list, "'ids_list' must be a list of integers"
         for id in ids_list:
             assert type(id) is int, "'ids_list' must be a list of integers"
             if id < 0:
                 raise ValueError("id values in 'ids_list' must be greater "
                                  "than 0")
-        params = {'id': ','.join(list(map(str, ids_list))), 'lang': self._language}
-        uri = http_client.HttpClient.to_url(GROUP_OBSERVATIONS_URL,
+        unique_ids = list(dict.fromkeys(ids_list))
+        cached = self._wapi.get_cached_json_many(
+            [self._observation_cache_key(id) for id in unique_ids])
+        observations = dict()
+        missing_ids = []
+        for id, json_data in zip(unique_ids, cached):
+            if json_data is not None:
+                observations[id] = self._parse('observation', json_data)
+            else:
+                observations[id] = None
+                missing_ids.append(id)
+        chunks = [missing_ids[i:i + GROUP_OBSERVATIONS_MAX_IDS]
+                  for i in range(0, len(missing_ids), GROUP_OBSERVATIONS_MAX_IDS)]
+        return observations, chunks
+
+    def _weather_at_ids_chunk(self, ids_chunk):
+        """
+        Helper method for weather_at_ids: queries - by means of the cache -
+        the OWM Weather API group endpoint for a chunk of city IDs
+
+        :returns: a dict mapping city IDs to *Observation* instances
+        """
+        data = self._get_json(GROUP_OBSERVATIONS_URL, self._group_params(ids_chunk))
+        return self._cache_group_observations(data)
+
+    def _group_params(self, ids_chunk):
+        return {'id': ','.join(map(str, ids_chunk)), 'lang': self._language}
+
+    def _cache_group_observations(self, data):
+        """
+        Helper method for weather_at_ids: parses the data returned by the OWM
+        Weather API group endpoint and caches each one of the observations
+        under the same key used by weather_at_id
+
+        :returns: a dict mapping city IDs to *Observation* instances
+        """
+        observations = self._parsers['observation_list'].parse_dict(data)
+        if not observations:
+            return dict()
+        result = dict()
+        responses = dict()
+        for item, obs in zip(data['list'], observations):
+            result[item['id']] = obs
+            responses[self._observation_cache_key(item['id'])] = item
+        self._wapi.set_cached_json_many(responses)
+        return result
+
+    def _observation_cache_key(self, id):
+        uri = http_client.HttpClient.to_url(OBSERVATION_URL,
+                                            self._API_key,
+                                            self._subscription_type,
+                                            self._use_ssl)
+        return http_client.HttpClient.cache_key(uri, params={'id': id, 'lang': self._language})
+
+    def _parse(self, parser_name, json_data):
+        """
+        Helper method parsing the JSON data with the named parser, by means of
+        the object cache when there is one
+
+        """
+        parser = self._parsers[parser_name]
+        if self._object_cache is None:
+            return parser.parse_dict(json_data)
+        return self._object_cache.parse(parser, json_data)
+
+    def _query(self, parser_name, fetch, *args, finish=None):
+        """
+        Helper method issuing a query: the JSON data returned by calling
+        fetch with the args is parsed with the named parser and the result is
+        handed to finish, if any. *AsyncOWM25* overrides it and the fetch
+        functions with coroutines, which is all it takes to turn the query
+        methods of this class into their asyncio counterparts
+
+        """
+        result = self._parse(parser_name, fetch(*args))
+        return result if finish is None else finish(result)
+
+    def _get_json(self, API_endpoint_URL, params):
+        """
+        Helper method fetching - by means of the cache - the JSON data
+        returned by an OWM Weather API endpoint for the query params
+
+        """
+        uri = http_client.HttpClient.to_url(API_endpoint_URL,
                                             self._API_key,
                                             self._subscription_type,
                                             self._use_ssl)
         _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation_list'].parse_JSON(json_data)
+        return json_data
 
     def weather_at_places(self, pattern, searchtype, limit=None):
         """
@@ -370,12 +566,7 @@ class OWM25(owm.OWM):
         if limit is not None:
             # fix for OWM 2.5 API bug!
             params['cnt'] = limit - 1
-        uri = http_client.HttpClient.to_url(FIND_OBSERVATIONS_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation_list'].parse_JSON(json_data)
+        return self._query('observation_list', self._get_json, FIND_OBSERVATIONS_URL, params)
 
     @deprecated(will_be='removed', on_version=(3, 0, 0))
     def weather_at_station(self, station_id):
@@ -395,12 +586,7 @@ class OWM25(owm.OWM):
         if station_id < 0:
             raise ValueError("'station_id' value must be greater than 0")
         params = {'id': station_id, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(STATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation'].parse_JSON(json_data)
+        return self._query('observation', self._get_json, STATION_URL, params)
 
     @deprecated(will_be='removed', on_version=(3, 0, 0))
     def weather_at_stations_in_bbox(self, lat_top_left, lon_top_left,
@@ -450,12 +636,7 @@ class OWM25(owm.OWM):
                   'cluster': 'yes' if cluster else 'no',}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(BBOX_STATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation_list'].parse_JSON(json_data)
+        return self._query('observation_list', self._get_json, BBOX_STATION_URL, params)
 
     def weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
                                   zoom=10, cluster=False):
@@ -500,12 +681,7 @@ class OWM25(owm.OWM):
                                     str(lat_top),
                                     str(zoom)]),
                   'cluster': 'yes' if cluster else 'no'}
-        uri = http_client.HttpClient.to_url(BBOX_CITY_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation_list'].parse_JSON(json_data)
+        return self._query('observation_list', self._get_json, BBOX_CITY_URL, params)
 
     def weather_around_coords(self, lat, lon, limit=None):
         """
@@ -534,12 +710,7 @@ class OWM25(owm.OWM):
             if limit < 1:
                 raise ValueError("'limit' must be None or greater than zero")
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(FIND_OBSERVATIONS_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['observation_list'].parse_JSON(json_data)
+        return self._query('observation_list', self._get_json, FIND_OBSERVATIONS_URL, params)
 
     def three_hours_forecast(self, name):
         """
@@ -560,17 +731,8 @@ class OWM25(owm.OWM):
         assert isinstance(name, str), "Value must be a string"
         encoded_name = name
         params = {'q': encoded_name, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(THREE_HOURS_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("3h")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, THREE_HOURS_FORECAST_URL, params,
+                           finish=_forecaster('3h'))
 
     def three_hours_forecast_at_coords(self, lat, lon):
         """
@@ -594,17 +756,8 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(THREE_HOURS_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("3h")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, THREE_HOURS_FORECAST_URL, params,
+                           finish=_forecaster('3h'))
 
     def three_hours_forecast_at_id(self, id):
         """
@@ -626,17 +779,8 @@ class OWM25(owm.OWM):
         if id < 0:
             raise ValueError("'id' value must be greater than 0")
         params = {'id': id, 'lang': self._language}
-        uri = http_client.HttpClient.to_url(THREE_HOURS_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("3h")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, THREE_HOURS_FORECAST_URL, params,
+                           finish=_forecaster('3h'))
 
     def daily_forecast(self, name, limit=None):
         """
@@ -667,17 +811,8 @@ class OWM25(owm.OWM):
         params = {'q': encoded_name, 'lang': self._language}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(DAILY_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("daily")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, DAILY_FORECAST_URL, params,
+                           finish=_forecaster('daily'))
 
     def daily_forecast_at_coords(self, lat, lon, limit=None):
         """
@@ -711,17 +846,8 @@ class OWM25(owm.OWM):
         params = {'lon': lon, 'lat': lat, 'lang': self._language}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(DAILY_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("daily")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, DAILY_FORECAST_URL, params,
+                           finish=_forecaster('daily'))
 
     def daily_forecast_at_id(self, id, limit=None):
         """
@@ -754,17 +880,8 @@ class OWM25(owm.OWM):
         params = {'id': id, 'lang': self._language}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(DAILY_FORECAST_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        forecast = self._parsers['forecast'].parse_JSON(json_data)
-        if forecast is not None:
-            forecast.set_interval("daily")
-            return forecaster.Forecaster(forecast)
-        else:
-            return None
+        return self._query('forecast', self._get_json, DAILY_FORECAST_URL, params,
+                           finish=_forecaster('daily'))
 
     def weather_history_at_place(self, name, start=None, end=None):
         """
@@ -812,12 +929,7 @@ class OWM25(owm.OWM):
         else:
             raise ValueError("Error: one of the time boundaries is None, " \
                              "while the other is not!")
-        uri = http_client.HttpClient.to_url(CITY_WEATHER_HISTORY_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['weather_history'].parse_JSON(json_data)
+        return self._query('weather_history', self._get_json, CITY_WEATHER_HISTORY_URL, params)
 
     def weather_history_at_coords(self, lat, lon, start=None, end=None):
         """
@@ -866,12 +978,7 @@ class OWM25(owm.OWM):
             if unix_start >= unix_end:
                 raise ValueError("Error: the start time boundary must "
                                  "precede the end time!")
-        uri = http_client.HttpClient.to_url(CITY_WEATHER_HISTORY_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['weather_history'].parse_JSON(json_data)
+        return self._query('weather_history', self._get_json, CITY_WEATHER_HISTORY_URL, params)
 
     def weather_history_at_id(self, id, start=None, end=None):
         """
@@ -920,12 +1027,7 @@ class OWM25(owm.OWM):
         else:
             raise ValueError("Error: one of the time boundaries is None, " \
                              "while the other is not!")
-        uri = http_client.HttpClient.to_url(CITY_WEATHER_HISTORY_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['weather_history'].parse_JSON(json_data)
+        return self._query('weather_history', self._get_json, CITY_WEATHER_HISTORY_URL, params)
 
     @deprecated(will_be='removed', on_version=(3, 0, 0))
     def station_at_coords(self, lat, lon, limit=None):
@@ -958,12 +1060,7 @@ class OWM25(owm.OWM):
         params = {'lat': lat, 'lon': lon}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(FIND_STATION_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        return self._parsers['station_list'].parse_JSON(json_data)
+        return self._query('station_list', self._get_json, FIND_STATION_URL, params)
 
     def station_tick_history(self, station_ID, limit=None):
         """
@@ -991,12 +1088,7 @@ class OWM25(owm.OWM):
             assert isinstance(limit, int), "'limit' must be an int or None"
             if limit < 1:
                 raise ValueError("'limit' must be None or greater than zero")
-        station_history = self._retrieve_station_history(station_ID, limit,
-                                                         "tick")
-        if station_history is not None:
-            return historian.Historian(station_history)
-        else:
-            return None
+        return self._station_history(station_ID, limit, "tick")
 
     def station_hour_history(self, station_ID, limit=None):
         """
@@ -1025,12 +1117,7 @@ class OWM25(owm.OWM):
             assert isinstance(limit, int), "'limit' must be an int or None"
             if limit < 1:
                 raise ValueError("'limit' must be None or greater than zero")
-        station_history = self._retrieve_station_history(station_ID, limit,
-                                                         "hour")
-        if station_history is not None:
-            return historian.Historian(station_history)
-        else:
-            return None
+        return self._station_history(station_ID, limit, "hour")
 
     def station_day_history(self, station_ID, limit=None):
         """
@@ -1059,31 +1146,18 @@ class OWM25(owm.OWM):
             assert isinstance(limit, int), "'limit' must be an int or None"
             if limit < 1:
                 raise ValueError("'limit' must be None or greater than zero")
-        station_history = self._retrieve_station_history(station_ID, limit,
-                                                         "day")
-        if station_history is not None:
-            return historian.Historian(station_history)
-        else:
-            return None
+        return self._station_history(station_ID, limit, "day")
 
-    def _retrieve_station_history(self, station_ID, limit, interval):
+    def _station_history(self, station_ID, limit, interval):
         """
         Helper method for station_X_history functions.
         """
         params = {'id': station_ID, 'type': interval, 'lang': self._language}
         if limit is not None:
             params['cnt'] = limit
-        uri = http_client.HttpClient.to_url(STATION_WEATHER_HISTORY_URL,
-                                            self._API_key,
-                                            self._subscription_type,
-                                            self._use_ssl)
-        _, json_data = self._wapi.cacheable_get_json(uri, params=params)
-        station_history = \
-            self._parsers['station_history'].parse_JSON(json_data)
-        if station_history is not None:
-            station_history.set_station_ID(station_ID)
-            station_history.set_interval(interval)
-        return station_history
+        return self._query('station_history', self._get_json,
+                           STATION_WEATHER_HISTORY_URL, params,
+                           finish=_historian(station_ID, interval))
 
     #  --- UV API ENDPOINTS ---
 
@@ -1106,9 +1180,7 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat}
-        json_data = self._uvapi.get_uvi(params)
-        uvindex = self._parsers['uvindex'].parse_JSON(json_data)
-        return uvindex
+        return self._query('uvindex', self._uvapi.get_uvi, params)
 
     def uvindex_forecast_around_coords(self, lat, lon):
         """
@@ -1127,9 +1199,7 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat}
-        json_data = self._uvapi.get_uvi_forecast(params)
-        uvindex_list = self._parsers['uvindex_list'].parse_JSON(json_data)
-        return uvindex_list
+        return self._query('uvindex_list', self._uvapi.get_uvi_forecast, params)
 
     def uvindex_history_around_coords(self, lat, lon, start, end=None):
         """
@@ -1162,9 +1232,7 @@ class OWM25(owm.OWM):
         else:
             end = timeformatutils.timeformat(end, 'unix')
         params = {'lon': lon, 'lat': lat, 'start': start, 'end': end}
-        json_data = self._uvapi.get_uvi_history(params)
-        uvindex_list = self._parsers['uvindex_list'].parse_JSON(json_data)
-        return uvindex_list
+        return self._query('uvindex_list', self._uvapi.get_uvi_history, params)
 
     #  --- POLLUTION API ENDPOINTS ---
 
@@ -1200,12 +1268,8 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self._pollapi.get_coi(params)
-        coindex = self._parsers['coindex'].parse_JSON(json_data)
-        if interval is None:
-            interval = 'year'
-        coindex._interval = interval
-        return coindex
+        return self._query('coindex', self._pollapi.get_coi, params,
+                           finish=_interval_setter(interval or 'year'))
 
     def ozone_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -1238,12 +1302,9 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self._pollapi.get_o3(params)
-        ozone = self._parsers['ozone'].parse_JSON(json_data)
-        if interval is None:
-            interval = 'year'
-            ozone._interval = interval
-        return ozone
+        return self._query('ozone', self._pollapi.get_o3, params,
+                           finish=_interval_setter('year')
+                           if interval is None else None)
 
     def no2index_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -1277,12 +1338,8 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self._pollapi.get_no2(params)
-        no2index = self._parsers['no2index'].parse_JSON(json_data)
-        if interval is None:
-            interval = 'year'
-        no2index._interval = interval
-        return no2index
+        return self._query('no2index', self._pollapi.get_no2, params,
+                           finish=_interval_setter(interval or 'year'))
 
     def so2index_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -1316,12 +1373,135 @@ class OWM25(owm.OWM):
         geo.assert_is_lon(lon)
         geo.assert_is_lat(lat)
         params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self._pollapi.get_so2(params)
-        so2index = self._parsers['so2index'].parse_JSON(json_data)
-        if interval is None:
-            interval = 'year'
-        so2index._interval = interval
-        return so2index
+        return self._query('so2index', self._pollapi.get_so2, params,
+                           finish=_interval_setter(interval or 'year'))
+
+    #  --- BULK API CALLS ---
+
+    def weather_at_coords_many(self, coords_list, max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for the currently observed weather at each
+        one of the specified geographic coordinates, issuing the calls
+        concurrently over a bounded pool of worker threads.
+        Results are yielded in the same order as the input coordinates as soon
+        as they are available; a failure on one of the locations is reported in
+        the corresponding result and does not stop the others.
+        Please mind that the configured cache must be thread-safe.
+
+        :param coords_list: the (lat, lon) tuples of the locations
+        :type coords_list: iterable of tuples
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            an *Observation* instance or ``None``
+        """
+        return concurrency.bulk_map(lambda coords: self.weather_at_coords(*coords),
+                                    coords_list, max_workers)
+
+    def weather_at_ids_many(self, ids_list, max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for the currently observed weather at each
+        one of the specified city IDs, issuing the calls concurrently over a
+        bounded pool of worker threads. See *weather_at_coords_many* for
+        details on how results are returned.
+
+        :param ids_list: the city IDs
+        :type ids_list: iterable of int
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            an *Observation* instance or ``None``
+        """
+        return concurrency.bulk_map(self.weather_at_id, ids_list, max_workers)
+
+    def three_hours_forecast_at_coords_many(self, coords_list,
+                                            max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for three hours weather forecast for each
+        one of the specified geographic coordinates, issuing the calls
+        concurrently over a bounded pool of worker threads. See
+        *weather_at_coords_many* for details on how results are returned.
+
+        :param coords_list: the (lat, lon) tuples of the locations
+        :type coords_list: iterable of tuples
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            a *Forecaster* instance or ``None``
+        """
+        return concurrency.bulk_map(
+            lambda coords: self.three_hours_forecast_at_coords(*coords),
+            coords_list, max_workers)
+
+    def three_hours_forecast_at_ids_many(self, ids_list,
+                                         max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for three hours weather forecast for each
+        one of the specified city IDs, issuing the calls concurrently over a
+        bounded pool of worker threads. See *weather_at_coords_many* for
+        details on how results are returned.
+
+        :param ids_list: the city IDs
+        :type ids_list: iterable of int
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            a *Forecaster* instance or ``None``
+        """
+        return concurrency.bulk_map(self.three_hours_forecast_at_id, ids_list,
+                                    max_workers)
+
+    def daily_forecast_at_coords_many(self, coords_list, limit=None,
+                                      max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for daily weather forecast for each one of
+        the specified geographic coordinates, issuing the calls concurrently
+        over a bounded pool of worker threads. See *weather_at_coords_many*
+        for details on how results are returned.
+
+        :param coords_list: the (lat, lon) tuples of the locations
+        :type coords_list: iterable of tuples
+        :param limit: the maximum number of daily *Weather* items to be
+            retrieved for each location (default is ``None``, which stands for
+            any number of items)
+        :type limit: int or ``None``
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            a *Forecaster* instance or ``None``
+        """
+        return concurrency.bulk_map(
+            lambda coords: self.daily_forecast_at_coords(*coords, limit=limit),
+            coords_list, max_workers)
+
+    def daily_forecast_at_ids_many(self, ids_list, limit=None,
+                                   max_workers=CONNECTION_POOL_SIZE):
+        """
+        Queries the OWM Weather API for daily weather forecast for each one of
+        the specified city IDs, issuing the calls concurrently over a bounded
+        pool of worker threads. See *weather_at_coords_many* for details on how
+        results are returned.
+
+        :param ids_list: the city IDs
+        :type ids_list: iterable of int
+        :param limit: the maximum number of daily *Weather* items to be
+            retrieved for each location (default is ``None``, which stands for
+            any number of items)
+        :type limit: int or ``None``
+        :param max_workers: the maximum number of concurrent API calls
+            (defaults to the HTTP connection pool size)
+        :type max_workers: int
+        :returns: a generator of *BulkResult* instances, whose ``result`` is
+            a *Forecaster* instance or ``None``
+        """
+        return concurrency.bulk_map(
+            lambda id: self.daily_forecast_at_id(id, limit=limit),
+            ids_list, max_workers)
 
     def __repr__(self):
         return "<%s.%s - API key=%s, OWM Weather API version=%s, " \
@@ -3,8 +3,8 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning Forecast objects
 """
 
-import json
 import time
+from pyowm.commons import jsoncodec
 from pyowm.weatherapi25 import location
 from pyowm.weatherapi25 import weather
 from pyowm.weatherapi25 import forecast
@@ -17,38 +17,42 @@ class ForecastParser(jsonparser.JSONParser):
     Concrete *JSONParser* implementation building a *Forecast* instance out
     of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses a *Forecast* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a *Forecast* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         # Check if server returned errors: this check overcomes the lack of use
         # of HTTP error status codes by the OWM API 2.5. This mechanism is
         # supposed to be deprecated as soon as the API fully adopts HTTP for
         # conveying errors to the clients
         if 'message' in d and 'cod' in d:
             if d['cod'] == "404":
-                print("OWM API: data not found - response payload: " + json.dumps(d), d['cod'])
+                print("OWM API: data not found - response payload: " + jsoncodec.dumps(d), d['cod'])
                 return None
             elif d['cod'] != "200":
-                raise api_response_error.APIResponseError("OWM API: error - response payload: " + json.dumps(d), d['cod'])
+                raise api_response_error.APIResponseError("OWM API: error - response payload: " + jsoncodec.dumps(d), d['cod'])
         try:
             place = location.location_from_dictionary(d)
         except KeyError:
@@ -62,8 +66,8 @@ class ForecastParser(jsonparser.JSONParser):
         else:
             if 'list' in d:
                 try:
-                    weathers = [weather.weather_from_dictionary(item) \
-                                for item in d['list']]
+                    weathers = weather.weathers_from_dictionaries(
+                        d['list'], self._lazy_weather)
                 except KeyError:
                     raise parse_response_error.ParseResponseError(
                           ''.join([__name__, ': impossible to read weather ' \
@@ -3,8 +3,9 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning lists of Observation objects
 """
 
-import json
+from pyowm.commons import jsoncodec
 from pyowm.abstractions.jsonparser import JSONParser
+from pyowm.weatherapi25 import weather
 from pyowm.weatherapi25.parsers.observationparser import ObservationParser
 from pyowm.exceptions.parse_response_error import ParseResponseError
 from pyowm.exceptions.api_response_error import APIResponseError
@@ -15,16 +16,23 @@ class ObservationListParser(JSONParser):
     Concrete *JSONParser* implementation building a list of *Observation*
     instances out of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def parse_JSON(self, JSON_string):
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
+
+    def parse_dict(self, data_dict):
         """
         Parses a list of *Observation* instances out of raw JSON data. Only
         certain properties of the data are used: if these properties are not
         found or cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a list of *Observation* instances or ``None`` if no data is
             available
         :raises: *ParseResponseError* if it is impossible to find or parse the
@@ -32,9 +40,9 @@ class ObservationListParser(JSONParser):
             returns a HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         observation_parser = ObservationParser()
         if 'cod' in d:
             # Check if server returned errors: this check overcomes the lack of use
@@ -45,10 +53,10 @@ class ObservationListParser(JSONParser):
                 pass
             else:
                 if d['cod'] == "404" or d['cod'] == 404:
-                    print("OWM API: data not found - response payload: " + json.dumps(d))
+                    print("OWM API: data not found - response payload: " + jsoncodec.dumps(d))
                     return None
                 else:
-                    raise APIResponseError("OWM API: error - response payload: " + json.dumps(d), str(d['cod']))
+                    raise APIResponseError("OWM API: error - response payload: " + jsoncodec.dumps(d), str(d['cod']))
 
         # Handle the case when no results are found
         if 'count' in d and d['count'] == "0":
@@ -56,8 +64,13 @@ class ObservationListParser(JSONParser):
         if 'cnt' in d and d['cnt'] == 0:
             return []
         if 'list' in d:
-            return [observation_parser.parse_JSON(json.dumps(item)) \
-                    for item in d['list']]
+            items = d['list']
+            if not items:
+                return []
+            # the items share the same layout, which is found out once
+            extract = weather.weather_extractor(items[0], self._lazy_weather)
+            return [observation_parser._parse_dict(item, extract)
+                    for item in items]
 
         # no way out..
         raise ParseResponseError(''.join([__name__,
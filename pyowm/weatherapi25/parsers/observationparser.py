@@ -3,8 +3,8 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning Observation objects
 """
 
-from json import loads, dumps
 from time import time
+from pyowm.commons import jsoncodec
 from pyowm.weatherapi25 import observation
 from pyowm.weatherapi25 import location
 from pyowm.weatherapi25 import weather
@@ -17,28 +17,43 @@ class ObservationParser(jsonparser.JSONParser):
     Concrete *JSONParser* implementation building an *Observation* instance out
     of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses an *Observation* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: an *Observation* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if self._lazy_weather:
+            return self._parse_dict(data_dict, weather.LazyWeather)
+        return self._parse_dict(data_dict, weather.weather_from_dictionary)
+
+    def _parse_dict(self, data_dict, weather_from_dictionary):
+        """
+        Helper method for parse_dict, building the *Weather* object with the
+        provided function (eg: the one returned by
+        ``weather.weather_extractor`` for the items of observation lists)
+
+        """
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = loads(JSON_string)
+        d = data_dict
         # Check if server returned errors: this check overcomes the lack of use
         # of HTTP error status codes by the OWM API 2.5. This mechanism is
         # supposed to be deprecated as soon as the API fully adopts HTTP for
@@ -46,11 +61,11 @@ class ObservationParser(jsonparser.JSONParser):
         if 'message' in d and 'cod' in d:
             if d['cod'] == "404":
                 print("OWM API: observation data not available - response " \
-                    "payload: " + dumps(d))
+                    "payload: " + jsoncodec.dumps(d))
                 return None
             else:
                 raise api_response_error.APIResponseError(
-                                      "OWM API: error - response payload: " + dumps(d), d['cod'])
+                                      "OWM API: error - response payload: " + jsoncodec.dumps(d), d['cod'])
         try:
             place = location.location_from_dictionary(d)
         except KeyError:
@@ -58,7 +73,7 @@ class ObservationParser(jsonparser.JSONParser):
                                       ''.join([__name__, ': impossible to ' \
                                        'read location info from JSON data']))
         try:
-            w = weather.weather_from_dictionary(d)
+            w = weather_from_dictionary(d)
         except KeyError:
             raise parse_response_error.ParseResponseError(
                                       ''.join([__name__, ': impossible to ' \
@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a StationHistory instance
 """
 
-import json
 import time
 from pyowm.weatherapi25 import stationhistory
 from pyowm.abstractions import jsonparser
@@ -20,14 +19,14 @@ class StationHistoryParser(jsonparser.JSONParser):
     def __init__(self):
         pass
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses a *StationHistory* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a *StationHistory* instance or ``None`` if no data is
             available
         :raises: *ParseResponseError* if it is impossible to find or parse the
@@ -35,9 +34,9 @@ class StationHistoryParser(jsonparser.JSONParser):
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         # Check if server returned errors: this check overcomes the lack of use
         # of HTTP error status codes by the OWM API but it's supposed to be
         # deprecated as soon as the API implements a correct HTTP mechanism for
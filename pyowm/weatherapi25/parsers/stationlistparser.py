@@ -3,9 +3,9 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a list of Station instances
 """
 
-import json
 
 from pyowm.abstractions.jsonparser import JSONParser
+from pyowm.weatherapi25 import weather
 from pyowm.weatherapi25.parsers.stationparser import StationParser
 from pyowm.exceptions.parse_response_error import ParseResponseError
 
@@ -15,16 +15,23 @@ class StationListParser(JSONParser):
     Concrete *JSONParser* implementation building a list of *Station*
     instances out of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def parse_JSON(self, JSON_string):
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
+
+    def parse_dict(self, data_dict):
         """
         Parses a list of *Station* instances out of raw JSON data. Only
         certain properties of the data are used: if these properties are not
         found or cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: list
         :returns: a list of *Station* instances or ``None`` if no data is
             available
         :raises: *ParseResponseError* if it is impossible to find or parse the
@@ -32,8 +39,15 @@ class StationListParser(JSONParser):
             returns a HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         station_parser = StationParser()
-        return [station_parser.parse_JSON(json.dumps(item)) for item in d]
+        # the last measurements share the same layout, which is found out once
+        if self._lazy_weather:
+            extract = weather.LazyWeather
+        else:
+            extract = weather.weather_from_dictionary
+        if d and isinstance(d[0], dict) and isinstance(d[0].get('last'), dict):
+            extract = weather.weather_extractor(d[0]['last'], self._lazy_weather)
+        return [station_parser._parse_dict(item, extract) for item in d]
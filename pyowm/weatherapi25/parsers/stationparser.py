@@ -3,7 +3,6 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a Station instance
 """
 
-import json
 import time
 
 from pyowm.weatherapi25 import station
@@ -17,25 +16,43 @@ class StationParser(jsonparser.JSONParser):
     Concrete *JSONParser* implementation building a *Station* instance
     out of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def parse_JSON(self, JSON_string):
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
+
+    def parse_dict(self, data_dict):
         """
         Parses a *Station* instance out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a *Station* instance or ``None`` if no data is available
         :raises: *ParseResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the JSON
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if self._lazy_weather:
+            return self._parse_dict(data_dict, weather.LazyWeather)
+        return self._parse_dict(data_dict, weather.weather_from_dictionary)
+
+    def _parse_dict(self, data_dict, weather_from_dictionary):
+        """
+        Helper method for parse_dict, building the *Weather* object of the last
+        station measurement with the provided function (eg: the one returned
+        by ``weather.weather_extractor`` for the items of station lists)
+
+        """
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         try:
             name = d['station']['name']
             station_ID = d['station']['id']
@@ -58,7 +75,7 @@ class StationParser(jsonparser.JSONParser):
             raise parse_response_error.ParseResponseError(error_msg)
         else:
             if 'last' in d:
-                last_weather = weather.weather_from_dictionary(d['last'])
+                last_weather = weather_from_dictionary(d['last'])
             else:
                 last_weather = None
 
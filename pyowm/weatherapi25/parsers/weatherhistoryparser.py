@@ -3,7 +3,7 @@ Module containing a concrete implementation for JSONParser abstract class,
 returning a list of Weather objects
 """
 
-import json
+from pyowm.commons import jsoncodec
 from pyowm.weatherapi25 import weather
 from pyowm.abstractions import jsonparser
 from pyowm.exceptions import parse_response_error, api_response_error
@@ -14,19 +14,23 @@ class WeatherHistoryParser(jsonparser.JSONParser):
     Concrete *JSONParser* implementation building a list of *Weather* instances
     out of raw JSON data coming from OWM Weather API responses.
 
+    :param lazy_weather: if ``True`` the parser builds *LazyWeather* objects,
+        whose fields are read out of the JSON data on first access
+    :type lazy_weather: bool
+
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, lazy_weather=False):
+        self._lazy_weather = lazy_weather
 
-    def parse_JSON(self, JSON_string):
+    def parse_dict(self, data_dict):
         """
         Parses a list of *Weather* instances out of raw JSON data. Only certain
         properties of the data are used: if these properties are not found or
         cannot be parsed, an error is issued.
 
-        :param JSON_string: a raw JSON string
-        :type JSON_string: str
+        :param data_dict: the decoded JSON data
+        :type data_dict: dict
         :returns: a list of *Weather* instances or ``None`` if no data is
             available
         :raises: *ParseResponseError* if it is impossible to find or parse the
@@ -34,9 +38,9 @@ class WeatherHistoryParser(jsonparser.JSONParser):
             string embeds an HTTP status error
 
         """
-        if JSON_string is None:
+        if data_dict is None:
             raise parse_response_error.ParseResponseError('JSON data is None')
-        d = json.loads(JSON_string)
+        d = data_dict
         # Check if server returned errors: this check overcomes the lack of use
         # of HTTP error status codes by the OWM API 2.5. This mechanism is
         # supposed to be deprecated as soon as the API fully adopts HTTP for
@@ -44,19 +48,19 @@ class WeatherHistoryParser(jsonparser.JSONParser):
         if 'message' in d and 'cod' in d:
             if d['cod'] == "404":
                 print("OWM API: data not found - response payload: " + \
-                    json.dumps(d))
+                    jsoncodec.dumps(d))
                 return None
             elif d['cod'] != "200":
                 raise api_response_error.APIResponseError(
-                                      "OWM API: error - response payload: " + json.dumps(d), d['cod'])
+                                      "OWM API: error - response payload: " + jsoncodec.dumps(d), d['cod'])
         # Handle the case when no results are found
         if 'cnt' in d and d['cnt'] == "0":
             return []
         else:
             if 'list' in d:
                 try:
-                    return [weather.weather_from_dictionary(item) \
-                            for item in d['list']]
+                    return weather.weathers_from_dictionaries(
+                        d['list'], self._lazy_weather)
                 except KeyError:
                     raise parse_response_error.ParseResponseError(
                               ''.join([__name__, ': impossible to read ' \
@@ -2,9 +2,10 @@
 Module containing classes and data structures related to meteostation data
 """
 
-import json
 import xml.etree.ElementTree as ET
 
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25 import weather
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     LIST_STATION_XMLNS_PREFIX, LIST_STATION_XMLNS_URL)
@@ -12,7 +13,7 @@ from pyowm.utils import xmlutils
 from pyowm.abstractions.decorators import deprecated
 
 
-class Station(object):
+class Station(Slotted):
     """
     A class representing meteostations which are reporting current weather
     conditions from geographical coordinates.
@@ -39,6 +40,9 @@ class Station(object):
 
     """
 
+    __slots__ = ('_name', '_station_ID', '_station_type', '_status', '_lat',
+                 '_lon', '_distance', '_last_weather')
+
     @deprecated(will_be='removed', on_version=(3, 0, 0),
                 name='weatherapi25.station.Station')
     def __init__(self, name, station_ID, station_type, status, lat, lon,
@@ -143,14 +147,14 @@ class Station(object):
         last = None
         if self._last_weather:
             last = self._last_weather.to_JSON()
-        return json.dumps({'name': self._name,
+        return jsoncodec.dumps({'name': self._name,
                            'station_ID': self._station_ID,
                            'station_type': self._station_type,
                            'status': self._status,
                            'lat': self._lat,
                            'lon': self._lon,
                            'distance': self._distance,
-                           'weather': json.loads(last),
+                           'weather': jsoncodec.loads(last),
                            })
 
     def to_XML(self, xml_declaration=True, xmlns=True):
@@ -3,14 +3,15 @@ Module containing classes and datastructures related to meteostation history
 data
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     STATION_HISTORY_XMLNS_PREFIX, STATION_HISTORY_XMLNS_URL)
 from pyowm.utils import timeformatutils, xmlutils
 
 
-class StationHistory(object):
+class StationHistory(Slotted):
 
     """
     A class representing historic weather measurements collected by a
@@ -32,6 +33,8 @@ class StationHistory(object):
         negative
     """
 
+    __slots__ = ('_station_ID', '_interval', '_reception_time', '_measurements')
+
     def __init__(self, station_ID, interval, reception_time, measurements):
         self._station_ID = station_ID
         self._interval = interval
@@ -40,6 +43,13 @@ class StationHistory(object):
         self._reception_time = reception_time
         self._measurements = measurements
 
+    def __copy__(self):
+        # copies do not share the measurements, which are mutable dicts
+        return StationHistory(self._station_ID, self._interval,
+                              self._reception_time,
+                              {tstamp: dict(measurement) for tstamp, measurement
+                               in self._measurements.items()})
+
     def get_station_ID(self):
         """
         Returns the ID of the meteostation
@@ -114,7 +124,7 @@ class StationHistory(object):
         :returns: the JSON string
 
         """
-        return json.dumps({"station_ID": self._station_ID,
+        return jsoncodec.dumps({"station_ID": self._station_ID,
                             "interval": self._interval,
                             "reception_time": self._reception_time,
                             "measurements": self._measurements
@@ -2,15 +2,22 @@
 Module containing weather data classes and data structures.
 """
 
-import json
 import xml.etree.ElementTree as ET
+from pyowm.commons import jsoncodec
+from pyowm.commons.slotted import Slotted
 from pyowm.weatherapi25.xsd.xmlnsconfig import (
     WEATHER_XMLNS_PREFIX, WEATHER_XMLNS_URL)
 from pyowm.utils import timeformatutils, temputils, xmlutils
 from pyowm.weatherapi25.uris import ICONS_BASE_URL
 
 
-class Weather(object):
+def _copied(container):
+    # getters return copies of the mutable containers, so that Weather objects
+    # can be safely shared (eg: by an ObjectCache)
+    return dict(container) if container is not None else None
+
+
+class Weather(Slotted):
     """
     A class encapsulating raw weather data.
     A reference about OWM weather codes and icons can be found at:
@@ -57,6 +64,12 @@ class Weather(object):
 
     """
 
+    __slots__ = ('_reference_time', '_sunset_time', '_sunrise_time', '_clouds',
+                 '_rain', '_snow', '_wind', '_humidity', '_pressure',
+                 '_temperature', '_status', '_detailed_status',
+                 '_weather_code', '_weather_icon_name', '_visibility_distance',
+                 '_dewpoint', '_humidex', '_heat_index')
+
     def __init__(self, reference_time, sunset_time, sunrise_time, clouds, rain,
                  snow, wind, humidity, pressure, temperature, status,
                  detailed_status, weather_code, weather_icon_name,
@@ -154,7 +167,7 @@ class Weather(object):
         :returns: a dict containing rain info
 
         """
-        return self._rain
+        return _copied(self._rain)
 
     def get_snow(self):
         """Returns a dict containing snow info
@@ -162,7 +175,7 @@ class Weather(object):
         :returns: a dict containing snow info
 
         """
-        return self._snow
+        return _copied(self._snow)
 
     def get_wind(self, unit='meters_sec'):
         """Returns a dict containing wind info
@@ -174,7 +187,7 @@ class Weather(object):
 
         """
         if unit == 'meters_sec':
-            return self._wind
+            return _copied(self._wind)
         elif unit == 'miles_hour':
             wind_dict = {k: self._wind[k] for k in self._wind if self._wind[k] is not None}
             return temputils.metric_wind_dict_to_imperial(wind_dict)
@@ -195,7 +208,7 @@ class Weather(object):
         :returns: a dict containing pressure info
 
         """
-        return self._pressure
+        return _copied(self._pressure)
 
     def get_temperature(self, unit='kelvin'):
         """Returns a dict with temperature info
@@ -298,7 +311,7 @@ class Weather(object):
         :returns: the JSON string
 
         """
-        return json.dumps({'reference_time': self._reference_time,
+        return jsoncodec.dumps({'reference_time': self._reference_time,
                            'sunset_time': self._sunset_time,
                            'sunrise_time': self._sunrise_time,
                            'clouds': self._clouds,
@@ -581,3 +594,362 @@ def weather_from_dictionary(d):
                 rain, snow, wind, humidity, pressure, temperature,
                 status, detailed_status, weather_code, weather_icon_name,
                 visibility_distance, dewpoint, humidex, heat_index)
+
+
+# -- the value-shaping steps of weather_from_dictionary, shared by
+# _weather_from_nested_layout and by the readers of LazyWeather
+
+def _sun_times(d):
+    if 'sys' not in d:
+        return 0, 0
+    sys = d['sys']
+    return (sys['sunset'] if 'sunset' in sys else 0,
+            sys['sunrise'] if 'sunrise' in sys else 0)
+
+
+def _calc_values(calc):
+    return (calc['dewpoint'] if 'dewpoint' in calc else None,
+            calc['humidex'] if 'humidex' in calc else None,
+            calc['heatindex'] if 'heatindex' in calc else None)
+
+
+def _visibility_distance(visibility):
+    if isinstance(visibility, int):
+        return visibility
+    return visibility['distance'] if 'distance' in visibility else None
+
+
+def _clouds(value):
+    if isinstance(value, (int, float)):
+        return value
+    return value['all'] if 'all' in value else 0
+
+
+def _precipitation(value):
+    if isinstance(value, (int, float)):
+        return {'all': value}
+    return value.copy() if value is not None else dict()
+
+
+def _wind(d):
+    if 'wind' in d and d['wind'] is not None:
+        return d['wind'].copy()
+    wind = dict()
+    if 'speed' in d:
+        wind['speed'] = d['speed']
+    if 'deg' in d:
+        wind['deg'] = d['deg']
+    return wind
+
+
+def _main_temperature(main):
+    return {'temp': main['temp'],
+            'temp_kf': main['temp_kf'] if 'temp_kf' in main else None,
+            'temp_max': main['temp_max'] if 'temp_max' in main else None,
+            'temp_min': main['temp_min'] if 'temp_min' in main else None
+            }
+
+
+def _status_info(d):
+    if 'weather' not in d:
+        return '', '', 0, ''
+    info = d['weather'][0]
+    return info['main'], info['description'], info['id'], info['icon']
+
+
+def _weather_from_nested_layout(d):
+    """
+    Builds a *Weather* object out of a data dictionary having temperature,
+    pressure and humidity nested into 'main' (eg: the items of 3h forecasts,
+    of searches, of weather history and of station lists), taking the steps
+    that ``weather_from_dictionary`` takes for such a layout without probing
+    the other layouts first. Dictionaries having a different layout are
+    handed to ``weather_from_dictionary``.
+
+    """
+    if 'last' in d or 'temp' in d or 'pressure' in d or 'humidity' in d:
+        return weather_from_dictionary(d)
+    try:
+        reference_time = d['dt']
+        # -- humidity, pressure and temperature
+        main = d['main']
+        humidity = main['humidity'] if 'humidity' in main else 0
+        pressure = {'press': main['pressure'] if 'pressure' in main else None,
+                    'sea_level': main['sea_level'] if 'sea_level' in main else None}
+        temperature = _main_temperature(main) if 'temp' in main else dict()
+        # -- the other fields
+        if 'sys' in d:
+            sunset_time, sunrise_time = _sun_times(d)
+        else:
+            sunset_time = sunrise_time = 0
+        if 'calc' in d:
+            dewpoint, humidex, heat_index = _calc_values(d['calc'])
+        else:
+            dewpoint = humidex = heat_index = None
+        visibility_distance = _visibility_distance(d['visibility']) \
+            if 'visibility' in d else None
+        clouds = _clouds(d['clouds']) if 'clouds' in d else 0
+        rain = _precipitation(d['rain']) if 'rain' in d else dict()
+        snow = _precipitation(d['snow']) if 'snow' in d else dict()
+        wind = _wind(d)
+        status, detailed_status, weather_code, weather_icon_name = \
+            _status_info(d)
+    except KeyError:
+        return weather_from_dictionary(d)
+    return Weather(reference_time, sunset_time, sunrise_time, clouds,
+                   rain, snow, wind, humidity, pressure, temperature,
+                   status, detailed_status, weather_code, weather_icon_name,
+                   visibility_distance, dewpoint, humidex, heat_index)
+
+
+def weather_extractor(d, lazy=False):
+    """
+    Returns a function building *Weather* objects out of data dictionaries
+    having the same layout as the provided one, giving the same results as
+    ``weather_from_dictionary``: which one of the alternative layouts applies
+    (temperature, pressure and humidity nested into 'main' or at the top
+    level) is found out once, out of the provided dictionary, rather than for
+    each dictionary. Dictionaries having them at the top level (eg: the items
+    of daily forecasts) are handed to ``weather_from_dictionary``, which reads
+    that layout first; the function returned for the other layout hands the
+    dictionaries which turn out to have a different layout to it as well.
+    Meant for the lists of items of the OWM API responses, which share the
+    same layout.
+
+    :param d: a data dictionary having the layout of the ones to be read
+    :type d: dict
+    :param lazy: if ``True`` the function returns *LazyWeather* instances,
+        whose fields are read out of the data dictionaries on first access
+    :type lazy: bool
+    :returns: a function taking a data dictionary and returning a *Weather*
+        instance, raising *KeyError* if it is impossible to find or read the
+        data needed to build the instance
+
+    """
+    if lazy:
+        return LazyWeather
+    if 'dt' not in d or 'last' in d:
+        return weather_from_dictionary
+    if 'main' in d and isinstance(d['main'], dict) and not \
+            ('temp' in d or 'pressure' in d or 'humidity' in d):
+        return _weather_from_nested_layout
+    return weather_from_dictionary
+
+
+def weathers_from_dictionaries(items, lazy=False):
+    """
+    Builds a list of *Weather* objects out of a list of data dictionaries,
+    such as the items of an OWM API response, finding out their layout once
+    out of the first one (see ``weather_extractor``).
+
+    :param items: the data dictionaries
+    :type items: list of dict
+    :param lazy: if ``True`` *LazyWeather* instances are built, whose fields
+        are read out of the data dictionaries on first access
+    :type lazy: bool
+    :returns: a list of *Weather* instances
+    :raises: *KeyError* if it is impossible to find or read the data
+        needed to build the instances
+
+    """
+    if not items:
+        return []
+    extract = weather_extractor(items[0], lazy)
+    return [extract(item) for item in items]
+
+
+# -- lazy weather: each field is read out of the data dictionary by a reader
+# taking the same steps as weather_from_dictionary
+
+def _reference_time_of(d):
+    if 'dt' in d:
+        reference_time = d['dt']
+    else:
+        reference_time = d['last']['dt']
+    if reference_time < 0:
+        raise ValueError("'reference_time' must be greater than 0")
+    return reference_time
+
+
+def _sunset_time_of(d):
+    sunset_time = _sun_times(d)[0]
+    return sunset_time if sunset_time >= 0 else None
+
+
+def _sunrise_time_of(d):
+    sunrise_time = _sun_times(d)[1]
+    return sunrise_time if sunrise_time >= 0 else None
+
+
+def _calc_values_of(d):
+    if 'calc' in d:
+        return _calc_values(d['calc'])
+    if 'last' in d and 'calc' in d['last']:
+        return _calc_values(d['last']['calc'])
+    return None, None, None
+
+
+def _dewpoint_of(d):
+    return _calc_values_of(d)[0]
+
+
+def _humidex_of(d):
+    humidex = _calc_values_of(d)[1]
+    if humidex is not None and humidex < 0:
+        raise ValueError("'humidex' must be greater than 0")
+    return humidex
+
+
+def _heat_index_of(d):
+    heat_index = _calc_values_of(d)[2]
+    if heat_index is not None and heat_index < 0:
+        raise ValueError("'heat index' must be grater than 0")
+    return heat_index
+
+
+def _visibility_distance_of(d):
+    if 'visibility' in d:
+        visibility = d['visibility']
+    elif 'last' in d and 'visibility' in d['last']:
+        visibility = d['last']['visibility']
+    else:
+        return None
+    visibility_distance = _visibility_distance(visibility)
+    if visibility_distance is not None and visibility_distance < 0:
+        raise ValueError("'visibility_distance' must be greater than 0")
+    return visibility_distance
+
+
+def _clouds_of(d):
+    clouds = _clouds(d['clouds']) if 'clouds' in d else 0
+    if clouds < 0:
+        raise ValueError("'clouds' must be greater than 0")
+    return clouds
+
+
+def _precipitation_reader(key):
+    def read(d):
+        return _precipitation(d[key]) if key in d else dict()
+    return read
+
+
+def _wind_of(d):
+    if 'last' in d and (d['wind'] if 'wind' in d else None) is None:
+        last = d['last']
+        if 'wind' in last and last['wind'] is not None:
+            return last['wind'].copy()
+        return dict()
+    return _wind(d)
+
+
+def _humidity_of(d):
+    if 'humidity' in d:
+        humidity = d['humidity']
+    elif 'main' in d and 'humidity' in d['main']:
+        humidity = d['main']['humidity']
+    elif 'last' in d and 'main' in d['last'] and 'humidity' in d['last']['main']:
+        humidity = d['last']['main']['humidity']
+    else:
+        humidity = 0
+    if humidity < 0:
+        raise ValueError("'humidity' must be greatear than 0")
+    return humidity
+
+
+def _pressure_of(d):
+    if 'pressure' in d:
+        atm_press = d['pressure']
+    elif 'main' in d and 'pressure' in d['main']:
+        atm_press = d['main']['pressure']
+    elif 'last' in d:
+        atm_press = d['last']['main']['pressure']
+    else:
+        atm_press = None
+    if 'main' in d and 'sea_level' in d['main']:
+        sea_level_press = d['main']['sea_level']
+    else:
+        sea_level_press = None
+    return {'press': atm_press, 'sea_level': sea_level_press}
+
+
+def _temperature_of(d):
+    if 'temp' in d:
+        return d['temp'].copy() if d['temp'] is not None else dict()
+    if 'main' in d and 'temp' in d['main']:
+        return _main_temperature(d['main'])
+    if 'last' in d:
+        return dict(temp=d['last']['main']['temp'])
+    return dict()
+
+
+def _status_reader(index):
+    def read(d):
+        return _status_info(d)[index]
+    return read
+
+
+class _LazyField(object):
+    """
+    Descriptor of a field of *LazyWeather* objects, reading it out of their
+    data dictionary and storing it into the instance dict, which is looked up
+    before the descriptor from then on
+
+    """
+
+    def __init__(self, name, reader):
+        self._name = name
+        self._reader = reader
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self._reader(instance._data)
+        instance.__dict__[self._name] = value
+        return value
+
+
+class LazyWeather(Weather):
+    """
+    A *Weather* object keeping a reference to the data dictionary it is built
+    out of, and reading each one of its fields out of it on first access
+    only, so that the cost of parsing large responses (eg: forecasts, bounding
+    box searches) scales with the fields that are actually read. Fields are
+    read the way ``weather_from_dictionary`` reads them, and kept once read.
+    Only the reference time is read when the object is built: the errors
+    that ``weather_from_dictionary`` raises for the other fields (*KeyError*
+    when they cannot be read, *ValueError* when they are negative) are raised
+    by the getters.
+    The data dictionary must not be changed afterwards: it is usually part
+    of a decoded OWM API response, which in-process cache providers share.
+
+    :param d: a data dictionary
+    :type d: dict
+    :returns: a *LazyWeather* instance
+    :raises: *KeyError* if it is impossible to find or read the reference
+        time, *ValueError* when it is negative
+
+    """
+
+    # no __slots__: the fields read are kept into the instance dict, which is
+    # looked up before the descriptors of the fields but the reference time
+    _sunset_time = _LazyField('_sunset_time', _sunset_time_of)
+    _sunrise_time = _LazyField('_sunrise_time', _sunrise_time_of)
+    _clouds = _LazyField('_clouds', _clouds_of)
+    _rain = _LazyField('_rain', _precipitation_reader('rain'))
+    _snow = _LazyField('_snow', _precipitation_reader('snow'))
+    _wind = _LazyField('_wind', _wind_of)
+    _humidity = _LazyField('_humidity', _humidity_of)
+    _pressure = _LazyField('_pressure', _pressure_of)
+    _temperature = _LazyField('_temperature', _temperature_of)
+    _status = _LazyField('_status', _status_reader(0))
+    _detailed_status = _LazyField('_detailed_status', _status_reader(1))
+    _weather_code = _LazyField('_weather_code', _status_reader(2))
+    _weather_icon_name = _LazyField('_weather_icon_name', _status_reader(3))
+    _visibility_distance = _LazyField('_visibility_distance', _visibility_distance_of)
+    _dewpoint = _LazyField('_dewpoint', _dewpoint_of)
+    _humidex = _LazyField('_humidex', _humidex_of)
+    _heat_index = _LazyField('_heat_index', _heat_index_of)
+
+    def __init__(self, d):
+        self._data = d
+        self._reference_time = _reference_time_of(d)
@@ -30,6 +30,10 @@ setup(
         'requests>=2.20.0,<3',
         'geojson>=2.3.0,<3'
     ],
+    extras_require={
+        'async': ['aiohttp>=3.3,<4'],
+        'fastjson': ['orjson>=3,<4']
+    },
     python_requires='>=3.4',
     classifiers=[
       "License :: OSI Approved :: MIT License",
@@ -0,0 +1,68 @@
+"""
+Measures the memory saved by CompressedCache on the JSON test fixtures (the
+40 items 3h forecast, the 16 days daily forecast, the weather history and a
+single observation) and the CPU cost it adds to each cache hit, compared to a
+plain LRUCache storing JSON text. The hit cost includes the JSON decoding
+which HttpClient performs on each hit anyway. As the forecasts and the
+history are built by repeating one fixture item, their compression ratios are
+higher than the real world ones. Run with:
+
+    python -m tests.benchmarks.bench_compressedcache
+
+"""
+
+import json
+import timeit
+from pyowm.caches.compressedcache import CompressedCache
+from pyowm.caches.lrucache import LRUCache
+from tests.unit.weatherapi25.json_test_responses import (
+    OBSERVATION_JSON, THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON,
+    CITY_WEATHER_HISTORY_JSON)
+
+RUNS = 2000
+KEY = 'http://api.openweathermap.org/data/2.5/forecast?id=2643743'
+CODECS = [('zlib', 1), ('zlib', 6), ('zlib', 9), ('lzma', 0), ('lzma', 6)]
+
+
+def with_items(json_string, count):
+    data = json.loads(json_string)
+    item = data['list'][0]
+    data['list'] = [dict(item, dt=item['dt'] + i * 3600) for i in range(count)]
+    data['cnt'] = count
+    return json.dumps(data, separators=(',', ':'))
+
+
+FIXTURES = [
+    ('observation', json.dumps(json.loads(OBSERVATION_JSON),
+                               separators=(',', ':'))),
+    ('3h forecast', with_items(THREE_HOURS_FORECAST_JSON, 40)),
+    ('daily fcst', with_items(DAILY_FORECAST_JSON, 16)),
+    ('history', with_items(CITY_WEATHER_HISTORY_JSON, 24))]
+
+
+def measure_hit(cache):
+    def hit():
+        json.loads(cache.get(KEY))
+    elapsed = min(timeit.repeat(hit, number=RUNS, repeat=3))
+    return 1000000. * elapsed / RUNS
+
+
+if __name__ == '__main__':
+    print('%-12s %-8s %9s %9s %7s %12s %12s' % (
+        'fixture', 'codec', 'raw', 'stored', 'ratio', 'hit', 'added'))
+    for name, text in FIXTURES:
+        plain = LRUCache(max_bytes=10 ** 9)
+        plain.set(KEY, text)
+        baseline = measure_hit(plain)
+        print('%-12s %-8s %8dB %8dB %6.1fx %9.1f us %9s' % (
+            name, 'none', len(text), plain.size_bytes(), 1., baseline, '-'))
+        for codec, level in CODECS:
+            inner = LRUCache(max_bytes=10 ** 9)
+            cache = CompressedCache(inner, codec=codec, level=level,
+                                    threshold_bytes=0)
+            cache.set(KEY, text)
+            stored = inner.size_bytes()
+            hit = measure_hit(cache)
+            print('%-12s %-8s %8dB %8dB %6.1fx %9.1f us %+9.1f us' % (
+                name, '%s-%d' % (codec, level), len(text), stored,
+                float(len(text)) / stored, hit, hit - baseline))
@@ -0,0 +1,29 @@
+"""
+Compares one-shot connections against a pooled keep-alive session when
+issuing many API calls through HttpClient. Run with:
+
+    python -m tests.benchmarks.bench_http_client
+
+"""
+
+import timeit
+from pyowm.commons.http_client import HttpClient
+from tests.benchmarks.httpstub import HttpStub
+from tests.unit.weatherapi25.json_test_responses import OBSERVATION_JSON
+
+CALLS = 500
+
+
+def run(client, url):
+    for i in range(CALLS):
+        client.get_json(url + '/data/2.5/weather', params={'id': i})
+
+
+if __name__ == '__main__':
+    with HttpStub(OBSERVATION_JSON) as stub:
+        for label, client in [
+                ('one-shot connections', HttpClient()),
+                ('pooled session', HttpClient(session=HttpClient.pooled_session()))]:
+            elapsed = min(timeit.repeat(lambda: run(client, stub.url),
+                                        number=1, repeat=3))
+            print('%-22s %8.3f ms/call' % (label, 1000. * elapsed / CALLS))
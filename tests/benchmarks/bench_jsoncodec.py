@@ -0,0 +1,48 @@
+"""
+Compares the time taken by each installed JSON library to decode the 40 items
+3h forecast, the 16 days daily forecast and a 15 items search built out of the
+test fixtures, and to encode them back into JSON text.
+Run with:
+
+    python -m tests.benchmarks.bench_jsoncodec
+
+"""
+
+import json
+import timeit
+from pyowm.commons import jsoncodec
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, SEARCH_RESULTS_JSON)
+
+RUNS = 1000
+
+
+def with_items(json_string, count):
+    data = json.loads(json_string)
+    items = data['list']
+    data['list'] = [dict(items[i % len(items)], dt=items[0].get('dt', 0) + i * 3600)
+                    for i in range(count)]
+    data['cnt'] = count
+    return data
+
+
+def measure(function, *args):
+    elapsed = min(timeit.repeat(lambda: function(*args), number=RUNS, repeat=3))
+    return 1000000. * elapsed / RUNS
+
+
+if __name__ == '__main__':
+    backend = jsoncodec.backend()
+    for label, data in [
+            ('3h forecast, 40 items', with_items(THREE_HOURS_FORECAST_JSON, 40)),
+            ('daily forecast, 16 days', with_items(DAILY_FORECAST_JSON, 16)),
+            ('search, 15 items', with_items(SEARCH_RESULTS_JSON, 15))]:
+        text = json.dumps(data)
+        print('%s (%d bytes)' % (label, len(text)))
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            assert jsoncodec.loads(text) == data
+            print('    %-10s loads %8.1f us   dumps %8.1f us'
+                  % (name, measure(jsoncodec.loads, text),
+                     measure(jsoncodec.dumps, data)))
+    jsoncodec.use(backend)
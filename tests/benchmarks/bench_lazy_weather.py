@@ -0,0 +1,70 @@
+"""
+Compares parsing forecasts and searches into Weather objects against parsing
+them into LazyWeather objects, both when only the temperature and the weather
+code of each item are read and when all the fields are read (by dumping the
+items to JSON). The 40 items 3h forecast, the 16 days daily forecast and a 15
+items search are built out of the test fixtures.
+Run with:
+
+    python -m tests.benchmarks.bench_lazy_weather
+
+"""
+
+import json
+import timeit
+from pyowm.weatherapi25.parsers.forecastparser import ForecastParser
+from pyowm.weatherapi25.parsers.observationlistparser import ObservationListParser
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, SEARCH_RESULTS_JSON)
+
+RUNS = 500
+
+
+def with_items(json_string, count):
+    data = json.loads(json_string)
+    items = data['list']
+    data['list'] = [dict(items[i % len(items)], dt=items[0].get('dt', 0) + i * 3600)
+                    for i in range(count)]
+    data['cnt'] = count
+    return data
+
+
+def weathers(parser, data):
+    result = parser.parse_dict(data)
+    if isinstance(result, list):
+        return [observation.get_weather() for observation in result]
+    return result.get_weathers()
+
+
+def read_some(parser, data):
+    return [(w.get_temperature(), w.get_weather_code())
+            for w in weathers(parser, data)]
+
+
+def read_all(parser, data):
+    return [w.to_JSON() for w in weathers(parser, data)]
+
+
+def measure(function, *args):
+    elapsed = min(timeit.repeat(lambda: function(*args), number=RUNS, repeat=3))
+    return 1000000. * elapsed / RUNS
+
+
+if __name__ == '__main__':
+    for label, parser_class, data in [
+            ('3h forecast, 40 items', ForecastParser,
+             with_items(THREE_HOURS_FORECAST_JSON, 40)),
+            ('daily forecast, 16 days', ForecastParser,
+             with_items(DAILY_FORECAST_JSON, 16)),
+            ('search, 15 items', ObservationListParser,
+             with_items(SEARCH_RESULTS_JSON, 15))]:
+        eager, lazy = parser_class(), parser_class(lazy_weather=True)
+        assert read_all(eager, data) == read_all(lazy, data)
+        print(label)
+        for what, function in [('parse only', weathers),
+                               ('temperature and code', read_some),
+                               ('all fields', read_all)]:
+            eager_time = measure(function, eager, data)
+            lazy_time = measure(function, lazy, data)
+            print('    %-22s eager %8.1f us   lazy %8.1f us   (%.2fx)'
+                  % (what, eager_time, lazy_time, eager_time / lazy_time))
@@ -0,0 +1,54 @@
+"""
+Measures LRUCache hit, update and insertion (with eviction) latencies on
+full caches of growing sizes: latencies are expected to stay flat. Run with:
+
+    python -m tests.benchmarks.bench_lrucache
+
+"""
+
+import random
+import timeit
+from pyowm.caches.lrucache import LRUCache
+
+SIZES = [100, 1000, 10000, 100000, 200000]
+OPERATIONS = 100000
+URL = 'http://api.openweathermap.org/data/2.5/weather?id=%d'
+
+
+def full_cache(size):
+    cache = LRUCache(size, 1000 * 60 * 60)
+    for i in range(size):
+        cache.set(URL % i, {'id': i})
+    return cache
+
+
+def measure(statement):
+    elapsed = min(timeit.repeat(statement, number=1, repeat=3))
+    return 1000000000. * elapsed / OPERATIONS
+
+
+if __name__ == '__main__':
+    print('%8s %12s %12s %12s' % ('size', 'get hit', 'set update', 'set evict'))
+    for size in SIZES:
+        cache = full_cache(size)
+        keys = [URL % random.randrange(size) for _ in range(OPERATIONS)]
+        next_id = [size]
+
+        def get_hits():
+            for key in keys:
+                cache.get(key)
+
+        def set_updates():
+            for key in keys:
+                cache.set(key, key)
+
+        def set_evictions():
+            # each new item evicts the least recently used one
+            start = next_id[0]
+            next_id[0] += OPERATIONS
+            for i in range(start, start + OPERATIONS):
+                cache.set(URL % i, i)
+
+        print('%8d %9.0f ns %9.0f ns %9.0f ns' % (
+            size, measure(get_hits), measure(set_updates),
+            measure(set_evictions)))
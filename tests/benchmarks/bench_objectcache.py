@@ -0,0 +1,60 @@
+"""
+Measures the cost of a cache hit with and without an ObjectCache: without it,
+the response returned by the LRUCache is parsed again; with it, a copy of the
+object parsed on the first hit is returned. The 40 items 3h forecast, the 16
+days daily forecast and a 15 items search are built out of the test fixtures.
+Run with:
+
+    python -m tests.benchmarks.bench_objectcache
+
+"""
+
+import json
+import timeit
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.objectcache import ObjectCache
+from pyowm.weatherapi25.parsers.forecastparser import ForecastParser
+from pyowm.weatherapi25.parsers.observationlistparser import ObservationListParser
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, SEARCH_RESULTS_JSON)
+
+RUNS = 2000
+KEY = 'http://api.openweathermap.org/data/2.5/forecast?id=2643743'
+
+
+def with_items(json_string, count):
+    data = json.loads(json_string)
+    items = data['list']
+    data['list'] = [dict(items[i % len(items)], dt=items[0].get('dt', 0) + i * 3600)
+                    for i in range(count)]
+    data['cnt'] = count
+    return data
+
+
+def parsing_hit(parser, cache):
+    return parser.parse_dict(cache.get(KEY))
+
+
+def object_cache_hit(parser, cache, object_cache):
+    return object_cache.parse(parser, cache.get(KEY))
+
+
+def measure(function, *args):
+    elapsed = min(timeit.repeat(lambda: function(*args), number=RUNS, repeat=3))
+    return 1000000. * elapsed / RUNS
+
+
+if __name__ == '__main__':
+    for label, parser, data in [
+            ('3h forecast, 40 items', ForecastParser(),
+             with_items(THREE_HOURS_FORECAST_JSON, 40)),
+            ('daily forecast, 16 days', ForecastParser(),
+             with_items(DAILY_FORECAST_JSON, 16)),
+            ('search, 15 items', ObservationListParser(),
+             with_items(SEARCH_RESULTS_JSON, 15))]:
+        cache, object_cache = LRUCache(), ObjectCache()
+        cache.set(KEY, data)
+        parsing_time = measure(parsing_hit, parser, cache)
+        object_time = measure(object_cache_hit, parser, cache, object_cache)
+        print('%-25s parsing %8.1f us   object cache %8.1f us   (%.1fx)'
+              % (label, parsing_time, object_time, parsing_time / object_time))
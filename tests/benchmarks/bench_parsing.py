@@ -0,0 +1,72 @@
+"""
+Compares the former JSON text pipeline between HttpClient, the cache and the
+parsers (decode the response, re-encode it for the cache, decode it again in
+the parser) against the decoded data pipeline, on cache misses and cache hits.
+The 40 items 3h forecast and the 16 days daily forecast are built out of the
+test fixtures. Run with:
+
+    python -m tests.benchmarks.bench_parsing
+
+"""
+
+import json
+import timeit
+from pyowm.caches.lrucache import LRUCache
+from pyowm.weatherapi25.parsers.forecastparser import ForecastParser
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON)
+
+RUNS = 2000
+KEY = 'http://api.openweathermap.org/data/2.5/forecast?id=2643743'
+
+
+def with_items(json_string, count):
+    data = json.loads(json_string)
+    item = data['list'][0]
+    data['list'] = [dict(item, dt=item['dt'] + i * 3600) for i in range(count)]
+    data['cnt'] = count
+    return json.dumps(data)
+
+
+def text_pipeline_miss(parser, cache, response_text):
+    data = json.loads(response_text)
+    json_string = json.dumps(data)
+    cache.set(KEY, json_string)
+    return parser.parse_JSON(json_string)
+
+
+def text_pipeline_hit(parser, cache):
+    return parser.parse_JSON(cache.get(KEY))
+
+
+def dict_pipeline_miss(parser, cache, response_text):
+    data = json.loads(response_text)
+    cache.set(KEY, data)
+    return parser.parse_dict(data)
+
+
+def dict_pipeline_hit(parser, cache):
+    return parser.parse_dict(cache.get(KEY))
+
+
+def measure(function, *args):
+    elapsed = min(timeit.repeat(lambda: function(*args), number=RUNS, repeat=3))
+    return 1000000. * elapsed / RUNS
+
+
+if __name__ == '__main__':
+    parser = ForecastParser()
+    for label, response_text in [
+            ('3h forecast, 40 items', with_items(THREE_HOURS_FORECAST_JSON, 40)),
+            ('daily forecast, 16 days', with_items(DAILY_FORECAST_JSON, 16))]:
+        print(label)
+        text_cache, dict_cache = LRUCache(), LRUCache()
+        text_pipeline_miss(parser, text_cache, response_text)
+        dict_pipeline_miss(parser, dict_cache, response_text)
+        for case, text_time, dict_time in [
+                ('miss', measure(text_pipeline_miss, parser, text_cache, response_text),
+                 measure(dict_pipeline_miss, parser, dict_cache, response_text)),
+                ('hit', measure(text_pipeline_hit, parser, text_cache),
+                 measure(dict_pipeline_hit, parser, dict_cache))]:
+            print('  %-5s JSON text %8.1f us   decoded data %8.1f us   (%.2fx)'
+                  % (case, text_time, dict_time, text_time / dict_time))
@@ -0,0 +1,104 @@
+"""
+Measures with tracemalloc the memory taken by each object of the domain
+classes, now that they keep their fields into __slots__, against twins of the
+same classes keeping them into a per-instance dict as they used to. Field
+values are shared by all the objects, so that only the objects themselves are
+measured. Savings are larger on Python versions before 3.11, whose
+per-instance dicts take more memory. Run with:
+
+    python -m tests.benchmarks.bench_slots
+
+"""
+
+import gc
+import tracemalloc
+import warnings
+from pyowm.agroapi10.imagery import MetaPNGImage
+from pyowm.agroapi10.soil import Soil
+from pyowm.pollutionapi30.coindex import COIndex
+from pyowm.pollutionapi30.no2index import NO2Index
+from pyowm.pollutionapi30.ozone import Ozone
+from pyowm.pollutionapi30.so2index import SO2Index
+from pyowm.stationsapi30.measurement import AggregatedMeasurement, Measurement
+from pyowm.stationsapi30.station import Station as StationsAPIStation
+from pyowm.uvindexapi30.uvindex import UVIndex
+from pyowm.weatherapi25.forecast import Forecast
+from pyowm.weatherapi25.location import Location
+from pyowm.weatherapi25.observation import Observation
+from pyowm.weatherapi25.station import Station
+from pyowm.weatherapi25.stationhistory import StationHistory
+from pyowm.weatherapi25.weather import Weather
+
+COUNT = 20000
+
+LOCATION = Location('London', -0.12574, 51.50853, 2643743, 'GB')
+WEATHER = Weather(1378459200, 1378496400, 1378449600, 67, {'all': 20},
+                  {'all': 0}, {'deg': 252.002, 'speed': 1.1}, 57,
+                  {'press': 1030.119, 'sea_level': 1038.589},
+                  {'temp': 294.199, 'temp_kf': -1.899, 'temp_max': 296.098,
+                   'temp_min': 294.199}, 'Clouds', 'Overcast clouds', 804,
+                  '04d', 1000, 300.0, 298.0, 296.0)
+SAMPLES = [{'precision': -4.99e-07, 'pressure': 1000, 'value': 8.16e-08}]
+
+FACTORIES = [
+    (Weather, lambda cls: cls(*WEATHER.__getstate__().values())),
+    (Location, lambda cls: cls('London', -0.12574, 51.50853, 2643743, 'GB')),
+    (Observation, lambda cls: cls(1378459200, LOCATION, WEATHER)),
+    (Forecast, lambda cls: cls('3h', 1378459200, LOCATION, [WEATHER])),
+    (Station, lambda cls: cls('KNGU', 2865, 1, 50, 36.9375, -76.2893, 18.95,
+                              WEATHER)),
+    (StationHistory, lambda cls: cls(2865, 'tick', 1378459200, {})),
+    (UVIndex, lambda cls: cls(1378459200, LOCATION, 6.8, 1378459200)),
+    (COIndex, lambda cls: cls(1378459200, LOCATION, 'day', SAMPLES,
+                              1378459200)),
+    (Ozone, lambda cls: cls(1378459200, LOCATION, 'day', 6.8, 1378459200)),
+    (NO2Index, lambda cls: cls(1378459200, LOCATION, 'day', SAMPLES,
+                               1378459200)),
+    (SO2Index, lambda cls: cls(1378459200, LOCATION, 'day', SAMPLES,
+                               1378459200)),
+    (AggregatedMeasurement, lambda cls: cls('mytest', 1378459200, 'h')),
+    (Measurement, lambda cls: cls('mytest', 1378459200, temperature=20.1)),
+    (StationsAPIStation, lambda cls: cls('5831', None, None, 'SF_TEST001',
+                                         'San Francisco', -122.43, 37.76,
+                                         150, 0)),
+    (Soil, lambda cls: cls(1378459200, 294.199, 287.3, 0.43, 'my-polygon')),
+    (MetaPNGImage, lambda cls: cls('http://a.com', 'truecolor', 'sentinel',
+                                   1378459200, 98.2, 0.5, 127.4, 23.5))
+]
+
+
+def with_dict(cls):
+    """
+    Returns a twin of the class, keeping the fields of its objects into a
+    per-instance dict
+    """
+    namespace = dict()
+    for klass in reversed(cls.__mro__[:-1]):
+        namespace.update(klass.__dict__)
+        for name in klass.__dict__.get('__slots__', ()):
+            namespace.pop(name)
+    for name in ['__slots__', '__getstate__', '__setstate__', '__copy__']:
+        namespace.pop(name, None)
+    return type(cls.__name__, (object,), namespace)
+
+
+def bytes_per_object(factory, cls):
+    gc.collect()
+    tracemalloc.start()
+    objects = [None] * COUNT
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(COUNT):
+        objects[i] = factory(cls)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return float(used) / len(objects)
+
+
+if __name__ == '__main__':
+    warnings.simplefilter('ignore', DeprecationWarning)
+    for cls, factory in FACTORIES:
+        dict_bytes = bytes_per_object(factory, with_dict(cls))
+        slots_bytes = bytes_per_object(factory, cls)
+        print('%-35s dict %5.0f bytes   slots %5.0f bytes   (%.1fx)'
+              % ('%s.%s' % (cls.__module__.rsplit('.', 1)[-1], cls.__name__),
+                 dict_bytes, slots_bytes, dict_bytes / slots_bytes))
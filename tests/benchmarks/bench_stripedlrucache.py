@@ -0,0 +1,67 @@
+"""
+Measures the throughput of a shared cache accessed by 1, 4 and 16 threads
+with a 90% get / 10% set workload, comparing an LRUCache guarded by a single
+global lock against a StripedLRUCache. Run with:
+
+    python -m tests.benchmarks.bench_stripedlrucache
+
+"""
+
+import random
+import threading
+import time
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.stripedlrucache import StripedLRUCache
+
+THREADS = [1, 4, 16]
+OPERATIONS = 400000
+KEYS = 2000
+CACHE_SIZE = 1000
+URL = 'http://api.openweathermap.org/data/2.5/weather?id=%d'
+
+
+class GlobalLockLRUCache(LRUCache):
+
+    def __init__(self, *args):
+        super(GlobalLockLRUCache, self).__init__(*args)
+        self._lock = threading.Lock()
+
+    def get(self, request_url):
+        with self._lock:
+            return super(GlobalLockLRUCache, self).get(request_url)
+
+    def set(self, request_url, response_json):
+        with self._lock:
+            super(GlobalLockLRUCache, self).set(request_url, response_json)
+
+
+def worker(cache, operations, seed):
+    rnd = random.Random(seed)
+    keys = [URL % rnd.randrange(KEYS) for _ in range(1000)]
+    for i in range(operations):
+        key = keys[i % 1000]
+        if i % 10:
+            cache.get(key)
+        else:
+            cache.set(key, {'id': key})
+
+
+def throughput(cache, n_threads):
+    threads = [threading.Thread(target=worker,
+                                args=(cache, OPERATIONS // n_threads, i))
+               for i in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print('%8s %20s %20s' % ('threads', 'global lock', 'striped'))
+    for n_threads in THREADS:
+        results = [max(throughput(factory(), n_threads) for _ in range(3))
+                   for factory in [lambda: GlobalLockLRUCache(CACHE_SIZE, 60000),
+                                   lambda: StripedLRUCache(CACHE_SIZE, 60000)]]
+        print('%8d %14.0f ops/s %14.0f ops/s' % (n_threads, results[0], results[1]))
@@ -0,0 +1,63 @@
+"""
+Compares building the Weather objects of a list of response items with
+weather_from_dictionary, which finds out the layout of each item, against
+weathers_from_dictionaries, which finds it out once. The 40 items 3h
+forecast, the 16 days daily forecast, the 24 items weather history, the 15
+items search and the 20 stations list are built out of the test fixtures.
+Run with:
+
+    python -m tests.benchmarks.bench_weather_extraction
+
+"""
+
+import json
+import timeit
+from pyowm.weatherapi25.weather import (weather_from_dictionary,
+                                       weathers_from_dictionaries)
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, CITY_WEATHER_HISTORY_JSON,
+    SEARCH_RESULTS_JSON, STATION_AT_COORDS_JSON)
+
+RUNS = 100
+REPEATS = 50
+
+
+def with_items(items, count):
+    return [dict(items[i % len(items)], dt=items[0]['dt'] + i * 3600)
+            for i in range(count)]
+
+
+def per_item(items):
+    return [weather_from_dictionary(item) for item in items]
+
+
+def measure(functions, *args):
+    # runs of the functions are interleaved, so that noise affects them alike
+    best = [float('inf')] * len(functions)
+    for _ in range(REPEATS):
+        for i, function in enumerate(functions):
+            elapsed = timeit.timeit(lambda: function(*args), number=RUNS)
+            best[i] = min(best[i], elapsed)
+    return [1000000. * elapsed / RUNS for elapsed in best]
+
+
+if __name__ == '__main__':
+    stations = json.loads(STATION_AT_COORDS_JSON)
+    for label, items in [
+            ('3h forecast, 40 items',
+             with_items(json.loads(THREE_HOURS_FORECAST_JSON)['list'], 40)),
+            ('daily forecast, 16 days',
+             with_items(json.loads(DAILY_FORECAST_JSON)['list'], 16)),
+            ('history, 24 items',
+             with_items(json.loads(CITY_WEATHER_HISTORY_JSON)['list'], 24)),
+            ('search, 15 items',
+             with_items(json.loads(SEARCH_RESULTS_JSON)['list'], 15)),
+            ('stations, 20 items',
+             with_items([item['last'] for item in stations], 20))]:
+        assert [w.__getstate__() for w in per_item(items)] == \
+            [w.__getstate__() for w in weathers_from_dictionaries(items)]
+        generic_time, specialised_time = measure(
+            [per_item, weathers_from_dictionaries], items)
+        print('%-25s per item %8.1f us   once per list %8.1f us   (%.2fx)'
+              % (label, generic_time, specialised_time,
+                 generic_time / specialised_time))
@@ -0,0 +1,57 @@
+"""
+A local HTTP server stubbing OWM web API responses, used by benchmarks
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def _handler_for(payload):
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # allows keep-alive connections
+        wbufsize = -1  # headers and body go out in a single segment
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+class HttpStub(object):
+    """
+    Serves the given JSON payload to any GET request on a local random port.
+    Use as a context manager: the ``url`` attribute is the server base URL.
+
+    :param payload: the JSON string to be served
+    :type payload: str
+
+    """
+
+    def __init__(self, payload):
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0),
+                                            _handler_for(payload.encode('utf-8')))
+        self.url = 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def __enter__(self):
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
@@ -32,14 +32,14 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(o1.get_reception_time() is not None)
         loc = o1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o1.get_weather()
         self.assertTrue(weat is not None)
         self.assertTrue(o2 is not None)
         self.assertTrue(o2.get_reception_time() is not None)
         loc = o2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o2.get_weather()
         self.assertTrue(weat is not None)
 
@@ -53,14 +53,14 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(o1.get_reception_time())
         loc = o1.get_location()
         self.assertTrue(loc)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o1.get_weather()
         self.assertTrue(weat)
         self.assertTrue(o2)
         self.assertTrue(o2.get_reception_time())
         loc = o2.get_location()
         self.assertTrue(loc)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o2.get_weather()
         self.assertTrue(weat)
 
@@ -73,7 +73,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(o1.get_reception_time())
         loc = o1.get_location()
         self.assertTrue(loc)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o1.get_weather()
         self.assertTrue(weat)
 
@@ -84,14 +84,14 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(o1.get_reception_time() is not None)
         loc = o1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o1.get_weather()
         self.assertTrue(weat is not None)
         self.assertTrue(o2 is not None)
         self.assertTrue(o2.get_reception_time() is not None)
         loc = o2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o2.get_weather()
         self.assertTrue(weat is not None)
 
@@ -104,14 +104,14 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(o1.get_reception_time() is not None)
         loc = o1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o1.get_weather()
         self.assertTrue(weat is not None)
         self.assertTrue(o2 is not None)
         self.assertTrue(o2.get_reception_time() is not None)
         loc = o2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = o2.get_weather()
         self.assertTrue(weat is not None)
 
@@ -129,7 +129,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time())
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
         self.assertTrue(isinstance(o2, list))
@@ -139,7 +139,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time())
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
 
@@ -152,7 +152,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time())
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
         self.assertTrue(isinstance(o4, list))
@@ -162,7 +162,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time())
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
 
@@ -178,7 +178,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time() is not None)
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
         o1 = self.__owm.weather_around_coords(57.0, -2.15, 2)  # Scotland
@@ -188,7 +188,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
             self.assertTrue(item.get_reception_time() is not None)
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
 
@@ -204,7 +204,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         self.assertTrue(fc2 is not None)
@@ -213,7 +213,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f2.get_reception_time() is not None)
         loc = f2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f2:
             self.assertTrue(weather is not None)
 
@@ -231,7 +231,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         self.assertTrue(fc2 is not None)
@@ -240,7 +240,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f2.get_reception_time() is not None)
         loc = f2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f2:
             self.assertTrue(weather is not None)
         with self.assertRaises(ValueError):
@@ -260,7 +260,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         self.assertTrue(fc2 is not None)
@@ -269,7 +269,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f2.get_reception_time() is not None)
         loc = f2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f2:
             self.assertTrue(weather is not None)
         # Unexistent
@@ -291,7 +291,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         self.assertTrue(fc2 is not None)
@@ -300,7 +300,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f2.get_reception_time() is not None)
         loc = f2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f2:
             self.assertTrue(weather is not None)
 
@@ -315,7 +315,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         with self.assertRaises(ValueError):
@@ -340,7 +340,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f1.get_reception_time() is not None)
         loc = f1.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f1:
             self.assertTrue(weather is not None)
         self.assertTrue(fc2 is not None)
@@ -349,7 +349,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         self.assertTrue(f2.get_reception_time() is not None)
         loc = f2.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         for weather in f2:
             self.assertTrue(weather is not None)
 
@@ -435,7 +435,7 @@ class IntegrationTestsWebAPI25(unittest.TestCase):
         for station in s1:
             self.assertTrue(station is not None)
             self.assertTrue(
-                    all(v is not None for v in station.__dict__.values()))
+                    all(v is not None for v in station.__getstate__().values()))
         with self.assertRaises(ValueError):
             self.__owm.station_at_coords(51.5073509, 220)
         with self.assertRaises(ValueError):
@@ -0,0 +1,143 @@
+"""
+A minimal in-process server speaking the Redis protocol (RESP), implementing
+the few commands used by RedisCache, so that it can be tested without a real
+Redis server
+"""
+
+import fnmatch
+import socketserver
+import threading
+import time
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        self.db = 0
+        self.authenticated = self.server.password is None
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            with self.server.lock:
+                self.server.commands.append(command)
+                reply = self.execute(command)
+            self.wfile.write(reply)
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        assert line[:1] == b'*', line
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return [args[0].decode('utf-8').upper()] + args[1:]
+
+    def data(self):
+        return self.server.dbs.setdefault(self.db, dict())
+
+    def lookup(self, key):
+        data = self.data()
+        item = data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and self.server.clock() >= expires_at:
+            del data[key]
+            return None
+        return value
+
+    def execute(self, command):
+        name, args = command[0], command[1:]
+        if name == 'AUTH':
+            if args[0].decode('utf-8') != self.server.password:
+                return b'-WRONGPASS invalid password\r\n'
+            self.authenticated = True
+            return b'+OK\r\n'
+        if not self.authenticated:
+            return b'-NOAUTH Authentication required.\r\n'
+        if name == 'PING':
+            return b'+PONG\r\n'
+        if name == 'SELECT':
+            self.db = int(args[0])
+            return b'+OK\r\n'
+        if name == 'GET':
+            return bulk(self.lookup(args[0]))
+        if name == 'MGET':
+            return array([bulk(self.lookup(key)) for key in args])
+        if name == 'SET':
+            expires_at = None
+            if len(args) == 4 and args[2].upper() == b'PX':
+                expires_at = self.server.clock() + int(args[3]) / 1000.
+            self.data()[args[0]] = (args[1], expires_at)
+            return b'+OK\r\n'
+        if name == 'DEL':
+            return b':%d\r\n' % sum(1 for key in args
+                                    if self.data().pop(key, None) is not None)
+        if name == 'STRLEN':
+            value = self.lookup(args[0])
+            return b':%d\r\n' % (len(value) if value is not None else 0)
+        if name == 'SCAN':
+            # the cursor is the index of the next key in key order
+            cursor, pattern, count = int(args[0]), b'*', 10
+            for option, value in zip(args[1::2], args[2::2]):
+                if option.upper() == b'MATCH':
+                    pattern = value
+                elif option.upper() == b'COUNT':
+                    count = int(value)
+            keys = sorted(key for key in self.data() if self.lookup(key) is not None)
+            batch = keys[cursor:cursor + count]
+            next_cursor = cursor + count if cursor + count < len(keys) else 0
+            matching = [bulk(key) for key in batch
+                        if fnmatch.fnmatchcase(key.decode('utf-8'),
+                                               pattern.decode('utf-8'))]
+            return array([bulk(b'%d' % next_cursor), array(matching)])
+        return b"-ERR unknown command '%s'\r\n" % name.encode('utf-8')
+
+
+def bulk(value):
+    if value is None:
+        return b'$-1\r\n'
+    return b'$%d\r\n%s\r\n' % (len(value), value)
+
+
+def array(items):
+    return b'*%d\r\n' % len(items) + b''.join(items)
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password=None):
+        socketserver.ThreadingTCPServer.__init__(self, ('127.0.0.1', 0),
+                                                 FakeRedisHandler)
+        self.password = password
+        self.clock = time.monotonic
+        self.lock = threading.Lock()
+        self.dbs = dict()
+        self.commands = []
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        kwargs=dict(poll_interval=0.01))
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def command_names(self):
+        with self.lock:
+            return [command[0] for command in self.commands]
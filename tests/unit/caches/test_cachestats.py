@@ -0,0 +1,132 @@
+"""
+Test case for cachestats.py module.
+"""
+
+import unittest
+from pyowm.caches.cachestats import CacheStats, endpoint_of
+
+
+class TestCacheStats(unittest.TestCase):
+
+    __weather_url = 'http://api.openweathermap.org/data/2.5/weather?id=1'
+    __forecast_url = 'http://api.openweathermap.org/data/2.5/forecast?id=1'
+
+    def test_endpoint_of(self):
+        self.assertEqual('/data/2.5/weather', endpoint_of(self.__weather_url))
+        self.assertEqual('/data/2.5/weather',
+                         endpoint_of('https://pro.openweathermap.org/data/2.5/weather'))
+        self.assertEqual('/pollution/v1/co/{}/current.json', endpoint_of(
+            'http://api.openweathermap.org/pollution/v1/co/45.0,9.0/current.json'))
+        for timeref in ['2016Z', '2016-01Z', '2016-01-02Z', '2016-01-02T10Z',
+                        '2016-01-02T10:30Z']:
+            self.assertEqual('/pollution/v1/co/{}/{}.json', endpoint_of(
+                'http://api.openweathermap.org/pollution/v1/co/45.0,9.0/%s.json'
+                % timeref))
+        self.assertEqual('/', endpoint_of('http://test.com'))
+        self.assertEqual('/', endpoint_of('http://test.com/?q=1'))
+
+    def test_empty_snapshot(self):
+        snapshot = CacheStats().snapshot()
+        self.assertEqual({}, snapshot['endpoints'])
+        self.assertEqual(dict(hits=0, misses=0, expirations=0, evictions=0,
+                              sets=0, errors=0, bytes=None, get_latency_us={},
+                              set_latency_us={}), snapshot['total'])
+
+    def test_counters_by_endpoint(self):
+        instance = CacheStats()
+        instance.record_get(self.__weather_url, True, 500)
+        instance.record_get(self.__weather_url, False, 1500)
+        instance.record_get(self.__forecast_url, False, 2500)
+        instance.record_set(self.__weather_url, 3000)
+        instance.record_removal(self.__weather_url, expired=True)
+        instance.record_removal(self.__forecast_url, evicted=True)
+        instance.record_error(self.__forecast_url)
+        snapshot = instance.snapshot()
+        weather = snapshot['endpoints']['/data/2.5/weather']
+        self.assertEqual((1, 1, 1, 0, 1), (weather['hits'], weather['misses'],
+                                           weather['expirations'],
+                                           weather['evictions'], weather['sets']))
+        self.assertEqual({1: 1, 2: 1}, weather['get_latency_us'])
+        self.assertEqual({4: 1}, weather['set_latency_us'])
+        self.assertIsNone(weather['bytes'])
+        total = snapshot['total']
+        self.assertEqual((1, 2, 1, 1, 1), (total['hits'], total['misses'],
+                                           total['expirations'],
+                                           total['evictions'], total['sets']))
+        self.assertEqual({1: 1, 2: 1, 4: 1}, total['get_latency_us'])
+        self.assertEqual((0, 1), (weather['errors'], total['errors']))
+
+    def test_latency_histogram_is_bounded(self):
+        instance = CacheStats()
+        instance.record_get(self.__weather_url, True, 10 ** 15)
+        histogram = instance.snapshot()['total']['get_latency_us']
+        self.assertEqual([2 ** 23], list(histogram))
+
+    def test_bytes_tracking(self):
+        instance = CacheStats(track_bytes=True)
+        instance.record_set(self.__weather_url, 100, nbytes=40)
+        instance.record_set(self.__forecast_url, 100, nbytes=60)
+        instance.record_removal(self.__weather_url, nbytes=10)
+        snapshot = instance.snapshot()
+        self.assertEqual(30, snapshot['endpoints']['/data/2.5/weather']['bytes'])
+        self.assertEqual(90, snapshot['total']['bytes'])
+        instance.clear_bytes()
+        self.assertEqual(0, instance.snapshot()['total']['bytes'])
+
+    def test_bytes_by_endpoint(self):
+        instance = CacheStats()
+        instance.record_get(self.__weather_url, True, 100)
+        snapshot = instance.snapshot(bytes_by_endpoint={'/data/2.5/weather': 10,
+                                                        '/data/2.5/forecast': 20})
+        self.assertEqual(10, snapshot['endpoints']['/data/2.5/weather']['bytes'])
+        self.assertEqual(0, snapshot['endpoints']['/data/2.5/forecast']['hits'])
+        self.assertEqual(30, snapshot['total']['bytes'])
+
+    def test_reset_keeps_bytes(self):
+        instance = CacheStats(track_bytes=True)
+        instance.record_set(self.__weather_url, 100, nbytes=40)
+        instance.record_get(self.__forecast_url, False, 100)
+        snapshot = instance.snapshot(reset=True)
+        self.assertEqual(1, snapshot['total']['sets'])
+        snapshot = instance.snapshot()
+        self.assertEqual(0, snapshot['total']['sets'])
+        self.assertEqual(0, snapshot['total']['misses'])
+        self.assertEqual(40, snapshot['total']['bytes'])
+        instance.reset()
+        self.assertEqual(['/data/2.5/weather'], list(instance.snapshot()['endpoints']))
+
+    def test_unsynchronized(self):
+        instance = CacheStats(synchronized=False)
+        for lat in range(3):
+            url = 'http://api.openweathermap.org/pollution/v1/co/%d,9/current.json' % lat
+            instance.record_set(url, 100)
+            instance.record_get(url, True, 100)
+            instance.record_removal(url, evicted=True)
+        instance.reset()
+        instance.record_get(self.__weather_url, False, 100)
+        snapshot = instance.snapshot()
+        self.assertEqual(['/data/2.5/weather'], list(snapshot['endpoints']))
+        self.assertEqual(1, snapshot['total']['misses'])
+
+    def test_many_urls_share_endpoints(self):
+        instance = CacheStats()
+        for lat in range(2000):
+            url = 'http://api.openweathermap.org/pollution/v1/co/%d,9/current.json' % lat
+            instance.record_get(url, False, 100)
+        snapshot = instance.snapshot()
+        self.assertEqual(['/pollution/v1/co/{}/current.json'],
+                         list(snapshot['endpoints']))
+        self.assertEqual(2000, snapshot['total']['misses'])
+
+    def test_merge(self):
+        first = CacheStats()
+        first.record_get(self.__weather_url, True, 500)
+        second = CacheStats()
+        second.record_get(self.__weather_url, False, 500)
+        second.record_get(self.__forecast_url, True, 500)
+        merged = CacheStats.merge([first.snapshot(), second.snapshot()])
+        weather = merged['endpoints']['/data/2.5/weather']
+        self.assertEqual((1, 1), (weather['hits'], weather['misses']))
+        self.assertEqual({1: 2}, weather['get_latency_us'])
+        self.assertEqual(2, merged['total']['hits'])
+        self.assertEqual(CacheStats().snapshot(), CacheStats.merge([]))
@@ -0,0 +1,127 @@
+"""
+Test case for compressedcache.py module.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pyowm.caches import lrucache
+from pyowm.caches.compressedcache import CompressedCache
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.sqlitecache import SQLiteCache
+from pyowm.commons.http_client import HttpClient
+
+
+class TestCompressedCache(unittest.TestCase):
+
+    __test_url = "http://test.com/path?param=value"
+    __test_data = {"list": [{"name": "London", "temp": 280.15}] * 50}
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, CompressedCache, LRUCache(), 'bz2')
+        self.assertRaises(AssertionError, CompressedCache, LRUCache(), 'zlib', 10)
+        self.assertRaises(AssertionError, CompressedCache, LRUCache(), 'lzma', -1)
+        self.assertRaises(AssertionError, CompressedCache, LRUCache(),
+                          threshold_bytes=-1)
+
+    def test_large_items_are_compressed(self):
+        for codec in ['zlib', 'lzma']:
+            inner = LRUCache()
+            instance = CompressedCache(inner, codec=codec)
+            instance.set(self.__test_url, self.__test_data)
+            stored = inner.get(self.__test_url)
+            self.assertTrue(isinstance(stored, bytes))
+            self.assertTrue(len(stored) < len(json.dumps(self.__test_data)))
+            self.assertEqual(self.__test_data,
+                             json.loads(instance.get(self.__test_url)))
+
+    def test_json_text_is_compressed(self):
+        instance = CompressedCache(LRUCache(), threshold_bytes=0)
+        instance.set("1", '{"a": "è"}')
+        instance.set("2", b'{"b": 2}')
+        self.assertEqual({"a": "è"}, json.loads(instance.get("1")))
+        self.assertEqual(b'{"b": 2}', instance.get("2"))
+
+    def test_small_items_are_stored_as_they_are(self):
+        inner = LRUCache()
+        instance = CompressedCache(inner, threshold_bytes=100)
+        instance.set("1", {"a": 1})
+        instance.set("2", '{"b": 2}')
+        self.assertEqual({"a": 1}, inner.get("1"))
+        self.assertEqual({"a": 1}, instance.get("1"))
+        self.assertEqual('{"b": 2}', instance.get("2"))
+
+    def test_items_compressed_with_another_codec_are_looked_up(self):
+        inner = LRUCache()
+        CompressedCache(inner, codec='lzma').set(self.__test_url,
+                                                 self.__test_data)
+        instance = CompressedCache(inner, codec='zlib')
+        self.assertEqual(self.__test_data,
+                         json.loads(instance.get(self.__test_url)))
+
+    def test_stale_items_are_decompressed(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = CompressedCache(LRUCache(10, 1000, stale_if_error_millis=5000))
+        instance.set(self.__test_url, self.__test_data)
+        clock['now'] += 2
+        result = instance.get_stale(self.__test_url, upstream_failed=True)
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertIsNone(instance.get(self.__test_url))
+        self.assertEqual(self.__test_data, json.loads(result))
+
+    def test_miss_when_getting_unknown_items(self):
+        self.assertIsNone(CompressedCache(LRUCache()).get(self.__test_url))
+
+    def test_size_clean_and_size_bytes_are_delegated(self):
+        inner = LRUCache(max_bytes=100000)
+        instance = CompressedCache(inner, threshold_bytes=0)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(1, instance.size())
+        self.assertEqual(inner.size_bytes(), instance.size_bytes())
+        self.assertTrue(instance.size_bytes() < len(json.dumps(self.__test_data)))
+        instance.clean()
+        self.assertEqual(0, inner.size())
+
+    def test_stats_are_delegated(self):
+        inner = LRUCache()
+        instance = CompressedCache(inner)
+        instance.set(self.__test_url, self.__test_data)
+        instance.get(self.__test_url)
+        self.assertEqual(inner.stats(), instance.stats())
+        self.assertEqual(1, instance.stats()['total']['hits'])
+
+    def test_wraps_sqlite_cache(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            inner = SQLiteCache(os.path.join(tmp_dir, 'cache.sqlite'))
+            instance = CompressedCache(inner, threshold_bytes=0)
+            instance.set(self.__test_url, self.__test_data)
+            self.assertEqual(self.__test_data,
+                             json.loads(instance.get(self.__test_url)))
+            inner.close()
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_plugs_into_http_client(self):
+        calls = []
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(uri)
+            return 200, self.__test_data
+
+        ref_to_original_get_json = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        client = HttpClient(cache=CompressedCache(LRUCache(), threshold_bytes=0))
+        first = client.cacheable_get_json('http://test.com', params={'id': 1})
+        second = client.cacheable_get_json('http://test.com', params={'id': 1})
+        HttpClient.get_json = ref_to_original_get_json
+        self.assertEqual((200, self.__test_data), first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(calls))
+
+    def test_repr(self):
+        self.assertTrue('CompressedCache' in repr(CompressedCache(LRUCache())))
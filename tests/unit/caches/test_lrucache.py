@@ -2,9 +2,13 @@
 Test case for lrucache.py module.
 """
 
+import threading
 import unittest
 from time import sleep
+from pyowm.caches import lrucache
+from pyowm.caches.cachestats import NoLock
 from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.ttlpolicy import TTLPolicy
 
 
 class TestLRUCache(unittest.TestCase):
@@ -60,8 +64,235 @@ class TestLRUCache(unittest.TestCase):
         instance.set("1", "aaa")
         instance.set("2", "bbb")
         self.assertEqual(2, instance.size())
-        most_recent_cache_item = instance._usage_recency._first_node
-        instance.set("1", "aaa")
+        instance.set("1", "zzz")
         self.assertEqual(2, instance.size())
-        result = instance._usage_recency._first_node
-        self.assertNotEqual(most_recent_cache_item, result)
\ No newline at end of file
+        self.assertEqual("zzz", instance.get("1"))
+        # "1" is now the most recently used item, so "2" is evicted first
+        instance.set("3", "ccc")
+        instance.set("4", "ddd")
+        self.assertIsNone(instance.get("2"))
+        self.assertEqual("zzz", instance.get("1"))
+
+    def test_least_recently_used_item_is_evicted(self):
+        instance = LRUCache(3, 1000 * 60 * 60)  # max 3 items
+        instance.set("1", "aaa")
+        instance.set("2", "bbb")
+        instance.set("3", "ccc")
+        instance.get("1")
+        instance.set("4", "ddd")
+        self.assertEqual(3, instance.size())
+        self.assertIsNone(instance.get("2"))
+        for key in ["1", "3", "4"]:
+            self.assertIsNotNone(instance.get(key))
+
+    def test_setting_cached_item_when_full_does_not_evict(self):
+        instance = LRUCache(2, 1000 * 60 * 60)  # max 2 items
+        instance.set("1", "aaa")
+        instance.set("2", "bbb")
+        instance.set("2", "ccc")
+        self.assertEqual("aaa", instance.get("1"))
+        self.assertEqual("ccc", instance.get("2"))
+
+    def test_hits_do_not_postpone_expiration(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = LRUCache(3, 1000)  # 1 second lifetime for items
+        instance.set(self.__test_url, self.__test_data)
+        clock['now'] += 0.8
+        self.assertEqual(self.__test_data, instance.get(self.__test_url))
+        clock['now'] += 0.8
+        self.assertIsNone(instance.get(self.__test_url))
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertEqual(0, instance.size())
+
+    def test_expired_items_within_grace_periods_are_stale_hits(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = LRUCache(3, 1000, stale_while_revalidate_millis=1000,
+                            stale_if_error_millis=5000)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, instance.get_stale(self.__test_url))
+        clock['now'] += 1.5
+        self.assertIsNone(instance.get(self.__test_url))
+        self.assertEqual(self.__test_data, instance.get_stale(self.__test_url))
+        clock['now'] += 1
+        self.assertIsNone(instance.get_stale(self.__test_url))
+        self.assertEqual(self.__test_data,
+                         instance.get_stale(self.__test_url, upstream_failed=True))
+        self.assertEqual(1, instance.size())
+        clock['now'] += 5
+        self.assertIsNone(instance.get_stale(self.__test_url, upstream_failed=True))
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertEqual(0, instance.size())
+
+    def test_expired_items_are_not_stale_hits_by_default(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = LRUCache(3, 1000)
+        instance.set(self.__test_url, self.__test_data)
+        clock['now'] += 1.5
+        self.assertIsNone(instance.get_stale(self.__test_url))
+        self.assertIsNone(instance.get_stale(self.__test_url, upstream_failed=True))
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertEqual(0, instance.size())
+
+    def test_synchronized_when_grace_periods_are_given(self):
+        self.assertIsInstance(LRUCache(3, 1000)._lock, NoLock)
+        for instance in (LRUCache(3, 1000, stale_while_revalidate_millis=1),
+                         LRUCache(3, 1000, stale_if_error_millis=1),
+                         LRUCache(3, 1000, synchronized=True)):
+            self.assertNotIsInstance(instance._lock, NoLock)
+        self.assertIsInstance(
+            LRUCache(3, 1000, stale_if_error_millis=1, synchronized=False)._lock,
+            NoLock)
+        self.assertFalse(LRUCache(3, 1000).is_thread_safe())
+        self.assertTrue(LRUCache(3, 1000, synchronized=True).is_thread_safe())
+
+    def test_concurrent_sets_and_gets_with_grace_periods(self):
+        # items are refreshed in background while being looked up
+        instance = LRUCache(10, 1000 * 60, stale_while_revalidate_millis=1000)
+        errors = []
+
+        def run(operation):
+            try:
+                for i in range(20000):
+                    operation('http://test.com/path?id=%d' % (i % 50))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run,
+                                    args=(lambda url: instance.set(url, url),)),
+                   threading.Thread(target=run, args=(instance.get,)),
+                   threading.Thread(target=run, args=(instance.get_stale,))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertEqual(10, instance.size())
+
+    def test_items_lifetimes_from_ttl_policy(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        policy = TTLPolicy({'http://api.test.com/weather': 1000,
+                            'http://api.test.com/forecast': 10000})
+        instance = LRUCache(3, 5000, ttl_policy=policy)
+        instance.set('http://api.test.com/weather?id=1', 'obs')
+        instance.set('http://api.test.com/forecast?id=1', 'forecast')
+        instance.set('http://api.test.com/other?id=1', 'other')
+        clock['now'] += 2
+        self.assertIsNone(instance.get('http://api.test.com/weather?id=1'))
+        self.assertEqual('other', instance.get('http://api.test.com/other?id=1'))
+        self.assertEqual('forecast', instance.get('http://api.test.com/forecast?id=1'))
+        clock['now'] += 5
+        self.assertIsNone(instance.get('http://api.test.com/other?id=1'))
+        self.assertEqual('forecast', instance.get('http://api.test.com/forecast?id=1'))
+        lrucache.monotonic = ref_to_original_monotonic
+
+    def test_many_items(self):
+        instance = LRUCache(100000, 1000 * 60 * 60)
+        for i in range(150000):
+            instance.set(str(i), i)
+        self.assertEqual(100000, instance.size())
+        self.assertIsNone(instance.get("49999"))
+        self.assertEqual(50000, instance.get("50000"))
+        self.assertEqual(149999, instance.get("149999"))
+
+    def test_stats(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = LRUCache(2, 1000)
+        instance.set('http://test.com/weather?id=1', 'a')
+        instance.set('http://test.com/forecast?id=1', 'b')
+        instance.get('http://test.com/weather?id=1')
+        instance.get('http://test.com/weather?id=2')
+        instance.set('http://test.com/weather?id=3', 'c')  # evicts the forecast
+        clock['now'] += 2
+        instance.get('http://test.com/weather?id=1')  # expired
+        lrucache.monotonic = ref_to_original_monotonic
+        stats = instance.stats()
+        weather = stats['endpoints']['/weather']
+        self.assertEqual((1, 2, 1, 0, 2), (weather['hits'], weather['misses'],
+                                           weather['expirations'],
+                                           weather['evictions'], weather['sets']))
+        self.assertEqual(3, sum(weather['get_latency_us'].values()))
+        self.assertEqual(1, stats['endpoints']['/forecast']['evictions'])
+        self.assertIsNone(stats['total']['bytes'])
+        self.assertEqual(3, instance.stats(reset=True)['total']['sets'])
+        self.assertEqual(0, instance.stats()['total']['sets'])
+
+    def test_stats_with_byte_budget(self):
+        instance = LRUCache(None, 1000 * 60, max_bytes=100)
+        instance.set('http://test.com/weather?id=1', 'a' * 10)
+        instance.set('http://test.com/forecast?id=1', 'b' * 20)
+        instance.set('http://test.com/weather?id=1', 'a' * 5)
+        stats = instance.stats()
+        self.assertEqual(5, stats['endpoints']['/weather']['bytes'])
+        self.assertEqual(instance.size_bytes(), stats['total']['bytes'])
+        instance.clean()
+        self.assertEqual(0, instance.stats()['total']['bytes'])
+
+    def test_init_fails_with_wrong_grace_periods(self):
+        self.assertRaises(AssertionError, LRUCache, 10, 1000,
+                          stale_while_revalidate_millis=-1)
+        self.assertRaises(AssertionError, LRUCache, 10, 1000,
+                          stale_if_error_millis=-1)
+
+    def test_init_fails_with_wrong_byte_budget(self):
+        self.assertRaises(AssertionError, LRUCache, 10, 1000, max_bytes=0)
+        self.assertRaises(AssertionError, LRUCache, None, 1000)
+
+    def test_encoded_size(self):
+        self.assertEqual(3, lrucache.encoded_size(b'abc'))
+        self.assertEqual(4, lrucache.encoded_size('ab\u00e8'))
+        self.assertEqual(len('{"a":[1,2]}'), lrucache.encoded_size({'a': [1, 2]}))
+
+    def test_size_bytes(self):
+        instance = LRUCache(10, 1000 * 60 * 60)
+        instance.set("1", {'a': 1})
+        instance.set("2", 'abcd')
+        self.assertEqual(len('{"a":1}') + 4, instance.size_bytes())
+        budgeted = LRUCache(10, 1000 * 60 * 60, max_bytes=100)
+        budgeted.set("1", {'a': 1})
+        budgeted.set("2", 'abcd')
+        self.assertEqual(instance.size_bytes(), budgeted.size_bytes())
+        budgeted.set("2", 'ab')
+        self.assertEqual(len('{"a":1}') + 2, budgeted.size_bytes())
+        budgeted.clean()
+        self.assertEqual(0, budgeted.size_bytes())
+
+    def test_byte_budget_preserved_when_setting(self):
+        instance = LRUCache(None, 1000 * 60 * 60, max_bytes=10)
+        instance.set("1", 'aaaa')
+        instance.set("2", 'bbbb')
+        instance.get("1")
+        instance.set("3", 'cccccc')
+        self.assertTrue(instance.size_bytes() <= 10)
+        self.assertIsNone(instance.get("2"))
+        self.assertEqual('aaaa', instance.get("1"))
+        self.assertEqual('cccccc', instance.get("3"))
+
+    def test_items_larger_than_byte_budget_are_not_cached(self):
+        instance = LRUCache(10, 1000 * 60 * 60, max_bytes=10)
+        instance.set("1", 'aaaa')
+        instance.set("2", 'bbbb')
+        instance.set("2", 'x' * 11)
+        self.assertIsNone(instance.get("2"))
+        self.assertEqual('aaaa', instance.get("1"))
+        self.assertEqual(4, instance.size_bytes())
+
+    def test_expired_items_release_their_bytes(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = LRUCache(10, 1000, max_bytes=100)
+        instance.set("1", 'aaaa')
+        clock['now'] += 2
+        self.assertIsNone(instance.get("1"))
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertEqual(0, instance.size_bytes())
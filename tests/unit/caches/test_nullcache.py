@@ -11,3 +11,13 @@ class TestNullCache(unittest.TestCase):
     def test_get_always_returns_null(self):
         instance = NullCache()
         self.assertFalse(instance.get("abcdefghi"))
+
+    def test_stats(self):
+        instance = NullCache()
+        instance.set("http://test.com/path?q=1", "data")
+        instance.get("http://test.com/path?q=1")
+        stats = instance.stats()
+        self.assertEqual({}, stats['endpoints'])
+        self.assertEqual((0, 0, 0), (stats['total']['hits'],
+                                     stats['total']['misses'],
+                                     stats['total']['sets']))
@@ -0,0 +1,148 @@
+"""
+Test case for objectcache.py module
+"""
+
+import json
+import threading
+import unittest
+from pyowm.caches.objectcache import ObjectCache
+from pyowm.weatherapi25.parsers.forecastparser import ForecastParser
+from pyowm.weatherapi25.parsers.observationlistparser import ObservationListParser
+from tests.unit.weatherapi25.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, SEARCH_RESULTS_JSON)
+
+
+class CountingParser(object):
+
+    def __init__(self, parser):
+        self._parser = parser
+        self.calls = 0
+
+    def parse_dict(self, data_dict):
+        self.calls += 1
+        return self._parser.parse_dict(data_dict)
+
+
+class NoneParser(object):
+
+    def parse_dict(self, data_dict):
+        return None
+
+
+class TestObjectCache(unittest.TestCase):
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, ObjectCache, max_size=0)
+
+    def test_parse_hits_the_same_json_data(self):
+        instance = ObjectCache()
+        parser = CountingParser(ForecastParser())
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        first = instance.parse(parser, data)
+        second = instance.parse(parser, data)
+        self.assertEqual(1, parser.calls)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.to_JSON(), second.to_JSON())
+        # equal but different JSON data is parsed again
+        instance.parse(parser, json.loads(THREE_HOURS_FORECAST_JSON))
+        self.assertEqual(2, parser.calls)
+        self.assertEqual(dict(hits=1, misses=2, size=2), instance.stats())
+
+    def test_parsers_are_kept_apart(self):
+        instance = ObjectCache()
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        parser = CountingParser(ForecastParser())
+        other_parser = CountingParser(ForecastParser())
+        instance.parse(parser, data)
+        instance.parse(other_parser, data)
+        self.assertEqual((1, 1), (parser.calls, other_parser.calls))
+
+    def test_mutating_copies_leaves_entries_untouched(self):
+        instance = ObjectCache()
+        parser = CountingParser(ForecastParser())
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        forecast = instance.parse(parser, data)
+        count, interval = len(forecast), forecast.get_interval()
+        forecast.set_interval('daily')
+        forecast.actualize()
+        cached = instance.parse(parser, data)
+        cached.get(0).get_pressure()['press'] = -1
+        cached = instance.parse(parser, data)
+        self.assertEqual(1, parser.calls)
+        self.assertEqual(interval, cached.get_interval())
+        self.assertEqual(count, len(cached))
+        self.assertNotEqual(-1, cached.get(0).get_pressure()['press'])
+
+    def test_lists_are_copied(self):
+        instance = ObjectCache()
+        parser = CountingParser(ObservationListParser())
+        data = json.loads(SEARCH_RESULTS_JSON)
+        observations = instance.parse(parser, data)
+        observations.pop()
+        self.assertEqual(len(data['list']), len(instance.parse(parser, data)))
+        self.assertEqual(1, parser.calls)
+
+    def test_none_results_are_cached(self):
+        instance = ObjectCache()
+        parser = CountingParser(NoneParser())
+        data = {"cod": "404"}
+        self.assertIsNone(instance.parse(parser, data))
+        self.assertIsNone(instance.parse(parser, data))
+        self.assertEqual(1, parser.calls)
+
+    def test_least_recently_used_entries_are_discarded(self):
+        instance = ObjectCache(max_size=2)
+        parser = CountingParser(ForecastParser())
+        datas = [json.loads(THREE_HOURS_FORECAST_JSON) for _ in range(3)]
+        instance.parse(parser, datas[0])
+        instance.parse(parser, datas[1])
+        instance.parse(parser, datas[0])
+        instance.parse(parser, datas[2])
+        self.assertEqual(2, instance.size())
+        instance.parse(parser, datas[0])
+        self.assertEqual(3, parser.calls)
+        instance.parse(parser, datas[1])
+        self.assertEqual(4, parser.calls)
+
+    def test_clean_and_stats_reset(self):
+        instance = ObjectCache()
+        parser = CountingParser(ForecastParser())
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        instance.parse(parser, data)
+        instance.parse(parser, data)
+        self.assertEqual(dict(hits=1, misses=1, size=1),
+                         instance.stats(reset=True))
+        self.assertEqual(dict(hits=0, misses=0, size=1), instance.stats())
+        instance.clean()
+        self.assertEqual(0, instance.size())
+        instance.parse(parser, data)
+        self.assertEqual(2, parser.calls)
+
+    def test_concurrent_use(self):
+        instance = ObjectCache(max_size=4)
+        parser = ForecastParser()
+        datas = [json.loads(THREE_HOURS_FORECAST_JSON) for _ in range(8)]
+        errors = []
+
+        def work(n):
+            try:
+                for i in range(50):
+                    forecast = instance.parse(parser, datas[(n + i) % len(datas)])
+                    forecast.actualize()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertEqual(4, instance.size())
+
+    def test_repr(self):
+        self.assertIn('max size=10', repr(ObjectCache(max_size=10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
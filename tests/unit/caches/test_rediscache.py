@@ -0,0 +1,217 @@
+"""
+Test case for rediscache.py module, run against an in-process fake server
+"""
+
+import json
+import socket
+import threading
+import unittest
+from pyowm.caches.compressedcache import CompressedCache
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.rediscache import RedisCache
+from pyowm.caches.tieredcache import TieredCache
+from pyowm.caches.ttlpolicy import TTLPolicy
+from pyowm.commons.http_client import HttpClient
+from pyowm.exceptions.cache_error import CacheError
+from pyowm.weatherapi25.configuration25 import parsers
+from pyowm.weatherapi25.owm25 import OWM25
+from tests.unit.caches.fakeredis import FakeRedisServer
+from tests.unit.weatherapi25.json_test_responses import SEARCH_RESULTS_JSON
+
+
+class TestRedisCache(unittest.TestCase):
+
+    __test_url = "http://api.openweathermap.org/data/2.5/weather?id=1"
+    __test_data = {"name": "London", "temp": 280.15}
+
+    def setUp(self):
+        self.now = 1000.
+        self.server = FakeRedisServer().start()
+        self.server.clock = lambda: self.now
+
+    def tearDown(self):
+        self.server.stop()
+
+    def cache(self, **kwargs):
+        return RedisCache(port=self.server.port, **kwargs)
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, RedisCache, item_lifetime_millis=0)
+        self.assertRaises(AssertionError, RedisCache, timeout=0)
+        self.assertRaises(AssertionError, RedisCache, max_idle_connections=-1)
+
+    def test_get_and_set(self):
+        instance = self.cache()
+        self.assertIsNone(instance.get(self.__test_url))
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, json.loads(instance.get(self.__test_url)))
+        instance.set(self.__test_url, '{"name": "Paris"}')
+        self.assertEqual(b'{"name": "Paris"}', instance.get(self.__test_url))
+        self.assertIn(b'pyowm:' + self.__test_url.encode('utf-8'),
+                      self.server.dbs[0])
+
+    def test_binary_values(self):
+        instance = CompressedCache(self.cache(), threshold_bytes=0)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, json.loads(instance.get(self.__test_url)))
+        self.assertEqual([self.__test_data, None],
+                         [json.loads(data) if data else data for data in
+                          instance.get_many([self.__test_url, 'http://test.com'])])
+
+    def test_items_expire(self):
+        policy = TTLPolicy({'http://api.openweathermap.org/data/2.5/forecast': 60000})
+        instance = self.cache(item_lifetime_millis=1000, ttl_policy=policy)
+        forecast_url = "http://api.openweathermap.org/data/2.5/forecast?id=1"
+        instance.set(self.__test_url, self.__test_data)
+        instance.set(forecast_url, self.__test_data)
+        self.now += 2
+        self.assertIsNone(instance.get(self.__test_url))
+        self.assertIsNotNone(instance.get(forecast_url))
+        self.now += 60
+        self.assertIsNone(instance.get(forecast_url))
+
+    def test_get_many_takes_a_single_command(self):
+        instance = self.cache()
+        urls = ["http://api.openweathermap.org/data/2.5/weather?id=%d" % i
+                for i in range(5)]
+        instance.set_many({url: {"id": i} for i, url in enumerate(urls) if i % 2})
+        del self.server.commands[:]
+        values = instance.get_many(urls)
+        self.assertEqual([None, {"id": 1}, None, {"id": 3}, None],
+                         [json.loads(value) if value else value for value in values])
+        self.assertEqual(['MGET'], self.server.command_names())
+        self.assertEqual([], instance.get_many([]))
+        instance.set_many(dict())
+        self.assertEqual(['MGET'], self.server.command_names())
+
+    def test_clean_size_and_size_bytes(self):
+        instance = self.cache()
+        self.server.dbs[0] = {b'other': (b'data', None)}
+        instance.set_many({"http://test.com/%d" % i: "x" * 10 for i in range(25)})
+        self.assertEqual(25, instance.size())
+        self.assertEqual(250, instance.size_bytes())
+        instance.clean()
+        self.assertEqual(0, instance.size())
+        self.assertEqual(0, instance.size_bytes())
+        self.assertEqual([b'other'], list(self.server.dbs[0]))
+
+    def test_db_and_password(self):
+        self.server.stop()
+        self.server = FakeRedisServer(password='secret').start()
+        instance = self.cache(db=2, password='secret')
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual([2], list(self.server.dbs))
+        for instance in [self.cache(password='wrong'), self.cache()]:
+            self.assertIsNone(instance.get(self.__test_url))
+            self.assertEqual(1, instance.stats()['total']['errors'])
+            self.assertRaises(CacheError, instance.size)
+
+    def test_connections_are_reused(self):
+        instance = self.cache(max_idle_connections=1)
+        for _ in range(3):
+            instance.get(self.__test_url)
+        self.assertEqual(0, self.server.command_names().count('SELECT'))
+        self.assertEqual(1, len(instance._idle))
+
+    def test_unreachable_store(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        instance = RedisCache(port=port, timeout=1)
+        self.assertIsNone(instance.get(self.__test_url))
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual([None, None], instance.get_many([self.__test_url,
+                                                          'http://test.com']))
+        total = instance.stats()['total']
+        self.assertEqual((0, 3, 0, 4), (total['hits'], total['misses'],
+                                        total['sets'], total['errors']))
+        self.assertRaises(CacheError, instance.clean)
+
+    def test_unreachable_store_degrades_to_misses(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        l1 = LRUCache()
+        cache = TieredCache(l1, RedisCache(port=port, timeout=1))
+        owm = OWM25(parsers, 'test_API_key', cache=cache)
+        data = json.loads(SEARCH_RESULTS_JSON)
+        ids = [item['id'] for item in data['list']]
+        original_get_json = HttpClient.get_json
+        HttpClient.get_json = lambda instance, uri, params=None, headers=None: (200, data)
+        try:
+            result = owm.weather_at_ids(ids)
+        finally:
+            HttpClient.get_json = original_get_json
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        # the group response and the observations
+        self.assertEqual(len(ids) + 1, l1.size())
+        self.assertEqual(2 * (len(ids) + 1), cache.stats()['total']['errors'])
+
+    def test_concurrent_use(self):
+        instance = self.cache()
+        errors = []
+
+        def work(n):
+            try:
+                for i in range(20):
+                    url = "http://test.com/%d/%d" % (n, i)
+                    instance.set(url, {"n": n, "i": i})
+                    assert json.loads(instance.get(url)) == {"n": n, "i": i}
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertEqual(160, instance.size())
+
+    def test_stats(self):
+        instance = self.cache()
+        instance.set(self.__test_url, self.__test_data)
+        instance.get_many([self.__test_url, "http://api.openweathermap.org/data/2.5/forecast?id=1"])
+        stats = instance.stats(reset=True)
+        self.assertEqual((1, 1, 1), (stats['total']['hits'], stats['total']['misses'],
+                                     stats['total']['sets']))
+        self.assertEqual(['/data/2.5/forecast', '/data/2.5/weather'],
+                         sorted(stats['endpoints']))
+        self.assertEqual(0, instance.stats()['total']['hits'])
+
+    def test_weather_at_ids_looks_up_all_ids_at_once(self):
+        cache = self.cache()
+        owm = OWM25(parsers, 'test_API_key', cache=cache)
+        data = json.loads(SEARCH_RESULTS_JSON)
+        ids = [item['id'] for item in data['list']]
+        original_get_json = HttpClient.get_json
+        HttpClient.get_json = lambda instance, uri, params=None, headers=None: (200, data)
+        try:
+            owm.weather_at_ids(ids)
+            del self.server.commands[:]
+            result = owm.weather_at_ids(ids)
+        finally:
+            HttpClient.get_json = original_get_json
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        self.assertEqual(['MGET'], self.server.command_names())
+
+    def test_tiered_cache_over_store(self):
+        l1 = LRUCache()
+        instance = TieredCache(l1, self.cache())
+        urls = ["http://test.com/%d" % i for i in range(3)]
+        self.cache().set_many({urls[0]: {"i": 0}, urls[1]: '{"i": 1}'})
+        l1.set(urls[0], {"i": 0})
+        del self.server.commands[:]
+        self.assertEqual([{"i": 0}, {"i": 1}, None], instance.get_many(urls))
+        self.assertEqual(['MGET'], self.server.command_names())
+        self.assertEqual([2], [len(command) - 1 for command in self.server.commands])
+        self.assertEqual({"i": 1}, l1.get(urls[1]))
+
+    def test_repr(self):
+        self.assertIn('key prefix=pyowm:', repr(self.cache()))
+
+
+if __name__ == "__main__":
+    unittest.main()
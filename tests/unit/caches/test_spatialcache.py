@@ -0,0 +1,169 @@
+"""
+Test case for spatialcache.py module.
+"""
+
+import random
+import unittest
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.spatialcache import SpatialCache, _distance_km
+from pyowm.commons.http_client import HttpClient
+
+
+def _observation_url(lat, lon, lang='en'):
+    return HttpClient.cache_key('http://api.test.com/data/weather',
+                                params=dict(lat=lat, lon=lon, lang=lang))
+
+
+def _pollution_url(lat, lon):
+    return HttpClient.cache_key('http://api.test.com/pollution/v1/co/%s,%s/current.json'
+                                % (lat, lon), params=dict(appid='x'))
+
+
+class TestSpatialCache(unittest.TestCase):
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, SpatialCache, LRUCache(), 0)
+        self.assertRaises(AssertionError, SpatialCache, LRUCache(), 2, 0)
+
+    def test_distance_km(self):
+        self.assertAlmostEqual(0., _distance_km(45., 9., 45., 9.))
+        # one degree of latitude is about 111 km
+        self.assertAlmostEqual(111.3, _distance_km(45., 9., 46., 9.), 0)
+        self.assertAlmostEqual(_distance_km(10., 20., 30., 40.),
+                               _distance_km(30., 40., 10., 20.))
+
+    def test_locate(self):
+        base, lat, lon = SpatialCache.locate(_observation_url(51.50853, -0.12574))
+        self.assertEqual('http://api.test.com/data/weather?lang=en', base)
+        self.assertEqual((51.50853, -0.12574), (lat, lon))
+        base, lat, lon = SpatialCache.locate(_pollution_url(45.0, -9.5))
+        self.assertEqual('http://api.test.com/pollution/v1/co/{}/current.json', base)
+        self.assertEqual((45.0, -9.5), (lat, lon))
+        self.assertIsNone(SpatialCache.locate('http://api.test.com/data/weather?id=1'))
+        self.assertIsNone(SpatialCache.locate('http://api.test.com/data/weather?lat=a&lon=1'))
+
+    def test_exact_hits(self):
+        instance = SpatialCache(LRUCache())
+        instance.set('http://api.test.com/data/weather?id=1', 'by id')
+        instance.set(_observation_url(45, 9), 'by coords')
+        self.assertEqual('by id', instance.get('http://api.test.com/data/weather?id=1'))
+        self.assertEqual('by coords', instance.get(_observation_url(45, 9)))
+        self.assertEqual(2, instance.size())
+
+    def test_hits_within_radius(self):
+        instance = SpatialCache(LRUCache(), radius_km=2)
+        instance.set(_observation_url(51.50853, -0.12574), 'london')
+        self.assertEqual('london', instance.get(_observation_url(51.50857, -0.12579)))
+        self.assertEqual('london', instance.get(_observation_url(51.52, -0.14)))
+        self.assertIsNone(instance.get(_observation_url(51.53, -0.12574)))
+        self.assertIsNone(instance.get(_observation_url(51.50853, -0.16)))
+
+    def test_nearest_location_wins(self):
+        instance = SpatialCache(LRUCache(), radius_km=5)
+        instance.set(_observation_url(45.0, 9.0), 'far')
+        instance.set(_observation_url(45.02, 9.0), 'near')
+        self.assertEqual('near', instance.get(_observation_url(45.015, 9.0)))
+        self.assertEqual('far', instance.get(_observation_url(45.004, 9.0)))
+
+    def test_hits_across_cells_and_hemispheres(self):
+        instance = SpatialCache(LRUCache(), radius_km=2)
+        instance.set(_observation_url(0.005, -0.005), 'equator')
+        self.assertEqual('equator', instance.get(_observation_url(-0.005, 0.005)))
+        instance.set(_observation_url(-33.8688, 151.2093), 'sydney')
+        self.assertEqual('sydney', instance.get(_observation_url(-33.87, 151.21)))
+
+    def test_hits_at_high_latitudes(self):
+        instance = SpatialCache(LRUCache(), radius_km=2)
+        instance.set(_observation_url(89.995, 10.0), 'north pole')
+        # a few degrees of longitude are less than a kilometer apart here
+        self.assertEqual('north pole', instance.get(_observation_url(89.995, 14.0)))
+        instance.set(_observation_url(78.2232, 15.6267), 'svalbard')
+        self.assertEqual('svalbard', instance.get(_observation_url(78.2232, 15.68)))
+        self.assertIsNone(instance.get(_observation_url(78.2232, 15.75)))
+
+    def test_grid_lookups_match_exhaustive_search(self):
+        rnd = random.Random(42)
+        instance = SpatialCache(LRUCache(10000), radius_km=3)
+        points = []
+        for _ in range(1000):
+            lat = rnd.choice([0., 45., -60., 85.]) + rnd.uniform(-0.2, 0.2)
+            lon = rnd.uniform(-0.5, 0.5)
+            points.append((lat, lon))
+            instance.set(_observation_url(lat, lon), (lat, lon))
+        for _ in range(200):
+            lat, lon = rnd.choice(points)
+            lat += rnd.uniform(-0.05, 0.05)
+            lon += rnd.uniform(-0.05, 0.05)
+            distances = sorted((_distance_km(lat, lon, p[0], p[1]), p) for p in points)
+            expected = distances[0][1] if distances[0][0] <= 3 else None
+            result = instance.get(_observation_url(lat, lon))
+            self.assertEqual(expected, result)
+
+    def test_other_params_must_match(self):
+        instance = SpatialCache(LRUCache())
+        instance.set(_observation_url(45.0, 9.0, lang='en'), 'english')
+        self.assertIsNone(instance.get(_observation_url(45.0001, 9.0, lang='it')))
+        other_endpoint = HttpClient.cache_key('http://api.test.com/data/forecast',
+                                              params=dict(lat=45.0001, lon=9.0, lang='en'))
+        self.assertIsNone(instance.get(other_endpoint))
+
+    def test_hits_on_coordinates_in_path(self):
+        instance = SpatialCache(LRUCache())
+        instance.set(_pollution_url(45.0, 9.0), 'co')
+        self.assertEqual('co', instance.get(_pollution_url(45.001, 9.001)))
+        self.assertIsNone(instance.get(_pollution_url(45.1, 9.0)))
+
+    def test_locations_evicted_from_decorated_cache_are_forgotten(self):
+        inner = LRUCache(1)
+        instance = SpatialCache(inner)
+        instance.set(_observation_url(45.0, 9.0), 'first')
+        instance.set('http://api.test.com/data/weather?id=1', 'other')
+        self.assertEqual(1, len(instance._locations))
+        self.assertIsNone(instance.get(_observation_url(45.0001, 9.0)))
+        self.assertEqual(0, len(instance._locations))
+        self.assertEqual({}, instance._cells)
+
+    def test_max_locations_preserved_when_setting(self):
+        instance = SpatialCache(LRUCache(100), max_locations=3)
+        for i in range(5):
+            instance.set(_observation_url(i, 0), i)
+        self.assertEqual(3, len(instance._locations))
+        self.assertEqual(3, sum(len(urls) for urls in instance._cells.values()))
+        self.assertIsNone(instance.get(_observation_url(0.0001, 0)))
+        self.assertEqual(4, instance.get(_observation_url(4.0001, 0)))
+
+    def test_setting_same_url_again_reindexes_it(self):
+        instance = SpatialCache(LRUCache())
+        url = _observation_url(45.0, 9.0)
+        instance.set(url, 'old')
+        instance.set(url, 'new')
+        self.assertEqual(1, len(instance._locations))
+        self.assertEqual('new', instance.get(_observation_url(45.0001, 9.0)))
+
+    def test_clean_cache(self):
+        instance = SpatialCache(LRUCache())
+        instance.set(_observation_url(45.0, 9.0), 'data')
+        instance.clean()
+        self.assertEqual(0, instance.size())
+        self.assertEqual(0, len(instance._locations))
+        self.assertIsNone(instance.get(_observation_url(45.0001, 9.0)))
+
+    def test_plugs_into_http_client(self):
+        calls = []
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(params)
+            return 200, {'coord': {'lat': params['lat'], 'lon': params['lon']}}
+
+        ref_to_original_get_json = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        client = HttpClient(cache=SpatialCache(LRUCache()))
+        uri = HttpClient.to_url('http://%s.test.com/data/weather', 'key', 'free')
+        first = client.cacheable_get_json(uri, params=dict(lat=45.00001, lon=9.00001))
+        second = client.cacheable_get_json(uri, params=dict(lat=45.00002, lon=9.00002))
+        HttpClient.get_json = ref_to_original_get_json
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(calls))
+
+    def test_repr(self):
+        self.assertTrue('SpatialCache' in repr(SpatialCache(LRUCache())))
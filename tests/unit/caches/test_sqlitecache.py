@@ -0,0 +1,254 @@
+"""
+Test case for sqlitecache.py module.
+"""
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pyowm.caches import sqlitecache
+from pyowm.caches.sqlitecache import SQLiteCache
+from pyowm.caches.ttlpolicy import TTLPolicy
+from pyowm.commons import jsoncodec
+from pyowm.commons.http_client import HttpClient
+
+
+def _store_from_another_process(db_path, url, value):
+    SQLiteCache(db_path).set(url, value)
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    __test_url = "http://test.com/path?param=value"
+    __test_data = {"name": "London", "id": 2643743}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'cache.sqlite')
+        self.ref_to_original_time = sqlitecache.time
+        self.clock = dict(now=1000.)
+
+    def tearDown(self):
+        sqlitecache.time = self.ref_to_original_time
+        shutil.rmtree(self.tmp_dir)
+
+    def use_fake_clock(self):
+        sqlitecache.time = lambda: self.clock['now']
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, SQLiteCache, self.db_path, 0)
+        self.assertRaises(AssertionError, SQLiteCache, self.db_path, 10, 0)
+
+    def test_database_is_in_wal_mode(self):
+        instance = SQLiteCache(self.db_path)
+        mode = instance._connection().execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual('wal', mode.lower())
+
+    def test_hit_when_getting_freshly_inserted_items(self):
+        instance = SQLiteCache(self.db_path)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(1, instance.size())
+        self.assertEqual(self.__test_data, json.loads(instance.get(self.__test_url)))
+
+    def test_json_text_is_stored_as_is(self):
+        instance = SQLiteCache(self.db_path)
+        instance.set("1", '{"a": 1}')
+        instance.set("2", b'{"b": 2}')
+        self.assertEqual('{"a": 1}', instance.get("1"))
+        self.assertEqual(b'{"b": 2}', instance.get("2"))
+
+    def test_binary_data_is_stored_as_is(self):
+        instance = SQLiteCache(self.db_path)
+        instance.set("1", b'\x00\xff\x10')
+        self.assertEqual(b'\x00\xff\x10', instance.get("1"))
+        self.assertEqual(3, instance.size_bytes())
+
+    def test_miss_when_getting_unknown_items(self):
+        instance = SQLiteCache(self.db_path)
+        self.assertIsNone(instance.get(self.__test_url))
+
+    def test_miss_getting_old_items(self):
+        self.use_fake_clock()
+        instance = SQLiteCache(self.db_path, 10, 1000)  # 1 second lifetime
+        instance.set(self.__test_url, self.__test_data)
+        self.clock['now'] += 0.5
+        self.assertIsNotNone(instance.get(self.__test_url))
+        self.clock['now'] += 1
+        self.assertIsNone(instance.get(self.__test_url))
+        self.assertEqual(0, instance.size())
+
+    def test_items_lifetimes_from_ttl_policy(self):
+        self.use_fake_clock()
+        policy = TTLPolicy({'http://api.test.com/weather': 1000})
+        instance = SQLiteCache(self.db_path, 10, 5000, ttl_policy=policy)
+        instance.set('http://api.test.com/weather?id=1', 'obs')
+        instance.set('http://api.test.com/other?id=1', 'other')
+        self.clock['now'] += 2
+        self.assertIsNone(instance.get('http://api.test.com/weather?id=1'))
+        self.assertEqual('other', instance.get('http://api.test.com/other?id=1'))
+
+    def test_cache_max_size_preserved_when_setting(self):
+        self.use_fake_clock()
+        instance = SQLiteCache(self.db_path, 3)
+        for i in range(5):
+            self.clock['now'] += 1
+            instance.set(str(i), i)
+        self.assertEqual(3, instance.size())
+        self.assertIsNone(instance.get("0"))
+        self.assertIsNone(instance.get("1"))
+        self.assertEqual('4', instance.get("4"))
+
+    def test_expired_items_are_evicted_first(self):
+        self.use_fake_clock()
+        policy = TTLPolicy({'http://api.test.com/weather': 1000})
+        instance = SQLiteCache(self.db_path, 2, 60000, ttl_policy=policy)
+        instance.set('http://api.test.com/other?id=1', 'other')
+        self.clock['now'] += 1
+        instance.set('http://api.test.com/weather?id=1', 'obs')
+        self.clock['now'] += 2
+        instance.set('http://api.test.com/other?id=2', 'other')
+        self.assertEqual(2, instance.size())
+        self.assertEqual('other', instance.get('http://api.test.com/other?id=1'))
+
+    def test_size_bytes(self):
+        instance = SQLiteCache(self.db_path)
+        self.assertEqual(0, instance.size_bytes())
+        instance.set("1", {"a": 1})
+        instance.set("2", 'ab\u00e8')
+        self.assertEqual(len(jsoncodec.dumps({"a": 1})) + 4, instance.size_bytes())
+
+    def test_totals_follow_replacements_and_removals(self):
+        self.use_fake_clock()
+        instance = SQLiteCache(self.db_path, 3, 1000)
+        instance.set("1", 'aaaa')
+        instance.set("1", 'aa')
+        instance.set("2", 'bbb')
+        self.assertEqual((2, 5), (instance.size(), instance.size_bytes()))
+        self.clock['now'] += 2
+        self.assertIsNone(instance.get("1"))  # expired
+        self.assertEqual((1, 3), (instance.size(), instance.size_bytes()))
+        for i in range(3, 7):
+            instance.set(str(i), 'c')
+        self.assertEqual((3, 3), (instance.size(), instance.size_bytes()))
+        instance.clean()
+        self.assertEqual((0, 0), (instance.size(), instance.size_bytes()))
+
+    def test_totals_of_databases_created_without_them(self):
+        instance = SQLiteCache(self.db_path)
+        instance.set("1", 'aaaa')
+        instance.set("2", 'bb')
+        conn = instance._connection()
+        for name in ('owm_cache_inserted', 'owm_cache_deleted'):
+            conn.execute('DROP TRIGGER %s' % name)
+        conn.execute('DROP TABLE owm_cache_totals')
+        instance.close()
+        other = SQLiteCache(self.db_path)
+        self.assertEqual((2, 6), (other.size(), other.size_bytes()))
+        other.set("3", 'c')
+        self.assertEqual((3, 7), (other.size(), other.size_bytes()))
+
+    def test_byte_budget_preserved_when_setting(self):
+        self.use_fake_clock()
+        instance = SQLiteCache(self.db_path, None, max_bytes=10)
+        for i, value in enumerate(['aaaa', 'bbbb', 'cccccc']):
+            self.clock['now'] += 1
+            instance.set(str(i), value)
+        self.assertEqual(10, instance.size_bytes())
+        self.assertIsNone(instance.get("0"))
+        self.assertEqual('bbbb', instance.get("1"))
+        self.assertEqual('cccccc', instance.get("2"))
+
+    def test_items_larger_than_byte_budget_are_not_cached(self):
+        instance = SQLiteCache(self.db_path, 10, max_bytes=10)
+        instance.set("1", 'aaaa')
+        instance.set("2", 'x' * 11)
+        self.assertIsNone(instance.get("2"))
+        self.assertEqual('aaaa', instance.get("1"))
+
+    def test_stats(self):
+        self.use_fake_clock()
+        instance = SQLiteCache(self.db_path, 2, 1000)
+        instance.set('http://test.com/weather?id=1', 'aaaa')
+        instance.set('http://test.com/forecast?id=1', 'bb')
+        instance.get('http://test.com/weather?id=1')
+        instance.get('http://test.com/weather?id=2')
+        self.clock['now'] += 0.5
+        instance.set('http://test.com/weather?id=3', 'c')  # evicts a weather
+        self.clock['now'] += 0.8
+        instance.get('http://test.com/forecast?id=1')  # expired
+        stats = instance.stats()
+        weather = stats['endpoints']['/weather']
+        self.assertEqual((1, 1, 1, 2), (weather['hits'], weather['misses'],
+                                        weather['evictions'], weather['sets']))
+        self.assertEqual(1, weather['bytes'])
+        forecast = stats['endpoints']['/forecast']
+        self.assertEqual((1, 1), (forecast['expirations'], forecast['misses']))
+        self.assertEqual(0, forecast['bytes'])
+        self.assertEqual(instance.size_bytes(), stats['total']['bytes'])
+
+    def test_plugs_into_http_client(self):
+        calls = []
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(uri)
+            return 200, {'name': 'London'}
+
+        ref_to_original_get_json = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        client = HttpClient(cache=SQLiteCache(self.db_path))
+        first = client.cacheable_get_json('http://test.com', params={'id': 1})
+        second = client.cacheable_get_json('http://test.com', params={'id': 1})
+        HttpClient.get_json = ref_to_original_get_json
+        self.assertEqual((200, {'name': 'London'}), first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(calls))
+
+    def test_clean_cache(self):
+        instance = SQLiteCache(self.db_path)
+        for i in range(3):
+            instance.set(str(i), i)
+        instance.clean()
+        self.assertEqual(0, instance.size())
+
+    def test_items_are_persistent(self):
+        instance = SQLiteCache(self.db_path)
+        instance.set(self.__test_url, self.__test_data)
+        instance.close()
+        other = SQLiteCache(self.db_path)
+        self.assertEqual(self.__test_data, json.loads(other.get(self.__test_url)))
+
+    def test_items_are_shared_between_processes(self):
+        instance = SQLiteCache(self.db_path)
+        process = multiprocessing.Process(
+            target=_store_from_another_process,
+            args=(self.db_path, self.__test_url, self.__test_data))
+        process.start()
+        process.join()
+        self.assertEqual(0, process.exitcode)
+        self.assertEqual(self.__test_data, json.loads(instance.get(self.__test_url)))
+
+    def test_concurrent_access(self):
+        instance = SQLiteCache(self.db_path, 50)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(50):
+                    key = 'http://test.com/?id=%d' % ((n * 50 + i) % 80)
+                    instance.set(key, {'key': key})
+                    value = instance.get(key)
+                    if value is not None and json.loads(value) != {'key': key}:
+                        errors.append((key, value))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([], errors)
+        self.assertTrue(instance.size() <= 50)
@@ -0,0 +1,161 @@
+"""
+Test case for stripedlrucache.py module.
+"""
+
+import random
+import threading
+import unittest
+from pyowm.caches import lrucache
+from pyowm.caches.stripedlrucache import StripedLRUCache
+
+
+class TestStripedLRUCache(unittest.TestCase):
+
+    __test_url = "http://test.com/path?param=value"
+    __test_data = "test_data"
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, StripedLRUCache, 0)
+        self.assertRaises(AssertionError, StripedLRUCache, 10, 0)
+        self.assertRaises(AssertionError, StripedLRUCache, 10, 1000, 0)
+
+    def test_stripes_are_capped_to_max_size(self):
+        instance = StripedLRUCache(3, 1000, stripes=16)
+        self.assertEqual(3, len(instance._stripes))
+
+    def test_stripes_sizes_sum_up_to_max_size(self):
+        instance = StripedLRUCache(100, 1000, stripes=16)
+        self.assertEqual(100, sum(stripe._max_size
+                                  for _, stripe in instance._stripes))
+
+    def test_byte_budget_is_split_over_stripes(self):
+        instance = StripedLRUCache(None, 1000, stripes=4, max_bytes=1001)
+        self.assertEqual(1001, sum(stripe._max_bytes
+                                   for _, stripe in instance._stripes))
+        instance = StripedLRUCache(100, 1000, stripes=16, max_bytes=3)
+        self.assertEqual(3, len(instance._stripes))
+
+    def test_items_larger_than_stripe_budget_are_not_cached(self):
+        instance = StripedLRUCache(None, 1000, stripes=4, max_bytes=400)
+        instance.set(self.__test_url, 'x' * 150)
+        self.assertIsNone(instance.get(self.__test_url))
+
+    def test_stripes_are_capped_to_fit_max_item_bytes(self):
+        instance = StripedLRUCache(None, 1000, stripes=16, max_bytes=400,
+                                   max_item_bytes=150)
+        self.assertEqual(2, len(instance._stripes))
+        self.assertTrue(all(stripe._max_bytes >= 150
+                            for _, stripe in instance._stripes))
+        instance.set(self.__test_url, 'x' * 150)
+        self.assertEqual('x' * 150, instance.get(self.__test_url))
+
+    def test_init_fails_with_wrong_max_item_bytes(self):
+        self.assertRaises(AssertionError, StripedLRUCache, 100, 1000,
+                          max_item_bytes=10)
+        self.assertRaises(AssertionError, StripedLRUCache, 100, 1000,
+                          max_bytes=100, max_item_bytes=101)
+        self.assertRaises(AssertionError, StripedLRUCache, 100, 1000,
+                          max_bytes=100, max_item_bytes=0)
+
+    def test_byte_budget_preserved_when_setting(self):
+        instance = StripedLRUCache(None, 1000 * 60 * 60, stripes=4,
+                                   max_bytes=400)
+        for i in range(200):
+            instance.set(str(i), 'x' * 10)
+        self.assertTrue(0 < instance.size_bytes() <= 400)
+        self.assertEqual(10 * instance.size(), instance.size_bytes())
+
+    def test_hit_when_getting_freshly_inserted_items(self):
+        instance = StripedLRUCache(10, 1000 * 60 * 60)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(1, instance.size())
+        self.assertEqual(self.__test_data, instance.get(self.__test_url))
+
+    def test_miss_getting_old_items(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = StripedLRUCache(10, 1000)  # 1 second lifetime for items
+        instance.set(self.__test_url, self.__test_data)
+        clock['now'] += 2
+        result = instance.get(self.__test_url)
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertIsNone(result)
+        self.assertEqual(0, instance.size())
+
+    def test_stale_hits_getting_old_items_within_grace_periods(self):
+        clock = dict(now=1000.)
+        ref_to_original_monotonic = lrucache.monotonic
+        lrucache.monotonic = lambda: clock['now']
+        instance = StripedLRUCache(10, 1000, stale_while_revalidate_millis=1000,
+                                   stale_if_error_millis=5000)
+        instance.set(self.__test_url, self.__test_data)
+        clock['now'] += 3
+        self.assertIsNone(instance.get(self.__test_url))
+        self.assertIsNone(instance.get_stale(self.__test_url))
+        result = instance.get_stale(self.__test_url, upstream_failed=True)
+        lrucache.monotonic = ref_to_original_monotonic
+        self.assertEqual(self.__test_data, result)
+
+    def test_least_recently_used_item_is_evicted(self):
+        instance = StripedLRUCache(3, 1000 * 60 * 60, stripes=1)
+        instance.set("1", "aaa")
+        instance.set("2", "bbb")
+        instance.set("3", "ccc")
+        instance.get("1")
+        instance.set("4", "ddd")
+        self.assertEqual(3, instance.size())
+        self.assertIsNone(instance.get("2"))
+
+    def test_cache_max_size_preserved_when_setting(self):
+        instance = StripedLRUCache(50, 1000 * 60 * 60, stripes=8)
+        for i in range(500):
+            instance.set(str(i), i)
+        self.assertTrue(instance.size() <= 50)
+
+    def test_clean_cache(self):
+        instance = StripedLRUCache(10, 1000 * 60 * 60)
+        for i in range(10):
+            instance.set(str(i), i)
+        instance.clean()
+        self.assertEqual(0, instance.size())
+
+    def test_stats_are_merged(self):
+        instance = StripedLRUCache(100, 1000 * 60 * 60, stripes=4)
+        for i in range(20):
+            instance.set('http://test.com/weather?id=%d' % i, i)
+            instance.get('http://test.com/weather?id=%d' % i)
+            instance.get('http://test.com/forecast?id=%d' % i)
+        stats = instance.stats()
+        self.assertEqual(20, stats['endpoints']['/weather']['hits'])
+        self.assertEqual(20, stats['endpoints']['/forecast']['misses'])
+        self.assertEqual(20, stats['total']['sets'])
+
+    def test_concurrent_access(self):
+        instance = StripedLRUCache(200, 1000 * 60 * 60, stripes=4)
+        errors = []
+
+        def worker(seed):
+            rnd = random.Random(seed)
+            try:
+                for _ in range(5000):
+                    key = 'http://test.com/?id=%d' % rnd.randrange(400)
+                    if rnd.random() < 0.5:
+                        instance.set(key, key.upper())
+                    else:
+                        value = instance.get(key)
+                        if value is not None and value != key.upper():
+                            errors.append((key, value))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([], errors)
+        self.assertTrue(instance.size() <= 200)
+        for _, stripe in instance._stripes:
+            self.assertTrue(stripe.size() <= stripe._max_size)
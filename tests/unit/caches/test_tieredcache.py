@@ -0,0 +1,123 @@
+"""
+Test case for tieredcache.py module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.nullcache import NullCache
+from pyowm.caches.sqlitecache import SQLiteCache
+from pyowm.caches.tieredcache import TieredCache
+
+
+class StaleLRUCache(LRUCache):
+
+    def __init__(self, stale):
+        LRUCache.__init__(self)
+        self.stale = stale
+
+    def get_stale(self, request_url, upstream_failed=False):
+        return self.stale
+
+
+class TestTieredCache(unittest.TestCase):
+
+    __test_url = "http://test.com/data/2.5/weather?id=1"
+    __test_data = {"name": "London", "temp": 280.15}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_init_fails_with_wrong_parameters(self):
+        l1 = LRUCache()
+        self.assertRaises(AssertionError, TieredCache, l1, l1)
+        self.assertRaises(AssertionError, TieredCache, None, l1)
+
+    def test_is_thread_safe_when_both_tiers_are(self):
+        self.assertTrue(TieredCache(NullCache(), NullCache()).is_thread_safe())
+        self.assertFalse(TieredCache(LRUCache(), NullCache()).is_thread_safe())
+        self.assertFalse(TieredCache(NullCache(), LRUCache()).is_thread_safe())
+
+    def test_set_writes_through(self):
+        l1, l2 = LRUCache(), LRUCache()
+        instance = TieredCache(l1, l2)
+        instance.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, l1.get(self.__test_url))
+        self.assertEqual(self.__test_data, l2.get(self.__test_url))
+        self.assertEqual(self.__test_data, instance.get(self.__test_url))
+        self.assertEqual(1, instance.size())
+
+    def test_get_promotes_l2_hits(self):
+        l1, l2 = LRUCache(), LRUCache()
+        instance = TieredCache(l1, l2)
+        l2.set(self.__test_url, '{"name": "London", "temp": 280.15}')
+        self.assertEqual(self.__test_data, instance.get(self.__test_url))
+        self.assertEqual(self.__test_data, l1.get(self.__test_url))
+        self.assertIsNone(instance.get("http://test.com/other"))
+        self.assertEqual(1, l1.size())
+
+    def test_get_is_served_by_l1(self):
+        l1 = LRUCache()
+        instance = TieredCache(l1, NullCache())
+        l1.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, instance.get(self.__test_url))
+
+    def test_get_stale(self):
+        instance = TieredCache(StaleLRUCache(None), StaleLRUCache({"tier": 2}))
+        self.assertEqual({"tier": 2}, instance.get_stale(self.__test_url))
+        instance = TieredCache(StaleLRUCache({"tier": 1}), StaleLRUCache({"tier": 2}))
+        self.assertEqual({"tier": 1}, instance.get_stale(self.__test_url, True))
+        self.assertIsNone(TieredCache(LRUCache(), NullCache()).get_stale(self.__test_url))
+
+    def test_clean(self):
+        l1, l2 = LRUCache(), LRUCache()
+        instance = TieredCache(l1, l2)
+        instance.set(self.__test_url, self.__test_data)
+        instance.clean()
+        self.assertEqual((0, 0), (l1.size(), l2.size()))
+
+    def test_shared_l2(self):
+        # two processes, each one with its own L1, sharing the same database
+        db_path = os.path.join(self.tmp_dir, 'cache.sqlite')
+        first = TieredCache(LRUCache(), SQLiteCache(db_path))
+        second = TieredCache(LRUCache(), SQLiteCache(db_path))
+        first.set(self.__test_url, self.__test_data)
+        self.assertEqual(self.__test_data, second.get(self.__test_url))
+        self.assertEqual(1, second.size())
+        self.assertTrue(second.size_bytes() > 0)
+
+    def test_stats(self):
+        l1, l2 = LRUCache(cache_max_size=1), LRUCache()
+        instance = TieredCache(l1, l2)
+        instance.set(self.__test_url, self.__test_data)
+        instance.set("http://test.com/data/2.5/weather?id=2", self.__test_data)
+        instance.get(self.__test_url)
+        instance.get("http://test.com/data/2.5/weather?id=3")
+        stats = instance.stats()
+        total = stats['total']
+        self.assertEqual((1, 1, 2), (total['hits'], total['misses'],
+                                     total['sets']))
+        # the first item is evicted from L1, then promoted back evicting the
+        # second one
+        self.assertEqual(2, total['evictions'])
+        self.assertEqual((0, 2), (stats['l1']['total']['hits'],
+                                  stats['l1']['total']['misses']))
+        self.assertEqual((1, 1), (stats['l2']['total']['hits'],
+                                  stats['l2']['total']['misses']))
+        self.assertEqual(['/data/2.5/weather'], list(stats['endpoints']))
+        instance.stats(reset=True)
+        total = instance.stats()['total']
+        self.assertEqual((0, 0, 0), (total['hits'], total['misses'],
+                                     total['evictions']))
+
+    def test_repr(self):
+        self.assertIn('l2=', repr(TieredCache(LRUCache(), NullCache())))
+
+
+if __name__ == "__main__":
+    unittest.main()
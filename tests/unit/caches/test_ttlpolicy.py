@@ -0,0 +1,77 @@
+"""
+Test case for ttlpolicy.py module.
+"""
+
+import time
+import unittest
+from pyowm.caches.ttlpolicy import TTLPolicy
+from pyowm.weatherapi25 import configuration25
+
+
+class TestTTLPolicy(unittest.TestCase):
+
+    __instance = TTLPolicy({'http://%s.test.com/data/forecast': 1000,
+                            'http://%s.test.com/data/forecast/daily': 2000,
+                            'http://%s.test.com/data/weather': 3000},
+                           closed_window_lifetime=4000)
+
+    def test_init_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, TTLPolicy, {'http://a.com/x': 0})
+        self.assertRaises(AssertionError, TTLPolicy, {'http://a.com/x': 10},
+                          closed_window_lifetime=-1)
+
+    def test_lifetime_for(self):
+        self.assertEqual(1000, self.__instance.lifetime_for(
+            'http://api.test.com/data/forecast?id=123'))
+        self.assertEqual(3000, self.__instance.lifetime_for(
+            'https://pro.test.com/data/weather?q=London'))
+
+    def test_lifetime_for_most_specific_endpoint(self):
+        self.assertEqual(2000, self.__instance.lifetime_for(
+            'http://api.test.com/data/forecast/daily?id=123'))
+
+    def test_lifetime_for_unmatched_endpoint(self):
+        self.assertIsNone(self.__instance.lifetime_for(
+            'http://api.test.com/data/other?id=123'))
+        self.assertIsNone(self.__instance.lifetime_for(
+            'http://api.test.com/data/weatherstations?id=123'))
+
+    def test_lifetime_for_closed_time_windows(self):
+        past = int(time.time()) - 60 * 60 * 24
+        future = int(time.time()) + 60 * 60 * 24
+        self.assertEqual(4000, self.__instance.lifetime_for(
+            'http://api.test.com/data/weather?id=1&start=0&end=%d' % past))
+        self.assertEqual(3000, self.__instance.lifetime_for(
+            'http://api.test.com/data/weather?id=1&start=0&end=%d' % future))
+        self.assertEqual(3000, self.__instance.lifetime_for(
+            'http://api.test.com/data/weather?id=1&end=yesterday'))
+        self.assertEqual(3000, TTLPolicy({'http://a.com/data/weather': 3000})
+                         .lifetime_for('http://a.com/data/weather?end=%d' % past))
+
+    def test_configuration_policy(self):
+        policy = configuration25.cache_ttl_policy
+        observation = policy.lifetime_for(
+            'http://api.openweathermap.org/data/2.5/weather?APPID=x&id=123')
+        forecast = policy.lifetime_for(
+            'http://api.openweathermap.org/data/2.5/forecast?APPID=x&id=123')
+        daily = policy.lifetime_for(
+            'http://api.openweathermap.org/data/2.5/forecast/daily?APPID=x&id=123')
+        history = policy.lifetime_for(
+            'http://history.openweathermap.org/data/2.5/history/city?APPID=x'
+            '&id=123&start=1000&end=2000')
+        pollution = policy.lifetime_for(
+            'http://api.openweathermap.org/pollution/v1/co/0.0,10.0/current.json?appid=x')
+        self.assertTrue(observation < forecast < daily < history)
+        self.assertEqual(configuration25.CACHE_CLOSED_WINDOW_ITEM_LIFETIME, history)
+        self.assertIsNotNone(pollution)
+
+    def test_configuration_negative_policy(self):
+        policy = configuration25.negative_cache_ttl_policy
+        for url in ['http://api.openweathermap.org/data/2.5/weather?APPID=x&q=Londn',
+                    'http://api.openweathermap.org/data/2.5/find?APPID=x&q=Londn',
+                    'http://api.openweathermap.org/data/2.5/forecast?APPID=x&id=0',
+                    'http://history.openweathermap.org/data/2.5/history/city?APPID=x'
+                    '&id=0&start=1000&end=2000']:
+            negative = policy.lifetime_for(url)
+            self.assertIsNotNone(negative)
+            self.assertTrue(negative < configuration25.cache_ttl_policy.lifetime_for(url))
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import unittest
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.exceptions import api_call_error, api_response_error, parse_response_error
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class MockResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self.payload = payload
+
+    async def text(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockSession:
+    def __init__(self, status=200, payload=None, error=None):
+        self.status = status
+        self.payload = payload
+        self.error = error
+        self.requested_urls = []
+        self.closed = False
+
+    def get(self, url, headers=None, **kwargs):
+        self.requested_urls.append(url)
+        if self.error is not None:
+            raise self.error
+        return MockResponse(self.status, self.payload)
+
+    async def close(self):
+        self.closed = True
+
+
+class MockCache:
+    def __init__(self, expected_back):
+        self.expected_back = expected_back
+        self.stored = dict()
+
+    def get(self, url):
+        return self.expected_back
+
+    def set(self, url, json_str):
+        self.stored[url] = json_str
+
+
+class StaleCache(MockCache):
+    def __init__(self, stale):
+        MockCache.__init__(self, None)
+        self.stale = stale
+
+    def get_stale(self, url, upstream_failed=False):
+        return self.stale
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+
+    def test_get_json(self):
+        expected_data = '{"name": "james bond", "designation": "007"}'
+        session = MockSession(payload=expected_data)
+        instance = AsyncHttpClient(session=session)
+        status, data = run(instance.get_json('http://anyurl.com',
+                                             params=dict(b=2, a='x y')))
+        self.assertEqual(200, status)
+        self.assertEqual(json.loads(expected_data), data)
+        self.assertEqual(['http://anyurl.com/?b=2&a=x+y'], session.requested_urls)
+
+    def test_get_json_parse_error(self):
+        instance = AsyncHttpClient(session=MockSession(payload='{not json'))
+        with self.assertRaises(parse_response_error.ParseResponseError):
+            run(instance.get_json('http://anyurl.com'))
+
+    def test_get_json_checks_status_code(self):
+        instance = AsyncHttpClient(session=MockSession(status=404, payload='{}'))
+        with self.assertRaises(api_response_error.NotFoundError):
+            run(instance.get_json('http://anyurl.com'))
+
+    def test_timeouts(self):
+        instance = AsyncHttpClient(session=MockSession(error=asyncio.TimeoutError()))
+        with self.assertRaises(api_call_error.APICallTimeoutError):
+            run(instance.get_json('http://anyurl.com'))
+
+    def test_cacheable_get_json(self):
+        cached_data = '{"name": "james bond", "designation": "007"}'
+        other_data = '{"name": "doctor no"}'
+
+        # cache hit
+        session = MockSession(payload=other_data)
+        instance = AsyncHttpClient(cache=MockCache(cached_data), session=session)
+        status, data = run(instance.cacheable_get_json('http://anyurl.com'))
+        self.assertEqual(200, status)
+        self.assertEqual(json.loads(cached_data), data)
+        self.assertEqual([], session.requested_urls)
+
+        # cache miss
+        cache = MockCache(None)
+        instance = AsyncHttpClient(cache=cache, session=session)
+        status, data = run(instance.cacheable_get_json('http://anyurl.com',
+                                                       params=dict(a=1)))
+        self.assertEqual(200, status)
+        self.assertEqual(json.loads(other_data), data)
+        self.assertEqual({'http://anyurl.com/?a=1': data}, cache.stored)
+
+    def test_cacheable_get_json_coalesces_concurrent_misses(self):
+        session = MockSession(payload='{"name": "james bond"}')
+        instance = AsyncHttpClient(cache=MockCache(None), session=session)
+
+        async def concurrent_calls():
+            return await asyncio.gather(
+                *[instance.cacheable_get_json('http://anyurl.com')
+                  for _ in range(3)])
+
+        results = run(concurrent_calls())
+        self.assertEqual([(200, {'name': 'james bond'})] * 3, results)
+        self.assertEqual(['http://anyurl.com/'], session.requested_urls)
+
+    def test_cacheable_get_json_caches_not_found_errors(self):
+        session = MockSession(status=404, payload='{}')
+        negative_cache = MockCache(None)
+        instance = AsyncHttpClient(session=session,
+                                   negative_cache=negative_cache)
+        with self.assertRaises(api_response_error.NotFoundError):
+            run(instance.cacheable_get_json('http://anyurl.com'))
+        self.assertEqual({'http://anyurl.com/': dict(status=404, data=None)},
+                         negative_cache.stored)
+        negative_cache.expected_back = dict(status=404, data=None)
+        with self.assertRaises(api_response_error.NotFoundError):
+            run(instance.cacheable_get_json('http://anyurl.com'))
+        self.assertEqual(1, len(session.requested_urls))
+
+    def test_cacheable_get_json_serves_stale_while_revalidating(self):
+        session = MockSession(payload='{"name": "new"}')
+        cache = StaleCache('{"name": "old"}')
+        instance = AsyncHttpClient(cache=cache, session=session)
+
+        async def call_then_let_refresh_complete():
+            result = await instance.cacheable_get_json('http://anyurl.com')
+            await asyncio.gather(*instance._tasks.values())
+            return result
+
+        self.assertEqual((200, {'name': 'old'}),
+                         run(call_then_let_refresh_complete()))
+        self.assertEqual({'http://anyurl.com/': {'name': 'new'}}, cache.stored)
+
+    def test_cacheable_get_json_serves_stale_on_api_call_errors(self):
+        session = MockSession(error=asyncio.TimeoutError())
+        instance = AsyncHttpClient(cache=StaleCache('{"name": "old"}'),
+                                   session=session)
+        instance.cache.get_stale = \
+            lambda url, upstream_failed=False: \
+            '{"name": "old"}' if upstream_failed else None
+        self.assertEqual((200, {'name': 'old'}),
+                         run(instance.cacheable_get_json('http://anyurl.com')))
+        instance.cache.get_stale = lambda url, upstream_failed=False: None
+        with self.assertRaises(api_call_error.APICallTimeoutError):
+            run(instance.cacheable_get_json('http://anyurl.com'))
+
+    def test_close_does_not_close_external_session(self):
+        session = MockSession()
+        instance = AsyncHttpClient(session=session)
+        run(instance.close())
+        self.assertFalse(session.closed)
+        self.assertIs(session, instance.session)
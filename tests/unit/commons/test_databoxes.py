@@ -1,5 +1,5 @@
 import unittest
-from pyowm.commons.databoxes import ImageType, Satellite
+from pyowm.commons.databoxes import ImageType, Satellite, BulkResult
 
 
 class TestImageType(unittest.TestCase):
@@ -15,3 +15,13 @@ class TestSatellite(unittest.TestCase):
         instance = Satellite('Terrasat', 'tst')
         repr(instance)
 
+
+class TestBulkResult(unittest.TestCase):
+
+    def test_is_success(self):
+        self.assertTrue(BulkResult(1, 'result').is_success())
+        self.assertFalse(BulkResult(1, None, error=ValueError()).is_success())
+
+    def test_repr(self):
+        instance = BulkResult((1.2, 3.4), None, error=ValueError())
+        repr(instance)
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import threading
 import unittest
 import requests
 import json
 from pyowm.exceptions import api_call_error, api_response_error, parse_response_error
+from pyowm.caches.lrucache import LRUCache
 from pyowm.commons.http_client import HttpClient
 
 
@@ -28,6 +30,29 @@ class MockCache:
         pass
 
 
+class StaleCache(MockCache):
+    def __init__(self):
+        MockCache.__init__(self, None)
+        self.stale = None
+        self.stale_on_error = None
+        self.stale_lookups = []
+        self.stored = dict()
+
+    def get_stale(self, url, upstream_failed=False):
+        self.stale_lookups.append(upstream_failed)
+        return self.stale_on_error if upstream_failed else self.stale
+
+
+class MockSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def get(self, uri, params=None, headers=None, timeout=None, verify=False):
+        self.calls += 1
+        return self.response
+
+
 class TestHTTPClient(unittest.TestCase):
 
     requests_original_get = requests.get
@@ -48,6 +73,33 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(json.loads(expected_data), data)
         requests.get = self.requests_original_get
 
+    def test_get_json_with_session(self):
+        expected_data = '{"name": "james bond", "designation": "007"}'
+        session = MockSession(MockResponse(200, expected_data))
+        instance = HttpClient(session=session)
+        status, data = instance.get_json('http://anyurl.com')
+        self.assertEqual(json.loads(expected_data), data)
+        status, data = instance.get_json('http://anyurl.com')
+        self.assertEqual(2, session.calls)
+
+    def test_pooled_session(self):
+        session = HttpClient.pooled_session(pool_size=7, max_retries=3)
+        self.assertIsInstance(session, requests.Session)
+        for prefix in ['http://', 'https://']:
+            adapter = session.get_adapter(prefix + 'anyurl.com')
+            self.assertEqual(7, adapter._pool_connections)
+            self.assertEqual(7, adapter._pool_maxsize)
+            self.assertEqual(3, adapter.max_retries.total)
+        self.assertNotEqual('close', session.headers.get('Connection'))
+
+        session = HttpClient.pooled_session(keep_alive=False)
+        self.assertEqual('close', session.headers['Connection'])
+
+        with self.assertRaises(AssertionError):
+            HttpClient.pooled_session(pool_size=0)
+        with self.assertRaises(AssertionError):
+            HttpClient.pooled_session(max_retries=-1)
+
     def test_get_json_parse_error(self):
 
         def monkey_patched_get(uri, params=None, headers=None, timeout=None,
@@ -61,7 +113,7 @@ class TestHTTPClient(unittest.TestCase):
                           params=dict(a=1, b=2))
         requests.get = self.requests_original_get
 
-    def cacheable_get_json(self):
+    def test_cacheable_get_json(self):
 
         cached_data = '{"name": "james bond", "designation": "007"}'
         other_data = '{"name": "doctor no"}'
@@ -71,21 +123,322 @@ class TestHTTPClient(unittest.TestCase):
             return MockResponse(200, other_data)
         requests.get = monkey_patched_get
 
-        # cache hit
+        # cache hit, raw JSON text
         cache = MockCache(cached_data)
         instance = HttpClient(cache=cache)
         status, data = instance.cacheable_get_json('http://anyurl.com')
         self.assertEqual(200, status)
-        self.assertEqual(cached_data, data)
+        self.assertEqual(json.loads(cached_data), data)
 
-        # cache miss
+        # cache hit, decoded JSON data
+        cache = MockCache(json.loads(cached_data))
+        instance = HttpClient(cache=cache)
+        status, data = instance.cacheable_get_json('http://anyurl.com')
+        self.assertEqual(200, status)
+        self.assertIs(cache.expected_back, data)
+
+        # cache miss: decoded data is stored as is
+        stored = dict()
         cache = MockCache(None)
+        cache.set = stored.__setitem__
         instance = HttpClient(cache=cache)
         status, data = instance.cacheable_get_json('http://anyurl.com')
         self.assertEqual(200, status)
-        self.assertEqual(other_data, data)
+        self.assertEqual(json.loads(other_data), data)
+        self.assertEqual({'http://anyurl.com/': data}, stored)
+
+        requests.get = self.requests_original_get
+
+    def test_cacheable_get_json_coalesces_concurrent_misses(self):
+        release = threading.Event()
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            calls.append(uri)
+            release.wait()
+            return MockResponse(200, '{"name": "james bond"}')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=MockCache(None))
+        results = []
+
+        def target():
+            results.append(instance.cacheable_get_json('http://anyurl.com',
+                                                       params=dict(q='London')))
+
+        threads = [threading.Thread(target=target) for _ in range(5)]
+        for t in threads:
+            t.start()
+        threading.Timer(0.1, release.set).start()
+        for t in threads:
+            t.join()
+        requests.get = self.requests_original_get
+        self.assertEqual(1, len(calls))
+        self.assertEqual([(200, {"name": "james bond"})] * 5, results)
+
+    def test_cacheable_get_json_serves_stale_while_revalidating(self):
+        cache = StaleCache()
+        cache.stale = {'name': 'old'}
+        refreshed = threading.Event()
 
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            return MockResponse(200, '{"name": "new"}')
+
+        def set_item(url, data):
+            cache.stored[url] = data
+            refreshed.set()
+
+        cache.set = set_item
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=cache)
+        status, data = instance.cacheable_get_json('http://anyurl.com')
+        self.assertTrue(refreshed.wait(5))
+        requests.get = self.requests_original_get
+        self.assertEqual((200, {'name': 'old'}), (status, data))
+        self.assertEqual({'http://anyurl.com/': {'name': 'new'}}, cache.stored)
+        self.assertEqual([False], cache.stale_lookups)
+
+    def test_cacheable_get_json_serves_stale_on_api_call_errors(self):
+        cache = StaleCache()
+        cache.stale_on_error = '{"name": "old"}'
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            return MockResponse(502, 'Bad gateway')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=cache)
+        result = instance.cacheable_get_json('http://anyurl.com')
+        cache.stale_on_error = None
+        self.assertRaises(api_call_error.BadGatewayError,
+                          instance.cacheable_get_json, 'http://anyurl.com')
+        requests.get = self.requests_original_get
+        self.assertEqual((200, {'name': 'old'}), result)
+        self.assertEqual([False, True, False, True], cache.stale_lookups)
+
+    def test_cacheable_get_json_does_not_serve_stale_on_api_response_errors(self):
+        cache = StaleCache()
+        cache.stale_on_error = '{"name": "old"}'
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            return MockResponse(404, 'Not found')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=cache)
+        self.assertRaises(api_response_error.NotFoundError,
+                          instance.cacheable_get_json, 'http://anyurl.com')
+        requests.get = self.requests_original_get
+
+    def test_get_cached_json_many(self):
+        cache = LRUCache()
+        cache.set_many({'http://a.com': '{"a": 1}', 'http://b.com': {'b': 2}})
+        instance = HttpClient(cache=cache)
+        self.assertEqual([{'a': 1}, None, {'b': 2}], instance.get_cached_json_many(
+            ['http://a.com', 'http://c.com', 'http://b.com']))
+        with instance.refreshing():
+            self.assertEqual([None], instance.get_cached_json_many(['http://a.com']))
+        # duck-typed cache providers may not support multi-key operations
+        instance = HttpClient(cache=MockCache('{"a": 1}'))
+        self.assertEqual([{'a': 1}] * 2,
+                         instance.get_cached_json_many(['http://a.com', 'http://b.com']))
+        instance.set_cached_json_many({'http://a.com': {'a': 1}})
+
+    def test_has_thread_safe_caches(self):
+        self.assertTrue(HttpClient().has_thread_safe_caches())
+        self.assertFalse(HttpClient(cache=LRUCache()).has_thread_safe_caches())
+        self.assertFalse(HttpClient(negative_cache=LRUCache()).has_thread_safe_caches())
+        self.assertTrue(HttpClient(
+            cache=LRUCache(stale_if_error_millis=1000)).has_thread_safe_caches())
+        # duck-typed cache providers are not assumed to be thread-safe
+        self.assertFalse(HttpClient(cache=MockCache('{}')).has_thread_safe_caches())
+
+    def test_cacheable_get_json_refreshing(self):
+        payloads = ['{"name": "old"}', '{"name": "new"}']
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            return MockResponse(200, payloads.pop(0))
+
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=LRUCache())
+        instance.cacheable_get_json('http://anyurl.com')
+        with instance.refreshing():
+            refreshed = instance.cacheable_get_json('http://anyurl.com')
+            self.assertIsNone(instance.get_cached_json('http://anyurl.com/'))
+        result = instance.cacheable_get_json('http://anyurl.com')
+        requests.get = self.requests_original_get
+        self.assertEqual((200, {'name': 'new'}), refreshed)
+        self.assertEqual((200, {'name': 'new'}), result)
+        self.assertEqual([], payloads)
+
+    def test_refreshing_does_not_serve_stale_on_api_call_errors(self):
+        cache = StaleCache()
+        cache.stale_on_error = '{"name": "old"}'
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            return MockResponse(502, 'Bad gateway')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient(cache=cache)
+        with instance.refreshing():
+            self.assertRaises(api_call_error.BadGatewayError,
+                              instance.cacheable_get_json, 'http://anyurl.com')
+        requests.get = self.requests_original_get
+        self.assertEqual([], cache.stale_lookups)
+
+    def test_cacheable_get_json_caches_not_found_errors_apart(self):
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            calls.append(uri)
+            return MockResponse(404, '{"cod": "404", "message": "city not found"}')
+
+        requests.get = monkey_patched_get
+        cache = LRUCache()
+        negative_cache = LRUCache()
+        instance = HttpClient(cache=cache, negative_cache=negative_cache)
+        for _ in range(2):
+            self.assertRaises(api_response_error.NotFoundError,
+                              instance.cacheable_get_json, 'http://anyurl.com',
+                              params=dict(q='Londn'))
+        requests.get = self.requests_original_get
+        self.assertEqual(1, len(calls))
+        self.assertEqual(0, cache.size())
+        self.assertEqual(1, negative_cache.size())
+
+    def test_cacheable_get_json_caches_empty_results_apart(self):
+        calls = []
+        payloads = {'empty': '{"cod": "200", "count": 0, "list": []}',
+                    'full': '{"cod": "200", "count": 1, "list": [{"id": 1}]}'}
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            calls.append(uri)
+            return MockResponse(200, payloads[params['q']])
+
+        requests.get = monkey_patched_get
+        cache = LRUCache()
+        negative_cache = LRUCache()
+        instance = HttpClient(cache=cache, negative_cache=negative_cache)
+        for _ in range(2):
+            empty = instance.cacheable_get_json('http://anyurl.com',
+                                                params=dict(q='empty'))
+            full = instance.cacheable_get_json('http://anyurl.com',
+                                               params=dict(q='full'))
+        requests.get = self.requests_original_get
+        self.assertEqual((200, json.loads(payloads['empty'])), empty)
+        self.assertEqual((200, json.loads(payloads['full'])), full)
+        self.assertEqual(2, len(calls))
+        self.assertEqual(1, cache.size())
+        self.assertIsNotNone(cache.get('http://anyurl.com/?q=full'))
+        self.assertEqual(1, negative_cache.size())
+        self.assertIsNotNone(negative_cache.get('http://anyurl.com/?q=empty'))
+
+    def test_cacheable_get_json_caches_empty_results_without_negative_cache(self):
+        from pyowm.weatherapi25 import configuration25
+        calls = []
+        payloads = {'empty': (200, '{"cod": "200", "count": 0, "list": []}'),
+                    'missing': (404, '{"cod": "404", "message": "not found"}')}
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            calls.append(params['q'])
+            return MockResponse(*payloads[params['q']])
+
+        requests.get = monkey_patched_get
+        # both with no negative cache and with the one of the default
+        # configuration, empty results are cached as any other response
+        for negative_cache in (None, configuration25.negative_cache):
+            del calls[:]
+            cache = LRUCache()
+            instance = HttpClient(cache=cache, negative_cache=negative_cache)
+            for _ in range(2):
+                empty = instance.cacheable_get_json('http://anyurl.com',
+                                                    params=dict(q='empty'))
+                self.assertRaises(api_response_error.NotFoundError,
+                                  instance.cacheable_get_json,
+                                  'http://anyurl.com', params=dict(q='missing'))
+            self.assertEqual((200, json.loads(payloads['empty'][1])), empty)
+            self.assertEqual(['empty', 'missing', 'missing'], calls)
+            self.assertEqual(1, cache.size())
+            self.assertIsNotNone(cache.get('http://anyurl.com/?q=empty'))
+        requests.get = self.requests_original_get
+
+    def test_cacheable_get_json_with_negative_responses_as_json_text(self):
+        instance = HttpClient(negative_cache=MockCache('{"status": 200, "data": {"cnt": 0}}'))
+        self.assertEqual((200, {'cnt': 0}),
+                         instance.cacheable_get_json('http://anyurl.com'))
+        instance = HttpClient(negative_cache=MockCache('{"status": 404, "data": null}'))
+        self.assertRaises(api_response_error.NotFoundError,
+                          instance.cacheable_get_json, 'http://anyurl.com')
+
+    def test_is_empty_response(self):
+        self.assertTrue(HttpClient.is_empty_response({'cod': '404', 'message': 'no data'}))
+        self.assertTrue(HttpClient.is_empty_response({'cod': 404}))
+        self.assertTrue(HttpClient.is_empty_response({'cod': '200', 'cnt': 0}))
+        self.assertTrue(HttpClient.is_empty_response({'count': 0, 'list': []}))
+        self.assertFalse(HttpClient.is_empty_response({'cod': '200', 'cnt': 2}))
+        self.assertFalse(HttpClient.is_empty_response({'cod': 200}))
+        self.assertFalse(HttpClient.is_empty_response([]))
+        self.assertFalse(HttpClient.is_empty_response([{'cnt': 0}]))
+
+    def test_cache_key(self):
+        self.assertEqual('http://anyurl.com/', HttpClient.cache_key('http://anyurl.com'))
+        self.assertEqual('http://api.test.com/data/weather?id=1&lang=en',
+                         HttpClient.cache_key('http://api.test.com/data/weather',
+                                              params=dict(id=1, lang='en')))
+
+    def test_cache_key_strips_credentials(self):
+        expected = 'http://api.test.com/data/weather?q=London%2CGB'
+        for uri, params in [('http://api.test.com/data/weather?APPID=abc', dict(q='London,GB')),
+                            ('http://api.test.com/data/weather?appid=xyz', dict(q='London,GB')),
+                            ('http://api.test.com/data/weather', dict(q='London,GB', AppId='k'))]:
+            self.assertEqual(expected, HttpClient.cache_key(uri, params=params))
+
+    def test_cache_key_sorts_params(self):
+        first = HttpClient.cache_key('http://api.test.com/data/weather?lon=2&APPID=a',
+                                     params=dict(lat=1, lang='en'))
+        second = HttpClient.cache_key('http://api.test.com/data/weather?lang=en',
+                                      params=dict(lon=2, lat=1))
+        self.assertEqual('http://api.test.com/data/weather?lang=en&lat=1&lon=2', first)
+        self.assertEqual(first, second)
+        # values of repeated params keep their order
+        self.assertEqual('http://api.test.com/x?a=2&a=1&b=0',
+                         HttpClient.cache_key('http://api.test.com/x?b=0&a=2&a=1'))
+
+    def test_cache_key_normalises_subdomain_and_scheme(self):
+        expected = 'http://api.test.com/data/weather?id=1'
+        for uri in ['http://api.test.com/data/weather', 'http://pro.test.com/data/weather',
+                    'https://api.test.com/data/weather', 'https://pro.test.com/data/weather']:
+            self.assertEqual(expected, HttpClient.cache_key(uri, params=dict(id=1)))
+        self.assertEqual('http://history.test.com/data/history?id=1',
+                         HttpClient.cache_key('https://history.test.com/data/history',
+                                              params=dict(id=1)))
+
+    def test_cacheable_get_json_shares_cache_across_api_keys(self):
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, timeout=None,
+                               verify=False):
+            calls.append(uri)
+            return MockResponse(200, '{"name": "London"}')
+
+        requests.get = monkey_patched_get
+        cache = LRUCache()
+        first = HttpClient(cache=cache).cacheable_get_json(
+            HttpClient.to_url('http://%s.test.com/data/weather', 'key1', 'free'),
+            params=dict(q='London', lang='en'))
+        second = HttpClient(cache=cache).cacheable_get_json(
+            HttpClient.to_url('http://%s.test.com/data/weather', 'key2', 'pro'),
+            params=dict(lang='en', q='London'))
         requests.get = self.requests_original_get
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(calls))
 
     def test_post(self):
         expected_data = '{"key": "value"}'
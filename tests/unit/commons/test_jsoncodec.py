@@ -0,0 +1,124 @@
+"""
+Test case for jsoncodec.py module
+"""
+
+import json
+import unittest
+from unittest import mock
+from pyowm.commons import jsoncodec
+from pyowm.weatherapi25 import configuration25
+
+
+class TestJSONCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.__backend = jsoncodec.backend()
+        self.__selected = jsoncodec._codec.selected
+
+    def tearDown(self):
+        jsoncodec.use(self.__backend)
+        jsoncodec._codec.selected = self.__selected
+
+    def test_available(self):
+        result = jsoncodec.available()
+        self.assertIn('json', result)
+        self.assertEqual([n for n in jsoncodec.BACKENDS if n in result], result)
+
+    def test_use(self):
+        jsoncodec.use('json')
+        self.assertEqual('json', jsoncodec.backend())
+        jsoncodec.use('auto')
+        self.assertEqual(jsoncodec.available()[0], jsoncodec.backend())
+        jsoncodec.use(None)
+        self.assertEqual(jsoncodec.available()[0], jsoncodec.backend())
+
+    def test_selection_is_not_changed_by_owm_factory(self):
+        import pyowm
+        jsoncodec.use('json')
+        pyowm.OWM('test_API_key')
+        self.assertEqual('json', jsoncodec.backend())
+
+    def test_owm_factory_applies_the_configured_library_once(self):
+        import pyowm
+        jsoncodec._codec.selected = False
+        with mock.patch.object(configuration25, 'JSON_CODEC', 'json'):
+            pyowm.OWM('test_API_key')
+        self.assertEqual('json', jsoncodec.backend())
+        with mock.patch.object(configuration25, 'JSON_CODEC', 'auto'):
+            pyowm.OWM('test_API_key')
+        self.assertEqual('json', jsoncodec.backend())
+
+    def test_use_default_does_not_override_use(self):
+        jsoncodec.use('json')
+        jsoncodec.use_default('auto')
+        self.assertEqual('json', jsoncodec.backend())
+
+    def test_use_fails_with_unknown_names(self):
+        self.assertRaises(AssertionError, jsoncodec.use, 'simplejson')
+
+    def test_use_fails_with_libraries_not_installed(self):
+        missing = [n for n in jsoncodec.BACKENDS
+                   if n not in jsoncodec.available()]
+        for name in missing:
+            self.assertRaises(ImportError, jsoncodec.use, name)
+
+    def test_round_trip_with_every_library(self):
+        data = {'name': 'London', 'coord': {'lon': -0.13, 'lat': 51.51},
+                'weather': [{'id': 300, 'icon': '09d'}], 'rain': None,
+                'url': 'http://openweathermap.org/', 'ok': True}
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertEqual(data, jsoncodec.loads(jsoncodec.dumps(data)))
+            self.assertEqual(data, jsoncodec.loads(jsoncodec.dumpb(data)))
+            self.assertEqual(data, json.loads(jsoncodec.dumps(data)))
+            self.assertIsInstance(jsoncodec.dumps(data), str)
+            self.assertIsInstance(jsoncodec.dumpb(data), bytes)
+
+    def test_dumps_is_compact_with_every_library(self):
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertEqual('{"a":[1,2]}', jsoncodec.dumps({'a': [1, 2]}))
+
+    def test_loads_decodes_bytes_with_every_library(self):
+        # the json module of Python < 3.6 does not decode bytes
+        def str_only_loads(data, loads=json.loads):
+            if not isinstance(data, str):
+                raise TypeError('the JSON object must be str')
+            return loads(data)
+
+        with mock.patch.object(json, 'loads', str_only_loads):
+            for name in jsoncodec.available():
+                jsoncodec.use(name)
+                self.assertEqual({'name': 'Montr\u00e9al'},
+                                 jsoncodec.loads('{"name":"Montr\u00e9al"}'
+                                                 .encode('utf-8')))
+                self.assertEqual([2 ** 70],
+                                 jsoncodec.loads(bytearray(b'[1180591620717411303424]')))
+
+    def test_non_str_keys_are_coerced(self):
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertEqual({'1': 'a'}, jsoncodec.loads(jsoncodec.dumps({1: 'a'})))
+
+    def test_big_integers_fall_back_to_json(self):
+        value = 2 ** 70
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertEqual([value], jsoncodec.loads(jsoncodec.dumps([value])))
+            self.assertEqual([value], jsoncodec.loads(jsoncodec.dumpb([value])))
+
+    def test_loads_fails_with_invalid_json(self):
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertRaises(ValueError, jsoncodec.loads, '{"a": ')
+            self.assertRaises(TypeError, jsoncodec.loads, None)
+
+    def test_dumps_fails_with_unserializable_data(self):
+        for name in jsoncodec.available():
+            jsoncodec.use(name)
+            self.assertRaises(TypeError, jsoncodec.dumps, object())
+            self.assertRaises(TypeError, jsoncodec.dumpb, object())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Test case for slotted.py module
+"""
+
+import copy
+import pickle
+import unittest
+from pyowm.commons.slotted import Slotted
+
+
+class Point(Slotted):
+
+    __slots__ = ('_x', '_y', 'label')
+
+    def __init__(self, x, y, label=None):
+        self._x = x
+        self._y = y
+        if label is not None:
+            self.label = label
+
+
+class NamedPoint(Point):
+
+    __slots__ = ('name',)
+
+    def __init__(self, x, y, name):
+        super(NamedPoint, self).__init__(x, y)
+        self.name = name
+
+
+class PointWithDict(Point):
+    pass
+
+
+class LegacyPoint(object):
+
+    def __init__(self, x, y):
+        self._x = x
+        self._y = y
+
+
+class TestSlotted(unittest.TestCase):
+
+    def test_instances_have_no_dict(self):
+        self.assertFalse(hasattr(Point(1, 2), '__dict__'))
+        self.assertFalse(hasattr(NamedPoint(1, 2, 'a'), '__dict__'))
+        self.assertRaises(AttributeError, setattr, Point(1, 2), 'z', 3)
+
+    def test_getstate(self):
+        self.assertEqual(dict(_x=1, _y=2), Point(1, 2).__getstate__())
+        self.assertEqual(dict(_x=1, _y=2, label='a'),
+                         Point(1, 2, 'a').__getstate__())
+        self.assertEqual(dict(_x=1, _y=2, name='a'),
+                         NamedPoint(1, 2, 'a').__getstate__())
+        instance = PointWithDict(1, 2)
+        instance.z = 3
+        self.assertEqual(dict(_x=1, _y=2, z=3), instance.__getstate__())
+
+    def test_pickling_with_all_protocols(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for instance in [Point(1, 2), Point(1, 2, 'a'),
+                             NamedPoint(1, 2, 'a')]:
+                result = pickle.loads(pickle.dumps(instance, protocol))
+                self.assertIs(type(instance), type(result))
+                self.assertEqual(instance.__getstate__(), result.__getstate__())
+
+    def test_unpickling_objects_pickled_with_a_dict(self):
+        # pickles taken when the class had per-instance dicts
+        global Point
+        slotted_class = Point
+        LegacyPoint.__name__ = LegacyPoint.__qualname__ = 'Point'
+        try:
+            Point = LegacyPoint
+            data = pickle.dumps(LegacyPoint(1, 2), 2)
+        finally:
+            Point = slotted_class
+            LegacyPoint.__name__ = LegacyPoint.__qualname__ = 'LegacyPoint'
+        result = pickle.loads(data)
+        self.assertIs(Point, type(result))
+        self.assertEqual(dict(_x=1, _y=2), result.__getstate__())
+
+    def test_copy(self):
+        instance = NamedPoint([1], 2, 'a')
+        result = copy.copy(instance)
+        self.assertIsNot(instance, result)
+        self.assertIs(instance._x, result._x)
+        self.assertEqual(instance.__getstate__(), result.__getstate__())
+        instance = PointWithDict(1, 2)
+        instance.z = 3
+        result = copy.copy(instance)
+        self.assertEqual(dict(_x=1, _y=2, z=3), result.__getstate__())
+        result.z = 4
+        self.assertEqual(3, instance.z)
+
+
+if __name__ == "__main__":
+    unittest.main()
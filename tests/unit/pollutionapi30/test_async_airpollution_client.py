@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+from pyowm.pollutionapi30.async_airpollution_client import AsyncAirPollutionHttpClient
+
+
+class MockAsyncHttpClient:
+
+    async def cacheable_get_json(self, uri, params=None, headers=None):
+        return 200, uri
+
+
+class TestAsyncAirPollutionHttpClient(unittest.TestCase):
+
+    __instance = AsyncAirPollutionHttpClient('xyz', MockAsyncHttpClient())
+
+    def run_coroutine(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_get_coi(self):
+        params = {'lon': 8.25, 'lat': 43.75, 'start': None, 'interval': None}
+        result = self.run_coroutine(self.__instance.get_coi(params))
+        self.assertEqual('http://api.openweathermap.org/pollution/v1/co/43.75,8.25/current.json?APPID=xyz',
+                         result)
+
+    def test_get_o3(self):
+        params = {'lon': 8.25, 'lat': 43.75, 'start': 1463041620, 'interval': 'day'}
+        result = self.run_coroutine(self.__instance.get_o3(params))
+        self.assertEqual('http://api.openweathermap.org/pollution/v1/o3/43.75,8.25/2016-05-12Z.json?APPID=xyz',
+                         result)
+
+    def test_get_no2(self):
+        params = {'lon': 8.25, 'lat': 43.75, 'start': 1463041620, 'interval': None}
+        result = self.run_coroutine(self.__instance.get_no2(params))
+        self.assertEqual('http://api.openweathermap.org/pollution/v1/no2/43.75,8.25/2016Z.json?APPID=xyz',
+                         result)
+
+    def test_get_so2(self):
+        params = {'lon': 8.25, 'lat': 43.75, 'start': None, 'interval': None}
+        result = self.run_coroutine(self.__instance.get_so2(params))
+        self.assertEqual('http://api.openweathermap.org/pollution/v1/so2/43.75,8.25/current.json?APPID=xyz',
+                         result)
@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import datetime
 from pyowm.weatherapi25.location import Location
@@ -120,9 +121,14 @@ class TestCOIndex(unittest.TestCase):
     # interpeter-dependant serialization of XML/JSON objects)
 
     def test_to_JSON(self):
-        ordered_base_json = ''.join(sorted(COINDEX_JSON_DUMP))
-        ordered_actual_json = ''.join(sorted(self.__test_instance.to_JSON()))
-        self.assertEqual(ordered_base_json, ordered_actual_json)
+        # the formatting of the JSON text depends on the JSON codec backend
+        expected = json.loads(COINDEX_JSON_DUMP)
+        result = json.loads(self.__test_instance.to_JSON())
+        # the samples are dumped sorted by value, unlike in the expected dump
+        by_pressure = lambda sample: sample['pressure']
+        expected['co_samples'].sort(key=by_pressure)
+        result['co_samples'].sort(key=by_pressure)
+        self.assertEqual(expected, result)
 
     def test_to_XML(self):
         ordered_base_xml = ''.join(sorted(COINDEX_XML_DUMP))
@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import datetime
 from pyowm.weatherapi25.location import Location
@@ -101,9 +102,9 @@ class TestSO2Index(unittest.TestCase):
     # interpeter-dependant serialization of XML/JSON objects)
 
     def test_to_JSON(self):
-        ordered_base_json = ''.join(sorted(SO2INDEX_JSON_DUMP))
-        ordered_actual_json = ''.join(sorted(self.__test_instance.to_JSON()))
-        self.assertEqual(ordered_base_json, ordered_actual_json)
+        # the formatting of the JSON text depends on the JSON codec backend
+        self.assertEqual(json.loads(SO2INDEX_JSON_DUMP),
+                         json.loads(self.__test_instance.to_JSON()))
 
     def test_to_XML(self):
         ordered_base_xml = ''.join(sorted(SO2INDEX_XML_DUMP))
@@ -0,0 +1,232 @@
+import threading
+import time
+import unittest
+from pyowm.utils import concurrency
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def test_bulk_map_preserves_order(self):
+        def slow_square(x):
+            time.sleep(0.001 * (10 - x))
+            return x * x
+
+        results = list(concurrency.bulk_map(slow_square, range(10), 4))
+        self.assertEqual(list(range(10)), [r.query for r in results])
+        self.assertEqual([x * x for x in range(10)], [r.result for r in results])
+        self.assertTrue(all(r.is_success() for r in results))
+
+    def test_bulk_map_reports_failures_per_item(self):
+        def fail_on_odd(x):
+            if x % 2:
+                raise ValueError('odd')
+            return x
+
+        results = list(concurrency.bulk_map(fail_on_odd, range(6), 2))
+        self.assertEqual(6, len(results))
+        for r in results:
+            if r.query % 2:
+                self.assertFalse(r.is_success())
+                self.assertIsNone(r.result)
+                self.assertIsInstance(r.error, ValueError)
+            else:
+                self.assertTrue(r.is_success())
+                self.assertEqual(r.query, r.result)
+
+    def test_bulk_map_bounds_concurrency(self):
+        lock = threading.Lock()
+        counters = dict(running=0, peak=0)
+
+        def track(x):
+            with lock:
+                counters['running'] += 1
+                counters['peak'] = max(counters['peak'], counters['running'])
+            time.sleep(0.005)
+            with lock:
+                counters['running'] -= 1
+            return x
+
+        results = list(concurrency.bulk_map(track, range(20), 3))
+        self.assertEqual(20, len(results))
+        self.assertTrue(counters['peak'] <= 3)
+
+    def test_bulk_map_is_lazy(self):
+        consumed = []
+
+        def queries():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        gen = concurrency.bulk_map(lambda x: x, queries(), 2)
+        self.assertEqual([], consumed)
+        first = next(gen)
+        self.assertEqual(0, first.query)
+        self.assertTrue(len(consumed) < 100)
+        gen.close()
+
+    def test_bulk_map_fails_with_wrong_max_workers(self):
+        # upon invocation, not upon iteration
+        self.assertRaises(AssertionError, concurrency.bulk_map,
+                          lambda x: x, [1], 0)
+        self.assertRaises(AssertionError, concurrency.bulk_map,
+                          lambda x: x, [1], '2')
+
+    def _run_concurrently(self, single_flight, function, n_threads):
+        outcomes = []
+        lock = threading.Lock()
+
+        def target():
+            try:
+                result = single_flight.do('key', function)
+            except Exception as e:
+                result = e
+            with lock:
+                outcomes.append(result)
+
+        threads = [threading.Thread(target=target) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return outcomes
+
+    def test_single_flight_coalesces_concurrent_calls(self):
+        release = threading.Event()
+        calls = []
+        single_flight = concurrency.SingleFlight()
+
+        def slow():
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        outcomes = self._run_concurrently(single_flight, slow, 8)
+        timer.join()
+        self.assertEqual(['result'] * 8, outcomes)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(0, single_flight.in_flight())
+
+    def test_single_flight_shares_exceptions(self):
+        release = threading.Event()
+        single_flight = concurrency.SingleFlight()
+
+        def failing():
+            release.wait()
+            raise ValueError('boom')
+
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        outcomes = self._run_concurrently(single_flight, failing, 4)
+        timer.join()
+        self.assertEqual(4, len(outcomes))
+        self.assertTrue(all(isinstance(o, ValueError) for o in outcomes))
+        self.assertEqual(0, single_flight.in_flight())
+
+    def test_single_flight_releases_callers_waiting_for_interrupted_calls(self):
+        class Interrupt(BaseException):
+            pass
+
+        release = threading.Event()
+        single_flight = concurrency.SingleFlight()
+        outcomes = dict()
+
+        def interrupted():
+            release.wait()
+            raise Interrupt()
+
+        def run(name):
+            try:
+                outcomes[name] = single_flight.do('key', interrupted)
+            except BaseException as e:
+                outcomes[name] = e
+
+        leader = threading.Thread(target=run, args=('leader',))
+        leader.start()
+        while single_flight.in_flight() == 0:
+            time.sleep(0.01)
+        follower = threading.Thread(target=run, args=('follower',))
+        follower.start()
+        time.sleep(0.1)
+        release.set()
+        leader.join()
+        follower.join(5)
+        self.assertFalse(follower.is_alive())
+        self.assertIsInstance(outcomes['leader'], Interrupt)
+        self.assertIsInstance(outcomes['follower'], RuntimeError)
+        self.assertEqual(0, single_flight.in_flight())
+
+    def test_single_flight_does_not_memoize(self):
+        single_flight = concurrency.SingleFlight()
+        counter = dict(calls=0)
+
+        def count():
+            counter['calls'] += 1
+            return counter['calls']
+
+        self.assertEqual(1, single_flight.do('key', count))
+        self.assertEqual(2, single_flight.do('key', count))
+        self.assertEqual(3, single_flight.do('other', count))
+
+    def test_single_flight_do_in_background(self):
+        release = threading.Event()
+        calls = []
+        single_flight = concurrency.SingleFlight()
+
+        def slow():
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        self.assertTrue(single_flight.do_in_background('key', slow))
+        self.assertFalse(single_flight.do_in_background('key', slow))
+        self.assertEqual(1, single_flight.in_flight())
+        threading.Timer(0.1, release.set).start()
+        # foreground calls share the outcome of the background one
+        self.assertEqual('result', single_flight.do('key', slow))
+        self.assertEqual(1, len(calls))
+        self.assertEqual(0, single_flight.in_flight())
+
+    def test_single_flight_background_calls_share_bounded_workers(self):
+        release = threading.Event()
+        threads = set()
+        single_flights = [concurrency.SingleFlight() for _ in range(3)]
+
+        def slow():
+            threads.add(threading.current_thread())
+            release.wait()
+
+        for n in range(3 * concurrency._BACKGROUND_MAX_WORKERS):
+            self.assertTrue(single_flights[n % 3].do_in_background(n, slow))
+        threading.Timer(0.1, release.set).start()
+        while any(sf.in_flight() for sf in single_flights):
+            time.sleep(0.01)
+        self.assertTrue(len(threads) <= concurrency._BACKGROUND_MAX_WORKERS)
+
+    def test_single_flight_does_not_start_too_many_background_calls(self):
+        release = threading.Event()
+        single_flight = concurrency.SingleFlight()
+        max_pending = concurrency._BACKGROUND_MAX_PENDING
+        started = [single_flight.do_in_background(n, release.wait)
+                   for n in range(max_pending + 1)]
+        self.assertEqual([True] * max_pending + [False], started)
+        release.set()
+        while single_flight.in_flight():
+            time.sleep(0.01)
+        self.assertTrue(single_flight.do_in_background('key', lambda: None))
+
+    def test_single_flight_do_in_background_discards_exceptions(self):
+        single_flight = concurrency.SingleFlight()
+        done = threading.Event()
+
+        def failing():
+            done.set()
+            raise ValueError('boom')
+
+        self.assertTrue(single_flight.do_in_background('key', failing))
+        done.wait(5)
+        while single_flight.in_flight():
+            time.sleep(0.01)
+        self.assertEqual('ok', single_flight.do('key', lambda: 'ok'))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+Test cases for async_uv_client.py
+"""
+
+import asyncio
+import unittest
+from pyowm.uvindexapi30.async_uv_client import AsyncUltraVioletHttpClient
+
+
+class MockAsyncHttpClient:
+
+    async def cacheable_get_json(self, uri, params=None, headers=None):
+        return 200, (uri, params)
+
+
+class TestAsyncUltraVioletHttpClient(unittest.TestCase):
+
+    __instance = AsyncUltraVioletHttpClient('xyz', MockAsyncHttpClient())
+
+    def run_coroutine(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_get_uvi(self):
+        params = {'lon': 8.25, 'lat': 43.75}
+        expected = {k: str(v) for k, v in params.items()}
+        result = self.run_coroutine(self.__instance.get_uvi(params))
+        self.assertEqual('http://api.openweathermap.org/data/2.5/uvi?APPID=xyz',
+                         result[0])
+        self.assertEqual(expected, result[1])
+
+    def test_get_uvi_forecast(self):
+        params = {'lon': 8.25, 'lat': 43.75}
+        expected = {k: str(v) for k, v in params.items()}
+        result = self.run_coroutine(self.__instance.get_uvi_forecast(params))
+        self.assertEqual('http://api.openweathermap.org/data/2.5/uvi/forecast?APPID=xyz',
+                         result[0])
+        self.assertEqual(expected, result[1])
+
+    def test_get_uvi_history(self):
+        params = {'lon': 8.25, 'lat': 43.75, 'start': 1498049953,
+                  'end': 1498481991}
+        expected = {k: str(v) for k, v in params.items()}
+        result = self.run_coroutine(self.__instance.get_uvi_history(params))
+        self.assertEqual('http://api.openweathermap.org/data/2.5/uvi/history?APPID=xyz',
+                         result[0])
+        self.assertEqual(expected, result[1])
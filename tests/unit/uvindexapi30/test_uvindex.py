@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import datetime
 from pyowm.weatherapi25.location import Location
@@ -89,9 +90,9 @@ class TestUVIndex(unittest.TestCase):
     # interpeter-dependant serialization of XML/JSON objects)
 
     def test_to_JSON(self):
-        ordered_base_json = ''.join(sorted(UVINDEX_JSON_DUMP))
-        ordered_actual_json = ''.join(sorted(self.__test_instance.to_JSON()))
-        self.assertEqual(ordered_base_json, ordered_actual_json)
+        # the formatting of the JSON text depends on the JSON codec backend
+        self.assertEqual(json.loads(UVINDEX_JSON_DUMP),
+                         json.loads(self.__test_instance.to_JSON()))
 
     def test_to_XML(self):
         ordered_base_xml = ''.join(sorted(UVINDEX_XML_DUMP))
@@ -1,3 +1,4 @@
+import json
 import unittest
 from pyowm.uvindexapi30.uvindex import UVIndex
 from pyowm.uvindexapi30.parsers import UVIndexListParser
@@ -26,6 +27,11 @@ class TestUVListIndexParser(unittest.TestCase):
         self.assertEqual(5, len(result))
         self.assertTrue(all([isinstance(i, UVIndex) for i in result]))
 
+    def test_parse_dict(self):
+        result = self.__instance.parse_dict(json.loads(UVINDEX_LIST_JSON))
+        self.assertEqual(5, len(result))
+        self.assertTrue(all([isinstance(i, UVIndex) for i in result]))
+
     def test_parse_JSON_fails_when_JSON_data_is_None(self):
         self.assertRaises(ParseResponseError, UVIndexListParser.parse_JSON,
                           self.__instance, None)
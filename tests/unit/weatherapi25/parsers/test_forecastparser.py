@@ -2,8 +2,10 @@
 Test case for forecastparser.py module
 """
 
+import json
 import unittest
 from pyowm.weatherapi25.parsers.forecastparser import ForecastParser
+from pyowm.weatherapi25.weather import LazyWeather
 from pyowm.exceptions.parse_response_error import ParseResponseError
 from pyowm.exceptions.api_response_error import APIResponseError
 from tests.unit.weatherapi25.json_test_responses import (
@@ -29,11 +31,32 @@ class TestForecastParser(unittest.TestCase):
         self.assertFalse(result.get_interval() is not None)
         loc = result.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         self.assertTrue(isinstance(result.get_weathers(), list))
         for weather in result:
             self.assertTrue(weather is not None)
 
+    def test_parse_dict_with_lazy_weather(self):
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        expected = self.__instance.parse_dict(data)
+        result = ForecastParser(lazy_weather=True).parse_dict(data)
+        self.assertTrue(all(isinstance(w, LazyWeather) for w in result))
+        self.assertEqual([json.loads(w.to_JSON()) for w in expected],
+                         [json.loads(w.to_JSON()) for w in result])
+
+    def test_parse_dict(self):
+        data = json.loads(THREE_HOURS_FORECAST_JSON)
+        result = self.__instance.parse_dict(data)
+        expected = self.__instance.parse_JSON(THREE_HOURS_FORECAST_JSON)
+        self.assertEqual(len(expected), len(result))
+        self.assertEqual([w.get_reference_time() for w in expected],
+                         [w.get_reference_time() for w in result])
+        self.assertEqual(json.loads(THREE_HOURS_FORECAST_JSON), data)
+
+    def test_parse_dict_fails_when_data_is_None(self):
+        self.assertRaises(ParseResponseError, ForecastParser.parse_dict,
+                          self.__instance, None)
+
     def test_parse_JSON_fails_when_JSON_data_is_None(self):
         self.assertRaises(ParseResponseError, ForecastParser.parse_JSON,
                           self.__instance, None)
@@ -1,8 +1,10 @@
 """
 Test case for observationlistparser.py module
 """
+import json
 import unittest
 from pyowm.weatherapi25.parsers.observationlistparser import ObservationListParser
+from pyowm.weatherapi25.weather import LazyWeather
 from pyowm.exceptions.parse_response_error import ParseResponseError
 from pyowm.exceptions.api_response_error import APIResponseError
 from tests.unit.weatherapi25.json_test_responses import (
@@ -18,6 +20,21 @@ class TestObservationListParser(unittest.TestCase):
     __no_items_json = '{"cod": "200", "count": "0" }'
     __404_json = '{"cod": "404" }'
 
+    def test_parse_dict(self):
+        result = self.__instance.parse_dict(json.loads(SEARCH_RESULTS_JSON))
+        expected = self.__instance.parse_JSON(SEARCH_RESULTS_JSON)
+        self.assertEqual([o.get_location().get_ID() for o in expected],
+                         [o.get_location().get_ID() for o in result])
+
+    def test_parse_dict_with_lazy_weather(self):
+        data = json.loads(SEARCH_RESULTS_JSON)
+        expected = self.__instance.parse_dict(data)
+        result = ObservationListParser(lazy_weather=True).parse_dict(data)
+        self.assertTrue(all(isinstance(o.get_weather(), LazyWeather)
+                            for o in result))
+        self.assertEqual([json.loads(o.get_weather().to_JSON()) for o in expected],
+                         [json.loads(o.get_weather().to_JSON()) for o in result])
+
     def test_parse_JSON(self):
         result = self.__instance.parse_JSON(SEARCH_RESULTS_JSON)
         self.assertFalse(result is None)
@@ -27,7 +44,7 @@ class TestObservationListParser(unittest.TestCase):
             self.assertFalse(item.get_reception_time() is None)
             loc = item.get_location()
             self.assertFalse(loc is None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertFalse(weat is None)
 
@@ -1,6 +1,7 @@
 """
 Test case for observationparser.py module
 """
+import json
 import unittest
 from pyowm.weatherapi25.parsers.observationparser import ObservationParser
 from pyowm.exceptions.parse_response_error import ParseResponseError
@@ -21,10 +22,22 @@ class TestObservationParser(unittest.TestCase):
         self.assertFalse(result.get_reception_time() is None)
         loc = result.get_location()
         self.assertFalse(loc is None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = result.get_weather()
         self.assertFalse(weat is None)
 
+    def test_parse_dict(self):
+        result = self.__instance.parse_dict(json.loads(OBSERVATION_JSON))
+        expected = self.__instance.parse_JSON(OBSERVATION_JSON)
+        self.assertEqual(expected.get_location().get_ID(),
+                         result.get_location().get_ID())
+        self.assertEqual(expected.get_weather().get_reference_time(),
+                         result.get_weather().get_reference_time())
+
+    def test_parse_dict_fails_when_data_is_None(self):
+        self.assertRaises(ParseResponseError, ObservationParser.parse_dict,
+                          self.__instance, None)
+
     def test_parse_JSON_fails_when_JSON_data_is_None(self):
         self.assertRaises(ParseResponseError, ObservationParser.parse_JSON,
                           self.__instance, None)
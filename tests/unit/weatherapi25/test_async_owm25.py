@@ -0,0 +1,215 @@
+"""
+Test case for async_owm25.py module.
+API calls are mocked by replacing the coroutine issuing them on the
+AsyncHttpClient instance shared by all the API clients.
+"""
+
+import asyncio
+import json
+import unittest
+from tests.unit.weatherapi25.json_test_responses import (
+    OBSERVATION_JSON, SEARCH_RESULTS_JSON, THREE_HOURS_FORECAST_JSON,
+    DAILY_FORECAST_JSON, CITY_WEATHER_HISTORY_JSON, STATION_WEATHER_HISTORY_JSON,
+    THREE_HOURS_FORECAST_NOT_FOUND_JSON)
+from tests.unit.uvindexapi30.test_uvindexparser import UVINDEX_JSON
+from tests.unit.uvindexapi30.test_uvindexlistparser import UVINDEX_LIST_JSON
+from tests.unit.pollutionapi30.test_parsers import COINDEX_JSON, OZONE_JSON
+from pyowm.caches.lrucache import LRUCache
+from pyowm.weatherapi25.async_owm25 import AsyncOWM25
+from pyowm.weatherapi25.configuration25 import parsers
+from pyowm.exceptions.api_call_error import APICallTimeoutError
+from pyowm.weatherapi25.forecaster import Forecaster
+from pyowm.weatherapi25.historian import Historian
+from pyowm.weatherapi25.observation import Observation
+from pyowm.weatherapi25.weather import Weather
+from pyowm.uvindexapi30.uvindex import UVIndex
+from pyowm.pollutionapi30.coindex import COIndex
+from pyowm.pollutionapi30.ozone import Ozone
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class MockSession:
+    async def close(self):
+        pass
+
+
+class TestAsyncOWM25(unittest.TestCase):
+
+    def new_instance(self, payload):
+        instance = AsyncOWM25(parsers, 'test_API_key', session=MockSession())
+        calls = []
+
+        async def mock_cacheable_get_json(uri, params=None, headers=None):
+            calls.append((uri, params))
+            if isinstance(payload, Exception):
+                raise payload
+            return 200, json.loads(payload)
+
+        instance._wapi.cacheable_get_json = mock_cacheable_get_json
+        return instance, calls
+
+    def test_is_API_online(self):
+        instance, _ = self.new_instance(OBSERVATION_JSON)
+        self.assertTrue(run(instance.is_API_online()))
+        instance, _ = self.new_instance(APICallTimeoutError('timeout'))
+        self.assertFalse(run(instance.is_API_online()))
+
+    def test_weather_at_id(self):
+        instance, calls = self.new_instance(OBSERVATION_JSON)
+        result = run(instance.weather_at_id(5128581))
+        self.assertIsInstance(result, Observation)
+        uri, params = calls[0]
+        self.assertEqual('http://api.openweathermap.org/data/2.5/weather?APPID=test_API_key', uri)
+        self.assertEqual({'id': 5128581, 'lang': 'en'}, params)
+
+    def test_weather_at_id_fails_with_wrong_parameters(self):
+        instance, calls = self.new_instance(OBSERVATION_JSON)
+        self.assertRaises(ValueError, run, instance.weather_at_id(-1))
+        self.assertRaises(AssertionError, run, instance.weather_at_id('1'))
+        self.assertEqual([], calls)
+
+    def test_weather_at_coords_fails_with_wrong_parameters(self):
+        instance, _ = self.new_instance(OBSERVATION_JSON)
+        self.assertRaises(ValueError, run, instance.weather_at_coords(43.7, -200.0))
+        self.assertRaises(ValueError, run, instance.weather_at_coords(200, 2.5))
+
+    def test_weather_around_coords(self):
+        instance, calls = self.new_instance(SEARCH_RESULTS_JSON)
+        result = run(instance.weather_around_coords(57.0, -2.15, limit=2))
+        self.assertTrue(all(isinstance(i, Observation) for i in result))
+        self.assertEqual(2, calls[0][1]['cnt'])
+
+    def test_many_concurrent_calls(self):
+        instance, calls = self.new_instance(OBSERVATION_JSON)
+
+        async def gather():
+            return await asyncio.gather(*[instance.weather_at_id(i)
+                                          for i in range(50)])
+
+        results = run(gather())
+        self.assertEqual(50, len(results))
+        self.assertTrue(all(isinstance(i, Observation) for i in results))
+        self.assertEqual(list(range(50)), [c[1]['id'] for c in calls])
+
+    def test_three_hours_forecast_at_coords(self):
+        instance, _ = self.new_instance(THREE_HOURS_FORECAST_JSON)
+        result = run(instance.three_hours_forecast_at_coords(51.50853, -0.12574))
+        self.assertIsInstance(result, Forecaster)
+        self.assertEqual('3h', result.get_forecast().get_interval())
+
+    def test_three_hours_forecast_when_not_found(self):
+        instance, _ = self.new_instance(THREE_HOURS_FORECAST_NOT_FOUND_JSON)
+        self.assertIsNone(run(instance.three_hours_forecast('London,uk')))
+
+    def test_daily_forecast_at_id(self):
+        instance, calls = self.new_instance(DAILY_FORECAST_JSON)
+        result = run(instance.daily_forecast_at_id(2643743, limit=3))
+        self.assertIsInstance(result, Forecaster)
+        self.assertEqual('daily', result.get_forecast().get_interval())
+        self.assertEqual(3, calls[0][1]['cnt'])
+        self.assertRaises(ValueError, run, instance.daily_forecast_at_id(2643743, limit=0))
+
+    def test_weather_history_at_place(self):
+        instance, calls = self.new_instance(CITY_WEATHER_HISTORY_JSON)
+        result = run(instance.weather_history_at_place('London,uk', 1234567, 1234678))
+        self.assertTrue(all(isinstance(i, Weather) for i in result))
+        self.assertEqual('1234567', calls[0][1]['start'])
+        self.assertRaises(ValueError, run,
+                          instance.weather_history_at_place('London,uk', 1234567))
+        self.assertRaises(ValueError, run,
+                          instance.weather_history_at_place('London,uk', 1234678, 1234567))
+
+    def test_station_hour_history(self):
+        instance, _ = self.new_instance(STATION_WEATHER_HISTORY_JSON)
+        result = run(instance.station_hour_history(1234))
+        self.assertIsInstance(result, Historian)
+        station_history = result.get_station_history()
+        self.assertEqual(1234, station_history.get_station_ID())
+        self.assertEqual('hour', station_history.get_interval())
+
+    def test_uvindex_around_coords(self):
+        instance, calls = self.new_instance(UVINDEX_JSON)
+        result = run(instance.uvindex_around_coords(45, 9))
+        self.assertIsInstance(result, UVIndex)
+        self.assertEqual('http://api.openweathermap.org/data/2.5/uvi?APPID=test_API_key',
+                         calls[0][0])
+
+    def test_uvindex_forecast_around_coords(self):
+        instance, _ = self.new_instance(UVINDEX_LIST_JSON)
+        result = run(instance.uvindex_forecast_around_coords(45, 9))
+        self.assertTrue(all(isinstance(i, UVIndex) for i in result))
+
+    def test_coindex_around_coords(self):
+        instance, calls = self.new_instance(COINDEX_JSON)
+        result = run(instance.coindex_around_coords(45, 9))
+        self.assertIsInstance(result, COIndex)
+        self.assertEqual('year', result.get_interval())
+        self.assertTrue(calls[0][0].startswith(
+            'http://api.openweathermap.org/pollution/v1/co/45,9/current.json'))
+
+    def test_ozone_around_coords(self):
+        instance, _ = self.new_instance(OZONE_JSON)
+        result = run(instance.ozone_around_coords(45, 9, start=1463041620,
+                                                  interval='day'))
+        self.assertIsInstance(result, Ozone)
+
+    def test_weather_at_ids(self):
+        instance = AsyncOWM25(parsers, 'test_API_key', cache=LRUCache(),
+                              session=MockSession())
+        requested_chunks = []
+
+        async def mock_get_json(uri, params=None, headers=None):
+            ids = [int(i) for i in params['id'].split(',')]
+            requested_chunks.append(ids)
+            data = json.loads(SEARCH_RESULTS_JSON)
+            template = data['list'][0]
+            data['list'] = [dict(template, id=i) for i in ids]
+            data['count'] = len(ids)
+            return 200, data
+
+        instance._wapi.get_json = mock_get_json
+        ids = list(range(1, 46))
+        result = run(instance.weather_at_ids(ids))
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        self.assertEqual([20, 20, 5],
+                         sorted([len(c) for c in requested_chunks], reverse=True))
+        # observations are cached and shared with weather_at_id
+        del requested_chunks[:]
+        run(instance.weather_at_ids([45, 46]))
+        self.assertEqual([[46]], requested_chunks)
+        self.assertIsInstance(run(instance.weather_at_id(45)), Observation)
+
+    def test_weather_at_ids_fails_with_wrong_parameters(self):
+        instance, _ = self.new_instance(SEARCH_RESULTS_JSON)
+        self.assertRaises(AssertionError, run, instance.weather_at_ids('1'))
+        self.assertRaises(ValueError, run, instance.weather_at_ids([-1]))
+
+    def test_weather_at_ids_many(self):
+        instance, calls = self.new_instance(OBSERVATION_JSON)
+        results = run(instance.weather_at_ids_many([1, -2, 3], max_workers=2))
+        self.assertEqual([1, -2, 3], [r.query for r in results])
+        self.assertTrue(results[0].is_success())
+        self.assertIsInstance(results[0].result, Observation)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(2, len(calls))
+
+    def test_bulk_calls_fail_with_wrong_max_workers(self):
+        instance, _ = self.new_instance(OBSERVATION_JSON)
+        self.assertRaises(AssertionError, run,
+                          instance.weather_at_ids_many([1], max_workers=0))
+
+    def test_context_manager_closes_client(self):
+        instance, _ = self.new_instance(OBSERVATION_JSON)
+
+        async def use():
+            async with instance as owm:
+                return await owm.weather_at_place('London,uk')
+
+        self.assertIsInstance(run(use()), Observation)
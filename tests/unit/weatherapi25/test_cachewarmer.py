@@ -0,0 +1,195 @@
+"""
+Test case for cachewarmer.py module.
+Here we don't use mock objects because we don't want to rely on external
+mocking libraries; we use monkey patching instead.
+"""
+
+import json
+import time
+import unittest
+from contextlib import contextmanager
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.ttlpolicy import TTLPolicy
+from pyowm.commons.http_client import HttpClient
+from pyowm.weatherapi25 import cachewarmer
+from pyowm.weatherapi25.cachewarmer import CacheWarmer
+from pyowm.weatherapi25.configuration25 import parsers, OBSERVATION_URL, \
+    THREE_HOURS_FORECAST_URL
+from pyowm.weatherapi25.owm25 import OWM25
+from tests.unit.weatherapi25.json_test_responses import SEARCH_RESULTS_JSON
+
+
+class MockOWM(object):
+
+    def __init__(self, tick=lambda: None):
+        self.tick = tick  # each query takes a tick of time
+        self.queries = []
+        self.refreshing = False
+        self.failing = False
+
+    @contextmanager
+    def refreshing_cache(self):
+        self.refreshing = True
+        yield
+        self.refreshing = False
+
+    def _query(self, name, *args):
+        assert self.refreshing
+        self.queries.append((name,) + args)
+        self.tick()
+        if self.failing:
+            raise Exception('failure')
+
+    def weather_at_ids(self, ids, max_workers=None):
+        self._query('weather_at_ids', ids)
+
+    def weather_at_coords(self, lat, lon):
+        self._query('weather_at_coords', lat, lon)
+
+    def weather_at_place(self, name):
+        self._query('weather_at_place', name)
+
+    def three_hours_forecast_at_id(self, id):
+        self._query('three_hours_forecast_at_id', id)
+
+    def three_hours_forecast_at_coords(self, lat, lon):
+        self._query('three_hours_forecast_at_coords', lat, lon)
+
+    def three_hours_forecast(self, name):
+        self._query('three_hours_forecast', name)
+
+    def uvindex_around_coords(self, lat, lon):
+        self._query('uvindex_around_coords', lat, lon)
+
+
+class TestCacheWarmer(unittest.TestCase):
+
+    __ttl_policy = TTLPolicy({OBSERVATION_URL: 10 * 60 * 1000,
+                              THREE_HOURS_FORECAST_URL: 60 * 60 * 1000})
+
+    def setUp(self):
+        self.now = 1000.
+        self.original_monotonic = cachewarmer.monotonic
+        cachewarmer.monotonic = lambda: self.now
+
+    def tick(self):
+        self.now += 1
+
+    def tearDown(self):
+        cachewarmer.monotonic = self.original_monotonic
+
+    def test_init_fails_with_wrong_parameters(self):
+        owm = MockOWM(self.tick)
+        self.assertRaises(AssertionError, CacheWarmer, owm, endpoints=['daily'])
+        self.assertRaises(AssertionError, CacheWarmer, owm, calls_per_minute=0)
+        self.assertRaises(AssertionError, CacheWarmer, owm, lead_millis=-1)
+
+    def test_queries(self):
+        owm = MockOWM(self.tick)
+        instance = CacheWarmer(owm, ids=list(range(45)), coords=[(45., 9.)],
+                               places=['London,GB'],
+                               endpoints=['weather', 'forecast', 'uvindex'],
+                               ttl_policy=self.__ttl_policy)
+        # 3 group calls + 1 + 1 for weather, 45 + 1 + 1 for forecasts, 1 for UV
+        self.assertEqual(53, instance.queries())
+        self.assertEqual(53, instance.run_pending())
+        names = [query[0] for query in owm.queries]
+        self.assertEqual([list(range(20)), list(range(20, 40)), list(range(40, 45))],
+                         [query[1] for query in owm.queries
+                          if query[0] == 'weather_at_ids'])
+        self.assertEqual(45, names.count('three_hours_forecast_at_id'))
+        self.assertIn(('uvindex_around_coords', 45., 9.), owm.queries)
+        self.assertIn(('three_hours_forecast', 'London,GB'), owm.queries)
+        self.assertEqual(0, instance.run_pending())
+
+    def test_refreshes_ahead_of_expiry(self):
+        owm = MockOWM(self.tick)
+        instance = CacheWarmer(owm, ids=[1], endpoints=['weather', 'forecast'],
+                               ttl_policy=self.__ttl_policy,
+                               lead_millis=60 * 1000)
+        self.assertEqual(2, instance.run_pending())
+        self.now += 8 * 60
+        self.assertEqual(0, instance.run_pending())
+        self.now += 60
+        self.assertEqual(1, instance.run_pending())
+        self.assertEqual(('weather_at_ids', [1]), owm.queries[-1])
+        self.now += 50 * 60
+        self.assertEqual(2, instance.run_pending())
+        self.assertEqual(('three_hours_forecast_at_id', 1), owm.queries[-1])
+
+    def test_lead_is_bounded_by_half_of_the_lifetime(self):
+        instance = CacheWarmer(MockOWM(), ids=[1], endpoints=['weather'],
+                               default_lifetime_millis=60 * 1000,
+                               ttl_policy=None, lead_millis=10 * 60 * 1000)
+        self.assertEqual(2., instance.required_calls_per_minute())
+
+    def test_calls_per_minute_are_respected(self):
+        owm = MockOWM(self.tick)
+        instance = CacheWarmer(owm, ids=list(range(100)), endpoints=['forecast'],
+                               ttl_policy=self.__ttl_policy, calls_per_minute=30)
+        self.assertEqual(1, instance.run_pending())
+        self.assertEqual(0, instance.run_pending())
+        self.now += 1
+        self.assertEqual(1, instance.run_pending())
+        self.now += 60
+        self.assertEqual(1, instance.run_pending())
+        self.assertEqual([0, 1, 2], [query[1] for query in owm.queries])
+        self.assertAlmostEqual(100 / 59., instance.required_calls_per_minute())
+
+    def test_failed_queries_are_retried(self):
+        owm = MockOWM(self.tick)
+        owm.failing = True
+        instance = CacheWarmer(owm, places=['London,GB'], endpoints=['weather'],
+                               ttl_policy=self.__ttl_policy,
+                               retry_millis=30 * 1000)
+        self.assertEqual(1, instance.run_pending())
+        self.assertEqual(1, instance.failures())
+        owm.failing = False
+        self.now += 30
+        self.assertEqual(1, instance.run_pending())
+        self.assertEqual(1, instance.failures())
+        self.assertEqual(2, len(owm.queries))
+
+    def test_start_and_stop(self):
+        cachewarmer.monotonic = self.original_monotonic
+        owm = MockOWM()
+        instance = CacheWarmer(owm, ids=[1], endpoints=['weather'])
+        self.assertFalse(instance.is_running())
+        instance.start()
+        instance.start()
+        self.assertTrue(instance.is_running())
+        deadline = time.time() + 5
+        while not owm.queries and time.time() < deadline:
+            time.sleep(0.01)
+        instance.stop()
+        instance.stop()
+        self.assertFalse(instance.is_running())
+        self.assertEqual([('weather_at_ids', [1])], owm.queries)
+
+    def test_refreshes_fresh_cached_responses(self):
+        cache = LRUCache()
+        owm = OWM25(parsers, 'test_API_key', cache=cache)
+        names = iter(['Old', 'New'])
+
+        def mock_get_json(_, uri, params=None, headers=None):
+            data = json.loads(SEARCH_RESULTS_JSON)
+            data['list'] = data['list'][:1]
+            data['list'][0]['name'] = next(names)
+            return 200, data
+
+        original_get_json = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        city_id = json.loads(SEARCH_RESULTS_JSON)['list'][0]['id']
+        instance = CacheWarmer(owm, ids=[city_id], endpoints=['weather'])
+        instance.run_pending()
+        self.now += 10 * 60
+        instance.run_pending()
+        obs = owm.weather_at_id(city_id)
+        HttpClient.get_json = original_get_json
+        self.assertEqual('New', obs.get_location().get_name())
+        # the group response and the observation
+        self.assertEqual(2, cache.size())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 Test case for forecast.py module
 """
 
+import copy
+import json
 import unittest
 from datetime import datetime
 from pyowm.weatherapi25.location import Location
@@ -38,6 +40,18 @@ class TestForecast(unittest.TestCase):
     __test_instance = Forecast("daily", __test_reception_time, __test_location,
                                __test_weathers)
 
+    def test_copy(self):
+        f = Forecast("daily", self.__test_reception_time, self.__test_location,
+                     list(self.__test_weathers))
+        c = copy.copy(f)
+        self.assertEqual(f.to_JSON(), c.to_JSON())
+        self.assertIs(f.get(0), c.get(0))
+        c.set_interval("3h")
+        c.actualize()
+        self.assertEqual("daily", f.get_interval())
+        self.assertEqual(self.__test_n_weathers, len(f))
+        self.assertLess(len(c), len(f))
+
     def test_actualize(self):
         weathers = [Weather(1378459200, 1378496400, 1378449600, 67,
             {"all": 20}, {"all": 0}, {"deg": 252.002, "speed": 1.100}, 57,
@@ -129,9 +143,9 @@ class TestForecast(unittest.TestCase):
     # interpeter-dependant serialization of XML/JSON objects)
 
     def test_to_JSON(self):
-        ordered_base_json = ''.join(sorted(FORECAST_JSON_DUMP))
-        ordered_actual_json = ''.join(sorted(self.__test_instance.to_JSON()))
-        self.assertEqual(ordered_base_json, ordered_actual_json)
+        # the formatting of the JSON text depends on the JSON codec backend
+        self.assertEqual(json.loads(FORECAST_JSON_DUMP),
+                         json.loads(self.__test_instance.to_JSON()))
 
     def test_to_XML(self):
         ordered_base_xml = ''.join(sorted(FORECAST_XML_DUMP))
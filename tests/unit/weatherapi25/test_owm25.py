@@ -13,7 +13,11 @@ Monkey patching pattern:
 """
 
 import unittest
+import threading
 import time
+import json
+from urllib.parse import urlsplit, parse_qsl
+import requests
 from tests.unit.weatherapi25.json_test_responses import (OBSERVATION_JSON,
                                                          SEARCH_RESULTS_JSON, THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON,
                                                          THREE_HOURS_FORECAST_AT_COORDS_JSON, DAILY_FORECAST_AT_COORDS_JSON,
@@ -29,6 +33,9 @@ from tests.unit.pollutionapi30.test_parsers import COINDEX_JSON, OZONE_JSON, NO2
 from pyowm.weatherapi25.owm25 import OWM25
 from pyowm.constants import PYOWM_VERSION
 from pyowm.commons.http_client import HttpClient
+from pyowm.caches.lrucache import LRUCache
+from pyowm.caches.stripedlrucache import StripedLRUCache
+from pyowm.caches.objectcache import ObjectCache
 from pyowm.uvindexapi30.uv_client import UltraVioletHttpClient
 from pyowm.pollutionapi30.airpollution_client import AirPollutionHttpClient
 from pyowm.exceptions.api_call_error import APICallTimeoutError
@@ -79,91 +86,94 @@ class TestOWM25(unittest.TestCase):
 
     # Mock functions
     def mock_api_call_returning_single_obs(self, uri, params=None, headers=None):
-        return 200, OBSERVATION_JSON
+        return 200, json.loads(OBSERVATION_JSON)
 
     def mock_api_call_returning_single_station_obs(self, uri, params=None, headers=None):
-        return 200, STATION_OBSERVATION_JSON
+        return 200, json.loads(STATION_OBSERVATION_JSON)
 
     def mock_api_call_ping(self, uri, params=None, headers=None):
-        return 200, OBSERVATION_JSON
+        return 200, json.loads(OBSERVATION_JSON)
 
     def mock_api_call_failing_ping(self, uri, params=None, headers=None):
         raise APICallTimeoutError('timeout')
 
     def mock_api_call_returning_multiple_obs(self, uri, params=None, headers=None):
-        return 200, SEARCH_RESULTS_JSON
+        return 200, json.loads(SEARCH_RESULTS_JSON)
+
+    def mock_api_call_returning_multiple_obs_dict(self, uri, params=None, headers=None):
+        return 200, json.loads(SEARCH_RESULTS_JSON)
 
     def mock_api_call_returning_3h_forecast(self, uri, params=None, headers=None):
-        return 200, THREE_HOURS_FORECAST_JSON
+        return 200, json.loads(THREE_HOURS_FORECAST_JSON)
 
     def mock_api_call_returning_empty_3h_forecast(self, uri, params=None, headers=None):
-        return 200, THREE_HOURS_FORECAST_NOT_FOUND_JSON
+        return 200, json.loads(THREE_HOURS_FORECAST_NOT_FOUND_JSON)
 
     def mock_api_call_returning_empty_daily_forecast(self, uri, params=None, headers=None):
-        return 200, DAILY_FORECAST_NOT_FOUND_JSON
+        return 200, json.loads(DAILY_FORECAST_NOT_FOUND_JSON)
 
     def mock_api_call_returning_3h_forecast_at_coords(self,uri, params=None, headers=None):
-        return 200, THREE_HOURS_FORECAST_AT_COORDS_JSON
+        return 200, json.loads(THREE_HOURS_FORECAST_AT_COORDS_JSON)
 
     def mock_api_call_returning_3h_forecast_at_id(self, uri, params=None, headers=None):
-        return 200, THREE_HOURS_FORECAST_AT_ID_JSON
+        return 200, json.loads(THREE_HOURS_FORECAST_AT_ID_JSON)
 
     def mock_api_call_returning_daily_forecast(self, uri, params=None, headers=None):
-        return 200, DAILY_FORECAST_JSON
+        return 200, json.loads(DAILY_FORECAST_JSON)
 
     def mock_api_call_returning_daily_forecast_at_coords(self, uri, params=None, headers=None):
-        return 200, DAILY_FORECAST_AT_COORDS_JSON
+        return 200, json.loads(DAILY_FORECAST_AT_COORDS_JSON)
 
     def mock_api_call_returning_daily_forecast_at_id(self, uri, params=None, headers=None):
-        return 200, DAILY_FORECAST_AT_ID_JSON
+        return 200, json.loads(DAILY_FORECAST_AT_ID_JSON)
 
     def mock_api_call_returning_city_weather_history(self, uri, params=None, headers=None):
-        return 200, CITY_WEATHER_HISTORY_JSON
+        return 200, json.loads(CITY_WEATHER_HISTORY_JSON)
 
     def mock_api_call_returning_station_tick_weather_history(self, uri, params=None, headers=None):
-        return 200, STATION_TICK_WEATHER_HISTORY_JSON
+        return 200, json.loads(STATION_TICK_WEATHER_HISTORY_JSON)
 
     def mock_api_call_returning_station_hour_weather_history(self, uri, params=None, headers=None):
-        return 200, STATION_WEATHER_HISTORY_JSON
+        return 200, json.loads(STATION_WEATHER_HISTORY_JSON)
 
     def mock_call_api_returning_station_day_weather_history(self, uri, params=None, headers=None):
-        return 200, STATION_WEATHER_HISTORY_JSON
+        return 200, json.loads(STATION_WEATHER_HISTORY_JSON)
 
     def mock_call_api_returning_station_history_with_no_items(self, uri, params=None, headers=None):
-        return 200, STATION_HISTORY_NO_ITEMS_JSON
+        return 200, json.loads(STATION_HISTORY_NO_ITEMS_JSON)
 
     def mock_api_call_returning_weather_at_stations_in_bbox(self, uri, params=None, headers=None):
-        return 200, WEATHER_AT_STATION_IN_BBOX_JSON
+        return 200, json.loads(WEATHER_AT_STATION_IN_BBOX_JSON)
 
     def mock_api_call_returning_weather_at_places_in_bbox(self, uri, params=None, headers=None):
-        return 200, WEATHER_AT_PLACES_IN_BBOX_JSON
+        return 200, json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON)
 
     def mock_api_call_returning_station_at_coords(self, uri, params=None, headers=None):
-        return 200, STATION_AT_COORDS_JSON
+        return 200, json.loads(STATION_AT_COORDS_JSON)
 
     def mock_api_call_returning_weather_history_at_coords(self, uri, params=None, headers=None):
-        return 200, CITY_WEATHER_HISTORY_JSON
+        return 200, json.loads(CITY_WEATHER_HISTORY_JSON)
 
     def mock_get_uvi_returning_uvindex_around_coords(self, params_dict):
-        return UVINDEX_JSON
+        return json.loads(UVINDEX_JSON)
 
     def mock_get_uvi_forecast(self, params_dict):
-        return UVINDEX_LIST_JSON
+        return json.loads(UVINDEX_LIST_JSON)
 
     def mock_get_uvi_history(self, params_dict):
-        return UVINDEX_LIST_JSON
+        return json.loads(UVINDEX_LIST_JSON)
 
     def mock_get_coi_returning_coindex_around_coords(self, params_dict):
-        return COINDEX_JSON
+        return json.loads(COINDEX_JSON)
 
     def mock_get_o3_returning_coindex_around_coords(self, params_dict):
-        return OZONE_JSON
+        return json.loads(OZONE_JSON)
 
     def mock_get_no2_returning_no2index_around_coords(self, params_dict):
-        return NO2INDEX_JSON
+        return json.loads(NO2INDEX_JSON)
 
     def mock_get_so2_returning_so2index_around_coords(self, params_dict):
-        return SO2INDEX_JSON
+        return json.loads(SO2INDEX_JSON)
 
     # Tests
 
@@ -200,7 +210,7 @@ class TestOWM25(unittest.TestCase):
         HttpClient.cacheable_get_json = \
             self.mock_api_call_ping
         result = self.__test_instance.is_API_online()
-        HttpClient.call_API = original_func
+        HttpClient.cacheable_get_json = original_func
         self.assertTrue(result)
 
     def test_is_API_online_failure(self):
@@ -225,6 +235,148 @@ class TestOWM25(unittest.TestCase):
         self.assertTrue(result is not None)
         self.assertIsInstance(result, AlertManager)
 
+    def test_managers_share_session(self):
+        session = HttpClient.pooled_session()
+        instance = OWM25(self.__test_parsers, 'test_API_key', session=session)
+        self.assertIs(session, instance._wapi.session)
+        self.assertIs(session, instance.stations_manager().http_client.session)
+        self.assertIs(session, instance.alert_manager().http_client.session)
+        self.assertIs(session, instance.agro_manager().http_client.session)
+        self.assertIs(session, instance.tile_manager('temp_new').http_client.session)
+
+    def test_negative_cache(self):
+        negative_cache = LRUCache()
+        instance = OWM25(self.__test_parsers, 'test_API_key',
+                         negative_cache=negative_cache)
+        self.assertIs(negative_cache, instance._wapi.negative_cache)
+
+    def test_object_cache(self):
+        object_cache = ObjectCache()
+        instance = OWM25(self.__test_parsers, 'test_API_key', cache=LRUCache(),
+                         object_cache=object_cache)
+        fetched = []
+
+        def mock_get_json(_, uri, params=None, headers=None):
+            fetched.append(uri)
+            return 200, json.loads(THREE_HOURS_FORECAST_JSON)
+
+        ref_to_original_call_API = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        try:
+            first = instance.three_hours_forecast('London,uk')
+            first.get_forecast().set_interval('daily')
+            first.get_forecast().actualize()
+            second = instance.three_hours_forecast('London,uk')
+        finally:
+            HttpClient.get_json = ref_to_original_call_API
+        self.assertEqual(1, len(fetched))
+        self.assertEqual(dict(hits=1, misses=1, size=1), object_cache.stats())
+        self.assertEqual('3h', second.get_forecast().get_interval())
+        self.assertEqual(len(json.loads(THREE_HOURS_FORECAST_JSON)['list']),
+                         len(second.get_forecast()))
+
+    def test_cache_keys_of_all_endpoints(self):
+        endpoint_calls = [
+            ('is_API_online', ()),
+            ('weather_at_place', ('London,GB',)),
+            ('weather_at_coords', (51.5, -0.12)),
+            ('weather_at_zip_code', ('2000', 'AU')),
+            ('weather_at_id', (2643743,)),
+            ('weather_at_ids', ([2643743],)),
+            ('weather_at_places', ('London', 'accurate', 3)),
+            ('weather_at_station', (1000,)),
+            ('weather_at_stations_in_bbox', (49.07, 8.87, 61.26, 65.21)),
+            ('weather_at_places_in_bbox', (0.73, 38.42, 1.96, 39.39)),
+            ('weather_around_coords', (51.5, -0.12, 3)),
+            ('three_hours_forecast', ('London,GB',)),
+            ('three_hours_forecast_at_coords', (51.5, -0.12)),
+            ('three_hours_forecast_at_id', (2643743,)),
+            ('daily_forecast', ('London,GB', 3)),
+            ('daily_forecast_at_coords', (51.5, -0.12, 3)),
+            ('daily_forecast_at_id', (2643743, 3)),
+            ('weather_history_at_place', ('London,GB', 1000, 2000)),
+            ('weather_history_at_coords', (51.5, -0.12, 1000, 2000)),
+            ('weather_history_at_id', (2643743, 1000, 2000)),
+            ('station_at_coords', (51.5, -0.12, 3)),
+            ('station_tick_history', (1000, 3)),
+            ('station_hour_history', (1000, 3)),
+            ('station_day_history', (1000, 3)),
+            ('uvindex_around_coords', (45, 9)),
+            ('uvindex_forecast_around_coords', (45, 9)),
+            ('uvindex_history_around_coords', (45, 9, 1498049953, 1498481991)),
+            ('coindex_around_coords', (45, 9)),
+            ('ozone_around_coords', (45, 9)),
+            ('no2index_around_coords', (45, 9)),
+            ('so2index_around_coords', (45, 9))]
+
+        class KeyCaptured(Exception):
+            pass
+
+        def capture(instance, uri, params=None, headers=None):
+            raise KeyCaptured(HttpClient.cache_key(uri, params=params))
+
+        def capture_cached(instance, cache_key, stale=False, upstream_failed=False):
+            raise KeyCaptured(cache_key)
+
+        def capture_cached_many(instance, cache_keys):
+            raise KeyCaptured(cache_keys[0])
+
+        def cache_keys(owm):
+            keys = dict()
+            for name, args in endpoint_calls:
+                try:
+                    getattr(owm, name)(*args)
+                except KeyCaptured as e:
+                    keys[name] = e.args[0]
+            return keys
+
+        original_cacheable_get_json = HttpClient.cacheable_get_json
+        original_get_cached_json = HttpClient.get_cached_json
+        original_get_cached_json_many = HttpClient.get_cached_json_many
+        HttpClient.cacheable_get_json = capture
+        HttpClient.get_cached_json = capture_cached
+        HttpClient.get_cached_json_many = capture_cached_many
+        try:
+            keys_matrix = [
+                cache_keys(OWM25(self.__test_parsers, 'key1')),
+                cache_keys(OWM25(self.__test_parsers, 'key2', subscription_type='pro')),
+                cache_keys(OWM25(self.__test_parsers, 'key3', use_ssl=True)),
+                cache_keys(OWM25(self.__test_parsers, 'key4', subscription_type='pro',
+                                 use_ssl=True))]
+        finally:
+            HttpClient.cacheable_get_json = original_cacheable_get_json
+            HttpClient.get_cached_json = original_get_cached_json
+            HttpClient.get_cached_json_many = original_get_cached_json_many
+        keys = keys_matrix[0]
+        self.assertEqual(sorted(name for name, _ in endpoint_calls), sorted(keys))
+        for other_keys in keys_matrix[1:]:
+            self.assertEqual(keys, other_keys)
+        # is_API_online and weather_at_place look up the same response
+        self.assertEqual(len(keys) - 1, len(set(keys.values())))
+        for key in keys.values():
+            self.assertFalse('appid' in key.lower())
+            self.assertFalse('://pro.' in key)
+            self.assertTrue(key.startswith('http://'))
+            names = [name for name, _ in parse_qsl(urlsplit(key).query)]
+            self.assertEqual(sorted(names), names)
+
+    def test_cache_stats(self):
+        cache = LRUCache()
+        negative_cache = LRUCache()
+        instance = OWM25(self.__test_parsers, 'test_API_key', cache=cache,
+                         negative_cache=negative_cache)
+        cache.set('http://api.openweathermap.org/data/2.5/weather?id=1', {})
+        cache.get('http://api.openweathermap.org/data/2.5/weather?id=1')
+        negative_cache.get('http://api.openweathermap.org/data/2.5/weather?q=x')
+        stats = instance.cache_stats(reset=True)
+        self.assertEqual(1, stats['endpoints']['/data/2.5/weather']['hits'])
+        self.assertEqual(0, instance.cache_stats()['total']['hits'])
+        self.assertEqual(1, instance.negative_cache_stats()['total']['misses'])
+
+    def test_default_session_is_pooled(self):
+        instance = OWM25(self.__test_parsers, 'test_API_key')
+        self.assertIsInstance(instance._wapi.session, requests.Session)
+
     def test_get_API_version(self):
         self.assertEqual(self.__test_instance.OWM_API_VERSION,
                          self.__test_instance.get_API_version())
@@ -247,7 +399,7 @@ class TestOWM25(unittest.TestCase):
         self.assertTrue(result.get_reception_time() is not None)
         loc = result.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = result.get_weather()
         self.assertTrue(weat is not None)
 
@@ -265,7 +417,7 @@ class TestOWM25(unittest.TestCase):
         self.assertTrue(result.get_reception_time() is not None)
         loc = result.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = result.get_weather()
         self.assertTrue(weat is not None)
 
@@ -279,7 +431,7 @@ class TestOWM25(unittest.TestCase):
         self.assertTrue(result.get_reception_time() is not None)
         loc = result.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = result.get_weather()
         self.assertTrue(weat is not None)
 
@@ -306,7 +458,7 @@ class TestOWM25(unittest.TestCase):
         self.assertTrue(result.get_reception_time() is not None)
         loc = result.get_location()
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
         weat = result.get_weather()
         self.assertTrue(weat is not None)
 
@@ -315,17 +467,115 @@ class TestOWM25(unittest.TestCase):
                           self.__test_instance, -156667)
 
     def test_weather_at_ids(self):
-        ref_to_original_call_API = HttpClient.cacheable_get_json
-        HttpClient.cacheable_get_json = \
-            self.mock_api_call_returning_multiple_obs
-        result = self.__test_instance.weather_at_ids([5128581, 15647, 78654])
-        HttpClient.cacheable_get_json = ref_to_original_call_API
+        ref_to_original_call_API = HttpClient.get_json
+        HttpClient.get_json = \
+            self.mock_api_call_returning_multiple_obs_dict
+        result = self.__test_instance.weather_at_ids([2943743, 15647, 2643743])
+        HttpClient.get_json = ref_to_original_call_API
         self.assertTrue(isinstance(result, list))
+        self.assertEqual(2, len(result))
         for obs in result:
             self.assertTrue(obs is not None)
             self.assertTrue(isinstance(obs, Observation))
             weat = obs.get_weather()
             self.assertTrue(weat is not None)
+        # results follow the order of the requested IDs
+        self.assertEqual([2943743, 2643743],
+                         [obs.get_location().get_ID() for obs in result])
+
+    def _weather_at_ids_in_chunks(self, instance, ids, **kwargs):
+        # returns the result along with the requested chunks and the threads
+        # which requested them
+        requested_chunks = []
+        threads = set()
+
+        def mock_get_json(_, uri, params=None, headers=None):
+            ids = [int(i) for i in params['id'].split(',')]
+            requested_chunks.append(ids)
+            threads.add(threading.current_thread())
+            data = json.loads(SEARCH_RESULTS_JSON)
+            template = data['list'][0]
+            data['list'] = [dict(template, id=i) for i in ids]
+            data['count'] = len(ids)
+            return 200, data
+
+        ref_to_original_call_API = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        try:
+            result = instance.weather_at_ids(ids, **kwargs)
+        finally:
+            HttpClient.get_json = ref_to_original_call_API
+        return result, requested_chunks, threads
+
+    def test_weather_at_ids_splits_ids_into_chunks(self):
+        ids = list(range(1, 46))
+        result, requested_chunks, threads = \
+            self._weather_at_ids_in_chunks(self.__test_instance, ids)
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        # chunks are queried one after the other by default
+        self.assertEqual([20, 20, 5], [len(c) for c in requested_chunks])
+        self.assertEqual({threading.current_thread()}, threads)
+
+    def test_weather_at_ids_queries_chunks_concurrently_on_thread_safe_caches(self):
+        instance = OWM25(self.__test_parsers, 'test_API_key',
+                         cache=StripedLRUCache(100))
+        ids = list(range(1, 46))
+        result, requested_chunks, threads = \
+            self._weather_at_ids_in_chunks(instance, ids, max_workers=3)
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        self.assertEqual([20, 20, 5],
+                         sorted([len(c) for c in requested_chunks], reverse=True))
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_weather_at_ids_queries_chunks_sequentially_on_other_caches(self):
+        instance = OWM25(self.__test_parsers, 'test_API_key',
+                         cache=LRUCache(100))
+        ids = list(range(1, 46))
+        result, requested_chunks, threads = \
+            self._weather_at_ids_in_chunks(instance, ids, max_workers=3)
+        self.assertEqual(ids, [obs.get_location().get_ID() for obs in result])
+        self.assertEqual([20, 20, 5], [len(c) for c in requested_chunks])
+        self.assertEqual({threading.current_thread()}, threads)
+
+    def test_weather_at_ids_only_fetches_cache_misses(self):
+        cache = LRUCache()
+        instance = OWM25(self.__test_parsers, 'test_API_key', cache=cache)
+        requested_ids = []
+
+        def mock_get_json(_, uri, params=None, headers=None):
+            ids = [int(i) for i in params['id'].split(',')]
+            requested_ids.extend(ids)
+            data = json.loads(SEARCH_RESULTS_JSON)
+            data['list'] = [item for item in data['list'] if item['id'] in ids]
+            return 200, data
+
+        ref_to_original_call_API = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        instance.weather_at_ids([2643743])
+        self.assertEqual([2643743], requested_ids)
+        del requested_ids[:]
+        result = instance.weather_at_ids([2643743, 2943743])
+        HttpClient.get_json = ref_to_original_call_API
+        self.assertEqual([2943743], requested_ids)
+        self.assertEqual([2643743, 2943743],
+                         [obs.get_location().get_ID() for obs in result])
+
+    def test_weather_at_ids_group_calls_go_through_the_cache(self):
+        instance = OWM25(self.__test_parsers, 'test_API_key', cache=LRUCache(),
+                         negative_cache=LRUCache())
+        calls = []
+
+        def mock_get_json(_, uri, params=None, headers=None):
+            calls.append(params['id'])
+            return 200, {'cod': '200', 'count': 0, 'list': []}
+
+        ref_to_original_call_API = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        self.assertEqual([], instance.weather_at_ids([2643743]))
+        self.assertEqual([], instance.weather_at_ids([2643743]))
+        HttpClient.get_json = ref_to_original_call_API
+        # the empty response is served by the negative cache
+        self.assertEqual(['2643743'], calls)
 
     def test_weather_at_ids_fails_when_wrong_parameters(self):
         self.assertRaises(AssertionError, OWM25.weather_at_ids, \
@@ -364,7 +614,7 @@ class TestOWM25(unittest.TestCase):
             self.assertTrue(item.get_reception_time())
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
 
@@ -386,7 +636,7 @@ class TestOWM25(unittest.TestCase):
             self.assertTrue(item.get_reception_time() is not None)
             loc = item.get_location()
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(v is not None for v in loc.__getstate__().values()))
             weat = item.get_weather()
             self.assertTrue(weat is not None)
 
@@ -928,7 +1178,7 @@ class TestOWM25(unittest.TestCase):
         def mock_get_uvi_history_checking_end_parameter(instance, params_dict):
             self.assertIn('end', params_dict)
             self.assertIsNotNone(params_dict['end'])
-            return UVINDEX_LIST_JSON
+            return json.loads(UVINDEX_LIST_JSON)
 
         UltraVioletHttpClient.get_uvi_history = \
             mock_get_uvi_history_checking_end_parameter
@@ -1041,3 +1291,61 @@ class TestOWM25(unittest.TestCase):
                           self.__test_instance, -200, 2.5)
         self.assertRaises(ValueError, OWM25.so2index_around_coords, \
                           self.__test_instance, 200, 2.5)
+
+    def test_weather_at_coords_many(self):
+        original_func = HttpClient.cacheable_get_json
+        HttpClient.cacheable_get_json = \
+            self.mock_api_call_returning_single_obs
+        coords = [(57.0, -2.15), (43.7, -200.0), (45, 9)]
+        results = list(self.__test_instance.weather_at_coords_many(coords, max_workers=2))
+        HttpClient.cacheable_get_json = original_func
+        self.assertEqual(coords, [r.query for r in results])
+        self.assertTrue(isinstance(results[0].result, Observation))
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertTrue(isinstance(results[2].result, Observation))
+
+    def test_weather_at_ids_many(self):
+        original_func = HttpClient.cacheable_get_json
+        HttpClient.cacheable_get_json = \
+            self.mock_api_call_returning_single_obs
+        results = list(self.__test_instance.weather_at_ids_many([1, 2, 3]))
+        HttpClient.cacheable_get_json = original_func
+        self.assertEqual([1, 2, 3], [r.query for r in results])
+        self.assertTrue(all(isinstance(r.result, Observation) for r in results))
+
+    def test_bulk_calls_fail_with_wrong_max_workers(self):
+        self.assertRaises(AssertionError,
+                          self.__test_instance.weather_at_ids_many, [1],
+                          max_workers=0)
+        self.assertRaises(AssertionError,
+                          self.__test_instance.weather_at_coords_many,
+                          [(51.5, -0.1)], max_workers=-1)
+
+    def test_three_hours_forecast_at_ids_many(self):
+        original_func = HttpClient.cacheable_get_json
+        HttpClient.cacheable_get_json = \
+            self.mock_api_call_returning_3h_forecast_at_id
+        results = list(self.__test_instance.three_hours_forecast_at_ids_many([2643743, -1]))
+        HttpClient.cacheable_get_json = original_func
+        self.assertTrue(isinstance(results[0].result, Forecaster))
+        self.assertEqual("3h", results[0].result.get_forecast().get_interval())
+        self.assertFalse(results[1].is_success())
+
+    def test_three_hours_forecast_at_coords_many(self):
+        original_func = HttpClient.cacheable_get_json
+        HttpClient.cacheable_get_json = \
+            self.mock_api_call_returning_3h_forecast_at_coords
+        results = list(self.__test_instance.three_hours_forecast_at_coords_many([(51.50853, -0.12574)]))
+        HttpClient.cacheable_get_json = original_func
+        self.assertTrue(isinstance(results[0].result, Forecaster))
+
+    def test_daily_forecast_many(self):
+        original_func = HttpClient.cacheable_get_json
+        HttpClient.cacheable_get_json = \
+            self.mock_api_call_returning_daily_forecast_at_id
+        results_by_id = list(self.__test_instance.daily_forecast_at_ids_many([2643743], limit=2))
+        results_by_coords = list(self.__test_instance.daily_forecast_at_coords_many([(51.50853, -0.12574)], limit=0))
+        HttpClient.cacheable_get_json = original_func
+        self.assertTrue(isinstance(results_by_id[0].result, Forecaster))
+        self.assertEqual("daily", results_by_id[0].result.get_forecast().get_interval())
+        self.assertIsInstance(results_by_coords[0].error, ValueError)
@@ -2,8 +2,13 @@
 Test case for weather.py module
 """
 
+import json
+import pickle
 import unittest
-from pyowm.weatherapi25.weather import Weather, weather_from_dictionary
+from pyowm.weatherapi25.weather import (Weather, LazyWeather,
+                                       weather_from_dictionary,
+                                       weather_extractor,
+                                       weathers_from_dictionaries)
 from pyowm.utils.timeformatutils import UTC
 from tests.unit.weatherapi25.json_test_dumps import WEATHER_JSON_DUMP
 from datetime import datetime
@@ -219,13 +224,117 @@ class TestWeather(unittest.TestCase):
         }
         result1 = weather_from_dictionary(dict1)
         self.assertTrue(isinstance(result1, Weather))
-        self.assertTrue(all(v is not None for v in result1.__dict__.values()))
+        self.assertTrue(all(v is not None for v in result1.__getstate__().values()))
         result2 = weather_from_dictionary(dict2)
         self.assertTrue(isinstance(result2, Weather))
-        self.assertFalse(all(v is not None for v in result2.__dict__.values()))
+        self.assertFalse(all(v is not None for v in result2.__getstate__().values()))
         result3 = weather_from_dictionary(dict3)
         self.assertTrue(isinstance(result3, Weather))
 
+    def assertSameWeathers(self, items):
+        expected = [weather_from_dictionary(item).__getstate__() for item in items]
+        self.assertEqual(expected, [w.__getstate__() for w in
+                                    weathers_from_dictionaries(items)])
+        for item in items:
+            self.assertEqual(weather_from_dictionary(item).__getstate__(),
+                             weather_extractor(items[0])(item).__getstate__())
+        lazy_weathers = weathers_from_dictionaries(items, lazy=True)
+        self.assertEqual(expected, [self.materialised(w) for w in lazy_weathers])
+
+    def materialised(self, lazy_weather):
+        # reads all the fields of a LazyWeather
+        fields = Weather.__slots__
+        return {name: getattr(lazy_weather, name) for name in fields}
+
+    def test_weathers_from_dictionaries_on_fixtures(self):
+        from tests.unit.weatherapi25 import json_test_responses as responses
+        for name in ['THREE_HOURS_FORECAST_JSON', 'DAILY_FORECAST_JSON',
+                     'CITY_WEATHER_HISTORY_JSON', 'SEARCH_RESULTS_JSON',
+                     'WEATHER_AT_STATION_IN_BBOX_JSON',
+                     'WEATHER_AT_PLACES_IN_BBOX_JSON']:
+            self.assertSameWeathers(json.loads(getattr(responses, name))['list'])
+        stations = json.loads(responses.STATION_AT_COORDS_JSON)
+        self.assertSameWeathers([item['last'] for item in stations])
+        self.assertEqual([], weathers_from_dictionaries([]))
+
+    def test_weathers_from_dictionaries_on_varying_items(self):
+        nested = {'dt': 1378895177, 'wind': {'speed': 1.54, 'deg': 31},
+                  'main': {'pressure': 1022, 'humidity': 75, 'temp': 288.44,
+                           'temp_max': 289.82, 'temp_kf': 0.5}}
+        flat = {'dt': 1378897200, 'temp': {'day': 289.37, 'min': 284.88},
+                'pressure': 1025.35, 'humidity': 71, 'speed': 3.76, 'deg': 338}
+        variants = [
+            dict(rain={'3h': 0.25}, snow=1.5, clouds=48),
+            dict(rain=3, snow=None, clouds={'all': 20}, visibility=10000),
+            dict(rain=None, clouds={}, visibility={'distance': 1000}),
+            dict(clouds=[{'distance': 427, 'condition': 'SCT'}], visibility={}),
+            dict(sys={'sunset': 1378923812, 'pod': 'd'}, calc={'humidex': 298.0}),
+            dict(weather=[{'main': 'Rain', 'description': 'light rain',
+                           'id': 500, 'icon': '10d'}], wind=None),
+            dict(main={'pressure': 1000}, temp=None),
+        ]
+        for first in [nested, flat]:
+            items = [first] + [dict(first, **variant) for variant in variants]
+            items += [nested, flat, {'last': dict(nested, calc={'dewpoint': 1.0})}]
+            self.assertSameWeathers(items)
+
+    def test_weather_extractor_on_missing_data(self):
+        extract = weather_extractor({'dt': 1378895177, 'main': {'temp': 1}})
+        self.assertRaises(KeyError, extract, {'dt': 1378895177,
+                                              'weather': [{'main': 'Rain'}],
+                                              'main': {'temp': 1}})
+        self.assertRaises(KeyError, extract, {'main': {'temp': 1}})
+        self.assertIs(weather_from_dictionary, weather_extractor({'main': {}}))
+
+    def test_lazy_weather_reads_fields_on_first_access(self):
+        d = {'dt': 1378895177, 'clouds': {'all': 92},
+             'main': {'pressure': 1022, 'humidity': 75, 'temp': 288.44}}
+        instance = LazyWeather(d)
+        self.assertEqual({'_data'}, set(instance.__dict__))
+        self.assertEqual(288.44, instance.get_temperature()['temp'])
+        self.assertEqual({'_data', '_temperature'},
+                         set(instance.__dict__))
+        # fields are kept once read
+        d['main']['temp'] = 300.0
+        self.assertEqual(288.44, instance.get_temperature()['temp'])
+        self.assertEqual(92, instance.get_clouds())
+        self.assertEqual(weather_from_dictionary(d).get_humidity(),
+                         instance.get_humidity())
+        self.assertRaises(AttributeError, getattr, instance, '_unknown')
+
+    def test_lazy_weather_errors(self):
+        self.assertRaises(KeyError, LazyWeather, {'main': {'temp': 1}})
+        self.assertRaises(ValueError, LazyWeather, {'dt': -1})
+        instance = LazyWeather({'dt': 1378895177, 'clouds': -1, 'humidity': -1,
+                                'last': {}})
+        self.assertRaises(ValueError, instance.get_clouds)
+        self.assertRaises(ValueError, instance.get_humidity)
+        self.assertRaises(KeyError, instance.get_pressure)
+        self.assertRaises(KeyError, instance.get_temperature)
+        self.assertEqual('', instance.get_status())
+
+    def test_pickling(self):
+        instance = self.__test_instance
+        self.assertFalse(hasattr(instance, '__dict__'))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(instance, protocol))
+            self.assertEqual(instance.__getstate__(), result.__getstate__())
+
+    def test_lazy_weather_pickling_and_dumps(self):
+        from tests.unit.weatherapi25 import json_test_responses as responses
+        item = json.loads(responses.THREE_HOURS_FORECAST_JSON)['list'][0]
+        instance = LazyWeather(item)
+        instance.get_wind()
+        result = pickle.loads(pickle.dumps(instance))
+        self.assertEqual(self.materialised(instance), self.materialised(result))
+        expected = weather_from_dictionary(item)
+        self.assertEqual(json.loads(expected.to_JSON()),
+                         json.loads(LazyWeather(item).to_JSON()))
+        self.assertEqual(expected.to_XML(), LazyWeather(item).to_XML())
+        self.assertEqual(repr(expected).replace('Weather', 'LazyWeather'),
+                         repr(LazyWeather(item)))
+        self.assertIs(LazyWeather, weather_extractor(item, lazy=True))
+
     def test_from_dictionary_when_data_fields_are_none(self):
         dict1 = {'clouds': {'all': 92}, 'name': 'London',
                  'coord': {'lat': 51.50853, 'lon': -0.12574},
@@ -400,9 +509,9 @@ class TestWeather(unittest.TestCase):
     # interpeter-dependant serialization of XML/JSON objects)
 
     def test_to_JSON(self):
-        ordered_base_json = ''.join(sorted(WEATHER_JSON_DUMP))
-        ordered_actual_json = ''.join(sorted(self.__test_instance.to_JSON()))
-        self.assertEqual(ordered_base_json, ordered_actual_json)
+        # the formatting of the JSON text depends on the JSON codec backend
+        self.assertEqual(json.loads(WEATHER_JSON_DUMP),
+                         json.loads(self.__test_instance.to_JSON()))
 
     '''
     def test_to_XML(self):